@@ -1,7 +1,11 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-12"
+__version__ = "2026-10-18"
+# 2026-10-18    The pairing channels are configured in one batch.
+#               -c: continuous scan mode; all masters are received on one
+#               channel and kept in a clsAntInventory (instead of pairing
+#               one master per channel).
 # 2023-04-12    Added version argument
 # 2022-08-22    AntDongle stores received messages in a queue.
 # 2020-05-07    clsAntDongle encapsulates all functions
@@ -56,6 +60,83 @@ class clsDeviceID(object):
         self.TransmissionType = TransmissionType
 
 
+# -------------------------------------------------------------------------------
+# DeviceTypeID: (DeviceType, command line variable to pair with)
+# -------------------------------------------------------------------------------
+ScanDeviceTypes = {
+    ant.DeviceTypeID_HRM: ("HRM", "hrm"),
+    ant.DeviceTypeID_FE: ("FE", "fe"),
+    ant.DeviceTypeID_SCS: ("SCS", "scs"),
+    ant.DeviceTypeID_VTX: ("VTX", "vtx"),
+    ant.DeviceTypeID_VHU: ("VHU", "vhu"),
+}
+
+
+# -------------------------------------------------------------------------------
+# S c a n D e v i c e s
+# -------------------------------------------------------------------------------
+# input:        AntDongle, calibrated
+#               clv
+#
+# Description:  Open channel 0 in continuous scan mode and collect all masters
+#               in range in an inventory, for ScanTime seconds or until Ctrl-C.
+#               The first device of each type is paired with (clv.hrm, ...),
+#               as in the pairing loop.
+#
+# Returns:      the clsAntInventory
+# ------------------------------------------------------------------------------
+def ScanDevices(AntDongle, clv, ScanTime=30):
+    Inventory = ant.clsAntInventory()
+    AntDongle.ScanMode_ChannelConfig()
+
+    logfile.Console("Scanning, press Ctrl-C to exit")
+    EndTime = time.time() + ScanTime
+    try:
+        while time.time() < EndTime:
+            AntDongle.Read(False)
+            for d in AntDongle.Messages(min(EndTime, time.time() + 5)):
+                Device = Inventory.Update(d)
+                if Device is None or not Inventory.New:
+                    continue
+                DeviceType, Variable = ScanDeviceTypes.get(
+                    Device.DeviceTypeID, ("?", None)
+                )
+                if Variable and getattr(clv, Variable) <= 0:
+                    setattr(clv, Variable, Device.DeviceNumber)
+                logfile.Console(
+                    "ExplorANT: %3s discovered, number=%5s typeID=%3s TrType=%3s"
+                    % (
+                        DeviceType,
+                        Device.DeviceNumber,
+                        Device.DeviceTypeID,
+                        Device.TransmissionType,
+                    )
+                )
+            logfile.Console(
+                "ExplorANT: %s devices, %s seen in the last 5 seconds"
+                % (len(Inventory.Devices), len(Inventory.Seen(5)))
+            )
+    except KeyboardInterrupt:
+        pass
+    logfile.Console("Scanning stopped")
+
+    Now = time.time()
+    for Device in Inventory.Seen():
+        logfile.Console(
+            " %3s number=%5s typeID=%3s TrType=%3s, %5.1f msg/s, last seen %4.1fs ago"
+            % (
+                ScanDeviceTypes.get(Device.DeviceTypeID, ("?",))[0],
+                Device.DeviceNumber,
+                Device.DeviceTypeID,
+                Device.TransmissionType,
+                Device.Rate(),
+                Now - Device.LastSeen,
+            )
+        )
+    logfile.Console("--------------------")
+    return Inventory
+
+
 # ==============================================================================
 # Main program; Command line parameters
 # ==============================================================================
@@ -122,7 +203,15 @@ def main():
     AntDongle = ant.clsAntDongle(p)
     logfile.Console(AntDongle.Message)
 
-    if AntDongle.OK and not clv.SimulateTrainer:
+    if AntDongle.OK and not clv.SimulateTrainer and clv.scan:
+        # ---------------------------------------------------------------------------
+        # Receive all MASTER devices on one channel
+        # ---------------------------------------------------------------------------
+        AntDongle.Calibrate()
+        ScanDevices(AntDongle, clv)
+        AntDongle.ResetDongle()
+
+    elif AntDongle.OK and not clv.SimulateTrainer:
         # ---------------------------------------------------------------------------
         # We are going to look what MASTER devices there are
         # ---------------------------------------------------------------------------
@@ -156,6 +245,7 @@ def main():
         # ---------------------------------------------------------------------------
         NrDevicesToPair = 8  # Must be > channel_VTX_s !! AND LESS THAN CHANNEL_MAX
         print("Open channels: ", end="")
+        AntDongle.BeginChannelConfig()  # Send all channels in one batch
         for i in range(0, NrDevicesToPair):
             print(i, end=" ")
             if i == ant.channel_VTX_s:
@@ -171,6 +261,7 @@ def main():
                 AntDongle.SlavePair_ChannelConfig(
                     i, DeviceNumber, DeviceTypeID, TransmissionType
                 )
+        AntDongle.EndChannelConfig()
         print("")
 
         deviceIDs = []
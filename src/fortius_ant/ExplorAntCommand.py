@@ -2,7 +2,8 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-12"
+__version__ = "2026-10-18"
+# 2026-10-18    Added: -c --scan, continuous scan mode instead of pairing
 # 2023-04-12    Added version argument
 # 2020-05-01    Added: vhu, no command line variable defined
 # 2020-04-23    Create() and Get() removed because it is weard
@@ -33,6 +34,7 @@ class CommandLineVariables:  # noqa PLR902 PLR903
     vtx = -1  # i-Vortex
     vhu = -1  # i-Vortex Headunit
     SimulateTrainer = False
+    scan = False  # Continuous scan mode
 
     # ---------------------------------------------------------------------------
     # Define and process command line
@@ -52,6 +54,13 @@ class CommandLineVariables:  # noqa PLR902 PLR903
             required=False,
             action="store_true",
         )
+        parser.add_argument(
+            "-c",
+            "--scan",
+            help="Discover all ANT+ masters with continuous scan mode",
+            required=False,
+            action="store_true",
+        )
         parser.add_argument(
             "-d", "--debug", help="Show debugging data", required=False, default=False
         )
@@ -109,6 +118,7 @@ class CommandLineVariables:  # noqa PLR902 PLR903
         # -----------------------------------------------------------------------
         self.autostart = args.autostart
         self.SimulateTrainer = args.simulate
+        self.scan = args.scan
         self.version = args.version
 
         # -----------------------------------------------------------------------
@@ -183,6 +193,8 @@ class CommandLineVariables:  # noqa PLR902 PLR903
                 logfile.Console("-a")
             if self.SimulateTrainer:
                 logfile.Console("-s")
+            if self.scan:
+                logfile.Console("-c")
             if v or self.args.debug:
                 logfile.Console(f"-d {self.debug} ({bin(self.debug)})")
             if v or self.args.dongle:
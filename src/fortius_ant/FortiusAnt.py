@@ -22,7 +22,7 @@ from fortius_ant import FortiusAntBody
 from fortius_ant import FortiusAntCommand as cmd
 from fortius_ant import TCXexport, __packagetype__, __packageversion__, __shortversion__
 from fortius_ant import __version__ as __fullversion__
-from fortius_ant import antCTRL
+from fortius_ant import antCTRL, antDispatcher, antScheduler
 from fortius_ant import antDongle as ant
 from fortius_ant import antFE as fe
 from fortius_ant import antHRM as hrm
@@ -39,7 +39,7 @@ from fortius_ant import (
     settings,
 )
 from fortius_ant import structConstants as sc
-from fortius_ant import usbTrainer
+from fortius_ant import usbDevices, usbTrainer
 from fortius_ant.constants import (
     OnRaspberry,
     UseBluetooth,
@@ -1040,10 +1040,12 @@ def print_component_info():
     s = " %20s = %s"
     logfile.Write(s % ("FortiusAnt", __version__))
     logfile.Write(s % ("antCTRL", antCTRL.__version__))
+    logfile.Write(s % ("antDispatcher", antDispatcher.__version__))
     logfile.Write(s % ("antDongle", ant.__version__))
     logfile.Write(s % ("antFE", fe.__version__))
     logfile.Write(s % ("antHRM", hrm.__version__))
     logfile.Write(s % ("antPWR", pwr.__version__))
+    logfile.Write(s % ("antScheduler", antScheduler.__version__))
     logfile.Write(s % ("antSCS", scs.__version__))
     logfile.Write(s % ("bleBless", bleBless.__version__))
     logfile.Write(s % ("bleBlessClass", bleBlessClass.__version__))
@@ -1061,6 +1063,7 @@ def print_component_info():
     logfile.Write(s % ("settings", settings.__version__))
     logfile.Write(s % ("structConstants", sc.__version__))
     logfile.Write(s % ("TCXexport", TCXexport.__version__))
+    logfile.Write(s % ("usbDevices", usbDevices.__version__))
     logfile.Write(s % ("usbTrainer", usbTrainer.__version__))
     logfile.Write(s % ("argparse", argparse.__version__))
     logfile.Write(s % ("bless", get_version("bless")))
@@ -1,7 +1,7 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2022-08-22"
+__version__ = "2026-10-18"
 import argparse
 import binascii
 import glob
@@ -18,6 +18,29 @@ import time
 import numpy
 import usb.core
 
+# 2026-10-18    ANT messages are handled as soon as they arrive (instead of
+#               once per cycle) and a new target (page 48...51) is sent to
+#               the trainer immediately.
+#               The if/elif chain for received ANT messages is replaced by
+#               antDispatcher; the handlers are moved to antFE, antHRM,
+#               antCTRL, steering and usbTrainer.
+#               All ANT channels are configured in one batch.
+#               The dongle is reset once, by Calibrate().
+#               Master channel pages are sent on EVENT_TX by antScheduler.
+#               Burst data is reassembled instead of ignored.
+#               --capture records the ANT traffic, --replay plays it back.
+#               ANT messages are sent by the WriteThread of AntDongle, with
+#               priorities and only the newest broadcast per channel; the
+#               WriteThread is stopped on exit.
+#               --extended: ANT messages are extended with RSSI (in the
+#               statistics) and the RX timestamp of the dongle (plumbing
+#               only: used for the latency measurements, not by the handlers).
+#               -d with Data1: ANT messages are traced in a binary .anttrace
+#               file next to the logfile, see antDongle.clsAntTrace; the trace
+#               is completed and closed by Terminate().
+#               --trainerthread: the USB trainer is polled by its IOThread.
+#               LocateHW() scans the USB devices again, so that a dongle or
+#               trainer plugged in after startup is found.
 # 2022-08-22    AntDongle stores received messages in a queue.
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
 # 2022-05-12    Message added on failing calibration
@@ -241,6 +264,8 @@ if UseGui:
 from datetime import datetime
 
 import fortius_ant.antCTRL as ctrl
+import fortius_ant.antDispatcher as antDispatcher
+import fortius_ant.antScheduler as antScheduler
 import fortius_ant.antDongle as ant
 import fortius_ant.antFE as fe
 import fortius_ant.antHRM as hrm
@@ -254,6 +279,7 @@ import fortius_ant.logfile as logfile
 import fortius_ant.raspberry as raspberry
 import fortius_ant.steering as steering
 import fortius_ant.TCXexport as TCXexport
+import fortius_ant.usbDevices as usbDevices
 import fortius_ant.usbTrainer as usbTrainer
 
 PrintWarnings = False  # Print warnings even when logging = off
@@ -304,9 +330,16 @@ def Terminate():
     if debug.on(debug.Function):
         f("FortiusAntBody.Terminate() ...")
     # --------------------------------------------------------------------------
+    # Write the queued trace records, close trace and capture file
+    # --------------------------------------------------------------------------
+    if AntDongle != None:
+        AntDongle.StopTrace()
+        AntDongle.StopCapture()
+    # --------------------------------------------------------------------------
     # If there is an AntDongle, release it as good as possible
+    # (a replayed dongle has no USB device)
     # --------------------------------------------------------------------------
-    if AntDongle != None and AntDongle.OK:
+    if AntDongle != None and AntDongle.OK and AntDongle.devAntDongle:
         if debug.on(debug.Function):
             f("AntDongle.reset()")
         AntDongle.devAntDongle.reset()
@@ -423,6 +456,12 @@ def LocateHW(FortiusAntGui):
     if debug.on(debug.Application):
         logfile.Write("Scan for hardware")
 
+    # ---------------------------------------------------------------------------
+    # Devices may be plugged in since the previous LocateHW(); one new scan
+    # is shared by the dongle and the trainer.
+    # ---------------------------------------------------------------------------
+    usbDevices.Invalidate()
+
     # ---------------------------------------------------------------------------
     # No actions needed for Bluetooth dongle
     # ---------------------------------------------------------------------------
@@ -435,7 +474,16 @@ def LocateHW(FortiusAntGui):
     if AntDongle and AntDongle.OK:
         pass
     else:
-        AntDongle = ant.clsAntDongle(clv.antDeviceID)
+        if clv.AntReplay:
+            AntDongle = ant.clsReplayAntDongle(clv.AntReplay)
+        else:
+            AntDongle = ant.clsAntDongle(clv.antDeviceID)
+        if clv.AntCapture and AntDongle.OK:
+            AntDongle.StartCapture(clv.AntCapture)
+        if debug.on(debug.Data1) and logfile.FileName and AntDongle.OK:
+            AntDongle.StartTrace(logfile.FileName.replace(".log", ".anttrace"))
+        if clv.AntExtended:
+            AntDongle.LibConfig = ant.LibConfig_RSSI | ant.LibConfig_Timestamp
         manualMsg = ""
         if AntDongle.OK or not (
             clv.Tacx_Vortex or clv.Tacx_Genius or clv.Tacx_Bushido
@@ -765,6 +813,24 @@ def Tacx2Dongle(FortiusAntGui):
     return rtn
 
 
+# ------------------------------------------------------------------------------
+# H a n d l e U n e x p e c t e d D e v i c e
+# ------------------------------------------------------------------------------
+# ChannelID for a channel where no module expects a device
+# ------------------------------------------------------------------------------
+def HandleUnexpectedDevice(_id, _Channel, _DataPageNumber, info):
+    (
+        Channel,
+        DeviceNumber,
+        _DeviceTypeID,
+        _TransmissionType,
+    ) = ant.unmsg51_ChannelID(info)
+
+    if DeviceNumber != 0:  # No device paired, ignore
+        logfile.Console("Unexpected device %s on channel %s" % (DeviceNumber, Channel))
+    return True
+
+
 def Tacx2DongleSub(FortiusAntGui, Restart):
     global clv, AntDongle, TacxTrainer, tcx, bleCTP, manualMsg
 
@@ -784,28 +850,8 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     CassetteIndex = clv.CassetteStart
 
     # ---------------------------------------------------------------------------
-    # Command status data
-    # ---------------------------------------------------------------------------
-    p71_LastReceivedCommandID = 255
-    p71_SequenceNr = 255
-    p71_CommandStatus = 255
-    p71_Data1 = 0xFF
-    p71_Data2 = 0xFF
-    p71_Data3 = 0xFF
-    p71_Data4 = 0xFF
-
-    # ---------------------------------------------------------------------------
-    # Command status data for ANT Control
+    # Command status data (page 71) is maintained in antFE and antCTRL
     # ---------------------------------------------------------------------------
-    ctrl_p71_LastReceivedCommandID = 255
-    ctrl_p71_SequenceNr = 255
-    ctrl_p71_CommandStatus = 255
-    ctrl_p71_Data1 = 0xFF
-    ctrl_p71_Data2 = 0xFF
-    ctrl_p71_Data3 = 0xFF
-    ctrl_p71_Data4 = 0xFF
-
-    ctrl_Commands = []  # Containing tuples (manufacturer, serial, CommandNr)
 
     # ---------------------------------------------------------------------------
     # Info from ANT slave channels
@@ -831,8 +877,8 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     #
     # And if you want a dedicated Speed Cadence Sensor, implement like this...
     # ---------------------------------------------------------------------------
-    AntDongle.ResetDongle()  # reset dongle
-    AntDongle.Calibrate()  # calibrate ANT+ dongle
+    AntDongle.Calibrate()  # reset and calibrate ANT+ dongle
+    AntDongle.BeginChannelConfig()  # All channels are configured in one batch
     AntDongle.Trainer_ChannelConfig()  # Create ANT+ master channel for FE-C
 
     if clv.hrm == None:
@@ -925,6 +971,8 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     else:
         Steering = None
 
+    AntDongle.EndChannelConfig()  # Send and wait for the channel responses
+    AntDongle.StartWriteThread()  # Broadcasts are queued from now on
     AntDongle.ConfigMsg = False  # Displayed only once
 
     if not clv.gui:
@@ -1152,8 +1200,6 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
         TacxTrainer.SetGearboxReduction(1)
 
     CTPcommandTime = 0  # Time that last CTP command received
-    TargetPowerTime = 0  # Time that last TargetPower received
-    PowerModeActive = ""  # Text showing in userinterface
 
     LastANTtime = 0  # ANT+ interface is sent/received only
     # every 250ms
@@ -1171,6 +1217,60 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     scs.Initialize()
     ctrl.Initialize()
 
+    # ---------------------------------------------------------------------------
+    # Received ANT messages are routed to the handlers of the modules
+    # ---------------------------------------------------------------------------
+    Dispatcher = antDispatcher.clsAntDispatcher()
+    fe.RegisterHandlers(Dispatcher, AntDongle, TacxTrainer, clv)
+    hrm.RegisterHandlers(Dispatcher, AntDongle, clv)
+    ctrl.RegisterHandlers(Dispatcher, AntDongle)
+    TacxTrainer.RegisterHandlers(Dispatcher)
+    if BlackTrack is not None:
+        BlackTrack.RegisterHandlers(Dispatcher)
+    Dispatcher.Register(ant.msgID_ChannelID, None, None, HandleUnexpectedDevice)
+    Dispatcher.Register(
+        ant.msgID_ChannelResponse, None, None, antDispatcher.HandleIgnore
+    )
+    BurstReassembler = ant.clsAntBurstReassembler()  # No bursts expected yet
+    Dispatcher.Register(ant.msgID_BurstData, None, None, BurstReassembler.HandleBurst)
+
+    # ---------------------------------------------------------------------------
+    # Pages for the master channels, sent by the Scheduler when the dongle
+    # reports that the previous page is transmitted (EVENT_TX)
+    # ---------------------------------------------------------------------------
+    def PageHRM():
+        if TacxTrainer.HeartRate > 0:
+            return hrm.BroadcastHeartrateMessage(HeartRate)
+        return None
+
+    def PagePWR():
+        return pwr.BroadcastMessage(TacxTrainer.CurrentPower, TacxTrainer.Cadence)
+
+    def PageSCS():
+        return scs.BroadcastMessage(
+            TacxTrainer.PedalEchoTime,
+            TacxTrainer.PedalEchoCount,
+            TacxTrainer.VirtualSpeedKmh,
+            TacxTrainer.Cadence,
+        )
+
+    def PageFE():
+        return fe.BroadcastTrainerDataMessage(
+            TacxTrainer.Cadence,
+            TacxTrainer.CurrentPower,
+            TacxTrainer.SpeedKmh,
+            TacxTrainer.HeartRate,
+        )
+
+    Scheduler = antScheduler.clsAntScheduler(AntDongle)
+    if clv.hrm == None:
+        Scheduler.Register(Dispatcher, ant.channel_HRM, PageHRM)
+    Scheduler.Register(Dispatcher, ant.channel_PWR, PagePWR)
+    if clv.scs == None:
+        Scheduler.Register(Dispatcher, ant.channel_SCS, PageSCS)
+    Scheduler.Register(Dispatcher, ant.channel_CTRL, ctrl.BroadcastControlMessage)
+    Scheduler.Register(Dispatcher, ant.channel_FE, PageFE)
+
     # ---------------------------------------------------------------------------
     # Initialize CycleTime: fast for PedalStrokeAnalysis
     # ---------------------------------------------------------------------------
@@ -1218,6 +1318,8 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     if debug.on(debug.Function):
         logfile.Write("Tacx2Dongle; start main loop")
     rpi.DisplayState(constants.faOperational, TacxTrainer)
+    if clv.TrainerThread:
+        TacxTrainer.StartIOThread(min(CycleTime, 0.05))  # Poll faster than ANT
     try:
         while FortiusAntGui.RunningSwitch == True and not AntDongle.DongleReconnected:
             StartTime = time.time()
@@ -1242,8 +1344,8 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # Update displayed status; most relevant for Console-mode.
             # Also the DisplayState texts may have changed (due to trainer state)
             # -------------------------------------------------------------------
-            if TacxMessage != TacxTrainer.Message + PowerModeActive:
-                TacxMessage = TacxTrainer.Message + PowerModeActive
+            if TacxMessage != TacxTrainer.Message + fe.PowerModeActive:
+                TacxMessage = TacxTrainer.Message + fe.PowerModeActive
                 FortiusAntGui.SetMessages(Tacx=TacxMessage)
                 rpi.DisplayState(constants.faOperational, TacxTrainer)
 
@@ -1290,6 +1392,8 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             if clv.hrm == None:
                 HeartRate = TacxTrainer.HeartRate
                 # print('Use heartrate from trainer', HeartRate)
+            else:
+                HeartRate = hrm.HeartRate
 
             # -------------------------------------------------------------------
             # Show actual status; once for the GUI, once for Raspberry
@@ -1350,12 +1454,12 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # -------------------------------------------------------------------
             # Handle Control command
             # -------------------------------------------------------------------
-            if len(ctrl_Commands):
+            if len(ctrl.Commands):
                 (
                     ctrl_SlaveManufacturerID,
                     ctrl_SlaveSerialNumber,
                     ctrl_CommandNr,
-                ) = ctrl_Commands[0]
+                ) = ctrl.Commands[0]
 
                 # -------------------------------------------------------------------
                 # The ANT+controller gives head-unit commands.
@@ -1385,7 +1489,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                 # -------------------------------------------------------------------
                 # Remove command
                 # -------------------------------------------------------------------
-                ctrl_Commands.pop(0)
+                ctrl.Commands.pop(0)
 
             # -------------------------------------------------------------------
             # In manual-mode, power can be incremented or decremented
@@ -1534,7 +1638,6 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # Do ANT/BLE work every 1/4 second
             # -------------------------------------------------------------------
             messages = []  # messages to be sent to ANT
-            data = []  # responses received from ANT
             if QuarterSecond:
                 # LastANTtime = time.time()         # 2020-11-13 removed since duplicate
                 # ---------------------------------------------------------------
@@ -1542,52 +1645,13 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                 # ---------------------------------------------------------------
 
                 # ---------------------------------------------------------------
-                # Broadcast Heartrate message
-                # ---------------------------------------------------------------
-                if clv.hrm == None and TacxTrainer.HeartRate > 0:
-                    messages.append(hrm.BroadcastHeartrateMessage(HeartRate))
-
-                # ---------------------------------------------------------------
-                # Broadcast Bike Power message
-                # ---------------------------------------------------------------
-                if True:
-                    messages.append(
-                        pwr.BroadcastMessage(
-                            TacxTrainer.CurrentPower, TacxTrainer.Cadence
-                        )
-                    )
-
-                # ---------------------------------------------------------------
-                # Broadcast Speed and Cadence Sensor message
-                # ---------------------------------------------------------------
-                if clv.scs == None:
-                    messages.append(
-                        scs.BroadcastMessage(
-                            TacxTrainer.PedalEchoTime,
-                            TacxTrainer.PedalEchoCount,
-                            TacxTrainer.VirtualSpeedKmh,
-                            TacxTrainer.Cadence,
-                        )
-                    )
-
-                # ---------------------------------------------------------------
-                # Broadcast Controllable message
-                # ---------------------------------------------------------------
-                if True:
-                    messages.append(ctrl.BroadcastControlMessage())
-
-                # ---------------------------------------------------------------
-                # Broadcast TrainerData message to the CTP (Trainer Road, ...)
+                # Broadcast Heartrate, Bike Power, Speed and Cadence Sensor,
+                # Controllable and TrainerData (to the CTP) messages.
+                #
+                # Only for the channels that are not (yet) sent by the
+                # Scheduler on EVENT_TX.
                 # ---------------------------------------------------------------
-                # print('fe.BroadcastTrainerDataMessage', Cadence, CurrentPower, SpeedKmh, HeartRate)
-                messages.append(
-                    fe.BroadcastTrainerDataMessage(
-                        TacxTrainer.Cadence,
-                        TacxTrainer.CurrentPower,
-                        TacxTrainer.SpeedKmh,
-                        TacxTrainer.HeartRate,
-                    )
-                )
+                messages.extend(Scheduler.Pages())
 
                 # ---------------------------------------------------------------
                 # Send/receive to Bluetooth interface
@@ -1610,11 +1674,14 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                         bleEvent = True
                         CTPcommandTime = time.time()
                         if bleCTP.TargetMode == mode_Power:
-                            TargetPowerTime = time.time()
+                            fe.TargetPowerTime = time.time()
                             TacxTrainer.SetPower(bleCTP.TargetPower)
 
                         if bleCTP.TargetMode == mode_Grade:
-                            if clv.PowerMode and (time.time() - TargetPowerTime) < 30:
+                            if (
+                                clv.PowerMode
+                                and (time.time() - fe.TargetPowerTime) < 30
+                            ):
                                 pass
                             else:
                                 Grade = bleCTP.TargetGrade
@@ -1642,7 +1709,9 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # -------------------------------------------------------------------
             # Broadcast and receive ANT+ responses
             # -------------------------------------------------------------------
-            if len(messages) > 0:
+            if len(messages) > 0 and AntDongle.WriteQueue:
+                AntDongle.Send(messages)  # Written by the WriteThread
+            elif len(messages) > 0:
                 AntDongle.Write(messages, True, False, flush)
                 flush = False
                 # antEvent is not set here; only for data on FE-C channel
@@ -1651,532 +1720,38 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
             # Here all response from the ANT dongle are processed (receive=True)
             #
             # Commands from dongle that are expected are:
-            # - TargetGradeFromDongle or TargetPowerFromDongle
-            # - Information from HRM (if paired)
-            # - Information from i-Vortex (if paired)
+            # - TargetGradeFromDongle or TargetPowerFromDongle      (antFE)
+            # - Commands from ANT+ Control                          (antCTRL)
+            # - Information from HRM (if paired)                    (antHRM)
+            # - Information from i-Vortex, Genius, Bushido          (TacxTrainer)
+            # - Information from BlackTrack                         (steering)
             #
-            # Input is grouped by messageID, then channel. This has little
-            # practical impact; grouping by Channel would enable to handle all
-            # ANT in a channel (device) module. No advantage today.
+            # The Dispatcher routes each message to the handler that is
+            # registered for (messageID, channel, page), see RegisterHandlers().
+            #
+            # Messages are handled as soon as they arrive, until the end of
+            # the cycle; this replaces sleeping untill CycleTime is done.
             # -------------------------------------------------------------------
-            while AntDongle.MessageQueueSize() > 0:
-                d = AntDongle.MessageQueueGet()
-
-                (
-                    synch,
-                    length,
-                    id,
-                    info,
-                    checksum,
-                    _rest,
-                    Channel,
-                    DataPageNumber,
-                ) = ant.DecomposeMessage(d)
-                error = False
-
-                if clv.Tacx_Vortex or clv.Tacx_Genius or clv.Tacx_Bushido:
-                    if TacxTrainer.HandleANTmessage(d):
-                        continue  # Message is handled or ignored
-
-                if BlackTrack is not None:
-                    if BlackTrack.HandleAntMessage(d):
-                        continue
+            for d in AntDongle.Messages(StartTime + CycleTime):
+                id, Channel, DataPageNumber, info, handled = Dispatcher.Dispatch(d)
 
                 # ---------------------------------------------------------------
                 # AcknowledgedData = Slave -> Master
                 #       channel_FE = From CTP (Trainer Road, Zwift) --> Tacx
                 # ---------------------------------------------------------------
-                if id == ant.msgID_AcknowledgedData:
-                    # -----------------------------------------------------------
-                    # Fitness Equipment Channel inputs
-                    # -----------------------------------------------------------
-                    if Channel == ant.channel_FE:
-                        antEvent = True
-                        CTPcommandTime = time.time()
-                        # -------------------------------------------------------
-                        # Data page 48 (0x30) Basic resistance
-                        # -------------------------------------------------------
-                        if DataPageNumber == 48:
-                            # logfile.Console('Data page 48 Basic mode not implemented')
-                            # I never saw this appear anywhere (2020-05-08)
-                            # TargetMode            = mode_Basic
-                            # TargetGradeFromDongle = 0
-                            # TargetPowerFromDongle = ant.msgUnpage48_BasicResistance(info) * 1000  # n % of maximum of 1000Watt
-
-                            # 2020-11-04 as requested in issue 119
-                            # The percentage is used to calculate grade 0...20%
-                            Grade = ant.msgUnpage48_BasicResistance(info) * 20
-
-                            # Implemented for Magnetic Brake:
-                            # - grade is NOT shifted with GradeShift (here never negative)
-                            # - but is reduced with factor
-                            # - and is NOT reduced with factorDH since never negative
-                            Grade *= clv.GradeFactor
-
-                            TacxTrainer.SetGrade(Grade)
-                            TacxTrainer.SetRollingResistance(0.004)
-                            TacxTrainer.SetWind(0.51, 0.0, 1.0)
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus = 0  # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2 = 0xFF
-                            p71_Data3 = 0xFF
-                            p71_Data4 = info[8]  # target resistance
-
-                        # -------------------------------------------------------
-                        # Data page 49 (0x31) Target Power
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 49:
-                            TacxTrainer.SetPower(ant.msgUnpage49_TargetPower(info))
-                            TargetPowerTime = time.time()
-                            if False and clv.PowerMode and debug.on(debug.Application):
-                                logfile.Write(
-                                    "PowerMode: TargetPower info received - timestamp set"
-                                )
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus = 0  # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2 = 0xFF
-                            p71_Data3 = info[7]  # target power (LSB)
-                            p71_Data4 = info[8]  # target power (MSB)
-
-                        # -------------------------------------------------------
-                        # Data page 50 (0x32) Wind Resistance
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 50:
-                            (
-                                WindResistance,
-                                WindSpeed,
-                                DraftingFactor,
-                            ) = ant.msgUnpage50_WindResistance(info)
-                            TacxTrainer.SetWind(
-                                WindResistance, WindSpeed, DraftingFactor
-                            )
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus = 0  # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2 = info[6]  # wind resistance coefficient
-                            p71_Data3 = info[7]  # wind speed
-                            p71_Data4 = info[8]  # drafting factor
-
-                        # -------------------------------------------------------
-                        # Data page 51 (0x33) Track resistance
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 51:
-                            if clv.PowerMode and (time.time() - TargetPowerTime) < 30:
-                                # -----------------------------------------------
-                                # In PowerMode, TrackResistance is ignored
-                                #       (for xx seconds after the last power-command)
-                                # So if TrainerRoad is used simultaneously with
-                                #       Zwift/Rouvythe power commands from TR
-                                #       take precedence over Zwift/Rouvy and a
-                                #       power-training can be done while riding
-                                #       a Zwift/Rouvy simulation/video!
-                                # When TrainerRoad is finished, the Track
-                                #       resistance is active again
-                                # -----------------------------------------------
-                                PowerModeActive = " [P]"
-                                if (
-                                    False
-                                    and clv.PowerMode
-                                    and debug.on(debug.Application)
-                                ):
-                                    logfile.Write("PowerMode: Grade info ignored")
-                                pass
-                            else:
-                                (
-                                    Grade,
-                                    RollingResistance,
-                                ) = ant.msgUnpage51_TrackResistance(info)
-
-                                # -----------------------------------------------
-                                # Implemented when implementing Magnetic Brake:
-                                # [-] grade is shifted with GradeShift (-10% --> 0) ]
-                                # - then reduced with factor (can be re-adjusted with Virtual Gearbox)
-                                # - and reduced with factorDH (for downhill only)
-                                #
-                                # GradeAdjust is valid for all configurations!
-                                #
-                                # GradeShift is not expected to be used anymore,
-                                # and only left from earliest implementations
-                                # to avoid it has to be re-introduced in future again.
-                                # -----------------------------------------------
-                                Grade += clv.GradeShift
-                                Grade *= clv.GradeFactor
-                                if Grade < 0:
-                                    Grade *= clv.GradeFactorDH
-
-                                TacxTrainer.SetGrade(Grade)
-                                TacxTrainer.SetRollingResistance(RollingResistance)
-                                PowerModeActive = ""
-
-                            # Update "last command" data in case page 71 is requested later
-                            p71_LastReceivedCommandID = DataPageNumber
-                            # wrap around after 254 (255 = no command received)
-                            p71_SequenceNr = (p71_SequenceNr + 1) % 255
-                            p71_CommandStatus = 0  # successfully processed
-                            # echo raw command data (cannot use unpage, unpage does unit conversion etc)
-                            p71_Data2 = info[6]  # target grade (LSB)
-                            p71_Data3 = info[7]  # target grade (MSB)
-                            p71_Data4 = info[8]  # rolling resistance coefficient
-
-                        # -------------------------------------------------------
-                        # Data page 55 User configuration
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 55:
-                            (
-                                UserWeight,
-                                BicycleWeight,
-                                BicycleWheelDiameter,
-                                GearRatio,
-                            ) = ant.msgUnpage55_UserConfiguration(info)
-                            TacxTrainer.SetUserConfiguration(
-                                UserWeight,
-                                BicycleWeight,
-                                BicycleWheelDiameter,
-                                GearRatio,
-                            )
-
-                        # -------------------------------------------------------
-                        # Data page 70 Request data page
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 70:
-                            (
-                                _SlaveSerialNumber,
-                                _DescriptorByte1,
-                                _DescriptorByte2,
-                                _AckRequired,
-                                NrTimes,
-                                RequestedPageNumber,
-                                _CommandType,
-                            ) = ant.msgUnpage70_RequestDataPage(info)
-
-                            info = False
-                            if RequestedPageNumber == 54:
-                                # Capabilities;
-                                # bit 0 = Basic mode
-                                # bit 1 = Target/Power/Ergo mode
-                                # bit 2 = Simulation/Restance/Slope mode
-                                info = ant.msgPage54_FE_Capabilities(
-                                    ant.channel_FE, 0xFF, 0xFF, 0xFF, 0xFF, 1000, 0x07
-                                )
-
-                            elif RequestedPageNumber == 71:
-                                info = ant.msgPage71_CommandStatus(
-                                    ant.channel_FE,
-                                    p71_LastReceivedCommandID,
-                                    p71_SequenceNr,
-                                    p71_CommandStatus,
-                                    p71_Data1,
-                                    p71_Data2,
-                                    p71_Data3,
-                                    p71_Data4,
-                                )
-
-                            elif RequestedPageNumber == 80:
-                                info = ant.msgPage80_ManufacturerInfo(
-                                    ant.channel_FE,
-                                    0xFF,
-                                    0xFF,
-                                    ant.HWrevision_FE,
-                                    ant.Manufacturer_tacx,
-                                    ant.ModelNumber_FE,
-                                )
-
-                            elif RequestedPageNumber == 81:
-                                info = ant.msgPage81_ProductInformation(
-                                    ant.channel_FE,
-                                    0xFF,
-                                    ant.SWrevisionSupp_FE,
-                                    ant.SWrevisionMain_FE,
-                                    ant.SerialNumber_FE,
-                                )
-
-                            elif RequestedPageNumber == 82:
-                                info = ant.msgPage82_BatteryStatus(ant.channel_FE)
-
-                            else:
-                                error = "Requested page not suported"
-
-                            if info != False:
-                                data = []
-                                d = ant.ComposeMessage(ant.msgID_BroadcastData, info)
-                                while NrTimes:
-                                    data.append(d)
-                                    NrTimes -= 1
-                                AntDongle.Write(data, False)
-
-                        # -------------------------------------------------------
-                        # Data page 252 ????
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 252 and (
-                            PrintWarnings or debug.on(debug.Data1)
-                        ):
-                            logfile.Write(
-                                "FE data page 252 ignored. info=%s"
-                                % logfile.HexSpace(info)
-                            )
-                            pass
-
-                        # -------------------------------------------------------
-                        # Other data pages
-                        # -------------------------------------------------------
-                        else:
-                            error = "Unknown FE data page"
-
-                    # -----------------------------------------------------------
-                    # Control Channel inputs
-                    # -----------------------------------------------------------
-                    if Channel == ant.channel_CTRL:
-                        # -------------------------------------------------------
-                        # Data page 73 (0x53) Generic Command
-                        # -------------------------------------------------------
-                        if DataPageNumber == 73:
-                            (
-                                ctrl_SlaveSerialNumber,
-                                ctrl_SlaveManufacturerID,
-                                SequenceNr,
-                                ctrl_CommandNr,
-                            ) = ant.msgUnpage73_GenericCommand(info)
-
-                            # Update "last command" data in case page 71 is requested later
-                            ctrl_p71_LastReceivedCommandID = DataPageNumber
-                            ctrl_p71_SequenceNr = SequenceNr
-                            ctrl_p71_CommandStatus = 0  # successfully processed
-                            ctrl_p71_Data1 = ctrl_CommandNr & 0x00FF
-                            ctrl_p71_Data2 = (ctrl_CommandNr & 0xFF00) >> 8
-                            ctrl_p71_Data3 = 0xFF
-                            ctrl_p71_Data4 = 0xFF
-
-                            # ---------------------------------------------------
-                            # Commands should not overwrite, therefore stored
-                            # in a table as tuples.
-                            # ---------------------------------------------------
-                            ctrl_Commands.append(
-                                (
-                                    ctrl_SlaveManufacturerID,
-                                    ctrl_SlaveSerialNumber,
-                                    ctrl_CommandNr,
-                                )
-                            )
-                            CommandName = ctrl.CommandName.get(
-                                ctrl_CommandNr, "Unknown"
-                            )
-                            if debug.on(debug.Application):
-                                logfile.Print(
-                                    f"ANT+ Control {ctrl_SlaveManufacturerID} {ctrl_SlaveSerialNumber}: Received command {ctrl_CommandNr} = {CommandName} "
-                                )
-
-                        # -------------------------------------------------------
-                        # Data page 70 Request data page
-                        # -------------------------------------------------------
-                        elif DataPageNumber == 70:
-                            (
-                                _SlaveSerialNumber,
-                                _DescriptorByte1,
-                                _DescriptorByte2,
-                                _AckRequired,
-                                NrTimes,
-                                RequestedPageNumber,
-                                _CommandType,
-                            ) = ant.msgUnpage70_RequestDataPage(info)
-
-                            info = False
-                            if RequestedPageNumber == 71:
-                                info = ant.msgPage71_CommandStatus(
-                                    ant.channel_CTRL,
-                                    ctrl_p71_LastReceivedCommandID,
-                                    ctrl_p71_SequenceNr,
-                                    ctrl_p71_CommandStatus,
-                                    ctrl_p71_Data1,
-                                    ctrl_p71_Data2,
-                                    ctrl_p71_Data3,
-                                    ctrl_p71_Data4,
-                                )
-                            else:
-                                error = "Requested page not suported"
-
-                            if info != False:
-                                data = []
-                                d = ant.ComposeMessage(ant.msgID_BroadcastData, info)
-                                while NrTimes:
-                                    data.append(d)
-                                    NrTimes -= 1
-                                AntDongle.Write(data, False)
-
-                        # -------------------------------------------------------
-                        # Other data pages
-                        # -------------------------------------------------------
-                        else:
-                            error = "Unknown Control data page"
-
-                    # -----------------------------------------------------------
-                    # Unknown channel
-                    # -----------------------------------------------------------
-                    else:
-                        error = "Unknown channel"
-
-                # ---------------------------------------------------------------
-                # BroadcastData = Master -> Slave
-                #       channel_HRM_s = Heartbeat received from HRM
-                #       channel_SCS_s = Speed/Cadence received from SCS
-                # ---------------------------------------------------------------
-                elif id == ant.msgID_BroadcastData:
-                    # -----------------------------------------------------------
-                    # Heart Rate Monitor inputs
-                    # -----------------------------------------------------------
-                    if Channel == ant.channel_HRM_s:
-                        # -------------------------------------------------------
-                        # Ask what device is paired
-                        # -------------------------------------------------------
-                        if not AntHRMpaired:
-                            msg = ant.msg4D_RequestMessage(
-                                ant.channel_HRM_s, ant.msgID_ChannelID
-                            )
-                            AntDongle.Write([msg], False)
-
-                        # -------------------------------------------------------
-                        # Data page 0...4 HRM data
-                        # Only expected when -H flag specified
-                        # -------------------------------------------------------
-                        if DataPageNumber & 0x7F in (0, 1, 2, 3, 4, 5, 6, 7, 89, 95):
-                            if clv.hrm >= 0:
-                                (
-                                    _Channel,
-                                    _DataPageNumber,
-                                    _Spec1,
-                                    _Spec2,
-                                    _Spec3,
-                                    _HeartBeatEventTime,
-                                    _HeartBeatCount,
-                                    HeartRate,
-                                ) = ant.msgUnpage_Hrm(info)
-                                # print('Set heartrate from HRM', HeartRate)
-
-                            else:
-                                pass  # Ignore it
-
-                        # -------------------------------------------------------
-                        # Data page 89 (HRM strap Garmin#3), 95(HRM strap Garmin#4)
-                        # Added to previous set, provides HR info
-                        # -------------------------------------------------------
-                        elif DataPageNumber in (89, 95):
-                            pass  # Ignore it
-
-                        # -------------------------------------------------------
-                        # Other data pages
-                        # -------------------------------------------------------
-                        else:
-                            error = "Unknown HRM data page"
-
-                    # -----------------------------------------------------------
-                    # Speed Cadence Sensor inputs
-                    # -----------------------------------------------------------
-                    elif Channel == ant.channel_SCS:
-                        # -------------------------------------------------------
-                        # Data page 0 CSC data
-                        # Only expected when -S flag specified
-                        # -------------------------------------------------------
-                        if False:
-                            pass
-                        # scs                    elif clv.scs >= 0 and DataPageNumber & 0x7f == 0:
-                        # scs                        Channel, DataPageNumber, BikeCadenceEventTime, \
-                        # scs                            CumulativeCadenceRevolutionCount, BikeSpeedEventTime, \
-                        # scs                            CumulativeSpeedRevolutionCount = \
-                        # scs                            ant.msgUnpage0_CombinedSpeedCadence(info)
-                        # scs                        SpeedKmh   = ...
-                        # scs                        Cadence    = ...
-
-                        # -------------------------------------------------------
-                        # Other data pages
-                        # -------------------------------------------------------
-                        else:
-                            error = "Unknown SCS data page"
-
-                    # -----------------------------------------------------------
-                    # Unknown channel
-                    # -----------------------------------------------------------
-                    else:
-                        error = "Unknown channel"
-
-                # ---------------------------------------------------------------
-                # ChannelID - the info that a master on the network is paired
-                # ---------------------------------------------------------------
-                elif id == ant.msgID_ChannelID:
-                    (
-                        Channel,
-                        DeviceNumber,
-                        DeviceTypeID,
-                        _TransmissionType,
-                    ) = ant.unmsg51_ChannelID(info)
-
-                    if DeviceNumber == 0:  # No device paired, ignore
-                        pass
-
-                    elif (
-                        Channel == ant.channel_HRM_s
-                        and DeviceTypeID == ant.DeviceTypeID_HRM
-                    ):
-                        AntHRMpaired = True
-                        FortiusAntGui.SetMessages(
-                            HRM="Heart Rate Monitor paired: %s" % DeviceNumber
-                        )
-
-                    elif Channel == ant.channel_CTRL:
-                        pass  # Ignore since 2022-08-22; to be investigated
-                        # Obviously message was dropped before
-
-                    else:
-                        logfile.Console(
-                            "Unexpected device %s on channel %s"
-                            % (DeviceNumber, Channel)
-                        )
-
-                # ---------------------------------------------------------------
-                # Message ChannelResponse, acknowledges a message
-                # ---------------------------------------------------------------
-                elif id == ant.msgID_ChannelResponse:
-                    (
-                        Channel,
-                        _InitiatingMessageID,
-                        _ResponseCode,
-                    ) = ant.unmsg64_ChannelResponse(info)
-                    pass
-
-                # ---------------------------------------------------------------
-                # Message BurstData, ignored
-                # ---------------------------------------------------------------
-                elif id == ant.msgID_BurstData:
-                    pass
-
-                else:
-                    error = "Unknown message ID"
+                if id == ant.msgID_AcknowledgedData and Channel == ant.channel_FE:
+                    antEvent = True
+                    CTPcommandTime = time.time()
 
                 # ---------------------------------------------------------------
                 # Unsupported channel, message or page can be silently ignored
                 # Show WHAT we ignore, not to be blind for surprises!
                 # ---------------------------------------------------------------
-                if error and (PrintWarnings or debug.on(debug.Data1)):
+                if not handled and (PrintWarnings or debug.on(debug.Data1)):
                     logfile.Write(
-                        "ANT Dongle:%s: synch=%s, len=%2s, id=%s, check=%s, channel=%s, page=%s(%s) info=%s"
+                        "ANT Dongle:Unhandled message: id=%s, channel=%s, page=%s(%s) info=%s"
                         % (
-                            error,
-                            synch,
-                            length,
                             hex(id),
-                            checksum,
                             Channel,
                             DataPageNumber,
                             hex(DataPageNumber),
@@ -2184,6 +1759,35 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
                         )
                     )
 
+                # ---------------------------------------------------------------
+                # A new target from CTP is sent to the trainer immediately,
+                # not at the start of the next cycle
+                # ---------------------------------------------------------------
+                if (
+                    handled
+                    and id == ant.msgID_AcknowledgedData
+                    and Channel == ant.channel_FE
+                    and DataPageNumber in (48, 49, 50, 51)
+                ):
+                    TacxTrainer.SendTarget(usbTrainer.modeResistance)
+                    if debug.on(debug.Performance):
+                        logfile.Write(
+                            "Tacx2Dongle; page %s sent to trainer %5.1fms after arrival"
+                            % (
+                                DataPageNumber,
+                                (time.time() - AntDongle.MessageArrivalTime) * 1000,
+                            )
+                        )
+
+            # -------------------------------------------------------------------
+            # Inform user when HRM is paired
+            # -------------------------------------------------------------------
+            if hrm.Paired and not AntHRMpaired:
+                AntHRMpaired = True
+                FortiusAntGui.SetMessages(
+                    HRM="Heart Rate Monitor paired: %s" % hrm.DeviceNumber
+                )
+
             # -------------------------------------------------------------------
             # WAIT untill CycleTime is done
             # -------------------------------------------------------------------
@@ -2209,6 +1813,10 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     except KeyboardInterrupt:
         logfile.Console("Stopped")
 
+    TacxTrainer.StopIOThread()  # modeStop is sent directly
+    if debug.on(debug.Performance):
+        Dispatcher.LogTiming()
+
     rpi.DisplayState(constants.faStopped, TacxTrainer)
     # ---------------------------------------------------------------------------
     # Stop devices, if not reconnecting ANT
@@ -2230,6 +1838,7 @@ def Tacx2DongleSub(FortiusAntGui, Restart):
     # ---------------------------------------------------------------------------
     # Stop devices
     # ---------------------------------------------------------------------------
+    AntDongle.StopWriteThread()
     AntDongle.ResetDongle()
 
     return True
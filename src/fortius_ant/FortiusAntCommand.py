@@ -1,7 +1,10 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-11"
+__version__ = "2026-10-18"
+# 2026-10-18    --capture and --replay added
+#               --extended enables ANT extended messages (RSSI, RX timestamp)
+#               --trainerthread reads/writes the USB trainer in a thread
 # 2023-04-11    --version added
 # 2023-03-15    Typo in message corrected
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
@@ -184,6 +187,10 @@ class CommandLineVariables(object):
     # ---------------------------------------------------------------------------
     SettingsOnly = False  # introduced 2023-02-05; allow program to be launched as settings editor only
     VersionOnly = False  # introduced 2023-04-11; print version and exit
+    AntCapture = None  # introduced 2026-10-18; record ANT traffic in this file
+    AntReplay = None  # introduced 2026-10-18; replay ANT traffic from this file
+    AntExtended = False  # introduced 2026-10-18; ANT RSSI and RX timestamps
+    TrainerThread = False  # introduced 2026-10-18; USB trainer I/O in a thread
 
     # ---------------------------------------------------------------------------
     # Define and process command line
@@ -505,6 +512,21 @@ class CommandLineVariables(object):
         parser.add_argument(
             "--version", dest="VersionOnly", required=False, action="store_true"
         )
+        parser.add_argument(
+            "--capture", dest="AntCapture", metavar="file", required=False
+        )
+        parser.add_argument(
+            "--replay", dest="AntReplay", metavar="file", required=False
+        )
+        parser.add_argument(
+            "--extended", dest="AntExtended", required=False, action="store_true"
+        )
+        parser.add_argument(
+            "--trainerthread",
+            dest="TrainerThread",
+            required=False,
+            action="store_true",
+        )
         # -----------------------------------------------------------------------
         # Parse command line
         # Overwrite from json file if present
@@ -1091,6 +1113,10 @@ class CommandLineVariables(object):
 
         self.SettingsOnly = self.args.SettingsOnly
         self.VersionOnly = self.args.VersionOnly
+        self.AntCapture = self.args.AntCapture
+        self.AntReplay = self.args.AntReplay
+        self.AntExtended = self.args.AntExtended
+        self.TrainerThread = self.args.TrainerThread
 
     def print(self):
         try:
@@ -1,10 +1,13 @@
 """FortiusANT program."""
 __all__ = [
     "antCTRL",
+    "antDispatcher",
     "antDongle",
     "antFE",
     "antHRM",
+    "antLoopback",
     "antPWR",
+    "antScheduler",
     "antSCS",
     "bleBleak",
     "bleBlessClass",
@@ -21,11 +24,13 @@ __all__ = [
     "FortiusAnt",
     "fxload",
     "logfile",
+    "physics",
     "RadarGraph",
     "raspberry",
     "settings",
     "structConstants",
     "TCXexport",
+    "usbDevices",
     "usbTrainer",
 ]
 
@@ -2,12 +2,18 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-15"
+__version__ = "2026-10-18"
+# 2026-10-18    Handlers for the control commands (moved from FortiusAntBody),
+#               registered with clsAntDispatcher by RegisterHandlers()
+#               Requested pages are sent with AntDongle.Send() at
+#               WritePriorityRequested.
 # 2023-04-15    Improve flake8 compliance
 # 2020-12-27    Interleave like antPWR.py
 # 2020-12-14    First version, obtained from switchable
 # -------------------------------------------------------------------------------
 import fortius_ant.antDongle as ant
+import fortius_ant.debug as debug
+import fortius_ant.logfile as logfile
 
 # ---------------------------------------------------------------------------
 # ANT+ Control command codes
@@ -42,12 +48,37 @@ CommandName = {
 
 Interleave = None
 
+# Command status data, returned in page 71
+p71_LastReceivedCommandID = None
+p71_SequenceNr = None
+p71_CommandStatus = None
+p71_Data1 = None
+p71_Data2 = None
+p71_Data3 = None
+p71_Data4 = None
+
+Commands = None  # Containing tuples (manufacturer, serial, CommandNr)
+
+AntDongle = None  # Set by RegisterHandlers()
+
 
 def Initialize():
     """Initialize interface."""
-    global Interleave
+    global Interleave, Commands
+    global p71_LastReceivedCommandID, p71_SequenceNr, p71_CommandStatus
+    global p71_Data1, p71_Data2, p71_Data3, p71_Data4
     Interleave = 0
 
+    p71_LastReceivedCommandID = 255
+    p71_SequenceNr = 255
+    p71_CommandStatus = 255
+    p71_Data1 = 0xFF
+    p71_Data2 = 0xFF
+    p71_Data3 = 0xFF
+    p71_Data4 = 0xFF
+
+    Commands = []
+
 
 def BroadcastControlMessage():
     """Create control message.
@@ -99,6 +130,105 @@ def BroadcastControlMessage():
     return rtn
 
 
+# -------------------------------------------------------------------------------
+# R e g i s t e r H a n d l e r s
+# -------------------------------------------------------------------------------
+# input:        Dispatcher, clsAntDispatcher
+#               pAntDongle, used to reply on page 70
+#
+# Description:  The commands from an ANT+ control are received as
+#               AcknowledgedData on the Control channel.
+# -------------------------------------------------------------------------------
+def RegisterHandlers(Dispatcher, pAntDongle):
+    """Register the control command handlers."""
+    global AntDongle
+    AntDongle = pAntDongle
+
+    Dispatcher.Register(
+        ant.msgID_AcknowledgedData, ant.channel_CTRL, 73, HandleGenericCommand
+    )
+    Dispatcher.Register(
+        ant.msgID_AcknowledgedData, ant.channel_CTRL, 70, HandleRequestDataPage
+    )
+    Dispatcher.Register(ant.msgID_ChannelID, ant.channel_CTRL, None, HandleChannelID)
+
+
+# -------------------------------------------------------------------------------
+# Data page 73 (0x53) Generic Command
+# -------------------------------------------------------------------------------
+def HandleGenericCommand(_id, _Channel, DataPageNumber, info):
+    """Handle page 73, store the command in Commands[]."""
+    global p71_LastReceivedCommandID, p71_SequenceNr, p71_CommandStatus
+    global p71_Data1, p71_Data2, p71_Data3, p71_Data4
+    (
+        SlaveSerialNumber,
+        SlaveManufacturerID,
+        SequenceNr,
+        CommandNr,
+    ) = ant.msgUnpage73_GenericCommand(info)
+
+    # Update "last command" data in case page 71 is requested later
+    p71_LastReceivedCommandID = DataPageNumber
+    p71_SequenceNr = SequenceNr
+    p71_CommandStatus = 0  # successfully processed
+    p71_Data1 = CommandNr & 0x00FF
+    p71_Data2 = (CommandNr & 0xFF00) >> 8
+    p71_Data3 = 0xFF
+    p71_Data4 = 0xFF
+
+    # ---------------------------------------------------------------------------
+    # Commands should not overwrite, therefore stored in a table as tuples.
+    # ---------------------------------------------------------------------------
+    Commands.append((SlaveManufacturerID, SlaveSerialNumber, CommandNr))
+    if debug.on(debug.Application):
+        logfile.Print(
+            f"ANT+ Control {SlaveManufacturerID} {SlaveSerialNumber}: Received command {CommandNr} = {CommandName.get(CommandNr, 'Unknown')} "
+        )
+    return True
+
+
+# -------------------------------------------------------------------------------
+# Data page 70 Request data page
+# -------------------------------------------------------------------------------
+def HandleRequestDataPage(_id, _Channel, _DataPageNumber, info):
+    """Handle page 70, only page 71 can be requested."""
+    (
+        _SlaveSerialNumber,
+        _DescriptorByte1,
+        _DescriptorByte2,
+        _AckRequired,
+        NrTimes,
+        RequestedPageNumber,
+        _CommandType,
+    ) = ant.msgUnpage70_RequestDataPage(info)
+
+    if RequestedPageNumber == 71:
+        info = ant.msgPage71_CommandStatus(
+            ant.channel_CTRL,
+            p71_LastReceivedCommandID,
+            p71_SequenceNr,
+            p71_CommandStatus,
+            p71_Data1,
+            p71_Data2,
+            p71_Data3,
+            p71_Data4,
+        )
+        d = ant.ComposeMessage(ant.msgID_BroadcastData, info)
+        AntDongle.Send([d] * NrTimes, ant.WritePriorityRequested)
+
+    elif debug.on(debug.Data1):
+        logfile.Write("Control requested page %s not supported" % RequestedPageNumber)
+    return True
+
+
+# -------------------------------------------------------------------------------
+# ChannelID
+# -------------------------------------------------------------------------------
+def HandleChannelID(_id, _Channel, _DataPageNumber, _info):
+    """Ignore the ChannelID."""
+    return True  # Ignore since 2022-08-22; to be investigated
+
+
 # -------------------------------------------------------------------------------
 # Main program for module test
 # -------------------------------------------------------------------------------
@@ -0,0 +1,140 @@
+"""Route received ANT messages to the handlers registered by the ANT modules."""
+
+# -------------------------------------------------------------------------------
+# Version info
+# -------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version, replaces the if/elif chain in Tacx2DongleSub()
+# -------------------------------------------------------------------------------
+import time
+
+import fortius_ant.antDongle as ant
+import fortius_ant.debug as debug
+import fortius_ant.logfile as logfile
+
+# -------------------------------------------------------------------------------
+# Messages that carry a data page; for other messages the DataPageNumber is
+# not part of the key.
+# -------------------------------------------------------------------------------
+DataMessages = (
+    ant.msgID_BroadcastData,
+    ant.msgID_AcknowledgedData,
+    ant.msgID_BurstData,
+)
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t D i s p a t c h e r
+# -------------------------------------------------------------------------------
+# Description   A handler is registered for (MessageID, Channel, DataPageNumber)
+#               where Channel and DataPageNumber can be None (= any).
+#
+#               Dispatch() decomposes a message once and calls the handlers of
+#               the most specific key first:
+#                   (MessageID, Channel, DataPageNumber)
+#                   (MessageID, Channel, None)
+#                   (MessageID, None,    None)
+#               until a handler returns True (= handled).
+#
+#               A handler is called as
+#                   Handler(id, Channel, DataPageNumber, info)
+#               with the values as returned by ant.DecomposeMessage().
+#
+#               When debug.Performance is on, the time spent per handler is
+#               accumulated and can be written with LogTiming().
+# -------------------------------------------------------------------------------
+class clsAntDispatcher:
+    def __init__(self):
+        self.Handlers = {}
+        self.HandlerTime = {}  # name: [calls, seconds]
+
+    # ---------------------------------------------------------------------------
+    # R e g i s t e r
+    # ---------------------------------------------------------------------------
+    # input     MessageID, Channel, DataPageNumber; Channel/DataPageNumber None
+    #           means that the handler is called for any channel/page
+    #           Handler, function returning True when the message is handled
+    #
+    # function  Add the handler; handlers for the same key are called in the
+    #           order they are registered.
+    # ---------------------------------------------------------------------------
+    def Register(self, MessageID, Channel, DataPageNumber, Handler):
+        if debug.on(debug.Function):
+            logfile.Write(
+                "AntDispatcher.Register(%s, %s, %s, %s)"
+                % (hex(MessageID), Channel, DataPageNumber, Handler.__qualname__)
+            )
+        key = (MessageID, Channel, DataPageNumber)
+        self.Handlers.setdefault(key, []).append(Handler)
+
+    # ---------------------------------------------------------------------------
+    # D i s p a t c h
+    # ---------------------------------------------------------------------------
+    # input     d, a complete ANT message
+    #
+    # function  Call the registered handlers, see class description
+    #
+    # returns   id, Channel, DataPageNumber, info, handled
+    # ---------------------------------------------------------------------------
+    def Dispatch(self, d):
+        (
+            _synch,
+            _length,
+            id,
+            info,
+            _checksum,
+            _rest,
+            Channel,
+            DataPageNumber,
+        ) = ant.DecomposeMessage(d)
+
+        if id in DataMessages:
+            keys = (
+                (id, Channel, DataPageNumber),
+                (id, Channel, None),
+                (id, None, None),
+            )
+        else:
+            keys = ((id, Channel, None), (id, None, None))
+
+        handled = False
+        for key in keys:
+            handlers = self.Handlers.get(key)
+            if handlers:
+                for Handler in handlers:
+                    if debug.on(debug.Performance):
+                        StartTime = time.perf_counter()
+                        handled = Handler(id, Channel, DataPageNumber, info)
+                        self._Timing(Handler, time.perf_counter() - StartTime)
+                    else:
+                        handled = Handler(id, Channel, DataPageNumber, info)
+                    if handled:
+                        return id, Channel, DataPageNumber, info, True
+
+        return id, Channel, DataPageNumber, info, False
+
+    def _Timing(self, Handler, seconds):
+        t = self.HandlerTime.setdefault(Handler.__qualname__, [0, 0])
+        t[0] += 1
+        t[1] += seconds
+
+    # ---------------------------------------------------------------------------
+    # L o g T i m i n g
+    # ---------------------------------------------------------------------------
+    # function  Write the accumulated time per handler to the logfile
+    # ---------------------------------------------------------------------------
+    def LogTiming(self):
+        for name, (calls, seconds) in sorted(self.HandlerTime.items()):
+            logfile.Write(
+                "AntDispatcher: %-45s %6d calls, %8.3fms total, %6.3fms average"
+                % (name, calls, seconds * 1000, seconds * 1000 / calls)
+            )
+
+
+# -------------------------------------------------------------------------------
+# H a n d l e   I g n o r e
+# -------------------------------------------------------------------------------
+# A handler for messages that are silently ignored (e.g. ChannelResponse)
+# -------------------------------------------------------------------------------
+def HandleIgnore(_id, _Channel, _DataPageNumber, _info):
+    return True
@@ -1,7 +1,90 @@
 # ---------------------------------------------------------------------------
 # Version info
 # ---------------------------------------------------------------------------
-__version__ = "2023-03-15"
+__version__ = "2026-10-18"
+# 2026-10-18    clsAntFrameReassembler added; _Read() keeps a message that is
+#               split over two .read() calls instead of dropping it.
+#               Synch searched with find(), checksum without per-byte loop.
+#               SkippedBytes and ChecksumErrors are counted.
+#               clsAntCodec added; every message/page has one precompiled
+#               struct.Struct, registered in AntCodecs[] by (MessageID,
+#               DataPageNumber, DeviceTypeID). The msg/msgPage/msgUnpage
+#               functions are thin wrappers around the codecs.
+#               The message queue is used without extra lock (queue.Queue is
+#               thread-safe); WaitForMessage() and Messages() wait for a
+#               message to arrive, MessageArrivalTime is stored per message.
+#               ConfigureChannels() sends the channel configuration pipelined,
+#               matches each command to its Channel Response and resends only
+#               the failed commands. *_ChannelConfig() use it and can be
+#               batched with Begin/EndChannelConfig().
+#               After a reset, WaitForStartUp() waits for the StartUp message
+#               instead of a fixed 500ms; used by __GetDongle() (so also on
+#               reconnect) and ResetDongle(). Only the messages read while
+#               waiting are discarded, the queue is kept.
+#               EVENT_TX added, used by antScheduler.
+#               Burst transfer: ComposeBurst() and SendBurst() to send,
+#               clsAntBurstReassembler to receive with sequence check.
+#               The configuration messages are kept in a Journal that is
+#               replayed after a reconnect; DongleReconnected is only raised
+#               (and the application restarted) when that fails.
+#               Only acknowledged messages are journaled; during reconnect and
+#               replay, the other threads wait before writing (_WriteLock).
+#               The responses to the replay are read into a list of their own,
+#               so that the application does not take them from the queue.
+#               StopReadThread() can be called from the ReadThread itself.
+#               clsAntDonglePool uses several dongles as one, with the
+#               channels spread over the dongles (as many as each dongle
+#               reports in its Capabilities). Each dongle journals and
+#               replays its own part of the configuration.
+#               StartCapture() records the ANT traffic in a binary file,
+#               clsReplayAntDongle plays such a capture back.
+#               clsAntDongle(Devices=[...]) uses the given pyusb-like devices
+#               (e.g. antLoopback.clsLoopbackDevice) instead of usb.core.find().
+#               _Read() returns when StopReadThread() is called, also when
+#               the dongle keeps sending data.
+#               ReadThread() blocks ReadThreadTimeout (1s) per read instead of
+#               20ms; StopReadThread() wakes it with a request to the dongle
+#               (when that fails, the wait for the thread is bounded).
+#               The wake-up is written under the _WriteLock, counted and
+#               captured; its response is not put in the queue.
+#               Wakeups and IdleWakeups count the reads, see
+#               IdleWakeupsPerSecond().
+#               clsAsyncAntDongle: Send() and Frames() for asyncio, reading
+#               the dongle in an executor instead of the ReadThread.
+#               clsAntWriteQueue: Send() puts messages in a queue with
+#               priorities (config/acknowledged, requested pages, broadcasts)
+#               that is written by one thread, see StartWriteThread(); only the
+#               newest broadcast per channel is kept. The queue is paused by
+#               ResetDongle() and during a reconnect, and resumed when the
+#               channels are configured again.
+#               clsAntStatistics counts per channel the frames received and
+#               sent, the pages and RF events, plus the queue high-water mark
+#               and the queue latency; see Statistics.Snapshot(), written to
+#               the logfile every StatisticsInterval seconds.
+#               clsAntPoolStatistics adds up the statistics of the dongles of
+#               a clsAntDonglePool.
+#               Dongles are found with usbDevices.Find(), one USB scan for all
+#               dongle types (and the trainer); rescan only on reconnect.
+#               ScanMode_ChannelConfig() opens channel 0 in continuous scan
+#               mode with extended messages (channel ID); clsAntInventory
+#               keeps the masters received that way.
+#               LibConfig (set before Calibrate()) enables extended messages
+#               with channel ID, RSSI and/or RX timestamp. DecomposeMessage()
+#               removes the extension from info, unmsgExtended() parses it.
+#               With RX timestamps, clsAntRxClock converts them to host time
+#               and MessageArrivalTime is the time the message was received
+#               by the dongle, instead of the time it was read from USB; only
+#               data messages (ExtendedMessageIDs) have an RX timestamp.
+#               This is plumbing only: MessageArrivalTime is used for the
+#               latency measurements (queue latency, ChannelSetupTime, FE
+#               target latency); no handler (HRM, SCS, Vortex, BlackTrack)
+#               uses the RX time yet.
+#               StartTrace(): with debug.Data1 the messages are written to a
+#               binary trace by a thread (clsAntTrace) instead of formatted by
+#               DongleDebugMessage(); DecodeTrace() or
+#               "python -m fortius_ant.antDongle <trace>" makes the text.
+#               While tracing, the per-message text logging of _Read(),
+#               MessageQueuePut() and WaitForMessage() is skipped as well.
 # 2023-03-15    Even when there is no ANT-dongle, the message queue must be
 #               created, so that MessageQueueSize() returns zero.
 # 2022-08-22    Data from the ANT dongle is stored in a queue.
@@ -119,6 +202,9 @@ from pyexpat.errors import messages
 if platform.system() == "False":
     import serial  # pylint: disable=import-error
 
+import asyncio
+import collections
+import mmap
 import queue
 import struct
 import threading
@@ -130,6 +216,7 @@ import fortius_ant.debug as debug
 import fortius_ant.FortiusAntCommand as cmd
 import fortius_ant.logfile as logfile
 import fortius_ant.structConstants as sc
+import fortius_ant.usbDevices as usbDevices
 
 # ---------------------------------------------------------------------------
 # Our own choice what channels are used
@@ -332,9 +419,21 @@ msgID_ChannelID = 0x51  # Set, but also receive master channel - but how/when?
 msgID_ChannelTransmitPower = 0x60
 
 msgID_StartUp = 0x6F
+msgID_OpenRxScanMode = 0x5B
+msgID_LibConfig = 0x6E
 
 msgID_BurstData = 0x50
 
+# D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf 9.5.6.1 Channel response
+RESPONSE_NO_ERROR = 0x00
+EVENT_RX_SEARCH_TIMEOUT = 0x01  # Slave channel did not find a master
+EVENT_RX_FAIL = 0x02  # Slave channel missed a message
+EVENT_TX = 0x03  # Broadcast message sent, next message can be loaded
+EVENT_TRANSFER_TX_COMPLETED = 0x05  # Burst sent
+EVENT_TRANSFER_TX_FAILED = 0x06  # Burst failed, must be sent again
+EVENT_CHANNEL_CLOSED = 0x07
+EVENT_RX_FAIL_GO_TO_SEARCH = 0x08  # Slave channel lost the master
+
 # profile.xlsx: antplus_device_type
 DeviceTypeID_antfs = 1
 DeviceTypeID_bike_power = 11
@@ -394,6 +493,205 @@ RfFrequency_2466Mhz = 66  # used for Tacx Vortex only
 RfFrequency_2478Mhz = 0x4E  # used for Tacx Vortex Headunit
 
 
+# ---------------------------------------------------------------------------
+# c l s A n t F r a m e R e a s s e m b l e r
+# ---------------------------------------------------------------------------
+# function  Cut the byte-stream, as returned by devAntDongle.read(), into
+#           ANT messages: synch, length, id, info, checksum
+#
+#           A message may be split over two .read() calls; the incomplete
+#           tail of a buffer is kept and completed by the next Feed().
+#           The synch-byte is searched with bytes.find() and the checksum is
+#           calculated without a byte-by-byte loop (see _XorFold).
+#
+#           The returned messages are memoryviews on the received buffer,
+#           there is no copy per message. A view remains valid after the
+#           next Feed(), because every Feed() works on a new buffer.
+#
+# attributes
+#           SkippedBytes    nr of bytes skipped because synch was expected
+#           ChecksumErrors  nr of messages dropped because of bad checksum
+#           Messages        nr of messages correctly received
+#
+# functions Feed(data)      returns a list of complete, valid messages
+#           Reset()         drop incomplete data, e.g. after dongle reset
+# ---------------------------------------------------------------------------
+class clsAntFrameReassembler:
+    # -----------------------------------------------------------------------
+    # Largest info-length we accept; a larger length-byte means that the
+    # 0xa4 found is not a synch-byte but data (Rev 5.1, 7.1 max 41 bytes)
+    # -----------------------------------------------------------------------
+    MaxInfoLength = 41
+
+    def __init__(self):
+        self._Pending = b""  # Incomplete message from previous Feed()
+        self.SkippedBytes = 0
+        self.ChecksumErrors = 0
+        self.Messages = 0
+
+    def Reset(self):
+        self._Pending = b""
+
+    def Feed(self, data):
+        # -------------------------------------------------------------------
+        # Add the new data to what remains from the previous call
+        # bytes(data) returns data itself when it's bytes already
+        # -------------------------------------------------------------------
+        if self._Pending:
+            buffer = self._Pending + bytes(data)
+        else:
+            buffer = bytes(data)
+        view = memoryview(buffer)
+
+        rtn = []
+        end = len(buffer)
+        start = 0
+        while start < end:
+            # ---------------------------------------------------------------
+            # Each message starts with a4; skip characters if not
+            # ---------------------------------------------------------------
+            synch = buffer.find(0xA4, start)
+            if synch == -1:
+                synch = end
+            if synch != start:
+                self.SkippedBytes += synch - start
+                logfile.Console("Dongle.Read: %s characters skipped " % (synch - start))
+                start = synch
+                if start == end:
+                    break
+
+            # ---------------------------------------------------------------
+            # Second character is length of the info; add four for synch,
+            # len, id and checksum. Wait for next Feed() if incomplete.
+            # ---------------------------------------------------------------
+            if start + 1 == end:
+                break
+            length = buffer[start + 1]
+            if length > self.MaxInfoLength:
+                self.SkippedBytes += 1  # Not a synch-byte, find next one
+                start += 1
+                continue
+            length += 4
+            if start + length > end:
+                break
+
+            # ---------------------------------------------------------------
+            # Check checksum; when incorrect the message is dropped and the
+            # next synch-byte is searched AFTER the current one, so that a
+            # corrupted length does not cause good messages to be skipped.
+            # ---------------------------------------------------------------
+            d = view[start : start + length]
+            if _XorFold(d) != 0:  # Checksum included ==> xor = zero
+                self.ChecksumErrors += 1
+                logfile.Console(
+                    "Dongle.Read: error: checksum incorrect checksum=%s expected=%s data=%s"
+                    % (
+                        logfile.HexSpace(bytes(d[-1:])),
+                        logfile.HexSpace(CalcChecksum(d)),
+                        logfile.HexSpace(bytes(d)),
+                    )
+                )
+                start += 1
+                continue
+
+            self.Messages += 1
+            rtn.append(d)
+            start += length
+
+        # -------------------------------------------------------------------
+        # Keep the incomplete message (a copy, only a few bytes)
+        # -------------------------------------------------------------------
+        self._Pending = buffer[start:]
+        if self._Pending and debug.on(debug.Data1):
+            logfile.Write(
+                "Dongle.Read: %s characters kept for next read" % len(self._Pending)
+            )
+        return rtn
+
+
+# ---------------------------------------------------------------------------
+# c l s A n t B u r s t R e a s s e m b l e r
+# ---------------------------------------------------------------------------
+# function  Collect the packets of a burst (msgID_BurstData) per channel and
+#           return the complete payload when the last packet is received.
+#
+#           A burst starts with sequence number 0, followed by 1, 2, 3, 1, ..
+#           If a packet is missing, the burst is incomplete and dropped; a
+#           new burst starts with the next packet with sequence number 0.
+#
+#           The packets are collected in a list and joined once at the end,
+#           so a long burst is not copied for every packet.
+#
+# attributes
+#           Bursts          nr of complete bursts
+#           SequenceErrors  nr of bursts dropped because of a missing packet
+#
+# functions Feed(info)      returns (Channel, Payload) for a complete burst,
+#                           otherwise None
+#           Register(Channel, Handler)
+#                           Handler(Channel, Payload) is called for a
+#                           complete burst on Channel
+#           HandleBurst()   to be registered with clsAntDispatcher for
+#                           msgID_BurstData
+# ---------------------------------------------------------------------------
+class clsAntBurstReassembler:
+    def __init__(self):
+        self._Packets = {}  # Channel: list of Data
+        self._Expected = {}  # Channel: next SequenceNumber
+        self.Handlers = {}  # Channel: Handler
+        self.Bursts = 0
+        self.SequenceErrors = 0
+
+    def Reset(self):
+        self._Packets = {}
+        self._Expected = {}
+
+    def Register(self, Channel, Handler):
+        self.Handlers[Channel] = Handler
+
+    def Feed(self, info):
+        Channel, SequenceNumber, Data = unmsg50_BurstData(info)
+        Last = SequenceNumber & BurstLastPacket
+        SequenceNumber &= 0b011
+
+        if SequenceNumber == 0:
+            if Channel in self._Packets:
+                self.SequenceErrors += 1  # Previous burst not completed
+            self._Packets[Channel] = [Data]
+        elif Channel in self._Packets and SequenceNumber == self._Expected[Channel]:
+            self._Packets[Channel].append(Data)
+        else:
+            if Channel in self._Packets:
+                del self._Packets[Channel]
+                self.SequenceErrors += 1
+            if debug.on(debug.Data1):
+                logfile.Write(
+                    "AntBurst: channel %s, packet %s unexpected, burst dropped"
+                    % (Channel, SequenceNumber)
+                )
+            return None
+
+        if Last:
+            self.Bursts += 1
+            return Channel, b"".join(self._Packets.pop(Channel))
+
+        self._Expected[Channel] = SequenceNumber % 3 + 1  # 1, 2, 3, 1, ...
+        return None
+
+    def HandleBurst(self, _id, _Channel, _DataPageNumber, info):
+        rtn = self.Feed(info)
+        if rtn is not None:
+            Channel, Payload = rtn
+            if debug.on(debug.Data1):
+                logfile.Write(
+                    "AntBurst: channel %s, %s bytes received" % (Channel, len(Payload))
+                )
+            Handler = self.Handlers.get(Channel)
+            if Handler is not None:
+                Handler(Channel, Payload)
+        return True
+
+
 # ---------------------------------------------------------------------------
 # c l s A n t D o n g l e
 # ---------------------------------------------------------------------------
@@ -415,22 +713,67 @@ class clsAntDongle:
 
     # Messages are store in a queue since 22-8-2022
     _MessageQueue = None
-    _MessageLock = None
+    MessageArrivalTime = 0  # time.time() of the last message from the queue
+    # ... the RX time with LibConfig_Timestamp, for latency measurements
+
+    # Received data is cut into messages by the reassembler
+    Reassembler = None
 
     # Read messages in a separate thread
     UseThread = True  # "Compile time" flag to use threading
     ThreadActive = False  # "Run time" flag that threading active
     MessageThread = None  # The thread handle
+    ReadThreadTimeout = 1000  # ms that ReadThread() blocks, see StopReadThread()
+    ReadThreadStart = 0  # time.monotonic() when ReadThread() started
+    Wakeups = 0  # Number of reads from the dongle
+    IdleWakeups = 0  # ... that returned no data
+    _WakeResponse = False  # Capabilities requested by _WakeReadThread()
+
+    # Channel configuration, see ConfigureChannels()
+    ConfigTimeout = 0.5  # Seconds to wait for a channel response
+    ConfigRetries = 2  # Failed steps are sent again, this many times
+    ConfigWindow = 8  # Maximum nr of commands waiting for a response
+    _ConfigBatch = None  # Collected by BeginChannelConfig()
+
+    # Reset, see WaitForStartUp()
+    ResetTimeout = 0.5  # Max seconds to wait for StartUp after a reset
+    ResetFallback = 0.0  # Extra seconds to wait if StartUp is not received
+    ChannelSetupTime = None  # Channel: seconds from first command to last ack
+    _ResetMessages = None  # Messages read by WaitForStartUp(), not queued
+    _ReplayMessages = None  # (ArrivalTime, message) read by ReplayJournal()
+    Journal = None  # Configuration messages since last reset, see ReplayJournal()
+    _WriteLock = None  # Held while writing, and during reconnect and replay
+
+    Devices = None  # pyusb-like devices to use instead of usb.core.find()
+    WriteQueue = None  # clsAntWriteQueue, see StartWriteThread()
+    Statistics = None  # clsAntStatistics
+    LibConfig = 0  # Extended messages, LibConfig_*, sent by Calibrate()
+    RxClock = None  # clsAntRxClock, for LibConfig_Timestamp
+    StatisticsInterval = 60  # Seconds between the statistics in the logfile
+    Capture = None  # clsAntCapture, see StartCapture()
+    Trace = None  # clsAntTrace, see StartTrace()
+
+    # Member of a clsAntDonglePool
+    ChannelMap = None  # Physical channel: logical (pool) channel
+    MaxChannels = None  # From the Capabilities response, see _Read()
+    DevicesInUse = set()  # (bus, address) of the dongles opened in this process
+    _DeviceKey = None
 
     # -----------------------------------------------------------------------
     # _ _ i n i t _ _
     # -----------------------------------------------------------------------
     # Function  Create the class and try to find a dongle
     # -----------------------------------------------------------------------
-    def __init__(self, DeviceID=None):
+    def __init__(self, DeviceID=None, Devices=None):
         self.DeviceID = DeviceID
+        self.Devices = Devices  # Instead of usb.core.find(), e.g. antLoopback
         self._MessageQueue = queue.Queue()  # Here messages are stored
-        self._MessageLock = threading.Lock()  # This lock protects the queue
+        self.ChannelSetupTime = {}
+        self.Journal = []
+        self._WriteLock = threading.RLock()
+        self.Reassembler = clsAntFrameReassembler()
+        self.Statistics = clsAntStatistics(self)
+        self.RxClock = clsAntRxClock()
         self.OK = True  # Otherwise we're disabled!!
         if self.DeviceID == -1:
             self.OK = False  # No ANT dongle wanted
@@ -456,8 +799,13 @@ class clsAntDongle:
         self.DongleReconnected = False
 
         self.StopReadThread()  # Stop reading in a thread
+        self._WakeResponse = False  # Discarded by WaitForStartUp() anyway
+        self.Reassembler.Reset()  # Partial data is of no use anymore
+        clsAntDongle.DevicesInUse.discard(self._DeviceKey)
 
-        if self.DeviceID == None:
+        if self.Devices is not None:
+            dongles = {(None, "(provided)")}
+        elif self.DeviceID == None:
             dongles = {(4104, "Suunto"), (4105, "Garmin"), (4100, "Older")}
         else:
             dongles = {(self.DeviceID, "(provided)")}
@@ -482,7 +830,10 @@ class clsAntDongle:
                 # Note: filter on idVendor=0x0fcf is removed
                 # -----------------------------------------------------------
                 self.Message = "No (free) ANT-dongle found"
-                devAntDongles = usb.core.find(find_all=True, idProduct=ant_pid)
+                if self.Devices is not None:
+                    devAntDongles = self.Devices
+                else:
+                    devAntDongles = usbDevices.Find(idProduct=ant_pid)
             except Exception as e:
                 logfile.Console("GetDongle - Exception: %s" % e)
                 if "AttributeError" in str(e):
@@ -493,9 +844,12 @@ class clsAntDongle:
                     self.Message = "GetDongle: " + str(e)
             else:
                 # -----------------------------------------------------------
-                # Try all dongles of this type (as returned by usb.core.find)
+                # Try all dongles of this type (as returned by usbDevices.Find)
                 # -----------------------------------------------------------
                 for self.devAntDongle in devAntDongles:
+                    DeviceKey = (self.devAntDongle.bus, self.devAntDongle.address)
+                    if DeviceKey in clsAntDongle.DevicesInUse:
+                        continue  # Opened by another clsAntDongle (pool)
                     if debug.on(debug.Function):
                         s = (
                             "GetDongle - Try dongle: manufacturer=%7s, product=%15s, vendor=%6s, product=%6s(%s)"
@@ -536,44 +890,30 @@ class clsAntDongle:
                             # If not succesfull immediatly, repeat this
                             # As suggested by @martin-vi
                             # ---------------------------------------------------
-                            reset_string = msg4A_ResetSystem()  # reset string probe
-                            # same as ResetDongle()
-                            # done here to have explicit error-handling.
+                            # Same as ResetDongle(), done here to have
+                            # explicit error-handling.
+                            # ---------------------------------------------------
                             if debug.on(debug.Function):
                                 logfile.Write("GetDongle - Send reset string to dongle")
-                            self.devAntDongle.write(0x01, reset_string)
-                            time.sleep(0.500)  # after reset, 500ms before next action
-
-                            if debug.on(debug.Function):
-                                logfile.Write("GetDongle - Read answer")
-                            self.Read(False)
+                            self.devAntDongle.write(0x01, msg4A_ResetSystem())
 
                             if debug.on(debug.Function):
-                                logfile.Write("GetDongle - Check for an ANT+ reply")
+                                logfile.Write("GetDongle - Wait for an ANT+ reply")
                             self.Message = "No expected reply from dongle"
-                            while self.MessageQueueSize() > 0:
-                                s = self.MessageQueueGet()
-                                (
-                                    synch,
-                                    length,
-                                    id,
-                                    _info,
-                                    _checksum,
-                                    _rest,
-                                    _c,
-                                    _d,
-                                ) = DecomposeMessage(s)
-                                if synch == 0xA4 and length == 0x01 and id == 0x6F:
-                                    found_available_ant_stick = True
-                                    self.Message = (
-                                        "Using %s dongle"
-                                        % self.devAntDongle.manufacturer
-                                    )  # dongle[1]
-                                    self.Message = self.Message.replace(
-                                        "\0", ""
-                                    )  # .manufacturer is NULL-terminated
-                                    if "CYCPLUS" in self.Message:
-                                        self.Cycplus = True
+                            if self.WaitForStartUp():
+                                found_available_ant_stick = True
+                                clsAntDongle.DevicesInUse.add(DeviceKey)
+                                self._DeviceKey = DeviceKey
+                                if self.Devices is None:
+                                    usbDevices.Used(self.devAntDongle)
+                                self.Message = (
+                                    "Using %s dongle" % self.devAntDongle.manufacturer
+                                )  # dongle[1]
+                                self.Message = self.Message.replace(
+                                    "\0", ""
+                                )  # .manufacturer is NULL-terminated
+                                if "CYCPLUS" in self.Message:
+                                    self.Cycplus = True
 
                             # ---------------------------------------------------
                             # If found, then done - else retry to reset
@@ -615,44 +955,85 @@ class clsAntDongle:
     # -----------------------------------------------------------------------
     # M e s s a g e Q u e u e   P u t   /   G e t   /   S i z e
     # -----------------------------------------------------------------------
-    # input     self._MessageLock
-    #           self._MessageQueue
+    # input     self._MessageQueue
     #
-    # function  Put: add message to   queue, protected by lock
-    #           Get: get message from queue, protected by lock
+    # function  Put: add message to   queue
+    #           Get: get message from queue, without waiting
     #
-    #           The lock is used, so that Put/Get can be called from
-    #           different threads.
+    #           queue.Queue() is thread-safe, so that Put/Get can be called
+    #           from different threads without an additional lock.
+    #           The time of arrival is stored with the message, so that the
+    #           caller can measure the response time.
     #
     # output    self._MessageQueue
+    #           self.MessageArrivalTime     time.time() the message was put
     #
     # returns   Put: None
     #           Get: the next message from the queue (or None)
     # -----------------------------------------------------------------------
-    def MessageQueuePut(self, message):
-        if debug.on(debug.Function):
+    def MessageQueuePut(self, message, ArrivalTime=None):
+        if debug.on(debug.Function) and not self.Trace:
             logfile.Write("MessageQueuePut(%s)" % logfile.HexSpace(message))
-        self._MessageLock.acquire()
-        self._MessageQueue.put(message)
-        self._MessageLock.release()
+        if ArrivalTime is None:
+            ArrivalTime = time.time()
+        self._MessageQueue.put((ArrivalTime, message))
+        self.Statistics.Queued(self._MessageQueue.qsize())
 
     def MessageQueueGet(self):
-        self._MessageLock.acquire()
-        if self.MessageQueueSize():
-            message = self._MessageQueue.get(
-                block=False, timeout=1
-            )  # No timeout in the lock!!
-            self._MessageQueue.task_done()
-        else:
-            message = None
-        self._MessageLock.release()
-        if debug.on(debug.Function):
-            logfile.Write("MessageQueueGet() returns %s" % logfile.HexSpace(message))
-        return message
+        return self.WaitForMessage(0)
 
     def MessageQueueSize(self):
         return self._MessageQueue.qsize()
 
+    # -----------------------------------------------------------------------
+    # W a i t F o r M e s s a g e
+    # -----------------------------------------------------------------------
+    # input     timeout     seconds to wait; <= 0 means do not wait
+    #
+    # function  Get the next message from the queue, blocking until
+    #           ReadThread() delivers one or the timeout expires.
+    #
+    # output    self.MessageArrivalTime
+    #
+    # returns   the message, or None if there is no message
+    # -----------------------------------------------------------------------
+    def WaitForMessage(self, timeout):
+        try:
+            if timeout > 0:
+                self.MessageArrivalTime, message = self._MessageQueue.get(
+                    timeout=timeout
+                )
+            else:
+                self.MessageArrivalTime, message = self._MessageQueue.get_nowait()
+        except queue.Empty:
+            message = None
+        else:
+            self.Statistics.Dequeued(time.time() - self.MessageArrivalTime)
+        if debug.on(debug.Function) and not self.Trace:
+            logfile.Write("WaitForMessage() returns %s" % logfile.HexSpace(message))
+        return message
+
+    # -----------------------------------------------------------------------
+    # M e s s a g e s
+    # -----------------------------------------------------------------------
+    # input     Deadline    time.time() until which messages are waited for
+    #
+    # function  Iterate over the received messages; each message is returned
+    #           as soon as it is received, until the Deadline has passed and
+    #           the queue is empty.
+    #
+    #           for d in AntDongle.Messages(StartTime + CycleTime):
+    #               ...handle message d...
+    #
+    # returns   iterator of messages
+    # -----------------------------------------------------------------------
+    def Messages(self, Deadline):
+        while True:
+            message = self.WaitForMessage(Deadline - time.time())
+            if message is None:
+                return
+            yield message
+
     # -----------------------------------------------------------------------
     # W r i t e
     # -----------------------------------------------------------------------
@@ -689,7 +1070,7 @@ class clsAntDongle:
                 # -----------------------------------------------------------
                 # Logging
                 # -----------------------------------------------------------
-                DongleDebugMessage("Dongle    send   :", message)
+                self._DebugMessage(CaptureSent, "Dongle    send   :", message)
                 if debug.on(debug.Performance):
                     logfile.Write(
                         "devAntDongle.write(0x01,%s) ..." % logfile.HexSpace(message)
@@ -700,14 +1081,22 @@ class clsAntDongle:
                 #       that fails, which is done either here or by application.
                 # -----------------------------------------------------------
                 try:
-                    self.devAntDongle.write(
-                        0x01, message
-                    )  # input:   endpoint address, buffer, timeout
-                    # returns:
+                    with self._WriteLock:  # Not during reconnect, see below
+                        self.devAntDongle.write(
+                            0x01, message
+                        )  # input:   endpoint address, buffer, timeout
+                        # returns:
                 except Exception as e:
                     logfile.Console(
                         "AntDongle.Write exception (message lost): " + str(e)
                     )
+                else:
+                    if self.ChannelMap is None:
+                        self.Statistics.CountSent(message)
+                    else:  # Member of a pool, count the logical channel
+                        self.Statistics.CountSent(MapChannel(message, self.ChannelMap))
+                    if self.Capture:
+                        self.Capture.Write(CaptureSent, message)
 
                 if debug.on(debug.Performance):
                     logfile.Write("... done")
@@ -724,6 +1113,37 @@ class clsAntDongle:
             if receive and not flush:
                 self.Read(drop, 1)  # Shortest possible timeout
 
+    # ---------------------------------------------------------------------------
+    # S e n d
+    # ---------------------------------------------------------------------------
+    # input     messages    to be sent
+    #           Priority    WritePriority*, None = WritePriority(message)
+    #
+    # function  Put the messages in the WriteQueue when the WriteThread is
+    #           started, otherwise Write() them without reading responses.
+    #
+    #           The WriteQueue is paused (and emptied) by ResetDongle() and
+    #           paused during a reconnect; ConfigureChannels() resumes it when
+    #           the channels are configured (EndChannelConfig, ReplayJournal).
+    # ---------------------------------------------------------------------------
+    def Send(self, messages, Priority=None):
+        if self.WriteQueue:
+            self.WriteQueue.Put(messages, Priority)
+        else:
+            self.Write(messages, False)
+
+    def StartWriteThread(self):
+        if self.WriteQueue:
+            self.WriteQueue.Resume()
+        elif self.UseThread and self.OK:
+            self.WriteQueue = clsAntWriteQueue(self)
+            self.WriteQueue.Start()
+
+    def StopWriteThread(self):
+        if self.WriteQueue:
+            self.WriteQueue.Stop()
+            self.WriteQueue = None
+
     # ---------------------------------------------------------------------------
     # R e a d
     # ---------------------------------------------------------------------------
@@ -802,35 +1222,60 @@ class clsAntDongle:
         #
         # Still, this recovery is not useless. The dongle is connected again.
         # the caller must redo the channels.
+        #
+        # Other threads (main thread, WriteThread) do not write to the dongle
+        # while it is reconnected and the journal is replayed; their Write()
+        # waits for the _WriteLock and continues with the restored channels.
         # ----------------------------------------------------------------------
+        InReadThread = failed and self.MessageThread is threading.current_thread()
         while failed:
             logfile.Console("ANT Dongle not available; try to reconnect after 1 second")
             time.sleep(1)
-            if self.__GetDongle():
-                failed = False  # Exception resolved
-                self.DongleReconnected = True
-                logfile.Console("ANT Dongle reconnected, application restarts")
+            usbDevices.Invalidate()  # Dongle has a new address when replugged
+            if self.WriteQueue:
+                self.WriteQueue.Pause()  # Resumed by ReplayJournal()
+            with self._WriteLock:
+                if self.__GetDongle():
+                    failed = False  # Exception resolved
+                    if self.ReplayJournal():
+                        logfile.Console("ANT Dongle reconnected, channels restored")
+                    else:
+                        self.DongleReconnected = True
+                        logfile.Console("ANT Dongle reconnected, application restarts")
+
+                # -----------------------------------------------------------
+                # __GetDongle() stopped the ReadThread; if that's us, we
+                # continue reading.
+                # -----------------------------------------------------------
+                if InReadThread:
+                    self.MessageThread = threading.current_thread()
+                    self.ThreadActive = True
 
         if debug.on(debug.Performance):
             logfile.Write("... done")
         return trv
 
-    def _Read(self, _drop, timeout=20):
+    def _Read(self, _drop, timeout=20, Once=False):
         # -------------------------------------------------------------------
         # Read from antDongle untill no more data (timeout), or error
+        # (or after the first data when Once=True, see clsAsyncAntDongle)
         # Usually, dongle gives one buffer at the time, starting with 0xa4
         # Sometimes, multiple messages are received together on one .read
+        # and sometimes a message is split over two .read's; the
+        # reassembler takes care of both.
         #
         # https://www.thisisant.com/forum/view/viewthread/812
         # -------------------------------------------------------------------
         while self.OK:  # If no dongle ==> no action at all
             trv = self.__ReadAndRetry(timeout)
+            self.Wakeups += 1
             if len(trv) == 0:
+                self.IdleWakeups += 1
                 break
             # --------------------------------------------------------------------------
             # Handle content returned by .__ReadAndRetry()
             # --------------------------------------------------------------------------
-            if debug.on(debug.Data1):
+            if debug.on(debug.Data1) and not self.Trace:
                 logfile.Write(
                     "devAntDongle.__ReadAndRetry() returns %s "
                     % (logfile.HexSpaceL(trv))
@@ -838,63 +1283,44 @@ class clsAntDongle:
 
             if len(trv) > 900:
                 logfile.Console("Dongle.Read() too much data from .read()")
-            start = 0
-            while start < len(trv):
-                error = False
-                # -------------------------------------------------------
-                # Each message starts with a4; skip characters if not
-                # -------------------------------------------------------
-                skip = start
-                while skip < len(trv) and trv[skip] != 0xA4:
-                    skip += 1
-                if skip != start:
-                    logfile.Console(
-                        "Dongle.Read: %s characters skipped " % (skip - start)
-                    )
-                    start = skip
-                # -------------------------------------------------------
-                # Second character in the buffer (element in trv) is length of
-                # the info; add four for synch, len, id and checksum
-                # -------------------------------------------------------
-                if start + 1 < len(trv):
-                    length = trv[start + 1] + 4
-                    if start + length <= len(trv):
-                        # -------------------------------------------------------
-                        # Check length and checksum
-                        # Append to return array when correct
-                        # -------------------------------------------------------
-                        d = bytes(trv[start : start + length])
-                        checksum = d[-1:]
-                        expected = CalcChecksum(d)
-
-                        if expected != checksum:
-                            error = "error: checksum incorrect"
-                            logfile.Console(
-                                "%s checksum=%s expected=%s data=%s"
-                                % (
-                                    error,
-                                    logfile.HexSpace(checksum),
-                                    logfile.HexSpace(expected),
-                                    logfile.HexSpace(d),
-                                )
-                            )
-                        else:
-                            self.MessageQueuePut(d)  # 2022-08-22
-                            # Messages are always stored in the queue and hence never
-                            # dropped because a caller does not handle them.
-                            DongleDebugMessage("Dongle    receive:", d)
-                    else:
-                        error = "error: message exceeds buffer length"
-                        break
+
+            for d in self.Reassembler.Feed(trv):
+                d = bytes(d)  # The queue owns the message
+                if self.Capture:
+                    self.Capture.Write(CaptureReceived, d)
+                if self.ChannelMap is not None:
+                    d = MapChannel(d, self.ChannelMap)  # Member of a pool
+                self.Statistics.CountReceived(d)
+                if d[2] == msgID_Capabilities:
+                    self.MaxChannels = d[3]  # Used by clsAntDonglePool
+                ArrivalTime = None
+                if (
+                    self.LibConfig & LibConfig_Timestamp
+                    and d[1] > 9
+                    and d[2] in ExtendedMessageIDs  # See DecomposeMessage()
+                ):
+                    Timestamp = unmsgExtended(d[3:-1])[2]
+                    if Timestamp is not None:
+                        ArrivalTime = self.RxClock.RxTime(Timestamp, time.time())
+                if self._ResetMessages is not None:
+                    self._ResetMessages.append(d)  # See WaitForStartUp()
+                elif self._ReplayMessages is not None:
+                    if ArrivalTime is None:
+                        ArrivalTime = time.time()
+                    self._ReplayMessages.append((ArrivalTime, d))
+                elif d[2] == msgID_Capabilities and self._WakeResponse:
+                    self._WakeResponse = False  # Not for the application
                 else:
-                    break
-                if error:
-                    logfile.Console("Dongle.Read: %s" % (error))
-                # -------------------------------------------------------
-                # Next buffer in trv
-                # -------------------------------------------------------
-                start += length
-        if self.OK and debug.on(debug.Function):
+                    self.MessageQueuePut(d, ArrivalTime)  # 2022-08-22
+                # Messages are always stored in the queue and hence never
+                # dropped because a caller does not handle them.
+                self._DebugMessage(CaptureReceived, "Dongle    receive:", d)
+            if Once or (
+                not self.ThreadActive
+                and self.MessageThread is threading.current_thread()
+            ):
+                break  # StopReadThread(), even if data keeps coming
+        if self.OK and debug.on(debug.Function) and not self.Trace:
             logfile.Write(
                 "AntDongle.Read: Queue contains %s messages" % self.MessageQueueSize()
             )
@@ -928,10 +1354,27 @@ class clsAntDongle:
         else:
             self._Read(drop, timeout)
 
+    # --------------------------------------------------------------------------
+    # The ReadThread blocks on the read for ReadThreadTimeout, so that it does
+    # not wake up 50 times per second when there is no data. Received data is
+    # returned immediately, so this does not delay the messages.
+    #
+    # A blocking pyusb read cannot be interrupted; StopReadThread() therefore
+    # requests the capabilities of the dongle, the response ends the read.
+    # If that request cannot be written, the read ends after ReadThreadTimeout;
+    # the wait for the thread is bounded, so that a hanging read does not
+    # block the caller forever.
+    # The request is written as any other message (_WriteLock, Statistics,
+    # Capture); the response is not put in the queue.
+    # --------------------------------------------------------------------------
     def ReadThread(self):
+        self.ReadThreadStart = time.monotonic()
+        self.Wakeups = 0
+        self.IdleWakeups = 0
         while self.ThreadActive:
-            # print('*** Thread read message')
-            self._Read(False)
+            self._Read(False, self.ReadThreadTimeout)
+            if time.time() - self.Statistics.LogTime >= self.StatisticsInterval:
+                self.Statistics.Log()
 
     def StopReadThread(self):
         if self.MessageThread:
@@ -940,10 +1383,102 @@ class clsAntDongle:
                     "StopReadThread(): Stop thread reading messages from ANT dongle"
                 )
             self.ThreadActive = False  # Signal thread to stop
-            self.MessageThread.join()  # Wait that thread is stopped
+            if self.MessageThread is not threading.current_thread():
+                self._WakeReadThread()
+                # Wait that thread is stopped
+                self.MessageThread.join(self.ReadThreadTimeout / 1000 + 1)
+                if self.MessageThread.is_alive():
+                    logfile.Console("StopReadThread(): thread did not stop")
             self.MessageThread = None
             if debug.on(debug.Function):
-                logfile.Write("StopReadThread(): Thread stopped")
+                logfile.Write(
+                    "StopReadThread(): Thread stopped, %4.1f idle wakeups/second"
+                    % self.IdleWakeupsPerSecond()
+                )
+
+    def _WakeReadThread(self):
+        message = msg4D_RequestMessage(0, msgID_Capabilities)
+        self._DebugMessage(CaptureSent, "Dongle    send   :", message)
+        self._WakeResponse = True
+        try:
+            with self._WriteLock:
+                self.devAntDongle.write(0x01, message)
+        except Exception as e:  # The read ends at ReadThreadTimeout anyway
+            self._WakeResponse = False
+            logfile.Write(
+                "StopReadThread(): wake-up failed, read ends within %sms: %s"
+                % (self.ReadThreadTimeout, e)
+            )
+        else:
+            self.Statistics.CountSent(message)
+            if self.Capture:
+                self.Capture.Write(CaptureSent, message)
+
+    # --------------------------------------------------------------------------
+    # I d l e W a k e u p s P e r S e c o n d
+    # --------------------------------------------------------------------------
+    # returns   Reads without data per second since ReadThread() started
+    # --------------------------------------------------------------------------
+    def IdleWakeupsPerSecond(self):
+        elapsed = time.monotonic() - self.ReadThreadStart
+        if self.ReadThreadStart and elapsed > 0:
+            return self.IdleWakeups / elapsed
+        return 0
+
+    # -----------------------------------------------------------------------
+    # S t a r t C a p t u r e   /   S t o p C a p t u r e
+    # -----------------------------------------------------------------------
+    # input     FileName
+    #
+    # function  Record all messages sent to and received from the dongle,
+    #           see clsAntCapture
+    # -----------------------------------------------------------------------
+    def StartCapture(self, FileName):
+        self.StopCapture()
+        self.Capture = clsAntCapture(FileName)
+        logfile.Console("ANT traffic is captured in %s" % FileName)
+
+    def StopCapture(self):
+        if self.Capture:
+            self.Capture.Close()
+            self.Capture = None
+
+    # -----------------------------------------------------------------------
+    # S t a r t T r a c e   /   S t o p T r a c e
+    # -----------------------------------------------------------------------
+    # input     FileName
+    #
+    # function  Trace the messages in a binary file instead of writing them
+    #           to the logfile (debug.Data1), see clsAntTrace
+    # -----------------------------------------------------------------------
+    def StartTrace(self, FileName):
+        self.StopTrace()
+        self.Trace = clsAntTrace(FileName)
+        logfile.Console("ANT messages are traced in %s" % FileName)
+
+    def StopTrace(self):
+        if self.Trace:
+            self.Trace.Close()
+            self.Trace = None
+
+    def _DebugMessage(self, Direction, text, d):
+        if self.Trace:
+            self.Trace.Write(Direction, d)
+        else:
+            DongleDebugMessage(text, d)
+
+    # -----------------------------------------------------------------------
+    # S e n d B u r s t
+    # -----------------------------------------------------------------------
+    # input     Channel, Payload
+    #
+    # function  Send Payload as one burst on the channel; the dongle reports
+    #           the result with a Channel Response (EVENT_TRANSFER_TX_...)
+    # -----------------------------------------------------------------------
+    def SendBurst(self, Channel, Payload):
+        if debug.on(debug.Data1):
+            logfile.Write("SendBurst(%s, %s bytes)" % (Channel, len(Payload)))
+        self.Write(ComposeBurst(Channel, Payload), False)
 
     # -----------------------------------------------------------------------
     # Standard dongle commands
@@ -967,11 +1502,19 @@ class clsAntDongle:
             msg46_SetNetworkKey(NetworkNumber=0x01, NetworkKey=0x00),
             # network for Tacx i-Vortex
         ]
-        self.Write(messages)
+        if self.LibConfig:
+            messages.append(msg6E_LibConfig(self.LibConfig))
+        self.RxClock = clsAntRxClock()  # The dongle clock restarts on reset
+        self.ConfigureChannels(messages)
         self.StartReadThread()  # Start reading in a thread from now on
 
     def ResetDongle(self):
+        if self.WriteQueue:  # Queued messages are for the old channels
+            self.WriteQueue.Pause(Clear=True)  # Resumed by ConfigureChannels()
         self.StopReadThread()  # Stop reading in a thread
+        self._WakeResponse = False  # Discarded by WaitForStartUp() anyway
+        self.Reassembler.Reset()  # Partial data is of no use anymore
+        self.Journal = []  # The dongle forgets the configuration
 
         if self.Cycplus:
             # For CYCPLUS dongles this command may be given on initialization only
@@ -985,7 +1528,254 @@ class clsAntDongle:
                 msg4A_ResetSystem(),
             ]
             self.Write(messages, False)
-        time.sleep(0.500)  # After Reset, 500ms before next action
+            if self.OK:
+                self.WaitForStartUp()  # After Reset, wait before next action
+
+    # -----------------------------------------------------------------------
+    # W a i t F o r S t a r t U p
+    # -----------------------------------------------------------------------
+    # input     self.ResetTimeout   max time to wait for the StartUp message
+    #           self.ResetFallback  time to wait when StartUp is not received
+    #
+    # function  After msg4A_ResetSystem(), the dongle sends msg 0x6F (StartUp)
+    #           as soon as it's ready. Read untill that message is received;
+    #           instead of a fixed 500ms delay, the next action is done
+    #           right away.
+    #           Messages received before StartUp were sent before the reset
+    #           and are discarded; they are read into a list of their own, so
+    #           that the messages already in the queue (of the application,
+    #           or of the other dongles in a pool) are kept.
+    #           The ReadThread must not be active.
+    #
+    # returns   True if StartUp received
+    # -----------------------------------------------------------------------
+    def WaitForStartUp(self):
+        StartTime = time.time()
+        Deadline = StartTime + self.ResetTimeout
+        self._ResetMessages = []
+        try:
+            while time.time() < Deadline:
+                self._Read(False, 10)
+                while self._ResetMessages:
+                    d = self._ResetMessages.pop(0)
+                    _s, length, id, _i, _c, _r, _ch, _p = DecomposeMessage(d)
+                    if id == msgID_StartUp and length == 0x01:
+                        if debug.on(debug.Function | debug.Performance):
+                            logfile.Write(
+                                "WaitForStartUp: dongle ready after %4.0fms"
+                                % ((time.time() - StartTime) * 1000)
+                            )
+                        for d in self._ResetMessages:
+                            self.MessageQueuePut(d)  # Sent after the reset
+                        return True
+        finally:
+            self._ResetMessages = None
+
+        if debug.on(debug.Function):
+            logfile.Write("WaitForStartUp: no StartUp message received")
+        time.sleep(self.ResetFallback)
+        return False
+
+    # -----------------------------------------------------------------------
+    # C o n f i g u r e C h a n n e l s
+    # -----------------------------------------------------------------------
+    # input     messages    commands to configure one or more channels
+    #
+    # function  Send the commands pipelined, without waiting for the response
+    #           of each command (up to ConfigWindow commands outstanding).
+    #           Each command is acknowledged by the dongle with a Channel
+    #           Response (msg 0x40) for (Channel, InitiatingMessageID);
+    #           only the commands that are rejected or not acknowledged within
+    #           ConfigTimeout are sent again (ConfigRetries times).
+    #
+    #           Requests (msg 0x4D) are not acknowledged; the requested
+    #           message, as all other received messages, stays in the queue
+    #           for the application.
+    #
+    #           The *_ChannelConfig() functions call ConfigureChannel(), so
+    #           that between BeginChannelConfig() and EndChannelConfig() the
+    #           commands of all channels are sent in one batch.
+    #
+    # output    self.ChannelSetupTime[Channel]  time from the first command
+    #                       sent to the last response received for the channel
+    #
+    # returns   True when all commands are acknowledged
+    # -----------------------------------------------------------------------
+    def BeginChannelConfig(self):
+        self._ConfigBatch = []
+
+    def EndChannelConfig(self):
+        messages = self._ConfigBatch
+        self._ConfigBatch = None
+        return self.ConfigureChannels(messages)
+
+    def ConfigureChannel(self, messages):
+        if self._ConfigBatch is None:
+            return self.ConfigureChannels(messages)
+        else:
+            self._ConfigBatch.extend(messages)
+            return True
+
+    def ConfigureChannels(self, messages):
+        if not self.OK:  # If no dongle ==> no action at all
+            return True
+
+        messages = list(messages)
+        steps = messages
+        StartTime = {}  # Channel: time of first command
+        for attempt in range(self.ConfigRetries + 1):
+            if attempt and debug.on(debug.Function):
+                logfile.Write(
+                    "ConfigureChannels: retry %s failed step(s), attempt %s"
+                    % (len(steps), attempt)
+                )
+            steps = self._ConfigureSteps(steps, StartTime)
+            if not steps:
+                break
+
+        # To be replayed after reconnect; failed steps would fail again
+        self.Journal.extend(m for m in messages if m not in steps)
+
+        if self.WriteQueue:
+            self.WriteQueue.Resume()  # Paused by ResetDongle() or reconnect
+
+        for message in steps:
+            _s, _l, id, info, _c, _r, Channel, _p = DecomposeMessage(message)
+            logfile.Console(
+                "ANT channel %s: command %s not accepted by dongle" % (Channel, hex(id))
+            )
+
+        if debug.on(debug.Function | debug.Performance):
+            for Channel in sorted(StartTime):
+                logfile.Write(
+                    "ConfigureChannels: channel %s setup in %4.0fms"
+                    % (Channel, self.ChannelSetupTime.get(Channel, 0) * 1000)
+                )
+        return not steps
+
+    # -----------------------------------------------------------------------
+    # R e p l a y J o u r n a l
+    # -----------------------------------------------------------------------
+    # function  After a reconnect, the dongle has lost its configuration.
+    #           All configuration messages sent since the last reset (the
+    #           Journal, see ConfigureChannels) are sent again, so that the
+    #           application can continue without restart.
+    #
+    #           Called in the thread that detected the failure (usually the
+    #           ReadThread), while reading is done directly; the _WriteLock is
+    #           held, so that the other threads do not write meanwhile.
+    #
+    #           The application may be waiting for the queue meanwhile, so the
+    #           messages are read into a list of their own (as WaitForStartUp
+    #           does) and the Channel Responses cannot be taken by the
+    #           application; the other messages are put in the queue.
+    #
+    # returns   True if the channels are restored
+    # -----------------------------------------------------------------------
+    def ReplayJournal(self):
+        messages = self.Journal
+        if not messages:
+            return False
+        if debug.on(debug.Function):
+            logfile.Write("ReplayJournal: %s messages" % len(messages))
+        self.Journal = []  # ConfigureChannels() adds them again
+        if self.UseThread and self.ThreadActive:  # Not after a reconnect
+            return self.ConfigureChannels(messages)
+        self._ReplayMessages = []
+        try:
+            return self.ConfigureChannels(messages)
+        finally:
+            for ArrivalTime, d in self._ReplayMessages:
+                self.MessageQueuePut(d, ArrivalTime)  # Not a Channel Response
+            self._ReplayMessages = None
+
+    def _ConfigureSteps(self, steps, StartTime):
+        pending = []  # (Channel, MessageID, message) waiting for response
+        failed = []
+        other = []  # received messages that are not for us
+        Deadline = 0
+
+        for message in steps + [None]:
+            # ---------------------------------------------------------------
+            # Receive responses while the window is full, after the last
+            # message until all are received (or timeout)
+            # ---------------------------------------------------------------
+            while pending and (message is None or len(pending) >= self.ConfigWindow):
+                d = self._ConfigResponse(Deadline)
+                if d is None:
+                    break  # Timeout, pending commands failed
+                Deadline = time.time() + self.ConfigTimeout
+
+                _s, _l, id, info, _c, _r, _ch, _p = DecomposeMessage(d)
+                if id != msgID_ChannelResponse or len(info) != 3:
+                    other.append(d)
+                    continue
+                (
+                    Channel,
+                    InitiatingMessageID,
+                    ResponseCode,
+                ) = unmsg64_ChannelResponse(info)
+                for i, (c, m, sent) in enumerate(pending):
+                    if c == Channel and m == InitiatingMessageID:
+                        del pending[i]
+                        if ResponseCode != RESPONSE_NO_ERROR:
+                            if debug.on(debug.Function):
+                                logfile.Write(
+                                    "ConfigureChannels: channel %s, command %s, response code %s"
+                                    % (Channel, hex(m), hex(ResponseCode))
+                                )
+                            failed.append(sent)
+                        self.ChannelSetupTime[Channel] = (
+                            self.MessageArrivalTime - StartTime[Channel]
+                        )
+                        break
+                else:
+                    other.append(d)  # e.g. an RF event
+
+            if message is None:
+                break
+
+            # ---------------------------------------------------------------
+            # Send next command, without reading
+            # The response of a pool member has the logical channel number
+            # ---------------------------------------------------------------
+            Response = message
+            if self.ChannelMap is not None:
+                Response = MapChannel(message, self.ChannelMap)
+            _s, _l, id, info, _c, _r, Channel, _p = DecomposeMessage(Response)
+            StartTime.setdefault(Channel, time.time())
+            self.Write([message], False)
+            Deadline = time.time() + self.ConfigTimeout
+            if id != msgID_RequestMessage:
+                pending.append((Channel, id, message))
+
+        # -------------------------------------------------------------------
+        # Not acknowledged = failed; other messages back into the queue
+        # -------------------------------------------------------------------
+        failed.extend(sent for _c, _m, sent in pending)
+        for d in other:
+            self.MessageQueuePut(d)
+        return [m for m in steps if m in failed]
+
+    def _ConfigResponse(self, Deadline):
+        while True:
+            remaining = Deadline - time.time()
+            if self._ReplayMessages is not None:  # See ReplayJournal()
+                if not self._ReplayMessages:
+                    self._Read(False, 1)
+                if self._ReplayMessages:
+                    self.MessageArrivalTime, d = self._ReplayMessages.pop(0)
+                    return d
+                if remaining <= 0:
+                    return None
+                continue
+            if self.UseThread and self.ThreadActive:
+                return self.WaitForMessage(max(0, remaining))
+            if self.MessageQueueSize() == 0:
+                self._Read(False, 1)  # Shortest possible timeout
+            d = self.WaitForMessage(0)
+            if d is not None or remaining <= 0:
+                return d
 
     def SlavePair_ChannelConfig(
         self, channel_pair, DeviceNumber=0, DeviceTypeID=0, TransmissionType=0
@@ -1010,9 +1800,7 @@ class clsAntDongle:
             msg60_ChannelTransmitPower(channel_pair, TransmitPower_0dBm),
             msg4B_OpenChannel(channel_pair),
         ]
-        self.Write(
-            messages
-        )  # 2021-04-15 ", True, False"  removed because it's inconsistent
+        self.ConfigureChannel(messages)
 
     def Trainer_ChannelConfig(self):
         if self.OK:
@@ -1035,7 +1823,7 @@ class clsAntDongle:
             msg60_ChannelTransmitPower(channel_FE, TransmitPower_0dBm),
             msg4B_OpenChannel(channel_FE),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveTrainer_ChannelConfig(self, DeviceNumber):
         if DeviceNumber > 0:
@@ -1063,7 +1851,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_FE_s),
             msg4D_RequestMessage(channel_FE_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def HRM_ChannelConfig(self):
         if self.OK:
@@ -1086,7 +1874,7 @@ class clsAntDongle:
             msg60_ChannelTransmitPower(channel_HRM, TransmitPower_0dBm),
             msg4B_OpenChannel(channel_HRM),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveHRM_ChannelConfig(self, DeviceNumber):
         if DeviceNumber > 0:
@@ -1116,7 +1904,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_HRM_s),
             msg4D_RequestMessage(channel_HRM_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def PWR_ChannelConfig(self, DeviceNumber):
         if self.OK:
@@ -1139,7 +1927,7 @@ class clsAntDongle:
             msg60_ChannelTransmitPower(channel_PWR, TransmitPower_0dBm),
             msg4B_OpenChannel(channel_PWR),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SCS_ChannelConfig(self, DeviceNumber):
         if self.OK:
@@ -1162,7 +1950,7 @@ class clsAntDongle:
             msg60_ChannelTransmitPower(channel_SCS, TransmitPower_0dBm),
             msg4B_OpenChannel(channel_SCS),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveSCS_ChannelConfig(self, DeviceNumber):
         if DeviceNumber > 0:
@@ -1190,7 +1978,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_SCS_s),
             msg4D_RequestMessage(channel_SCS_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def CTRL_ChannelConfig(self, DeviceNumber):
         if self.OK:
@@ -1216,7 +2004,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_CTRL),
             msg4D_RequestMessage(channel_CTRL, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def VTX_ChannelConfig(self):  # Pretend to be a Tacx Vortex
         if self.OK:
@@ -1240,7 +2028,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_VTX),
             msg4D_RequestMessage(channel_VTX, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveVTX_ChannelConfig(self, DeviceNumber):  # Listen to a Tacx Vortex
         if DeviceNumber > 0:
@@ -1269,7 +2057,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_VTX_s),
             msg4D_RequestMessage(channel_VTX_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveGNS_ChannelConfig(self, DeviceNumber):  # Listen to a Tacx Genius
         if DeviceNumber > 0:
@@ -1299,7 +2087,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_GNS_s),
             msg4D_RequestMessage(channel_GNS_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveBHU_ChannelConfig(self, DeviceNumber):  # Listen to a Tacx Genius
         if DeviceNumber > 0:
@@ -1330,7 +2118,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_GNS_s),
             msg4D_RequestMessage(channel_GNS_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveVHU_ChannelConfig(self, DeviceNumber):  # Listen to a Tacx Vortex Headunit
         # See comment above msgPage000_TacxVortexHU_StayAlive
@@ -1360,7 +2148,7 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_VHU_s),
             msg4D_RequestMessage(channel_VHU_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
 
     def SlaveBLTR_ChannelConfig(
         self, DeviceNumber
@@ -1390,7 +2178,35 @@ class clsAntDongle:
             msg4B_OpenChannel(channel_BLTR_s),
             msg4D_RequestMessage(channel_BLTR_s, msgID_ChannelID),
         ]
-        self.Write(messages)
+        self.ConfigureChannel(messages)
+
+    # -----------------------------------------------------------------------
+    # Continuous scan mode
+    # -----------------------------------------------------------------------
+    # D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf
+    # 5.2.1.1 Continuous scanning mode, 9.5.4.5 Open Rx Scan Mode (0x5B)
+    #
+    # Channel 0 receives the messages of all masters in range (instead of
+    # pairing with one master); the other channels cannot be used. Each
+    # message is extended with the channel ID of the master, see
+    # unmsgExtended_ChannelID().
+    # -----------------------------------------------------------------------
+    def ScanMode_ChannelConfig(self):
+        if self.OK:
+            if self.ConfigMsg:
+                logfile.Console("FortiusANT scans for all ANT+ masters in range")
+            if debug.on(debug.Data1):
+                logfile.Write("ScanMode_ChannelConfig()")
+        messages = [
+            msg42_AssignChannel(
+                0, ChannelType_BidirectionalReceive, NetworkNumber=0x00
+            ),
+            msg51_ChannelID(0, 0, 0, 0),  # Any master
+            msg45_ChannelRfFrequency(0, RfFrequency_2457Mhz),
+            msg6E_LibConfig(self.LibConfig | LibConfig_ChannelID),
+            msg5B_OpenRxScanMode(),
+        ]
+        self.ConfigureChannel(messages)
 
     def PowerDisplay_unused(self):
         if self.OK and debug.on(debug.Data1):
@@ -1410,35 +2226,952 @@ class clsAntDongle:
 
 
 # -------------------------------------------------------------------------------
-# E n u m e r a t e A l l
+# c l s A n t D o n g l e P o o l
 # -------------------------------------------------------------------------------
-# input     none
+# function  Use several ANT dongles as if it were one clsAntDongle with more
+#           channels.
 #
-# function  list all usb-devices
+#           The application uses logical channel numbers. When a channel is
+#           used for the first time, it is assigned to the dongle with the
+#           least channels in use and the lowest free (physical) channel of
+#           that dongle; the number of channels of a dongle is taken from its
+#           Capabilities (requested by Calibrate), ChannelsPerDongle until
+#           received. Messages are sent to that dongle with the channel
+#           number replaced (see MapChannel); messages without a channel
+#           (reset, network key, capabilities) are sent to all dongles.
 #
-# returns   none
+#           Each dongle has its own ReadThread; all dongles put the received
+#           messages, with the logical channel number, in one queue so that
+#           the application receives one stream in order of arrival.
+#
+#           All other functions (ConfigureChannels, *_ChannelConfig, ...) are
+#           those of clsAntDongle, working on the logical channels.
+#
+#           The configuration messages are journaled by the dongle they are
+#           sent to; if one of the dongles reconnects, it replays its own
+#           journal. Only if that fails, DongleReconnected is raised so that
+#           the application restarts and all dongles are reset.
+#
+#           The frames are counted by the dongles, with the logical channel
+#           numbers; Statistics.Snapshot() adds them up, see
+#           clsAntPoolStatistics.
 # -------------------------------------------------------------------------------
-def EnumerateAll():
-    logfile.Console("Dongles in the system:")
-    devices = usb.core.find(find_all=True)
-    for device in devices:
-        #       print (device)
-        s = "manufacturer=%7s, product=%15s, vendor=%6s, product=%6s(%s)" % (
-            device.manufacturer,
-            device.product,
-            hex(device.idVendor),
-            hex(device.idProduct),
-            device.idProduct,
-        )
-        logfile.Console(s.replace("\0", ""))
+class clsAntDonglePool(clsAntDongle):
+    ChannelsPerDongle = 8  # ANT USB2 and ANT USB-m, until MaxChannels is known
 
-        i = 0
-        for cfg in device:  # Do not understand this construction; see pyusb tutorial
-            i += 1
-            for intf in cfg:
-                for _ep in intf:
+    def __init__(self, DeviceID=None, MaxDongles=4, Dongles=None):
+        self.DeviceID = DeviceID
+        self._MessageQueue = queue.Queue()  # Shared by all dongles
+        self.Reassembler = clsAntFrameReassembler()  # Not used
+        self.Statistics = clsAntPoolStatistics(self)
+        self.ChannelSetupTime = {}
+        self.Journal = []
+        self.Assignment = {}  # Logical channel: (dongle, physical channel)
+
+        # ---------------------------------------------------------------
+        # Open dongles until no more available
+        # ---------------------------------------------------------------
+        if Dongles is None:
+            Dongles = []
+            while DeviceID != -1 and len(Dongles) < MaxDongles:
+                Dongle = clsAntDongle(DeviceID)
+                if not Dongle.OK:
+                    break
+                Dongles.append(Dongle)
+
+        self.Dongles = Dongles
+        for Dongle in self.Dongles:
+            Dongle._MessageQueue = self._MessageQueue
+            Dongle.ChannelMap = {}
+
+        self.OK = len(self.Dongles) > 0
+        if self.OK:
+            self.Message = "Using %s dongle(s): %s" % (
+                len(self.Dongles),
+                ", ".join(Dongle.Message for Dongle in self.Dongles),
+            )
+        else:
+            self.Message = "No (free) ANT-dongle found"
+
+    @property
+    def DongleReconnected(self):
+        return any(Dongle.DongleReconnected for Dongle in self.Dongles)
+
+    @DongleReconnected.setter
+    def DongleReconnected(self, value):
+        for Dongle in self.Dongles:
+            Dongle.DongleReconnected = value
+
+    # -----------------------------------------------------------------------
+    # A s s i g n C h a n n e l
+    # -----------------------------------------------------------------------
+    # input     Channel, logical channel number
+    #
+    # returns   dongle, physical channel
+    # -----------------------------------------------------------------------
+    def AssignChannel(self, Channel):
+        rtn = self.Assignment.get(Channel)
+        if rtn is None:
+            free = [d for d in self.Dongles if len(d.ChannelMap) < self._Channels(d)]
+            if not free:
+                logfile.Console(
+                    "AntDonglePool: no free channel for channel %s" % Channel
+                )
+                return self.Dongles[0], Channel
+            Dongle = min(free, key=lambda d: len(d.ChannelMap))
+            Physical = min(set(range(self._Channels(Dongle))) - set(Dongle.ChannelMap))
+            Dongle.ChannelMap[Physical] = Channel
+            rtn = self.Assignment[Channel] = (Dongle, Physical)
+            if debug.on(debug.Function):
+                logfile.Write(
+                    "AntDonglePool: channel %s assigned to dongle %s, channel %s"
+                    % (Channel, self.Dongles.index(Dongle), Physical)
+                )
+        return rtn
+
+    def _Channels(self, Dongle):
+        return Dongle.MaxChannels or self.ChannelsPerDongle
+
+    # -----------------------------------------------------------------------
+    # R o u t e
+    # -----------------------------------------------------------------------
+    # input     message, with logical channel number
+    #
+    # returns   list of (dongle, message with physical channel number)
+    # -----------------------------------------------------------------------
+    def _Route(self, message):
+        if IsChannelMessage(message):
+            Channel = message[3]
+            if message[2] == msgID_BurstData:
+                Channel &= 0b00011111
+            Dongle, Physical = self.AssignChannel(Channel)
+            return [(Dongle, MapChannel(message, {Channel: Physical}))]
+        return [(Dongle, message) for Dongle in self.Dongles]
+
+    def Write(self, messages, receive=True, drop=True, flush=True):
+        for message in messages:
+            for Dongle, d in self._Route(message):
+                Dongle.Write([d], False)
+        if receive:
+            self.Read(drop, 20 if flush else 1)
+
+    # -----------------------------------------------------------------------
+    # The acknowledged messages are journaled by the dongle as well, so that
+    # the dongle can replay them itself after a reconnect.
+    # -----------------------------------------------------------------------
+    def ConfigureChannels(self, messages):
+        Journaled = len(self.Journal)
+        rtn = clsAntDongle.ConfigureChannels(self, messages)
+        for message in self.Journal[Journaled:]:
+            for Dongle, d in self._Route(message):
+                Dongle.Journal.append(d)
+        return rtn
+
+    def Read(self, drop, timeout=20):
+        for Dongle in self.Dongles:
+            Dongle.Read(drop, timeout)
+
+    def _Read(self, drop, timeout=20, Once=False):
+        for Dongle in self.Dongles:
+            Dongle._Read(drop, timeout, Once)
+
+    def StartReadThread(self):
+        for Dongle in self.Dongles:
+            Dongle.StartReadThread()
+        self.ThreadActive = any(Dongle.ThreadActive for Dongle in self.Dongles)
+
+    def StopReadThread(self):
+        for Dongle in self.Dongles:
+            Dongle.StopReadThread()
+        self.ThreadActive = False
+
+    def _WakeReadThread(self):
+        for Dongle in self.Dongles:
+            Dongle._WakeReadThread()
+
+    def ResetDongle(self):
+        if self.WriteQueue:
+            self.WriteQueue.Pause(Clear=True)
+        for Dongle in self.Dongles:
+            Dongle.ResetDongle()
+            Dongle.ChannelMap = {}
+        self.ThreadActive = False
+        self.Assignment = {}
+        self.Journal = []
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t I n v e n t o r y
+# -------------------------------------------------------------------------------
+# function  The ANT masters seen in continuous scan mode, one entry per
+#           (DeviceNumber, DeviceTypeID) with:
+#               TransmissionType
+#               FirstSeen, LastSeen     time.time()
+#               Messages                nr of messages received
+#               Rate()                  messages per second
+#
+#           Update(d) is called for every received message; only messages
+#           extended with the channel ID are used.
+# -------------------------------------------------------------------------------
+class clsAntInventoryDevice:
+    def __init__(self, DeviceNumber, DeviceTypeID, TransmissionType, Now):
+        self.DeviceNumber = DeviceNumber
+        self.DeviceTypeID = DeviceTypeID
+        self.TransmissionType = TransmissionType
+        self.FirstSeen = Now
+        self.LastSeen = Now
+        self.Messages = 0
+
+    def Rate(self):
+        if self.LastSeen > self.FirstSeen:
+            return (self.Messages - 1) / (self.LastSeen - self.FirstSeen)
+        return 0.0
+
+
+class clsAntInventory:
+    def __init__(self):
+        self.Devices = {}  # (DeviceNumber, DeviceTypeID): clsAntInventoryDevice
+        self.New = False
+
+    # ---------------------------------------------------------------------------
+    # U p d a t e
+    # ---------------------------------------------------------------------------
+    # input     d, a received message
+    #
+    # returns   the clsAntInventoryDevice, None if d has no channel ID
+    #           New is True when the device is seen the first time
+    # ---------------------------------------------------------------------------
+    def Update(self, d, Now=None):
+        self.New = False
+        if d[2] not in (msgID_BroadcastData, msgID_AcknowledgedData, msgID_BurstData):
+            return None
+        ChannelID = unmsgExtended_ChannelID(d[3:-1])
+        if ChannelID is None:
+            return None
+        DeviceNumber, DeviceTypeID, TransmissionType = ChannelID
+        if Now is None:
+            Now = time.time()
+
+        Device = self.Devices.get((DeviceNumber, DeviceTypeID))
+        if Device is None:
+            Device = clsAntInventoryDevice(
+                DeviceNumber, DeviceTypeID, TransmissionType, Now
+            )
+            self.Devices[DeviceNumber, DeviceTypeID] = Device
+            self.New = True
+        Device.TransmissionType = TransmissionType
+        Device.LastSeen = Now
+        Device.Messages += 1
+        return Device
+
+    # ---------------------------------------------------------------------------
+    # S e e n
+    # ---------------------------------------------------------------------------
+    # returns   devices seen in the last MaxAge seconds, most recent first
+    # ---------------------------------------------------------------------------
+    def Seen(self, MaxAge=None, Now=None):
+        if Now is None:
+            Now = time.time()
+        return sorted(
+            (
+                x
+                for x in self.Devices.values()
+                if MaxAge is None or Now - x.LastSeen <= MaxAge
+            ),
+            key=lambda x: -x.LastSeen,
+        )
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t S t a t i s t i c s
+# -------------------------------------------------------------------------------
+# function  Link-quality and throughput counters of an ANT dongle:
+#               Received[Channel]           frames received
+#               Transmitted[Channel]        frames sent
+#               Pages[Channel, Page]        data pages received
+#               Events[Channel, Event]      RF events (EVENT_TX, EVENT_RX_FAIL,
+#                                           EVENT_RX_SEARCH_TIMEOUT, ...)
+#               RSSI[Channel]               last signal strength (dBm), when
+#                                           enabled with LibConfig_RSSI
+#               QueueHighWater              max messages in the receive queue
+#               LatencySum/Max/Count        seconds from received until taken
+#                                           from the queue by the application
+#           Channel is None for messages without channel (e.g. StartUp).
+#           ChecksumErrors and SkippedBytes cannot be related to a channel and
+#           are taken from the clsAntFrameReassembler.
+#
+#           The counters are updated by the ReadThread, the WriteThread and
+#           the main thread; a lock protects them so that Snapshot() takes a
+#           consistent copy.
+# -------------------------------------------------------------------------------
+class clsAntStatistics:
+    EventNames = {
+        EVENT_RX_SEARCH_TIMEOUT: "search timeout",
+        EVENT_RX_FAIL: "rx fail",
+        EVENT_TX: "tx",
+        EVENT_TRANSFER_TX_COMPLETED: "transfer completed",
+        EVENT_TRANSFER_TX_FAILED: "transfer failed",
+        EVENT_CHANNEL_CLOSED: "channel closed",
+        EVENT_RX_FAIL_GO_TO_SEARCH: "rx fail, go to search",
+    }
+
+    def __init__(self, AntDongle):
+        self.AntDongle = AntDongle
+        self._Lock = threading.Lock()
+        self.Reset()
+
+    def Reset(self):
+        with self._Lock:
+            self.StartTime = time.time()
+            self.LogTime = self.StartTime
+            self.Received = collections.Counter()
+            self.Transmitted = collections.Counter()
+            self.Pages = collections.Counter()
+            self.Events = collections.Counter()
+            self.RSSI = {}  # Channel: last RSSI in dBm, when LibConfig_RSSI
+            self.QueueHighWater = 0
+            self.LatencySum = 0.0
+            self.LatencyMax = 0.0
+            self.LatencyCount = 0
+
+    # ---------------------------------------------------------------------------
+    # Called by clsAntDongle
+    # ---------------------------------------------------------------------------
+    def CountReceived(self, d):
+        Channel = self._Channel(d)
+        id = d[2]
+        RSSI = None
+        if id in (msgID_BroadcastData, msgID_AcknowledgedData) and d[1] > 9:
+            RSSI = unmsgExtended(d[3:-1])[1]
+        with self._Lock:
+            self.Received[Channel] += 1
+            if id in (msgID_BroadcastData, msgID_AcknowledgedData) and d[1] > 1:
+                self.Pages[Channel, d[4]] += 1
+                if RSSI is not None:
+                    self.RSSI[Channel] = RSSI
+            elif id == msgID_ChannelResponse and d[1] > 2 and d[4] == msgID_RF_EVENT:
+                self.Events[Channel, d[5]] += 1
+
+    def CountSent(self, d):
+        Channel = self._Channel(d)
+        with self._Lock:
+            self.Transmitted[Channel] += 1
+
+    def Queued(self, QueueSize):
+        with self._Lock:
+            if QueueSize > self.QueueHighWater:
+                self.QueueHighWater = QueueSize
+
+    def Dequeued(self, Latency):
+        with self._Lock:
+            self.LatencySum += Latency
+            self.LatencyCount += 1
+            if Latency > self.LatencyMax:
+                self.LatencyMax = Latency
+
+    @staticmethod
+    def _Channel(d):
+        if not IsChannelMessage(d):
+            return None
+        if d[2] == msgID_BurstData:
+            return d[3] & 0b00011111
+        return d[3]
+
+    # ---------------------------------------------------------------------------
+    # S n a p s h o t
+    # ---------------------------------------------------------------------------
+    # returns   dict with a copy of the counters, see class description
+    # ---------------------------------------------------------------------------
+    def Snapshot(self):
+        with self._Lock:
+            if self.LatencyCount:
+                LatencyAverage = self.LatencySum / self.LatencyCount
+            else:
+                LatencyAverage = 0.0
+            return {
+                "Seconds": time.time() - self.StartTime,
+                "Received": dict(self.Received),
+                "Transmitted": dict(self.Transmitted),
+                "Pages": dict(self.Pages),
+                "Events": dict(self.Events),
+                "RSSI": dict(self.RSSI),
+                "QueueSize": self.AntDongle.MessageQueueSize(),
+                "QueueHighWater": self.QueueHighWater,
+                "LatencyAverage": LatencyAverage,
+                "LatencyMax": self.LatencyMax,
+                "ChecksumErrors": self.AntDongle.Reassembler.ChecksumErrors,
+                "SkippedBytes": self.AntDongle.Reassembler.SkippedBytes,
+            }
+
+    # ---------------------------------------------------------------------------
+    # L o g
+    # ---------------------------------------------------------------------------
+    # function  Write the snapshot to the logfile, one line per channel
+    # ---------------------------------------------------------------------------
+    def Log(self):
+        self.LogTime = time.time()
+        s = self.Snapshot()
+        logfile.Write(
+            "AntStatistics: %4.0fs queue=%s high-water=%s latency=%4.1fms "
+            "max=%4.1fms checksum errors=%s skipped bytes=%s"
+            % (
+                s["Seconds"],
+                s["QueueSize"],
+                s["QueueHighWater"],
+                s["LatencyAverage"] * 1000,
+                s["LatencyMax"] * 1000,
+                s["ChecksumErrors"],
+                s["SkippedBytes"],
+            )
+        )
+        Channels = set(s["Received"]) | set(s["Transmitted"])
+        for Channel in sorted(Channels, key=lambda c: -1 if c is None else c):
+            Pages = [
+                "%s:%s" % (Page, n)
+                for (c, Page), n in sorted(s["Pages"].items())
+                if c == Channel
+            ]
+            Events = [
+                "%s:%s" % (self.EventNames.get(Event, hex(Event)), n)
+                for (c, Event), n in sorted(s["Events"].items())
+                if c == Channel
+            ]
+            logfile.Write(
+                "AntStatistics: channel %4s rx=%6s tx=%6s pages %s events %s"
+                % (
+                    Channel,
+                    s["Received"].get(Channel, 0),
+                    s["Transmitted"].get(Channel, 0),
+                    " ".join(Pages) or "-",
+                    ", ".join(Events) or "-",
+                )
+            )
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t P o o l S t a t i s t i c s
+# -------------------------------------------------------------------------------
+# function  The statistics of a clsAntDonglePool. The frames, pages, events,
+#           RSSI and reassembler counters are those of the dongles added up;
+#           the latency is measured by the pool, since the application takes
+#           the messages from the queue of the pool.
+# -------------------------------------------------------------------------------
+class clsAntPoolStatistics(clsAntStatistics):
+    def Snapshot(self):
+        s = clsAntStatistics.Snapshot(self)
+        s["ChecksumErrors"] = s["SkippedBytes"] = 0  # The pool does not read
+        for Dongle in self.AntDongle.Dongles:
+            m = Dongle.Statistics.Snapshot()
+            for Counter in ("Received", "Transmitted", "Pages", "Events"):
+                Total = collections.Counter(s[Counter])
+                Total.update(m[Counter])
+                s[Counter] = dict(Total)
+            s["RSSI"].update(m["RSSI"])
+            s["QueueHighWater"] = max(s["QueueHighWater"], m["QueueHighWater"])
+            s["ChecksumErrors"] += m["ChecksumErrors"]
+            s["SkippedBytes"] += m["SkippedBytes"]
+        return s
+
+
+# -------------------------------------------------------------------------------
+# W r i t e P r i o r i t y
+# -------------------------------------------------------------------------------
+# returns   the default priority of a message in the clsAntWriteQueue:
+#               WritePriorityConfig     commands and acknowledged data
+#               WritePriorityRequested  burst data; requested pages must be
+#                                       given this priority by the caller
+#               WritePriorityBroadcast  broadcast data
+# -------------------------------------------------------------------------------
+WritePriorityConfig = 0
+WritePriorityRequested = 1
+WritePriorityBroadcast = 2
+
+
+def WritePriority(message):
+    if message[2] == msgID_BroadcastData:
+        return WritePriorityBroadcast
+    if message[2] == msgID_BurstData:
+        return WritePriorityRequested
+    return WritePriorityConfig
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t W r i t e Q u e u e
+# -------------------------------------------------------------------------------
+# function  Outbound messages for an ANT dongle, written by one thread:
+#               - the message with the highest priority is written first
+#               - in the same priority, messages are written in order
+#               - of the broadcasts, only the newest per channel is kept, an
+#                 older one is replaced (Coalesced) since it is stale anyway
+#
+#           So that a requested page that is repeated NrTimes does not delay
+#           a command and the periodic broadcasts do not queue up.
+#           Messages that are not written when Stop() is called are dropped.
+#           While Paused, messages are queued but not written.
+# -------------------------------------------------------------------------------
+class clsAntWriteQueue:
+    def __init__(self, AntDongle):
+        self.AntDongle = AntDongle
+        self._Condition = threading.Condition()
+        self._Messages = (collections.deque(), collections.deque())
+        self._Broadcasts = {}  # Channel: newest broadcast, in order of arrival
+        self.Active = False
+        self.Paused = False
+        self.Thread = None
+        self.Written = 0
+        self.Coalesced = 0
+
+    def Put(self, messages, Priority=None):
+        with self._Condition:
+            for message in messages:
+                if Priority is None:
+                    p = WritePriority(message)
+                else:
+                    p = Priority
+                if p == WritePriorityBroadcast:
+                    Channel = message[3]
+                    if Channel in self._Broadcasts:
+                        self.Coalesced += 1
+                    self._Broadcasts[Channel] = message
+                else:
+                    self._Messages[p].append(message)
+            self._Condition.notify()
+
+    def Size(self):
+        with self._Condition:
+            return sum(len(q) for q in self._Messages) + len(self._Broadcasts)
+
+    # ---------------------------------------------------------------------------
+    # G e t
+    # ---------------------------------------------------------------------------
+    # returns   the next message to be written, None on timeout or Stop()
+    # ---------------------------------------------------------------------------
+    def Get(self, timeout=None):
+        with self._Condition:
+            self._Condition.wait_for(self._Ready, timeout)
+            if self.Paused:
+                return None
+            for q in self._Messages:
+                if q:
+                    return q.popleft()
+            if self._Broadcasts:
+                Channel = next(iter(self._Broadcasts))
+                return self._Broadcasts.pop(Channel)
+            return None
+
+    # ---------------------------------------------------------------------------
+    # P a u s e   /   R e s u m e
+    # ---------------------------------------------------------------------------
+    # input     Clear   drop the queued messages
+    # ---------------------------------------------------------------------------
+    def Pause(self, Clear=False):
+        with self._Condition:
+            self.Paused = True
+            if Clear:
+                for q in self._Messages:
+                    q.clear()
+                self._Broadcasts.clear()
+
+    def Resume(self):
+        with self._Condition:
+            self.Paused = False
+            self._Condition.notify()
+
+    def _Ready(self):
+        if not self.Active:
+            return True
+        return not self.Paused and (self._Broadcasts or any(self._Messages))
+
+    def Start(self):
+        self.Active = True
+        self.Thread = threading.Thread(target=self._WriteThread, daemon=True)
+        self.Thread.start()
+
+    def Stop(self):
+        with self._Condition:
+            self.Active = False
+            self._Condition.notify()
+        if self.Thread and self.Thread is not threading.current_thread():
+            self.Thread.join()
+        self.Thread = None
+
+    def _WriteThread(self):
+        while self.Active:
+            message = self.Get()
+            if message is not None and self.Active and not self.Paused:
+                self.AntDongle.Write([message], False)
+                self.Written += 1
+
+
+# -------------------------------------------------------------------------------
+# c l s A s y n c A n t D o n g l e
+# -------------------------------------------------------------------------------
+# function  asyncio interface to a configured clsAntDongle, so that
+#           the ANT handling can run in the same event loop as the BLE server:
+#               await AsyncDongle.Send(messages)
+#               async for d in AsyncDongle.Frames():
+#
+#           The dongle is read in the default executor (instead of the
+#           ReadThread, which is stopped); the messages are yielded in the
+#           event loop, so the handlers do not run in another thread.
+#
+#           The channels must be configured before Frames() is started, since
+#           ConfigureChannels() reads the dongle itself.
+#           Close() ends Frames() and wakes up a blocking read.
+# -------------------------------------------------------------------------------
+class clsAsyncAntDongle:
+    def __init__(self, AntDongle):
+        self.AntDongle = AntDongle
+        self.Active = False
+
+    async def Send(self, messages):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.AntDongle.Write, messages, False)
+
+    async def Frames(self):
+        loop = asyncio.get_running_loop()
+        self.AntDongle.StopReadThread()
+        self.Active = True
+        while self.Active and self.AntDongle.OK:
+            d = self.AntDongle.MessageQueueGet()
+            if d is None:
+                await loop.run_in_executor(
+                    None,
+                    self.AntDongle._Read,
+                    False,
+                    self.AntDongle.ReadThreadTimeout,
+                    True,  # Return to the event loop on the first data
+                )
+            else:
+                yield d
+
+    def Close(self):
+        if self.Active:
+            self.Active = False
+            self.AntDongle._WakeReadThread()
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t C a p t u r e
+# -------------------------------------------------------------------------------
+# function  Append ANT messages to a binary capture file:
+#               CaptureMagic                        once, at start of file
+#               CaptureRecord + message             for every message
+#           where CaptureRecord = time.monotonic_ns(), direction, length.
+#
+#           The file is written unbuffered so that a capture is complete
+#           up to the last message, even if the program is aborted.
+#           Write() may be called from the ReadThread and the main thread.
+#
+#           ReadCapture() returns the records of a capture file.
+# -------------------------------------------------------------------------------
+CaptureMagic = b"FANTCAP1"
+CaptureRecord = struct.Struct(
+    sc.little_endian
+    + sc.unsigned_long_long  # time.monotonic_ns()
+    + sc.unsigned_char  # direction
+    + sc.unsigned_char  # length of the message
+)
+CaptureReceived = 0
+CaptureSent = 1
+
+
+class clsAntCapture:
+    def __init__(self, FileName):
+        self._Lock = threading.Lock()
+        self.Frames = 0
+        exists = os.path.isfile(FileName) and os.path.getsize(FileName) > 0
+        self._File = open(FileName, "ab", buffering=0)
+        if not exists:
+            self._File.write(CaptureMagic)
+
+    def Write(self, Direction, d):
+        record = CaptureRecord.pack(time.monotonic_ns(), Direction, len(d)) + d
+        with self._Lock:
+            self._File.write(record)
+            self.Frames += 1
+
+    def Close(self):
+        with self._Lock:
+            self._File.close()
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t T r a c e
+# -------------------------------------------------------------------------------
+# function  A capture file, written by a thread of its own, used instead of
+#           DongleDebugMessage() when debug.Data1 is active.
+#
+#           Write() only stores timestamp, direction and message in a queue;
+#           packing and (buffered) writing is done by the TraceThread, and the
+#           file is flushed when the queue is empty. So tracing costs the
+#           ReadThread and the main thread next to nothing and can be active
+#           for a whole ride.
+#
+#           The file has the format of clsAntCapture, so it can be replayed
+#           as well; DecodeTrace() returns the DongleDebugMessage() text.
+# -------------------------------------------------------------------------------
+class clsAntTrace(clsAntCapture):
+    def __init__(self, FileName):
+        self.Frames = 0
+        self._Queue = queue.SimpleQueue()
+        exists = os.path.isfile(FileName) and os.path.getsize(FileName) > 0
+        self._File = open(FileName, "ab")
+        if not exists:
+            self._File.write(CaptureMagic)
+        self._Thread = threading.Thread(
+            target=self._TraceThread, name="AntTrace", daemon=True
+        )
+        self._Thread.start()
+
+    def Write(self, Direction, d):
+        self._Queue.put((time.monotonic_ns(), Direction, d))
+        self.Frames += 1
+
+    def _TraceThread(self):
+        while True:
+            record = self._Queue.get()
+            if record is None:
+                break
+            Timestamp, Direction, d = record
+            self._File.write(CaptureRecord.pack(Timestamp, Direction, len(d)) + d)
+            if self._Queue.empty():
+                self._File.flush()
+        self._File.close()
+
+    def Close(self):
+        self._Queue.put(None)
+        self._Thread.join()
+
+
+# -------------------------------------------------------------------------------
+# R e a d C a p t u r e
+# -------------------------------------------------------------------------------
+# input     FileName
+#           MemoryMap   True: the file is memory-mapped, False: streamed
+#
+# function  Read a file written by clsAntCapture; an incomplete last record
+#           (program aborted while writing) is ignored.
+#
+# returns   generator of (Timestamp, Direction, message)
+#               Timestamp in nano-seconds, time.monotonic_ns() when recorded
+# -------------------------------------------------------------------------------
+def ReadCapture(FileName, MemoryMap=True):
+    with open(FileName, "rb") as f:
+        if f.read(len(CaptureMagic)) != CaptureMagic:
+            raise ValueError("%s is not an ANT capture file" % FileName)
+
+        if MemoryMap:
+            size = os.path.getsize(FileName)
+            if size == len(CaptureMagic):
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                offset = len(CaptureMagic)
+                while offset + CaptureRecord.size <= size:
+                    Timestamp, Direction, length = CaptureRecord.unpack_from(m, offset)
+                    offset += CaptureRecord.size
+                    if offset + length > size:
+                        break
+                    yield Timestamp, Direction, m[offset : offset + length]
+                    offset += length
+        else:
+            while True:
+                record = f.read(CaptureRecord.size)
+                if len(record) < CaptureRecord.size:
+                    break
+                Timestamp, Direction, length = CaptureRecord.unpack(record)
+                d = f.read(length)
+                if len(d) < length:
+                    break
+                yield Timestamp, Direction, d
+
+
+# -------------------------------------------------------------------------------
+# D e c o d e T r a c e
+# -------------------------------------------------------------------------------
+# input     FileName    written by clsAntTrace (or clsAntCapture)
+#
+# function  Translate the trace to the text of DongleDebugMessage(), offline
+#
+# returns   generator of text lines; seconds since the first message first
+# -------------------------------------------------------------------------------
+TraceText = {CaptureReceived: "Dongle    receive:", CaptureSent: "Dongle    send   :"}
+
+
+def DecodeTrace(FileName):
+    StartTime = None
+    for Timestamp, Direction, d in ReadCapture(FileName, False):
+        if StartTime is None:
+            StartTime = Timestamp
+        yield "%10.3f %s" % (
+            (Timestamp - StartTime) / 1e9,
+            DongleDebugText(TraceText.get(Direction, "?"), d),
+        )
+
+
+# -------------------------------------------------------------------------------
+# c l s R e p l a y A n t D o n g l e
+# -------------------------------------------------------------------------------
+# function  An ANT dongle that returns the received messages from a capture
+#           file, so that a session can be reproduced without dongle.
+#
+#           RealTime=True   the messages are returned at the same pace as
+#                           recorded
+#           RealTime=False  as fast as possible; each _Read() returns the
+#                           messages received until the next message that
+#                           was sent (= the response on the previous Write)
+#
+#           Messages written are not sent, but counted (Sent).
+#           Finished is set when the complete capture is returned.
+# -------------------------------------------------------------------------------
+class clsReplayAntDongle(clsAntDongle):
+    ReadThreadTimeout = 20  # The replay cannot be woken up
+
+    def __init__(self, FileName, RealTime=True):
+        self.DeviceID = None
+        self._MessageQueue = queue.Queue()
+        self.Reassembler = clsAntFrameReassembler()  # Not used
+        self.Statistics = clsAntStatistics(self)
+        self.ChannelSetupTime = {}
+        self.Journal = []
+        self.RealTime = RealTime
+        self.Sent = 0
+        self.Finished = False
+        self._Offset = None  # Replay time - recorded time
+
+        self._Records = ReadCapture(FileName)
+        self._Next = next(self._Records, None)
+        self.OK = True
+        self.Message = "Replay of %s" % FileName
+
+    def Write(self, messages, receive=True, drop=True, flush=True):
+        for message in messages:
+            self._DebugMessage(CaptureSent, "Replay    send   :", message)
+            self.Sent += 1
+        if receive:
+            self.Read(drop, 1)
+
+    def _Read(self, _drop, timeout=20, Once=False):
+        now = time.monotonic_ns()
+        Deadline = now + timeout * 1000000
+        count = 0
+        while self._Next is not None:
+            if Once and count:
+                break  # See clsAsyncAntDongle
+            Timestamp, Direction, d = self._Next
+            if self._Offset is None:
+                self._Offset = now - Timestamp
+
+            if self.RealTime:
+                Due = Timestamp + self._Offset
+                now = time.monotonic_ns()
+                if Due > Deadline:
+                    time.sleep(max(0, Deadline - now) / 1e9)
+                    break
+                if Due > now:
+                    time.sleep((Due - now) / 1e9)
+            elif Direction == CaptureSent and count:
+                break
+
+            self._Next = next(self._Records, None)
+            if Direction == CaptureReceived:
+                d = bytes(d)
+                self.MessageQueuePut(d)
+                self._DebugMessage(CaptureReceived, "Replay    receive:", d)
+                count += 1
+
+        if self._Next is None:
+            if not self.Finished:
+                logfile.Console("Replay of ANT capture finished")
+            self.Finished = True
+            if not count:
+                time.sleep(timeout / 1000)  # Like a dongle without data
+
+    def _WakeReadThread(self):
+        pass  # The read ends within ReadThreadTimeout
+
+    def ResetDongle(self):
+        if self.WriteQueue:
+            self.WriteQueue.Pause(Clear=True)
+        self.StopReadThread()
+        self.Journal = []
+
+
+# -------------------------------------------------------------------------------
+# M a p C h a n n e l
+# -------------------------------------------------------------------------------
+# input     d, ANT message
+#           Map, {from channel: to channel}
+#
+# function  Replace the channel number in the message (used by the pool)
+#
+# returns   the message, with new channel and checksum
+# -------------------------------------------------------------------------------
+ChannelLessMessages = (
+    msgID_ResetSystem,
+    msgID_SetNetworkKey,
+    msgID_StartUp,
+    msgID_Capabilities,
+    msgID_ANTversion,
+    msgID_LibConfig,
+)
+
+
+def IsChannelMessage(d):
+    if d[1] == 0 or d[2] in ChannelLessMessages:
+        return False
+    if d[2] in (msgID_ChannelResponse, msgID_RequestMessage):
+        # Response to/request for a message without channel
+        return d[1] < 2 or d[4] not in ChannelLessMessages
+    return True
+
+
+def MapChannel(d, Map):
+    if not IsChannelMessage(d):
+        return d
+    if d[2] == msgID_BurstData:
+        Upper, Channel = d[3] & 0b11100000, d[3] & 0b00011111
+    else:
+        Upper, Channel = 0, d[3]
+    New = Map.get(Channel)
+    if New is None or New == Channel:
+        return d
+    rtn = bytearray(d)
+    rtn[3] = Upper | New
+    rtn[-1] = _XorFold(rtn[:-1])
+    return bytes(rtn)
+
+
+# -------------------------------------------------------------------------------
+# E n u m e r a t e A l l
+# -------------------------------------------------------------------------------
+# input     none
+#
+# function  list all usb-devices
+#
+# returns   none
+# -------------------------------------------------------------------------------
+def EnumerateAll():
+    logfile.Console("Dongles in the system:")
+    devices = usbDevices.Find(Rescan=True)
+    for device in devices:
+        #       print (device)
+        s = "manufacturer=%7s, product=%15s, vendor=%6s, product=%6s(%s)" % (
+            device.manufacturer,
+            device.product,
+            hex(device.idVendor),
+            hex(device.idProduct),
+            device.idProduct,
+        )
+        logfile.Console(s.replace("\0", ""))
+
+        i = 0
+        for cfg in device:  # Do not understand this construction; see pyusb tutorial
+            i += 1
+            for intf in cfg:
+                for _ep in intf:
                     pass
-    logfile.Console("--------------------")
+    logfile.Console("-------------------- %4.1fms" % (usbDevices.ScanTime * 1000))
 
 
 # -------------------------------------------------------------------------------
@@ -1457,35 +3190,128 @@ def calc_checksum(message):
 
 
 def CalcChecksum(message):
-    xor_value = 0
     length = message[1]  # byte 1; length of info
     length += 3  # Add synch, len, id
-    for i in range(0, length):  # Process bytes as defined in length
-        xor_value = xor_value ^ message[i]
+    xor_value = _XorFold(message[:length])  # Process bytes as defined in length
 
     #   print('checksum', logfile.HexSpace(message), xor_value, bytes([xor_value]))
 
-    return bytes([xor_value])
+    return bytes((xor_value,))
+
+
+# -------------------------------------------------------------------------------
+# X o r F o l d
+# -------------------------------------------------------------------------------
+# input     data, bytes-like
+#
+# function  xor all bytes of data
+#           The buffer is taken as one (large) integer, which is folded in two
+#           halves that are xor-ed until one byte remains. For an ANT-message
+#           that's four integer operations instead of a loop over all bytes.
+#
+# returns   the xor-value (int)
+# -------------------------------------------------------------------------------
+def _XorFold(data):
+    n = len(data)
+    x = int.from_bytes(data, "little")
+    while n > 1:
+        n = (n + 1) >> 1  # nr of bytes in lower half
+        bits = n << 3
+        x = (x & ((1 << bits) - 1)) ^ (x >> bits)
+    return x
 
 
 # -------------------------------------------------------------------------------
 # C o m p o s e   A N T   M e s s a g e
 # -------------------------------------------------------------------------------
-def ComposeMessage(id, info):
-    fSynch = sc.unsigned_char
-    fLength = sc.unsigned_char
-    fId = sc.unsigned_char
-    fInfo = str(len(info)) + sc.char_array  # 9 character string
+_MessageHeader = struct.Struct(
+    sc.no_alignment
+    + sc.unsigned_char  # Synch
+    + sc.unsigned_char  # Length
+    + sc.unsigned_char  # Id
+)
+
 
-    format = sc.no_alignment + fSynch + fLength + fId + fInfo
-    data = struct.pack(format, 0xA4, len(info), id, info)
+def ComposeMessage(id, info):
+    length = len(info)
     # -----------------------------------------------------------------------
-    # Add the checksum
+    # synch + length + id + info + checksum in one buffer
     # (antifier added \00\00 after each message for unknown reason)
     # -----------------------------------------------------------------------
-    data += calc_checksum(data)
+    data = bytearray(length + 4)
+    _MessageHeader.pack_into(data, 0, 0xA4, length, id)
+    data[3:-1] = info
+    data[-1] = _XorFold(memoryview(data)[:-1])
+
+    return bytes(data)
+
 
-    return data
+# -------------------------------------------------------------------------------
+# c l s A n t C o d e c
+# -------------------------------------------------------------------------------
+# Description   One precompiled struct.Struct per ANT message or ANT+ page.
+#               The codec is created once, when the module is loaded, and
+#               registered in AntCodecs[] so that the layout of a received
+#               message can be found by (MessageID, DataPageNumber, DeviceTypeID).
+#
+#               DataPageNumber  None for messages without a page (msg4x, SCS)
+#                               or (page, subpage) when one device uses the
+#                               same page number for several layouts.
+#               DeviceTypeID    None for the common pages (70, 71, 73, 80...)
+#
+#               Pack/Unpack     the info-part, as the msgPage/msgUnpage
+#                               functions always did.
+#               PackInto        into a caller-supplied (preallocated) buffer
+#               UnpackFrom      directly from a complete message (offset=3)
+#               Compose         the complete message, including checksum
+# -------------------------------------------------------------------------------
+AntCodecs = {}
+
+
+class clsAntCodec:
+    def __init__(self, MessageID, DataPageNumber, DeviceTypeID, Format):
+        self.MessageID = MessageID
+        self.DataPageNumber = DataPageNumber
+        self.DeviceTypeID = DeviceTypeID
+        self.Struct = struct.Struct(Format)
+        self.Size = self.Struct.size
+
+        self.Pack = self.Struct.pack  # bound methods; no extra call level
+        self.Unpack = self.Struct.unpack
+
+        key = (MessageID, DataPageNumber, DeviceTypeID)
+        assert key not in AntCodecs, "Duplicate ANT codec %s" % (key,)
+        AntCodecs[key] = self
+
+    def PackInto(self, buffer, offset, *values):
+        self.Struct.pack_into(buffer, offset, *values)
+
+    def UnpackFrom(self, message, offset=3):
+        return self.Struct.unpack_from(message, offset)
+
+    def Compose(self, *values):
+        data = bytearray(self.Size + 4)
+        _MessageHeader.pack_into(data, 0, 0xA4, self.Size, self.MessageID)
+        self.Struct.pack_into(data, 3, *values)
+        data[-1] = _XorFold(memoryview(data)[:-1])
+        return bytes(data)
+
+
+# -------------------------------------------------------------------------------
+# G e t C o d e c
+# -------------------------------------------------------------------------------
+# input     MessageID, DataPageNumber, DeviceTypeID as registered by clsAntCodec
+#
+# function  Find the codec for a message; a device specific codec has priority
+#           over a common page.
+#
+# returns   clsAntCodec or None
+# -------------------------------------------------------------------------------
+def GetCodec(MessageID, DataPageNumber, DeviceTypeID=None):
+    rtn = AntCodecs.get((MessageID, DataPageNumber, DeviceTypeID))
+    if rtn is None and DeviceTypeID is not None:
+        rtn = AntCodecs.get((MessageID, DataPageNumber, None))
+    return rtn
 
 
 def DecomposeMessage(d):
@@ -1518,13 +3344,18 @@ def DecomposeMessage(d):
 
     # ---------------------------------------------------------------------------
     # Special treatment for Burst data
-    # Note that SequenceNumber is not returned and therefore lost, which is to
-    #      be implemented as soon as we will use msgID_BurstData
+    # Note that SequenceNumber is not returned; clsAntBurstReassembler takes
+    #      it from info, see unmsg50_BurstData()
     # ---------------------------------------------------------------------------
     if id == msgID_BurstData:
-        _SequenceNumber = (Channel & 0b11100000) >> 5  # Upper 3 bits
         Channel = Channel & 0b00011111  # Lower 5 bits
 
+    # ---------------------------------------------------------------------------
+    # Extended data message: info without the extension, see unmsgExtended()
+    # ---------------------------------------------------------------------------
+    if length > 9 and id in ExtendedMessageIDs:
+        info = info[:9]
+
     return synch, length, id, info, checksum, rest, Channel, DataPageNumber
 
 
@@ -1534,6 +3365,7 @@ def DecomposeMessage(d):
 # input     msg, d
 #
 # function  Write structured dongle message to logfile if so requested
+#           DongleDebugText() returns the text, also used by DecodeTrace()
 #           Message ID is translated to text
 #           Also, channel and page are logged
 #           - the first byte of info is not always channel, if not ignore!
@@ -1541,272 +3373,511 @@ def DecomposeMessage(d):
 #           - and some messages, payload is not printed but specific data
 #               e.g. ANTversion
 #
-# returns   none
+# returns   DongleDebugText: the line for the logfile
+#           DongleDebugMessage: none
 # -------------------------------------------------------------------------------
-def DongleDebugMessage(text, d):
-    if debug.on(debug.Data1):
-        synch, length, id, info, checksum, _rest, Channel, p = DecomposeMessage(d)
-
-        # -----------------------------------------------------------------------
-        # info_ is the payload of the message
-        # Channel and p are filled, but only valid for some messages
-        # -----------------------------------------------------------------------
-        info_ = logfile.HexSpace(info)
-
-        # -----------------------------------------------------------------------
-        # First add readable name (id_) to id
-        # -----------------------------------------------------------------------
-        if id == msgID_ANTversion:
-            id_ = "ANT version"
-
-        elif id == msgID_BroadcastData:
-            id_ = "Broadcast Data"
-        elif id == msgID_AcknowledgedData:
-            id_ = "Acknowledged Data"
-
-        elif id == msgID_ChannelResponse:
-            id_ = "Channel Response"
-        elif id == msgID_Capabilities:
-            id_ = "Capabilities"
-        elif id == msgID_UnassignChannel:
-            id_ = "Unassign Channel"
-        elif id == msgID_AssignChannel:
-            id_ = "Assign Channel"
-        elif id == msgID_ChannelPeriod:
-            id_ = "Channel Period"
-        elif id == msgID_ChannelSearchTimeout:
-            id_ = "Channel Search Timeout"
-        elif id == msgID_ChannelRfFrequency:
-            id_ = "Channel RfFrequency"
-        elif id == msgID_SetNetworkKey:
-            id_ = "Set NetworkKey"
-        elif id == msgID_ResetSystem:
-            id_ = "Reset System"
-        elif id == msgID_OpenChannel:
-            id_ = "Open Channel"
-        elif id == msgID_RequestMessage:
-            id_ = "Request Message"
-        elif id == msgID_ChannelID:
-            id_ = "Channel ID"
-        elif id == msgID_ChannelTransmitPower:
-            id_ = "Channel TransmitPower"
-        elif id == msgID_StartUp:
-            id_ = "Start up"
-        elif id == msgID_RF_EVENT:
-            id_ = "RF event"  # D00000652..._Rev_5.1.pdf 9.5.6.1 Channel response
-        else:
-            id_ = "??"
+def DongleDebugText(text, d):
+    synch, length, id, info, checksum, _rest, Channel, p = DecomposeMessage(d)
 
-        # -------------------------------------------------------------------
-        # extra is additional info for the message
-        # p_ is readable pagenumber if there is a valid pagenumber
-        # -------------------------------------------------------------------
-        extra = ""  # Initially empty
-        p_ = ""  # There is not always page-info, do not show
-
-        if id == msgID_ChannelResponse or id == msgID_RequestMessage:
-            extra = " (ch=%s, msg=%s)" % (Channel, hex(p))
+    # -----------------------------------------------------------------------
+    # info_ is the payload of the message
+    # Channel and p are filled, but only valid for some messages
+    # -----------------------------------------------------------------------
+    info_ = logfile.HexSpace(info)
 
-        elif id == msgID_ANTversion:
-            Channel = -1  # There is no channel number for this message
-            extra = info.decode("utf-8").replace(
-                "\0", ""
-            )  # ANTversion in string format
-            info_ = ""
+    # -----------------------------------------------------------------------
+    # First add readable name (id_) to id
+    # -----------------------------------------------------------------------
+    if id == msgID_ANTversion:
+        id_ = "ANT version"
+
+    elif id == msgID_BroadcastData:
+        id_ = "Broadcast Data"
+    elif id == msgID_AcknowledgedData:
+        id_ = "Acknowledged Data"
+
+    elif id == msgID_ChannelResponse:
+        id_ = "Channel Response"
+    elif id == msgID_Capabilities:
+        id_ = "Capabilities"
+    elif id == msgID_UnassignChannel:
+        id_ = "Unassign Channel"
+    elif id == msgID_AssignChannel:
+        id_ = "Assign Channel"
+    elif id == msgID_ChannelPeriod:
+        id_ = "Channel Period"
+    elif id == msgID_ChannelSearchTimeout:
+        id_ = "Channel Search Timeout"
+    elif id == msgID_ChannelRfFrequency:
+        id_ = "Channel RfFrequency"
+    elif id == msgID_SetNetworkKey:
+        id_ = "Set NetworkKey"
+    elif id == msgID_ResetSystem:
+        id_ = "Reset System"
+    elif id == msgID_OpenChannel:
+        id_ = "Open Channel"
+    elif id == msgID_RequestMessage:
+        id_ = "Request Message"
+    elif id == msgID_ChannelID:
+        id_ = "Channel ID"
+    elif id == msgID_ChannelTransmitPower:
+        id_ = "Channel TransmitPower"
+    elif id == msgID_StartUp:
+        id_ = "Start up"
+    elif id == msgID_RF_EVENT:
+        id_ = "RF event"  # D00000652..._Rev_5.1.pdf 9.5.6.1 Channel response
+    else:
+        id_ = "??"
 
-        elif id == msgID_ChannelID:
-            extra = " (ch=%s, nr=%s, ID=%s, tt=%s)" % (unmsg51_ChannelID(info))
+    # -------------------------------------------------------------------
+    # extra is additional info for the message
+    # p_ is readable pagenumber if there is a valid pagenumber
+    # -------------------------------------------------------------------
+    extra = ""  # Initially empty
+    p_ = ""  # There is not always page-info, do not show
 
-        elif id == msgID_BroadcastData or id == msgID_AcknowledgedData:
-            # Pagenumber in Payload
-            if p < 0:
-                pass
-            elif Channel in (channel_SCS, channel_SCS_s):
-                p_ = " Speed and Cadence Sensor datapage"
-                p = None
-            elif p & 0x7F == 0:
-                p_ = "Default data page"  # D00000693_-_ANT+_Device_Profile_-_Heart_Rate_Rev_2.1
-            # Also called "Unknown data page"
-            # 'HRM' but other devices have other meanings
-            #    Left for future improvements.
-            #    e.g. dependant on Channel
-            elif p & 0x7F == 1:
-                p_ = "HRM Cumulative Operating Time"
-            elif p & 0x7F == 2:
-                p_ = "HRM Manufacturer info"
-            elif p & 0x7F == 3:
-                p_ = "HRM Product information"
-            elif p & 0x7F == 4:
-                p_ = "HRM Previous Heart beat"
-            elif p & 0x7F == 5:
-                p_ = "HRM Swim interval summary"
-            elif p & 0x7F == 6:
-                p_ = "HRM Capabilities"
-            elif p == 16:
-                p_ = "Main data page"
-            elif p == 25:
-                p_ = "Trainer Data"
-            elif p == 48:
-                p_ = "Basic Resistance"
-            elif p == 49:
-                p_ = "Target Power"
-            elif p == 50:
-                p_ = "Wind Resistance"
-            elif p == 51:
-                p_ = "Track Resistance"
-            elif p == 54:
-                p_ = "FE Capabilities"
-            elif p == 55:
-                p_ = "User Configuration"
-            elif p == 70:
-                p_ = "Request Datapage"
-            elif p == 76:
-                p_ = "Mode settings page"
-            elif p == 80:
-                p_ = "Manufacturer Info"
-            elif p == 81:
-                p_ = "Product Information"
-            elif p == 82:
-                p_ = "Battery Status"
-            #           elif p        == 89: p_ = 'Add channel ID to list ???'
-            elif p == 172:
-                p_ = "Tacx Request information/Set mode"
-            elif p == 173:
-                p_ = "Tacx Device information"
-            elif p == 220:
-                p_ = "Tacx Brake control"
-            elif p == 221:
-                p_ = "Tacx Data update"
-            else:
-                p_ = "??"
+    if id == msgID_ChannelResponse or id == msgID_RequestMessage:
+        extra = " (ch=%s, msg=%s)" % (Channel, hex(p))
 
-            if p != None:
-                p_ = " p=%s(%s)" % (p, p_)  # Page, show number and name
+    elif id == msgID_ANTversion:
+        Channel = -1  # There is no channel number for this message
+        extra = info.decode("utf-8").replace("\0", "")  # ANTversion in string format
+        info_ = ""
 
-        elif id == msgID_RF_EVENT:
-            pass  # We could fill info with error code
+    elif id == msgID_ChannelID:
+        extra = " (ch=%s, nr=%s, ID=%s, tt=%s)" % (unmsg51_ChannelID(info))
 
+    elif id == msgID_BroadcastData or id == msgID_AcknowledgedData:
+        # Pagenumber in Payload
+        if p < 0:
+            pass
+        elif Channel in (channel_SCS, channel_SCS_s):
+            p_ = " Speed and Cadence Sensor datapage"
+            p = None
+        elif p & 0x7F == 0:
+            p_ = "Default data page"  # D00000693_-_ANT+_Device_Profile_-_Heart_Rate_Rev_2.1
+        # Also called "Unknown data page"
+        # 'HRM' but other devices have other meanings
+        #    Left for future improvements.
+        #    e.g. dependant on Channel
+        elif p & 0x7F == 1:
+            p_ = "HRM Cumulative Operating Time"
+        elif p & 0x7F == 2:
+            p_ = "HRM Manufacturer info"
+        elif p & 0x7F == 3:
+            p_ = "HRM Product information"
+        elif p & 0x7F == 4:
+            p_ = "HRM Previous Heart beat"
+        elif p & 0x7F == 5:
+            p_ = "HRM Swim interval summary"
+        elif p & 0x7F == 6:
+            p_ = "HRM Capabilities"
+        elif p == 16:
+            p_ = "Main data page"
+        elif p == 25:
+            p_ = "Trainer Data"
+        elif p == 48:
+            p_ = "Basic Resistance"
+        elif p == 49:
+            p_ = "Target Power"
+        elif p == 50:
+            p_ = "Wind Resistance"
+        elif p == 51:
+            p_ = "Track Resistance"
+        elif p == 54:
+            p_ = "FE Capabilities"
+        elif p == 55:
+            p_ = "User Configuration"
+        elif p == 70:
+            p_ = "Request Datapage"
+        elif p == 76:
+            p_ = "Mode settings page"
+        elif p == 80:
+            p_ = "Manufacturer Info"
+        elif p == 81:
+            p_ = "Product Information"
+        elif p == 82:
+            p_ = "Battery Status"
+        #           elif p        == 89: p_ = 'Add channel ID to list ???'
+        elif p == 172:
+            p_ = "Tacx Request information/Set mode"
+        elif p == 173:
+            p_ = "Tacx Device information"
+        elif p == 220:
+            p_ = "Tacx Brake control"
+        elif p == 221:
+            p_ = "Tacx Data update"
         else:
-            Channel = -1  # There is no channel number for this message
-
-        # -----------------------------------------------------------------------
-        # extra is the explanation of info
-        # - if already filled, do not change
-        # - for data-pages "ch=1 p, pagenumber"
-        # -----------------------------------------------------------------------
-        if extra != "":
-            pass  # Already filled
+            p_ = "??"
+
+        if p != None:
+            p_ = " p=%s(%s)" % (p, p_)  # Page, show number and name
+
+    elif id == msgID_RF_EVENT:
+        pass  # We could fill info with error code
+
+    else:
+        Channel = -1  # There is no channel number for this message
+
+    # -----------------------------------------------------------------------
+    # extra is the explanation of info
+    # - if already filled, do not change
+    # - for data-pages "ch=1 p, pagenumber"
+    # -----------------------------------------------------------------------
+    if extra != "":
+        pass  # Already filled
+    else:
+        if Channel == -1:
+            extra = ""  # No Channel, do not show
         else:
-            if Channel == -1:
-                extra = ""  # No Channel, do not show
-            else:
-                extra = " (ch=%s%s)" % (
-                    Channel,
-                    p_,
-                )  # Channel, show it with optional pageinfo
+            extra = " (ch=%s%s)" % (
+                Channel,
+                p_,
+            )  # Channel, show it with optional pageinfo
 
-        # -----------------------------------------------------------------------
-        # Write to logfile
-        # -----------------------------------------------------------------------
-        logfile.Write(
-            "%s synch=%s, len=%2s, id=%s %-21s, check=%4s, info=%s%s"
-            % (text, hex(synch), length, hex(id), id_, hex(checksum), info_, extra)
-        )
+    # -----------------------------------------------------------------------
+    # Compose the logfile line
+    # -----------------------------------------------------------------------
+    return "%s synch=%s, len=%2s, id=%s %-21s, check=%4s, info=%s%s" % (
+        text,
+        hex(synch),
+        length,
+        hex(id),
+        id_,
+        hex(checksum),
+        info_,
+        extra,
+    )
+
+
+def DongleDebugMessage(text, d):
+    if debug.on(debug.Data1):
+        logfile.Write(DongleDebugText(text, d))
 
 
 # ==============================================================================
 # ANT+ message interface
 # ==============================================================================
+# Each message or page has one precompiled codec (see clsAntCodec), defined
+# once when this module is loaded. The msg*() and msgPage*() functions do the
+# range checking and unit conversion and then call codec.Pack/Unpack; the
+# format is never built at runtime.
+#
+# Message codecs (configuration) are registered with DataPageNumber=None.
+# ==============================================================================
+codecMsg41_UnassignChannel = clsAntCodec(
+    msgID_UnassignChannel, None, None, sc.no_alignment + sc.unsigned_char
+)
+codecMsg42_AssignChannel = clsAntCodec(
+    msgID_AssignChannel,
+    None,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # ChannelNumber
+    + sc.unsigned_char  # ChannelType
+    + sc.unsigned_char,  # NetworkNumber
+)
+codecMsg43_ChannelPeriod = clsAntCodec(
+    msgID_ChannelPeriod,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_short,
+)
+codecMsg44_ChannelSearchTimeout = clsAntCodec(
+    msgID_ChannelSearchTimeout,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_short,
+)
+codecMsg45_ChannelRfFrequency = clsAntCodec(
+    msgID_ChannelRfFrequency,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_char,
+)
+codecMsg46_SetNetworkKey = clsAntCodec(
+    msgID_SetNetworkKey,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_long_long,
+)
+codecMsg4A_ResetSystem = clsAntCodec(
+    msgID_ResetSystem, None, None, sc.no_alignment + sc.unsigned_char
+)
+codecMsg4B_OpenChannel = clsAntCodec(
+    msgID_OpenChannel, None, None, sc.no_alignment + sc.unsigned_char
+)
+codecMsg4D_RequestMessage = clsAntCodec(
+    msgID_RequestMessage,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_char,
+)
+codecMsg50_BurstData = clsAntCodec(
+    msgID_BurstData,
+    None,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # Sequence (upper 3 bits) and Channel (lower 5 bits)
+    + "8"
+    + sc.char_array,  # Data
+)
+codecMsg51_ChannelID = clsAntCodec(
+    msgID_ChannelID,
+    None,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # ChannelNumber
+    + sc.unsigned_short  # DeviceNumber
+    + sc.unsigned_char  # DeviceTypeID
+    + sc.unsigned_char,  # TransmissionType
+)
+codecMsg5B_OpenRxScanMode = clsAntCodec(
+    msgID_OpenRxScanMode, None, None, sc.no_alignment + sc.unsigned_char
+)
+codecMsg60_ChannelTransmitPower = clsAntCodec(
+    msgID_ChannelTransmitPower,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_char,
+)
+codecMsg6E_LibConfig = clsAntCodec(
+    msgID_LibConfig,
+    None,
+    None,
+    sc.no_alignment + sc.unsigned_char + sc.unsigned_char,  # Filler, LibConfig
+)
+codecMsg64_ChannelResponse = clsAntCodec(
+    msgID_ChannelResponse,
+    None,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # Channel
+    + sc.unsigned_char  # InitiatingMessageID
+    + sc.unsigned_char,  # ResponseCode
+)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   42   A s s i g n C h a n n e l
 # ------------------------------------------------------------------------------
 def msg41_UnassignChannel(ChannelNumber):
-    format = sc.no_alignment + sc.unsigned_char
-    info = struct.pack(format, ChannelNumber)
-    msg = ComposeMessage(0x41, info)
-    return msg
+    return codecMsg41_UnassignChannel.Compose(ChannelNumber)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   42   A s s i g n C h a n n e l
 # ------------------------------------------------------------------------------
 def msg42_AssignChannel(ChannelNumber, ChannelType, NetworkNumber):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_char + sc.unsigned_char
-    info = struct.pack(format, ChannelNumber, ChannelType, NetworkNumber)
-    msg = ComposeMessage(0x42, info)
-    return msg
+    return codecMsg42_AssignChannel.Compose(ChannelNumber, ChannelType, NetworkNumber)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   43   C h a n n e l P e r i o d
 # ------------------------------------------------------------------------------
 def msg43_ChannelPeriod(ChannelNumber, ChannelPeriod):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_short
-    info = struct.pack(format, ChannelNumber, ChannelPeriod)
-    msg = ComposeMessage(0x43, info)
-    return msg
+    return codecMsg43_ChannelPeriod.Compose(ChannelNumber, ChannelPeriod)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   44   C h a n n e l S e a r c h T i m e o u t
 # ------------------------------------------------------------------------------
 def msg44_ChannelSearchTimeout(ChannelNumber, SearchTimeout):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_short
-    info = struct.pack(format, ChannelNumber, SearchTimeout)
-    msg = ComposeMessage(0x44, info)
-    return msg
+    return codecMsg44_ChannelSearchTimeout.Compose(ChannelNumber, SearchTimeout)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   45   C h a n n e l R f F r e q u e n c y
 # ------------------------------------------------------------------------------
 def msg45_ChannelRfFrequency(ChannelNumber, RfFrequency):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_char
-    info = struct.pack(format, ChannelNumber, RfFrequency)
-    msg = ComposeMessage(0x45, info)
-    return msg
+    return codecMsg45_ChannelRfFrequency.Compose(ChannelNumber, RfFrequency)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   46   S e t N e t w o r k K e y
 # ------------------------------------------------------------------------------
 def msg46_SetNetworkKey(NetworkNumber=0x00, NetworkKey=0x45C372BDFB21A5B9):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_long_long
-    info = struct.pack(format, NetworkNumber, NetworkKey)
-    msg = ComposeMessage(0x46, info)
-    return msg
+    return codecMsg46_SetNetworkKey.Compose(NetworkNumber, NetworkKey)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   4A   R e s e t   S y s t e m
 # ------------------------------------------------------------------------------
 def msg4A_ResetSystem():
-    format = sc.no_alignment + sc.unsigned_char
-    info = struct.pack(format, 0x00)
-    msg = ComposeMessage(0x4A, info)
-    return msg
+    return codecMsg4A_ResetSystem.Compose(0x00)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   4B   O p e n C h a n n e l
 # ------------------------------------------------------------------------------
 def msg4B_OpenChannel(ChannelNumber):
-    format = sc.no_alignment + sc.unsigned_char
-    info = struct.pack(format, ChannelNumber)
-    msg = ComposeMessage(0x4B, info)
-    return msg
+    return codecMsg4B_OpenChannel.Compose(ChannelNumber)
+
+
+# ------------------------------------------------------------------------------
+# A N T   M e s s a g e   4D   R e q u e s t   M e s s a g e
+# ------------------------------------------------------------------------------
+def msg4D_RequestMessage(ChannelNumber, RequestedMessageID):
+    return codecMsg4D_RequestMessage.Compose(ChannelNumber, RequestedMessageID)
+
+
+# ------------------------------------------------------------------------------
+# A N T   M e s s a g e   50   B u r s t D a t a
+# ------------------------------------------------------------------------------
+# D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf
+# 5.3.3 Burst data, 9.5.5.3 Burst Transfer Data (0x50)
+#
+# A burst is a series of packets of 8 bytes; the first byte of the message
+# contains the channel and a sequence number:
+#   bit 7       last packet of the burst
+#   bit 6..5    0 for the first packet, then 1, 2, 3, 1, 2, 3, ...
+#   bit 4..0    channel
+# ------------------------------------------------------------------------------
+BurstPacketSize = 8
+BurstLastPacket = 0b100  # In the sequence number
+
+
+def msg50_BurstData(ChannelNumber, SequenceNumber, Data):
+    return codecMsg50_BurstData.Compose(
+        (SequenceNumber << 5) | (ChannelNumber & 0b00011111), Data
+    )
+
+
+def unmsg50_BurstData(info):
+    # ChannelNumber, SequenceNumber, Data
+    SequenceChannel, Data = codecMsg50_BurstData.Unpack(info)
+    return SequenceChannel & 0b00011111, SequenceChannel >> 5, Data
+
+
+# ------------------------------------------------------------------------------
+# A N T   M e s s a g e   5B   O p e n R x S c a n M o d e
+# ------------------------------------------------------------------------------
+def msg5B_OpenRxScanMode():
+    return codecMsg5B_OpenRxScanMode.Compose(0x00)
+
+
+# ------------------------------------------------------------------------------
+# A N T   M e s s a g e   6E   L i b C o n f i g
+# ------------------------------------------------------------------------------
+# D00000652_ANT_Message_Protocol_and_Usage_Rev_5.1.pdf
+# 7.1.1 Extended messages, 9.5.2.20 Lib Config (0x6E)
+#
+# When enabled, data messages are extended after the 8 data bytes with a
+# flag byte and the requested fields, in this order:
+#   0x80    ChannelID   DeviceNumber (2), DeviceTypeID, TransmissionType
+#   0x40    RSSI        MeasurementType, RSSI (dBm, signed), Threshold
+#   0x20    Timestamp   RX timestamp (2), 1/32768 seconds, see clsAntRxClock
+# ------------------------------------------------------------------------------
+LibConfig_ChannelID = 0x80
+LibConfig_RSSI = 0x40
+LibConfig_Timestamp = 0x20
+
+ExtendedMessageIDs = (msgID_BroadcastData, msgID_AcknowledgedData, msgID_BurstData)
+
+ExtendedChannelID = struct.Struct(
+    sc.little_endian + sc.unsigned_short + sc.unsigned_char + sc.unsigned_char
+)
+ExtendedRSSI = struct.Struct(
+    sc.little_endian + sc.unsigned_char + sc.signed_char + sc.signed_char
+)
+ExtendedTimestamp = struct.Struct(sc.little_endian + sc.unsigned_short)
+
+
+def msg6E_LibConfig(LibConfig):
+    return codecMsg6E_LibConfig.Compose(0x00, LibConfig)
+
+
+# ------------------------------------------------------------------------------
+# input     info = Channel, 8 data bytes, flag byte, extension
+#
+# returns   ChannelID   (DeviceNumber, DeviceTypeID, TransmissionType)
+#           RSSI        dBm
+#           Timestamp   1/32768 seconds, rolls over every 2 seconds
+#           each None when not present
+# ------------------------------------------------------------------------------
+def unmsgExtended(info):
+    ChannelID = RSSI = Timestamp = None
+    if len(info) > 9:
+        flags = info[9]
+        offset = 10
+        if flags & LibConfig_ChannelID and len(info) >= offset + 4:
+            ChannelID = ExtendedChannelID.unpack_from(info, offset)
+            offset += ExtendedChannelID.size
+        if flags & LibConfig_RSSI and len(info) >= offset + 3:
+            RSSI = ExtendedRSSI.unpack_from(info, offset)[1]
+            offset += ExtendedRSSI.size
+        if flags & LibConfig_Timestamp and len(info) >= offset + 2:
+            Timestamp = ExtendedTimestamp.unpack_from(info, offset)[0]
+    return ChannelID, RSSI, Timestamp
+
+
+def unmsgExtended_ChannelID(info):
+    return unmsgExtended(info)[0]
+
+
+# ------------------------------------------------------------------------------
+# c l s A n t R x C l o c k
+# ------------------------------------------------------------------------------
+# function  Convert the RX timestamps of the dongle to host time.time()
+#
+#           The 16-bit timestamps are unwrapped (using the host time between
+#           the messages for gaps of more than one rollover) to Ticks.
+#           Offset = ArrivalTime - Ticks/32768 is smallest for the message that
+#           was read with the least USB and thread delay; that minimum is used
+#           so that the RX time of each message is independent of the delay.
+#           The minimum may rise by MaxDrift seconds per second, to follow a
+#           dongle clock that is slower than the host clock.
+# ------------------------------------------------------------------------------
+class clsAntRxClock:
+    TicksPerSecond = 32768
+    MaxDrift = 100e-6  # 100 ppm
+
+    def __init__(self):
+        self.Ticks = None  # Unwrapped timestamp of the last message
+        self.ArrivalTime = 0
+        self.Offset = None
+
+    def RxTime(self, Timestamp, ArrivalTime):
+        if self.Ticks is None:
+            self.Ticks = Timestamp
+        else:
+            delta = (Timestamp - self.Ticks) & 0xFFFF
+            gap = (ArrivalTime - self.ArrivalTime) * self.TicksPerSecond
+            delta += max(0, round((gap - delta) / 0x10000)) * 0x10000  # Rollovers
+            self.Ticks += delta
+        Seconds = self.Ticks / self.TicksPerSecond
+
+        Offset = ArrivalTime - Seconds
+        if self.Offset is None:
+            self.Offset = Offset
+        else:
+            Drift = (ArrivalTime - self.ArrivalTime) * self.MaxDrift
+            self.Offset = min(Offset, self.Offset + Drift)
+        self.ArrivalTime = ArrivalTime
+        return self.Offset + Seconds
 
 
 # ------------------------------------------------------------------------------
-# A N T   M e s s a g e   4D   R e q u e s t   M e s s a g e
+# C o m p o s e B u r s t
 # ------------------------------------------------------------------------------
-def msg4D_RequestMessage(ChannelNumber, RequestedMessageID):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_char
-    info = struct.pack(format, ChannelNumber, RequestedMessageID)
-    msg = ComposeMessage(0x4D, info)
-    return msg
+# input     ChannelNumber, Payload
+#
+# function  Split Payload in burst packets; the last packet is padded with
+#           zeroes to 8 bytes.
+#
+# returns   list of messages, to be sent with AntDongle.Write() or SendBurst()
+# ------------------------------------------------------------------------------
+def ComposeBurst(ChannelNumber, Payload):
+    Payload = memoryview(bytes(Payload))
+    count = max(1, (len(Payload) + BurstPacketSize - 1) // BurstPacketSize)
+    rtn = []
+    for i in range(count):
+        SequenceNumber = (i - 1) % 3 + 1 if i else 0  # 0, 1, 2, 3, 1, 2, 3
+        if i == count - 1:
+            SequenceNumber |= BurstLastPacket
+        Data = Payload[i * BurstPacketSize : (i + 1) * BurstPacketSize]
+        rtn.append(msg50_BurstData(ChannelNumber, SequenceNumber, bytes(Data)))
+    return rtn
 
 
 # ------------------------------------------------------------------------------
@@ -1818,42 +3889,21 @@ def msg4D_RequestMessage(ChannelNumber, RequestedMessageID):
 # Page 121. 9.5.7.2 Channel ID (0x51)
 # ------------------------------------------------------------------------------
 def msg51_ChannelID(ChannelNumber, DeviceNumber, DeviceTypeID, TransmissionType):
-    format = (
-        sc.no_alignment
-        + sc.unsigned_char
-        + sc.unsigned_short
-        + sc.unsigned_char
-        + sc.unsigned_char
-    )
-    info = struct.pack(
-        format, ChannelNumber, DeviceNumber, DeviceTypeID, TransmissionType
+    return codecMsg51_ChannelID.Compose(
+        ChannelNumber, DeviceNumber, DeviceTypeID, TransmissionType
     )
-    msg = ComposeMessage(0x51, info)
-    return msg
 
 
 def unmsg51_ChannelID(info):
-    #                              0                  1                   2                  3
-    format = (
-        sc.no_alignment
-        + sc.unsigned_char
-        + sc.unsigned_short
-        + sc.unsigned_char
-        + sc.unsigned_char
-    )
-    tuple = struct.unpack(format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3]
+    # ChannelNumber, DeviceNumber, DeviceTypeID, TransmissionType
+    return codecMsg51_ChannelID.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
 # A N T   M e s s a g e   60   C h a n n e l T r a n s m i t P o w e r
 # ------------------------------------------------------------------------------
 def msg60_ChannelTransmitPower(ChannelNumber, TransmitPower):
-    format = sc.no_alignment + sc.unsigned_char + sc.unsigned_char
-    info = struct.pack(format, ChannelNumber, TransmitPower)
-    msg = ComposeMessage(0x60, info)
-    return msg
+    return codecMsg60_ChannelTransmitPower.Compose(ChannelNumber, TransmitPower)
 
 
 # ------------------------------------------------------------------------------
@@ -1863,19 +3913,8 @@ def msg60_ChannelTransmitPower(ChannelNumber, TransmitPower):
 # 9.5.6 Channel response / event messages
 # ------------------------------------------------------------------------------
 def unmsg64_ChannelResponse(info):
-    nChannel = 0
-    fChannel = sc.unsigned_char
-
-    nInitiatingMessageID = 1
-    fInitiatingMessageID = sc.unsigned_char
-
-    nResponseCode = 2
-    fResponseCode = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fInitiatingMessageID + fResponseCode
-    tuple = struct.unpack(format, info)
-
-    return tuple[nChannel], tuple[nInitiatingMessageID], tuple[nResponseCode]
+    # Channel, InitiatingMessageID, ResponseCode
+    return codecMsg64_ChannelResponse.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -1885,45 +3924,31 @@ def unmsg64_ChannelResponse(info):
 #  trainer: D00001086_ANT+_Device_Profile_-_Bicycle_Power_Rev_5.1.pdf
 #           Data page 16 (0x10) Power-only Main Data Page
 # ------------------------------------------------------------------------------
-def msgPage16_PowerOnly(Channel, EventCount, Cadence, AccumulatedPower, CurrentPower):
-    DataPageNumber = 16
+codecPage16_PowerOnly = clsAntCodec(
+    msgID_BroadcastData,
+    16,
+    DeviceTypeID_PWR,
+    sc.no_alignment
+    + sc.unsigned_char  # Channel, first byte of the ANT+ message content
+    + sc.unsigned_char  # DataPageNumber, first byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # EventCount
+    + sc.unsigned_char  # PedalPower
+    + sc.unsigned_char  # InstantaneousCadence
+    + sc.unsigned_short  # AccumulatedPower
+    + sc.unsigned_short,  # InstantaneousPower
+)
+
 
+def msgPage16_PowerOnly(Channel, EventCount, Cadence, AccumulatedPower, CurrentPower):
     EventCount = int(min(0xFF, EventCount))
     Cadence = int(min(0xFF, Cadence))
     AccumulatedPower = int(min(0xFFFF, AccumulatedPower))
     CurrentPower = int(max(0, min(0x0FFF, CurrentPower)))  # 2021-02-19
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEventCount = sc.unsigned_char
-    fPedalPower = sc.unsigned_char
-    fInstantaneousCadence = sc.unsigned_char
-    fAccumulatedPower = sc.unsigned_short
-    fInstantaneousPower = sc.unsigned_short
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fEventCount
-        + fPedalPower
-        + fInstantaneousCadence
-        + fAccumulatedPower
-        + fInstantaneousPower
-    )
-    info = struct.pack(
-        format,
-        Channel,
-        DataPageNumber,
-        EventCount,
-        0xFF,
-        Cadence,
-        AccumulatedPower,
-        CurrentPower,
+    return codecPage16_PowerOnly.Pack(
+        Channel, 16, EventCount, 0xFF, Cadence, AccumulatedPower, CurrentPower
     )
 
-    return info
-
 
 # ------------------------------------------------------------------------------
 # P a g e 0 0   T a c x V o r t e x D a t a S p e e d
@@ -1946,74 +3971,39 @@ def msgPage16_PowerOnly(Channel, EventCount, Cadence, AccumulatedPower, CurrentP
 # 06:15:48,254: IGNORED!! msg=0x4e ch=7 p=0 info="07 00 80 17 00 4a 00 05 1d" TACX_VORTEX_DATA_SPEED
 #                                                ch p  power speed rrrrr cd
 # ------------------------------------------------------------------------------
-def msgPage00_TacxVortexDataSpeed(Channel, Power, Speed, Cadence):
-    DataPageNumber = 0
-
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = (
-        sc.unsigned_char
-    )  # payload[0]        First byte of the ANT+ datapage
-    fPower = sc.unsigned_short  # payload[1 and 2]  Watts, big-endian
-    fSpeed = sc.unsigned_short  # payload[3 and 4]  cm/s, big-endian
-    fReserved = sc.pad * 2  # payload[5 and 6]
-    fCadence = sc.unsigned_char  # payload[7]
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fPower
-        + fSpeed
-        + fReserved
-        + fCadence
-    )
-    info = struct.pack(
-        format, Channel, DataPageNumber, int(Power), int(Speed), int(Cadence)
-    )
+codecPage00_TacxVortexDataSpeed = clsAntCodec(
+    msgID_BroadcastData,
+    0,
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # payload[0]        First byte of the ANT+ datapage
+    + sc.unsigned_short  # payload[1 and 2]  Watts, big-endian
+    + sc.unsigned_short  # payload[3 and 4]  cm/s, big-endian
+    + sc.pad * 2  # payload[5 and 6]
+    + sc.unsigned_char,  # payload[7]        Cadence
+)
 
-    # print('msgPage00_TacxVortexDataSpeed', info, Channel, Power, Speed, Cadence)
 
-    return info
+def msgPage00_TacxVortexDataSpeed(Channel, Power, Speed, Cadence):
+    return codecPage00_TacxVortexDataSpeed.Pack(
+        Channel, 0, int(Power), int(Speed), int(Cadence)
+    )
 
 
 def msgUnpage00_TacxVortexDataSpeed(info):
-    nChannel = 0
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-
-    nDataPageNumber = 1
-    fDataPageNumber = (
-        sc.unsigned_char
-    )  # payload[0]        First byte of the ANT+ datapage
-
-    nPower = 2
-    fPower = sc.unsigned_short  # payload[1 and 2]  Watts, big-endian
-
-    nSpeed = 3
-    fSpeed = sc.unsigned_short  # payload[3 and 4]  cm/s, big-endian
-
-    fReserved = sc.pad * 2  # payload[5 and 6]
-
-    nCadence = 4
-    fCadence = sc.unsigned_char  # payload[7]
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fPower
-        + fSpeed
-        + fReserved
-        + fCadence
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        Power,
+        Speed,
+        Cadence,
+    ) = codecPage00_TacxVortexDataSpeed.Unpack(info)
 
-    _Channel = tuple[nChannel]
-    _DataPageNumber = tuple[nDataPageNumber]
-    UsingVirtualSpeed = (tuple[nPower] & 0x8000) >> 15  # B 1000 0000 0000 0000
-    CalibrationState = (tuple[nPower] & 0x6000) >> 13  # B 0110 0000 0000 0000
-    Power = tuple[nPower] & 0x07FF  # B 0000 0111 1111 1111
-    Speed = tuple[nSpeed] & 0x03FF  # B 0000 0011 1111 1111
-    Cadence = tuple[nCadence]
+    UsingVirtualSpeed = (Power & 0x8000) >> 15  # B 1000 0000 0000 0000
+    CalibrationState = (Power & 0x6000) >> 13  # B 0110 0000 0000 0000
+    Power = Power & 0x07FF  # B 0000 0111 1111 1111
+    Speed = Speed & 0x03FF  # B 0000 0011 1111 1111
 
     return UsingVirtualSpeed, Power, Speed, CalibrationState, Cadence
 
@@ -2038,39 +4028,33 @@ def msgUnpage00_TacxVortexDataSpeed(info):
 # 06:15:35,603: IGNORED!! msg=0x4e ch=7 p=1 info="07 01 3d 0d 00 29 42 00 00" TACX_VORTEX_DATA_SERIAL
 #                                                ch p  s1 s2 serial-- alarm
 # ------------------------------------------------------------------------------
-def msgUnpage01_TacxVortexDataSerial(info):
-    nChannel = 0
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-
-    nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
+codecPage01_TacxVortexDataSerial = clsAntCodec(
+    msgID_BroadcastData,
+    1,
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
+    + sc.unsigned_char  # payload[1]    S1
+    + sc.unsigned_char  # payload[2]    S2
+    + sc.unsigned_char  # payload[3]    S3
+    + sc.unsigned_short  # payload[4, 5] Serial
+    + sc.unsigned_short,  # payload[6, 7] Alarm
+)
 
-    nS1 = 2
-    fS1 = sc.unsigned_char  # payload[1]
 
-    nS2 = 3
-    fS2 = sc.unsigned_char  # payload[2]
-
-    nS3 = 4
-    fS3 = sc.unsigned_char  # payload[3]
-
-    nSerial = 5
-    fSerial = sc.unsigned_short  # payload[4, 5]
-
-    nAlarm = 6
-    fAlarm = sc.unsigned_short  # payload[6, 7]
-
-    format = (
-        sc.big_endian + fChannel + fDataPageNumber + fS1 + fS2 + fS3 + fSerial + fAlarm
-    )
-    tuple = struct.unpack(format, info)
-
-    _Channel = tuple[nChannel]
-    _DataPageNumber = tuple[nDataPageNumber]
-    S1 = tuple[nS1]
-    S2 = tuple[nS2]
-    Serial = tuple[nS3] * 256 * 256 + tuple[nSerial]
-    Alarm = tuple[nAlarm]
+def msgUnpage01_TacxVortexDataSerial(info):
+    (
+        _Channel,
+        _DataPageNumber,
+        S1,
+        S2,
+        S3,
+        Serial,
+        Alarm,
+    ) = codecPage01_TacxVortexDataSerial.Unpack(info)
+
+    Serial = S3 * 256 * 256 + Serial
 
     return S1, S2, Serial, Alarm
 
@@ -2092,40 +4076,28 @@ def msgUnpage01_TacxVortexDataSerial(info):
 # 06:15:35,850: IGNORED!! msg=0x4e ch=7 p=2 info="07 02 00 61 83 00 02 00 07" TACX_VORTEX_DATA_VERSION
 #                                                ch p  rrrrrrrr ma mi build
 # ------------------------------------------------------------------------------
-def msgUnpage02_TacxVortexDataVersion(info):
-    nChannel = 0
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
+codecPage02_TacxVortexDataVersion = clsAntCodec(
+    msgID_BroadcastData,
+    2,
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
+    + sc.pad * 3  # payload[1, 2, 3]
+    + sc.unsigned_char  # payload[4] Major
+    + sc.unsigned_char  # payload[5] Minor
+    + sc.unsigned_short,  # payload[6, 7] Build
+)
 
-    nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
 
-    fReserved = sc.pad * 3  # payload[1, 2, 3]
-
-    nMajor = 2
-    fMajor = sc.unsigned_char  # payload[4]
-
-    nMinor = 3
-    fMinor = sc.unsigned_char  # payload[5]
-
-    nBuild = 4
-    fBuild = sc.unsigned_short  # payload[6, 7]
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fReserved
-        + fMajor
-        + fMinor
-        + fBuild
-    )
-    tuple = struct.unpack(format, info)
-
-    _Channel = tuple[nChannel]
-    _DataPageNumber = tuple[nDataPageNumber]
-    Major = tuple[nMajor]
-    Minor = tuple[nMinor]
-    Build = tuple[nBuild]
+def msgUnpage02_TacxVortexDataVersion(info):
+    (
+        _Channel,
+        _DataPageNumber,
+        Major,
+        Minor,
+        Build,
+    ) = codecPage02_TacxVortexDataVersion.Unpack(info)
 
     return Major, Minor, Build
 
@@ -2149,61 +4121,81 @@ def msgUnpage02_TacxVortexDataVersion(info):
 #                                                      rrrrrrrrrrr cal
 #                                                                     vtxid
 # ------------------------------------------------------------------------------
-def msgPage03_TacxVortexDataCalibration(Channel, Calibration, VortexID):
-    DataPageNumber = 3
-
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-    fReserved = sc.pad * 4  # payload[1, 2, 3, 4]
-    fCalibration = sc.unsigned_char  # payload[5]
-    fVortexID = sc.unsigned_short  # payload[6, 7]
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fReserved
-        + fCalibration
-        + fVortexID
-    )
-    info = struct.pack(format, Channel, DataPageNumber, Calibration, VortexID)
+codecPage03_TacxVortexDataCalibration = clsAntCodec(
+    msgID_BroadcastData,
+    3,
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
+    + sc.pad * 4  # payload[1, 2, 3, 4]
+    + sc.unsigned_char  # payload[5] Calibration
+    + sc.unsigned_short,  # payload[6, 7] VortexID
+)
 
-    # print('msgPage03_TacxVortexDataCalibration', info, Channel, Calibration, VortexID)
 
-    return info
+def msgPage03_TacxVortexDataCalibration(Channel, Calibration, VortexID):
+    return codecPage03_TacxVortexDataCalibration.Pack(Channel, 3, Calibration, VortexID)
 
 
 def msgUnpage03_TacxVortexDataCalibration(info):
-    nChannel = 0
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-
-    nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # payload[0] First byte of the ANT+ datapage
-
-    fReserved = sc.pad * 4  # payload[1, 2, 3, 4]
+    (
+        _Channel,
+        _DataPageNumber,
+        Calibration,
+        VortexID,
+    ) = codecPage03_TacxVortexDataCalibration.Unpack(info)
 
-    nCalibration = 2
-    fCalibration = sc.unsigned_char  # payload[5]
-
-    nVortexID = 3
-    fVortexID = sc.unsigned_short  # payload[6, 7]
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fReserved
-        + fCalibration
-        + fVortexID
-    )
-    tuple = struct.unpack(format, info)
+    return Calibration, VortexID
 
-    _Channel = tuple[nChannel]
-    _DataPageNumber = tuple[nDataPageNumber]
-    Calibration = tuple[nCalibration]
-    VortexID = tuple[nVortexID]
 
-    return Calibration, VortexID
+# ------------------------------------------------------------------------------
+# P a g e 1 6   T a c x V o r t e x   c o m m a n d s
+# ------------------------------------------------------------------------------
+# All Vortex commands are page 16 with the same layout:
+#   channel, page, VortexID, Command, Subcommand, three bytes command data
+# the codec is registered with DataPageNumber=(16, Command).
+# ------------------------------------------------------------------------------
+codecPage16_TacxVortexSetFCSerial = clsAntCodec(
+    msgID_BroadcastData,
+    (16, 0x55),
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_short  # VortexID
+    + sc.unsigned_char  # 0x55 = coupling request
+    + sc.unsigned_char  # no explanation...
+    + sc.pad * 3,
+)
+
+codecPage16_TacxVortexCalibration = clsAntCodec(
+    msgID_BroadcastData,
+    (16, 0x00),
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_short  # VortexID
+    + sc.unsigned_char  # 0x00
+    + sc.unsigned_char  # 0xFF = calibration start, 0x7F = calibration value
+    + sc.unsigned_char  # CalibrationValue
+    + sc.pad * 2,
+)
+
+codecPage16_TacxVortexSetPower = clsAntCodec(
+    msgID_BroadcastData,
+    (16, 0xAA),
+    DeviceTypeID_VTX,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_short  # VortexID
+    + sc.unsigned_char  # 0xAA power request
+    + sc.unsigned_char  # Subcommand
+    + sc.unsigned_char  # NoCalibrationData
+    + sc.unsigned_short,  # Power https://tacx.com/nl/product/i-vortex/
+)
 
 
 # ------------------------------------------------------------------------------
@@ -2218,27 +4210,7 @@ def msgUnpage03_TacxVortexDataCalibration(info):
 #   }
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexSetFCSerial(Channel, VortexID):
-    DataPageNumber = 16
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID = sc.unsigned_short
-    fCommand = sc.unsigned_char  # 0x55 = coupling request
-    fSubcommand = sc.unsigned_char  # no explanation...
-    fReserved = sc.pad * 3
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fVortexID
-        + fCommand
-        + fSubcommand
-        + fReserved
-    )
-    info = struct.pack(format, Channel, DataPageNumber, VortexID, 0x55, 0x7F)
-
-    return info
+    return codecPage16_TacxVortexSetFCSerial.Pack(Channel, 16, VortexID, 0x55, 0x7F)
 
 
 # ------------------------------------------------------------------------------
@@ -2252,27 +4224,7 @@ def msgPage16_TacxVortexSetFCSerial(Channel, VortexID):
 #   }
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexStartCalibration(Channel, VortexID):
-    DataPageNumber = 16
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID = sc.unsigned_short
-    fCommand = sc.unsigned_char  # 0x00
-    fSubcommand = sc.unsigned_char  # 0xFF signals calibration start
-    fReserved = sc.pad * 3
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fVortexID
-        + fCommand
-        + fSubcommand
-        + fReserved
-    )
-    info = struct.pack(format, Channel, DataPageNumber, VortexID, 0x00, 0xFF)
-
-    return info
+    return codecPage16_TacxVortexCalibration.Pack(Channel, 16, VortexID, 0x00, 0xFF, 0)
 
 
 # ------------------------------------------------------------------------------
@@ -2300,31 +4252,9 @@ def msgPage16_tacxVortexStopCalibration(Channel, VortexID):
 #   }
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexSetCalibrationValue(Channel, VortexID, CalibrationValue):
-    DataPageNumber = 16
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID = sc.unsigned_short
-    fCommand = sc.unsigned_char  #
-    fSubcommand = sc.unsigned_char  # 0x7F signals calibration start
-    fCalibrationValue = sc.unsigned_char
-    fReserved = sc.pad * 2
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fVortexID
-        + fCommand
-        + fSubcommand
-        + fCalibrationValue
-        + fReserved
+    return codecPage16_TacxVortexCalibration.Pack(
+        Channel, 16, VortexID, 0, 0x7F, CalibrationValue
     )
-    info = struct.pack(
-        format, Channel, DataPageNumber, VortexID, 0, 0x7F, CalibrationValue
-    )
-
-    return info
 
 
 # ------------------------------------------------------------------------------
@@ -2340,57 +4270,16 @@ def msgPage16_TacxVortexSetCalibrationValue(Channel, VortexID, CalibrationValue)
 #   }
 # ------------------------------------------------------------------------------
 def msgPage16_TacxVortexSetPower(Channel, VortexID, Power):
-    DataPageNumber = 16
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID = sc.unsigned_short
-    fCommand = sc.unsigned_char  # 0xAA power request
-    fSubcommand = sc.unsigned_char
-    fNoCalibrationData = sc.unsigned_char
-    fPower = sc.unsigned_short  # https://tacx.com/nl/product/i-vortex/
     Power = max(0, Power)  # --> No simulation descent ==> power > 0
 
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fVortexID
-        + fCommand
-        + fSubcommand
-        + fNoCalibrationData
-        + fPower
+    return codecPage16_TacxVortexSetPower.Pack(
+        Channel, 16, int(VortexID), 0xAA, 0, 0, int(Power)
     )
-    info = struct.pack(
-        format, Channel, DataPageNumber, int(VortexID), 0xAA, 0, 0, int(Power)
-    )
-
-    return info
 
 
 def msgUnpage16_TacxVortexSetPower(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fVortexID = sc.unsigned_short
-    fCommand = sc.unsigned_char  # 0xAA power request
-    fSubcommand = sc.unsigned_char
-    fNoCalibrationData = sc.unsigned_char
-    fPower = sc.unsigned_short
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fVortexID
-        + fCommand
-        + fSubcommand
-        + fNoCalibrationData
-        + fPower
-    )
-    tuple = struct.unpack(format, info)
-
     # Channel,  DataPageNumber, VortexID, Command,  Subcommand, NoCalibrationData, Power
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    return codecPage16_TacxVortexSetPower.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -2426,88 +4315,86 @@ def msgUnpage16_TacxVortexSetPower(info):
 # to trigger the serial-number (the default frame), the version-number and the
 # battery status.
 # ------------------------------------------------------------------------------
-def msgPage000_TacxVortexHU_StayAlive(Channel):  # No Power Off
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fReserved = sc.pad * 8
+codecPage000_TacxVortexHU_StayAlive = clsAntCodec(
+    msgID_BroadcastData,
+    None,
+    DeviceTypeID_VHU,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.pad * 8,
+)
+
+codecPage172_TacxVortexHU_ChangeHeadunitMode = clsAntCodec(
+    msgID_BroadcastData,
+    172,
+    DeviceTypeID_VHU,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 0x03 Change headunit Mode
+    + sc.unsigned_char  # 0x00=TrainerControl 0x02=SpecialMode 0x04=PCmode
+    + sc.pad * 5,
+)
+
+codecPage221_TacxVortexHU_ButtonPressed = clsAntCodec(
+    msgID_BroadcastData,
+    (221, 0x10),
+    DeviceTypeID_VHU,
+    sc.big_endian
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 2 0x10 Button press
+    + sc.unsigned_char  # 3 Button 1...5
+    + sc.pad * 4  # -
+    + sc.unsigned_char,  # 4 Count
+)
 
-    format = sc.big_endian + fChannel + fReserved
-    info = struct.pack(format, Channel)
 
-    return info
+def msgPage000_TacxVortexHU_StayAlive(Channel):  # No Power Off
+    return codecPage000_TacxVortexHU_StayAlive.Pack(Channel)
 
 
 def msgPage172_TacxVortexHU_ChangeHeadunitMode(Channel, Mode):
-    DataPageNumber = 172
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCommand = sc.unsigned_char  # 0x03 Change headunit Mode
-    fMode = sc.unsigned_char  # 0x00=TrainerControl 0x02=SpecialMode 0x04=PCmode
-    fReserved = sc.pad * 5
-
-    format = sc.big_endian + fChannel + fDataPageNumber + fCommand + fMode + fReserved
-    info = struct.pack(format, Channel, DataPageNumber, 0x03, Mode)
-
-    return info
+    return codecPage172_TacxVortexHU_ChangeHeadunitMode.Pack(Channel, 172, 0x03, Mode)
 
 
 def msgUnpage221_TacxVortexHU_ButtonPressed(info):
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fCommand = sc.unsigned_char  # 2 0x10 Button press
-
-    nButton = 3
-    fButton = sc.unsigned_char  # 3 Button 1...5
-
-    fReserved = sc.pad * 4  # -
-    fCount = sc.unsigned_char  # 4
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fCommand
-        + fButton
-        + fReserved
-        + fCount
-    )
-    tuple = struct.unpack(format, info)
-
-    return tuple[nButton]
+    return codecPage221_TacxVortexHU_ButtonPressed.Unpack(info)[3]  # Button
 
 
 # -------------------------------------------------------------------------------------
 # P a g e 1 7 3  ( 0 x 0 1 )  T a c x V o r t e x S e r i a l M o d e
 # -------------------------------------------------------------------------------------
+codecPage173_01_TacxVortexHU_SerialMode = clsAntCodec(
+    msgID_BroadcastData,
+    (173, 0x01),
+    DeviceTypeID_VHU,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber == 0x01
+    + sc.unsigned_char  # head-unit mode
+    + sc.unsigned_char  # production year
+    + sc.unsigned_char  # device type id
+    + "3"
+    + sc.char_array,  # device number
+)
+
+
 def msgUnpage173_01_TacxVortexHU_SerialMode(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char  # == 0x01
-
-    fMode = sc.unsigned_char  # head-unit mode
-    nMode = 3
-    fYear = sc.unsigned_char  # production year
-    nYear = 4
-    fDeviceType = sc.unsigned_char  # device type id
-    nDeviceType = 5
-    fDeviceNumber = "3" + sc.char_array  # device number
-    nDeviceNumber = 6
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fMode
-        + fYear
-        + fDeviceType
-        + fDeviceNumber
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        _SubPageNumber,
+        Mode,
+        Year,
+        DeviceType,
+        DeviceNumber,
+    ) = codecPage173_01_TacxVortexHU_SerialMode.Unpack(info)
 
-    deviceNumber = int.from_bytes(tuple[nDeviceNumber], byteorder="big")
+    deviceNumber = int.from_bytes(DeviceNumber, byteorder="big")
 
-    return tuple[nMode], tuple[nYear], tuple[nDeviceType], deviceNumber
+    return Mode, Year, DeviceType, deviceNumber
 
 
 # ------------------------------------------------------------------------------
@@ -2520,241 +4407,228 @@ def msgUnpage173_01_TacxVortexHU_SerialMode(info):
 # ------------------------------------------------------------------------------
 # P a g e 2 2 0  ( 0 x 0 1 )  T a c x G e n i u s S e t T a r g e t
 # ------------------------------------------------------------------------------
+codecPage220_01_TacxGeniusSetTarget = clsAntCodec(
+    msgID_BroadcastData,
+    (220, 0x01),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber
+    + sc.unsigned_char  # brake mode (slope/power/heart rate)
+    + sc.short  # target slope (%) * 10/power (W)/HR (bpm)
+    + sc.unsigned_char  # user + bike weight (kg)
+    + sc.pad * 2,
+)
+
+
 def msgPage220_01_TacxGeniusSetTarget(Channel, Mode, Target, Weight):
-    DataPageNumber = 220
-    SubPageNumber = 0x01
     Weight = int(Weight)
     if Mode == GNS_Mode_Slope:
         Target = int(Target * 10)
     else:
         Target = int(Target)
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char
-    fMode = sc.unsigned_char  # brake mode (slope/power/heart rate)
-    fTarget = sc.short  # target slope (%) * 10/power (W)/HR (bpm)
-    fWeight = sc.unsigned_char  # user + bike weight (kg)
-    fPadding = sc.pad * 2
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fMode
-        + fTarget
-        + fWeight
-        + fPadding
+    return codecPage220_01_TacxGeniusSetTarget.Pack(
+        Channel, 220, 0x01, Mode, Target, Weight
     )
-    info = struct.pack(
-        format, Channel, DataPageNumber, SubPageNumber, Mode, Target, Weight
-    )
-
-    return info
 
 
 # ------------------------------------------------------------------------------
 # P a g e 2 2 0  ( 0 x 0 2 )  T a c x G e n i u s W i n d R e s i s t a n c e
 # ------------------------------------------------------------------------------
+codecPage220_02_TacxGeniusWindResistance = clsAntCodec(
+    msgID_BroadcastData,
+    (220, 0x02),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber
+    + sc.unsigned_short  # 0.5 * wind resistance cofficient (kg/m) * 1000
+    + sc.short  # wind speed (m/s) * 250 (head wind = negative)
+    + sc.pad * 2,
+)
+
+
 def msgPage220_02_TacxGeniusWindResistance(Channel, WindResistance, WindSpeed):
-    DataPageNumber = 220
-    SubPageNumber = 0x02
     WindResistance = int(WindResistance)
     WindSpeed = int(WindSpeed)
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char
-    fWindResistance = (
-        sc.unsigned_short
-    )  # 0.5 * wind resistance cofficient (kg/m) * 1000
-    fWindSpeed = sc.short  # wind speed (m/s) * 250 (head wind = negative)
-    fPadding = sc.pad * 2
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fWindResistance
-        + fWindSpeed
-        + fPadding
+    return codecPage220_02_TacxGeniusWindResistance.Pack(
+        Channel, 220, 0x02, WindResistance, WindSpeed
     )
-    info = struct.pack(
-        format, Channel, DataPageNumber, SubPageNumber, WindResistance, WindSpeed
-    )
-
-    return info
 
 
 # ------------------------------------------------------------------------------
 # P a g e 2 2 0  ( 0 x 0 4 )  T a c x G e n i u s C a l i b r a t i o n
 # ------------------------------------------------------------------------------
-def msgPage220_04_TacxGeniusCalibration(Channel, Action):
-    DataPageNumber = 220
-    SubPageNumber = 0x04
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char
-    fAction = sc.unsigned_char  # Calibration action
-    fPadding = sc.pad * 5
+codecPage220_04_TacxGeniusCalibration = clsAntCodec(
+    msgID_BroadcastData,
+    (220, 0x04),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber
+    + sc.unsigned_char  # Calibration action
+    + sc.pad * 5,
+)
 
-    format = (
-        sc.big_endian + fChannel + fDataPageNumber + fSubPageNumber + fAction + fPadding
-    )
-    info = struct.pack(format, Channel, DataPageNumber, SubPageNumber, Action)
 
-    return info
+def msgPage220_04_TacxGeniusCalibration(Channel, Action):
+    return codecPage220_04_TacxGeniusCalibration.Pack(Channel, 220, 0x04, Action)
 
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 1 )  T a c x G e n i u s S p e e d / P o w e r / C a d e n c e
 # -------------------------------------------------------------------------------------
+codecPage221_01_TacxGeniusSpeedPowerCadence = clsAntCodec(
+    msgID_BroadcastData,
+    (221, 0x01),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber == 0x01
+    + sc.unsigned_short  # speed (km/h) * 10
+    + sc.unsigned_short  # power (W)
+    + sc.unsigned_char  # cadence (rpm)
+    + sc.unsigned_char,  # L/R power balance (%)
+)
+
+
 def msgUnpage221_01_TacxGeniusSpeedPowerCadence(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char  # == 0x01
-
-    fSpeed = sc.unsigned_short  # speed (km/h) * 10
-    nSpeed = 3
-    fPower = sc.unsigned_short  # power (W)
-    nPower = 4
-    fCadence = sc.unsigned_char  # cadence (rpm)
-    nCadence = 5
-    fBalance = sc.unsigned_char  # L/R power balance (%)
-    nBalance = 6
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fSpeed
-        + fPower
-        + fCadence
-        + fBalance
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        _SubPageNumber,
+        Speed,
+        Power,
+        Cadence,
+        Balance,
+    ) = codecPage221_01_TacxGeniusSpeedPowerCadence.Unpack(info)
 
-    return tuple[nPower], tuple[nSpeed], tuple[nCadence], tuple[nBalance]
+    return Power, Speed, Cadence, Balance
 
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 2 )  T a c x G e n i u s D i s t a n c e H R
 # -------------------------------------------------------------------------------------
+codecPage221_02_TacxGeniusDistanceHR = clsAntCodec(
+    msgID_BroadcastData,
+    (221, 0x02),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber == 0x02
+    + sc.unsigned_int  # distance (m)
+    + sc.unsigned_char  # heartrate (bpm) (Vortex/Bushido only?)
+    + sc.pad,
+)
+
+
 def msgUnpage221_02_TacxGeniusDistanceHR(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char  # == 0x02
-
-    fDistance = sc.unsigned_int  # distance (m)
-    nDistance = 3
-    fHeartrate = sc.unsigned_char  # heartrate (bpm) (Vortex/Bushido only?)
-    nHeartrate = 4
-    fPadding = sc.pad
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fDistance
-        + fHeartrate
-        + fPadding
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        _SubPageNumber,
+        Distance,
+        Heartrate,
+    ) = codecPage221_02_TacxGeniusDistanceHR.Unpack(info)
 
-    return tuple[nDistance], tuple[nHeartrate]
+    return Distance, Heartrate
 
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 3 )  T a c x G e n i u s A l a r m T e m p e r a t u r e
 # -------------------------------------------------------------------------------------
+codecPage221_03_TacxGeniusAlarmTemperature = clsAntCodec(
+    msgID_BroadcastData,
+    (221, 0x03),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber == 0x03
+    + sc.unsigned_short  # alarm bitmask
+    + sc.unsigned_char  # brake temperature (°C ?)
+    + sc.unsigned_short  # Powerback (W)
+    + sc.pad,
+)
+
+
 def msgUnpage221_03_TacxGeniusAlarmTemperature(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char  # == 0x03
-
-    fAlarm = sc.unsigned_short  # alarm bitmask
-    nAlarm = 3
-    fTemperature = sc.unsigned_char  # brake temperature (°C ?)
-    nTemperature = 4
-    fPowerback = sc.unsigned_short  # Powerback (W)
-    nPowerback = 5
-    fPadding = sc.pad
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fAlarm
-        + fTemperature
-        + fPowerback
-        + fPadding
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        _SubPageNumber,
+        Alarm,
+        Temperature,
+        Powerback,
+    ) = codecPage221_03_TacxGeniusAlarmTemperature.Unpack(info)
 
-    return tuple[nAlarm], tuple[nTemperature], tuple[nPowerback]
+    return Alarm, Temperature, Powerback
 
 
 # -------------------------------------------------------------------------------------
 # P a g e 2 2 1  ( 0 x 0 4 )  T a c x G e n i u s C a l i b r a t i o n I n f o
 # -------------------------------------------------------------------------------------
+codecPage221_04_TacxGeniusCalibrationInfo = clsAntCodec(
+    msgID_BroadcastData,
+    (221, 0x04),
+    DeviceTypeID_GNS,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber == 0x04
+    + sc.unsigned_char  # calibration status
+    + sc.unsigned_short  # calibration value
+    + 3 * sc.pad,
+)
+
+
 def msgUnpage221_04_TacxGeniusCalibrationInfo(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char  # == 0x04
-
-    fCalibrationState = sc.unsigned_char  # calibration status
-    nCalibrationState = 3
-    fCalibrationValue = sc.unsigned_short  # brake temperature (°C ?)
-    nCalibrationValue = 4
-    fPadding = 3 * sc.pad
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fCalibrationState
-        + fCalibrationValue
-        + fPadding
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        _SubPageNumber,
+        CalibrationState,
+        CalibrationValue,
+    ) = codecPage221_04_TacxGeniusCalibrationInfo.Unpack(info)
 
-    return tuple[nCalibrationState], tuple[nCalibrationValue]
+    return CalibrationState, CalibrationValue
 
 
 # -------------------------------------------------------------------------------------
 # P a g e 1 7 3  ( 0 x 0 1 )  T a c x B u s h i d o S e r i a l M o d e
 # -------------------------------------------------------------------------------------
+codecPage173_01_TacxBushidoSerialMode = clsAntCodec(
+    msgID_BroadcastData,
+    (173, 0x01),
+    DeviceTypeID_BHU,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # SubPageNumber == 0x01
+    + sc.unsigned_char  # head unit mode
+    + sc.unsigned_char  # production year
+    + sc.int,  # device number
+)
+
+
 def msgUnpage173_01_TacxBushidoSerialMode(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSubPageNumber = sc.unsigned_char  # == 0x01
-
-    fMode = sc.unsigned_char  # head unit mode
-    nMode = 3
-    fYear = sc.unsigned_char  # production year
-    nYear = 4
-    fDeviceNumber = sc.int  # device number
-    nDeviceNumber = 5
-
-    format = (
-        sc.big_endian
-        + fChannel
-        + fDataPageNumber
-        + fSubPageNumber
-        + fMode
-        + fYear
-        + fDeviceNumber
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        _SubPageNumber,
+        Mode,
+        Year,
+        DeviceNumber,
+    ) = codecPage173_01_TacxBushidoSerialMode.Unpack(info)
 
-    return tuple[nMode], tuple[nYear], tuple[nDeviceNumber]
+    return Mode, Year, DeviceNumber
 
 
 # ------------------------------------------------------------------------------
@@ -2766,8 +4640,23 @@ def msgUnpage173_01_TacxBushidoSerialMode(info):
 # Notes:    Even though HRM is defined, it appears not being picked up by
 #           Trainer Road.
 # ------------------------------------------------------------------------------
+codecPage16_GeneralFEdata = clsAntCodec(
+    msgID_BroadcastData,
+    16,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 2 EquipmentType
+    + sc.unsigned_char  # 3 ElapsedTime
+    + sc.unsigned_char  # 4 DistanceTravelled
+    + sc.unsigned_short  # 5 Speed
+    + sc.unsigned_char  # 6 HeartRate
+    + sc.unsigned_char,  # 7 Capabilities
+)
+
+
 def msgPage16_GeneralFEdata(Channel, ElapsedTime, DistanceTravelled, Speed, HeartRate):
-    DataPageNumber = 16
     EquipmentType = 0x19  # Trainer
     ElapsedTime = int(min(0xFF, ElapsedTime))
     DistanceTravelled = int(min(0xFF, DistanceTravelled))
@@ -2784,30 +4673,9 @@ def msgPage16_GeneralFEdata(Channel, ElapsedTime, DistanceTravelled, Speed, Hear
 
     Capabilities = HRM | Distance | VirtualSpeedFlag | FEstate | LapToggleBit
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEquipmentType = sc.unsigned_char
-    fElapsedTime = sc.unsigned_char
-    fDistanceTravelled = sc.unsigned_char
-    fSpeed = sc.unsigned_short
-    fHeartRate = sc.unsigned_char
-    fCapabilities = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fEquipmentType
-        + fElapsedTime
-        + fDistanceTravelled
-        + fSpeed
-        + fHeartRate
-        + fCapabilities
-    )
-    info = struct.pack(
-        format,
+    return codecPage16_GeneralFEdata.Pack(
         Channel,
-        DataPageNumber,
+        16,
         EquipmentType,
         ElapsedTime,
         DistanceTravelled,
@@ -2816,42 +4684,11 @@ def msgPage16_GeneralFEdata(Channel, ElapsedTime, DistanceTravelled, Speed, Hear
         Capabilities,
     )
 
-    return info
-
 
 def msgUnpage16_GeneralFEdata(info):
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fEquipmentType = sc.unsigned_char  # 2
-    fElapsedTime = sc.unsigned_char  # 3
-    fDistanceTravelled = sc.unsigned_char  # 4
-    fSpeed = sc.unsigned_short  # 5
-    fHeartRate = sc.unsigned_char  # 6
-    fCapabilities = sc.unsigned_char  # 7
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fEquipmentType
-        + fElapsedTime
-        + fDistanceTravelled
-        + fSpeed
-        + fHeartRate
-        + fCapabilities
-    )
-    tuple = struct.unpack(format, info)
-
-    return (
-        tuple[0],
-        tuple[1],
-        tuple[2],
-        tuple[3],
-        tuple[4],
-        tuple[5],
-        tuple[6],
-        tuple[7],
-    )
+    # Channel, DataPageNumber, EquipmentType, ElapsedTime, DistanceTravelled,
+    # Speed, HeartRate, Capabilities
+    return codecPage16_GeneralFEdata.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -2861,38 +4698,33 @@ def msgUnpage16_GeneralFEdata(info):
 #  trainer: D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 #           Data page 25 (0x19) Specific Trainer/Stationary Bike Data
 # ------------------------------------------------------------------------------
+codecPage25_TrainerData = clsAntCodec(
+    msgID_BroadcastData,
+    25,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 2 Event
+    + sc.unsigned_char  # 3 Cadence
+    + sc.unsigned_short  # 4 AccPower
+    + sc.unsigned_short  # 5 InstPower; the first four bits have another meaning!!
+    + sc.unsigned_char,  # 6 Flags
+)
+
+
 def msgPage25_TrainerData(
     Channel, EventCounter, Cadence, AccumulatedPower, CurrentPower
 ):
-    DataPageNumber = 25
     EventCounter = int(min(0xFF, EventCounter))
     Cadence = int(min(0xFF, Cadence))
     AccumulatedPower = int(min(0xFFFF, AccumulatedPower))
     CurrentPower = int(max(0, min(0x0FFF, CurrentPower)))  # 2021-02-19
     Flags = 0x30  # Hmmm.... leave as is but do not understand the value
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fEvent = sc.unsigned_char
-    fCadence = sc.unsigned_char
-    fAccPower = sc.unsigned_short
-    fInstPower = sc.unsigned_short  # The first four bits have another meaning!!
-    fFlags = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fEvent
-        + fCadence
-        + fAccPower
-        + fInstPower
-        + fFlags
-    )
-    info = struct.pack(
-        format,
+    return codecPage25_TrainerData.Pack(
         Channel,
-        DataPageNumber,
+        25,
         EventCounter,
         Cadence,
         AccumulatedPower,
@@ -2900,31 +4732,10 @@ def msgPage25_TrainerData(
         Flags,
     )
 
-    return info
-
 
 def msgUnpage25_TrainerData(info):
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fEvent = sc.unsigned_char  # 2
-    fCadence = sc.unsigned_char  # 3
-    fAccPower = sc.unsigned_short  # 4
-    fInstPower = sc.unsigned_short  # 5 The first four bits have another meaning!!
-    fFlags = sc.unsigned_char  # 6
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fEvent
-        + fCadence
-        + fAccPower
-        + fInstPower
-        + fFlags
-    )
-    tuple = struct.unpack(format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    # Channel, DataPageNumber, Event, Cadence, AccPower, InstPower, Flags
+    return codecPage25_TrainerData.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -2933,22 +4744,24 @@ def msgUnpage25_TrainerData(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 48 (0x30) Basic Resistance
 # ------------------------------------------------------------------------------
-def msgUnpage48_BasicResistance(info):
-    _nChannel = 0
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
+codecPage48_BasicResistance = clsAntCodec(
+    msgID_AcknowledgedData,
+    48,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.pad * 6
+    + sc.unsigned_char,  # TotalResistance
+)
 
-    _nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
 
-    fReserved = sc.pad * 6
-
-    nTotalResistance = 2
-    fTotalResistance = sc.unsigned_char
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fTotalResistance
-    tuple = struct.unpack(format, info)
+def msgUnpage48_BasicResistance(info):
+    _Channel, _DataPageNumber, TotalResistance = codecPage48_BasicResistance.Unpack(
+        info
+    )
 
-    rtn = tuple[nTotalResistance] * 0.005  # 0 ... 100%
+    rtn = TotalResistance * 0.005  # 0 ... 100%
 
     return rtn
 
@@ -2959,22 +4772,22 @@ def msgUnpage48_BasicResistance(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 49 (0x31) Target Power
 # ------------------------------------------------------------------------------
-def msgUnpage49_TargetPower(info):
-    _nChannel = 0
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+codecPage49_TargetPower = clsAntCodec(
+    msgID_AcknowledgedData,
+    49,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.pad * 5
+    + sc.unsigned_short,  # TargetPower, units of 0.25Watt
+)
 
-    fReserved = sc.pad * 5
 
-    nTargetPower = 2
-    fTargetPower = sc.unsigned_short  # units of 0.25Watt
-
-    format = sc.no_alignment + fChannel + fDataPageNumber + fReserved + fTargetPower
-    tuple = struct.unpack(format, info)
+def msgUnpage49_TargetPower(info):
+    _Channel, _DataPageNumber, TargetPower = codecPage49_TargetPower.Unpack(info)
 
-    TargetPower = tuple[nTargetPower] / 4  # returns units of 1Watt
+    TargetPower = TargetPower / 4  # returns units of 1Watt
 
     return TargetPower
 
@@ -2985,48 +4798,39 @@ def msgUnpage49_TargetPower(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 50 (0x32) Wind Resistance
 # ------------------------------------------------------------------------------
-def msgUnpage50_WindResistance(info):
-    _nChannel = 0
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fReserved = sc.pad * 4
-
-    nWindResistanceCoefficient = 2
-    fWindResistanceCoefficient = sc.unsigned_char
+codecPage50_WindResistance = clsAntCodec(
+    msgID_AcknowledgedData,
+    50,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.pad * 4
+    + sc.unsigned_char  # WindResistanceCoefficient
+    + sc.unsigned_char  # WindSpeed
+    + sc.unsigned_char,  # DraftingFactor
+)
 
-    nWindSpeed = 3
-    fWindSpeed = sc.unsigned_char
 
-    nDraftingFactor = 4
-    fDraftingFactor = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved
-        + fWindResistanceCoefficient
-        + fWindSpeed
-        + fDraftingFactor
-    )
-    tuple = struct.unpack(format, info)
+def msgUnpage50_WindResistance(info):
+    (
+        _Channel,
+        _DataPageNumber,
+        WindResistance,
+        WindSpeed,
+        DraftingFactor,
+    ) = codecPage50_WindResistance.Unpack(info)
 
-    WindResistance = tuple[nWindResistanceCoefficient]
     if WindResistance == 0xFF:
         WindResistance = 0.51
     else:
         WindResistance = WindResistance * 0.01  # kg/m
 
-    WindSpeed = tuple[nWindSpeed]
     if WindSpeed == 0xFF:
         WindSpeed = 0.0
     else:
         WindSpeed = WindSpeed - 127  # km/h
 
-    DraftingFactor = tuple[nDraftingFactor]
     if DraftingFactor == 0xFF:
         DraftingFactor = 1.0
     else:
@@ -3041,38 +4845,32 @@ def msgUnpage50_WindResistance(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 51 (0x33) Target Resistance
 # ------------------------------------------------------------------------------
-def msgUnpage51_TrackResistance(info):
-    _nChannel = 0
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
+codecPage51_TrackResistance = clsAntCodec(
+    msgID_AcknowledgedData,
+    51,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.pad * 4
+    + sc.unsigned_short  # Grade
+    + sc.unsigned_char,  # RollingResistance
+)
 
-    _nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
 
-    fReserved = sc.pad * 4
-
-    nGrade = 2
-    fGrade = sc.unsigned_short
-
-    nRollingResistance = 3
-    fRollingResistance = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved
-        + fGrade
-        + fRollingResistance
-    )
-    tuple = struct.unpack(format, info)
+def msgUnpage51_TrackResistance(info):
+    (
+        _Channel,
+        _DataPageNumber,
+        Grade,
+        RollingResistance,
+    ) = codecPage51_TrackResistance.Unpack(info)
 
-    Grade = tuple[nGrade]
     if Grade == 0xFFFF:
         Grade = 0
     Grade = Grade * 0.01 - 200  # -200% - 200%, units 0.01%
     Grade = round(Grade, 2)
 
-    RollingResistance = tuple[nRollingResistance]
     if RollingResistance == 0xFF:
         RollingResistance = 0.004
     else:
@@ -3087,48 +4885,39 @@ def msgUnpage51_TrackResistance(info):
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # Data page 55 (0x37) User Configuration
 # ------------------------------------------------------------------------------
-def msgUnpage55_UserConfiguration(info):
-    _nChannel = 0
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    nUserWeight = 2
-    fUserWeight = sc.unsigned_short
+codecPage55_UserConfiguration = clsAntCodec(
+    msgID_AcknowledgedData,
+    55,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_short  # UserWeight
+    + sc.pad
+    + sc.unsigned_short  # BicycleInfo
+    + sc.unsigned_char  # BicycleWheelDiameter
+    + sc.unsigned_char,  # GearRatio
+)
 
-    fReserved = sc.pad
 
-    nBicycleInfo = 3
-    fBicycleInfo = sc.unsigned_short
-
-    nBicycleWheelDiameter = 4
-    fBicycleWheelDiameter = sc.unsigned_char
-
-    nGearRatio = 5
-    fGearRatio = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fUserWeight
-        + fReserved
-        + fBicycleInfo
-        + fBicycleWheelDiameter
-        + fGearRatio
-    )
-    tuple = struct.unpack(format, info)
+def msgUnpage55_UserConfiguration(info):
+    (
+        _Channel,
+        _DataPageNumber,
+        UserWeight,
+        BicycleInfo,
+        BicycleWheelDiameter,
+        GearRatio,
+    ) = codecPage55_UserConfiguration.Unpack(info)
 
-    UserWeigth = tuple[nUserWeight] * 0.01  # 0 ... 655.34 kg
+    UserWeigth = UserWeight * 0.01  # 0 ... 655.34 kg
 
-    BicycleInfo = tuple[nBicycleInfo]
     _BicyleWheelDiameterOffset = BicycleInfo & 0x000F  # 0 - 10 mm
     BicycleWeigth = (BicycleInfo & 0xFFF0) / 16 * 0.05  # 0 - 50 kg
 
-    BicyleWheelDiameter = tuple[nBicycleWheelDiameter] * 0.01  # 0 - 2.54m
+    BicyleWheelDiameter = BicycleWheelDiameter * 0.01  # 0 - 2.54m
 
-    GearRatio = tuple[nGearRatio] * 0.03  # 0.03 - 7.65
+    GearRatio = GearRatio * 0.03  # 0.03 - 7.65
 
     return UserWeigth, BicycleWeigth, BicyleWheelDiameter, GearRatio
 
@@ -3140,6 +4929,22 @@ def msgUnpage55_UserConfiguration(info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 70: (0x46) RequestDataPage
 # ------------------------------------------------------------------------------
+codecPage70_RequestDataPage = clsAntCodec(
+    msgID_AcknowledgedData,
+    70,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_short  # SlaveSerialNumber
+    + sc.unsigned_char  # DescriptorByte1
+    + sc.unsigned_char  # DescriptorByte2
+    + sc.unsigned_char  # ReqTransmissionResp
+    + sc.unsigned_char  # RequestedPageNumber
+    + sc.unsigned_char,  # CommandType
+)
+
+
 def msgPage70_RequestDataPage(
     Channel,
     SlaveSerialNumber,
@@ -3149,33 +4954,9 @@ def msgPage70_RequestDataPage(
     RequestedPageNumber,
     CommandType,
 ):
-    DataPageNumber = 70
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber = sc.unsigned_short
-    fDescriptorByte1 = sc.unsigned_char
-    fDescriptorByte2 = sc.unsigned_char
-    fReqTransmissionResp = sc.unsigned_char
-    fRequestedPageNumber = sc.unsigned_char
-    fCommandType = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fSlaveSerialNumber
-        + fDescriptorByte1
-        + fDescriptorByte2
-        + fReqTransmissionResp
-        + fRequestedPageNumber
-        + fCommandType
-    )
-
-    info = struct.pack(
-        format,
+    return codecPage70_RequestDataPage.Pack(
         Channel,
-        DataPageNumber,
+        70,
         SlaveSerialNumber,
         DescriptorByte1,
         DescriptorByte2,
@@ -3184,59 +4965,30 @@ def msgPage70_RequestDataPage(
         CommandType,
     )
 
-    return info
-
 
 def msgUnpage70_RequestDataPage(info):
-    _nChannel = 0
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-
-    _nDataPageNumber = 1
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    nSlaveSerialNumber = 2
-    fSlaveSerialNumber = sc.unsigned_short
-
-    nDescriptorByte1 = 3
-    fDescriptorByte1 = sc.unsigned_char
-
-    nDescriptorByte2 = 4
-    fDescriptorByte2 = sc.unsigned_char
-
-    nReqTransmissionResp = 5
-    fReqTransmissionResp = sc.unsigned_char
-
-    nRequestedPageNumber = 6
-    fRequestedPageNumber = sc.unsigned_char
-
-    nCommandType = 7
-    fCommandType = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fSlaveSerialNumber
-        + fDescriptorByte1
-        + fDescriptorByte2
-        + fReqTransmissionResp
-        + fRequestedPageNumber
-        + fCommandType
-    )
-    tuple = struct.unpack(format, info)
+    (
+        _Channel,
+        _DataPageNumber,
+        SlaveSerialNumber,
+        DescriptorByte1,
+        DescriptorByte2,
+        ReqTranmissionResponse,
+        RequestedPageNumber,
+        CommandType,
+    ) = codecPage70_RequestDataPage.Unpack(info)
 
-    ReqTranmissionResponse = tuple[nReqTransmissionResp]
     AckRequired = ReqTranmissionResponse & 0x80
     NrTimes = ReqTranmissionResponse & 0x7F
 
     return (
-        tuple[nSlaveSerialNumber],
-        tuple[nDescriptorByte1],
-        tuple[nDescriptorByte2],
+        SlaveSerialNumber,
+        DescriptorByte1,
+        DescriptorByte2,
         AckRequired,
         NrTimes,
-        tuple[nRequestedPageNumber],
-        tuple[nCommandType],
+        RequestedPageNumber,
+        CommandType,
     )
 
 
@@ -3246,6 +4998,22 @@ def msgUnpage70_RequestDataPage(info):
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # ------------------------------------------------------------------------------
+codecPage54_FE_Capabilities = clsAntCodec(
+    msgID_BroadcastData,
+    54,
+    DeviceTypeID_FE,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # Reserved1
+    + sc.unsigned_char  # Reserved2
+    + sc.unsigned_char  # Reserved3
+    + sc.unsigned_char  # Reserved4
+    + sc.unsigned_short  # MaximumResistance
+    + sc.unsigned_char,  # CapabilitiesBits
+)
+
+
 def msgPage54_FE_Capabilities(
     Channel,
     Reserved1,
@@ -3255,32 +5023,9 @@ def msgPage54_FE_Capabilities(
     MaximumResistance,
     CapabilitiesBits,
 ):
-    DataPageNumber = 54
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1 = sc.unsigned_char
-    fReserved2 = sc.unsigned_char
-    fReserved3 = sc.unsigned_char
-    fReserved4 = sc.unsigned_char
-    fMaximumResistance = sc.unsigned_short
-    fCapabilitiesBits = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved1
-        + fReserved2
-        + fReserved3
-        + fReserved4
-        + fMaximumResistance
-        + fCapabilitiesBits
-    )
-    info = struct.pack(
-        format,
+    return codecPage54_FE_Capabilities.Pack(
         Channel,
-        DataPageNumber,
+        54,
         Reserved1,
         Reserved2,
         Reserved3,
@@ -3289,8 +5034,6 @@ def msgPage54_FE_Capabilities(
         CapabilitiesBits,
     )
 
-    return info
-
 
 # ------------------------------------------------------------------------------
 # P a g e 7 1 _ C o m m a n d S t a t u s
@@ -3298,6 +5041,23 @@ def msgPage54_FE_Capabilities(
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D000001231_-_ANT+_Device_Profile_-_Fitness_Equipment_-_Rev_5.0_(6).pdf
 # ------------------------------------------------------------------------------
+codecPage71_CommandStatus = clsAntCodec(
+    msgID_BroadcastData,
+    71,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # LastReceivedCommandID
+    + sc.unsigned_char  # SequenceNr
+    + sc.unsigned_char  # CommandStatus
+    + sc.unsigned_char  # Data1
+    + sc.unsigned_char  # Data2
+    + sc.unsigned_char  # Data3
+    + sc.unsigned_char,  # Data4
+)
+
+
 def msgPage71_CommandStatus(
     Channel,
     LastReceivedCommandID,
@@ -3308,34 +5068,9 @@ def msgPage71_CommandStatus(
     Data3,
     Data4,
 ):
-    DataPageNumber = 71
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fLastReceivedCommandID = sc.unsigned_char
-    fSequenceNr = sc.unsigned_char
-    fCommandStatus = sc.unsigned_char
-    fData1 = sc.unsigned_char
-    fData2 = sc.unsigned_char
-    fData3 = sc.unsigned_char
-    fData4 = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fLastReceivedCommandID
-        + fSequenceNr
-        + fCommandStatus
-        + fData1
-        + fData2
-        + fData3
-        + fData4
-    )
-    info = struct.pack(
-        format,
+    return codecPage71_CommandStatus.Pack(
         Channel,
-        DataPageNumber,
+        71,
         LastReceivedCommandID,
         SequenceNr,
         CommandStatus,
@@ -3345,8 +5080,6 @@ def msgPage71_CommandStatus(
         Data4,
     )
 
-    return info
-
 
 # ------------------------------------------------------------------------------
 # P a g e 7 3 _ G e n e r i c C o m m a n d
@@ -3354,60 +5087,36 @@ def msgPage71_CommandStatus(
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # ------------------------------------------------------------------------------
+codecPage73_GenericCommand = clsAntCodec(
+    msgID_AcknowledgedData,
+    73,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_short  # SlaveSerialNumber
+    + sc.unsigned_short  # SlaveManufacturerID
+    + sc.unsigned_char  # SequenceNr
+    + sc.unsigned_short,  # CommandNr
+)
+
+
 def msgPage73_GenericCommand(
     Channel, SlaveSerialNumber, SlaveManufacturerID, SequencNr, CommandNr
 ):
-    DataPageNumber = 73
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber = sc.unsigned_short
-    fSlaveManufacturerID = sc.unsigned_short
-    fSequenceNr = sc.unsigned_char
-    fCommandNr = sc.unsigned_short
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fSlaveSerialNumber
-        + fSlaveManufacturerID
-        + fSequenceNr
-        + fCommandNr
-    )
-    info = struct.pack(
-        format,
+    return codecPage73_GenericCommand.Pack(
         Channel,
-        DataPageNumber,
+        73,
         SlaveSerialNumber,
         SlaveManufacturerID,
         SequencNr,
         CommandNr,
     )
 
-    return info
-
 
 def msgUnpage73_GenericCommand(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSlaveSerialNumber = sc.unsigned_short
-    fSlaveManufacturerID = sc.unsigned_short
-    fSequenceNr = sc.unsigned_char
-    fCommandNr = sc.unsigned_short
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fSlaveSerialNumber
-        + fSlaveManufacturerID
-        + fSequenceNr
-        + fCommandNr
-    )
-    tuple = struct.unpack(format, info)
-
-    return tuple[2], tuple[3], tuple[4], tuple[5]
+    # SlaveSerialNumber, SlaveManufacturerID, SequenceNr, CommandNr
+    return codecPage73_GenericCommand.Unpack(info)[2:]
 
 
 # ------------------------------------------------------------------------------
@@ -3416,41 +5125,35 @@ def msgUnpage73_GenericCommand(info):
 # Refer:    https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 80: (0x50) Manufacturers Information
-# ------------------------------------------------------------------------------
+#
+# page 28 byte 4,5,6,7- 15=dynastream, 89=tacx
+# antifier used 15 : "a4 09 4e 00 50 ff ff 01 0f 00 85 83 bb"
+# we use 89 (tacx) with the same ModelNumber
+#
+# Should be variable and caller-supplied; perhaps it influences pairing
+# when trainer-software wants a specific device?
+# ------------------------------------------------------------------------------
+codecPage80_ManufacturerInfo = clsAntCodec(
+    msgID_BroadcastData,
+    80,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 2 Reserved1
+    + sc.unsigned_char  # 3 Reserved2
+    + sc.unsigned_char  # 4 HWrevision
+    + sc.unsigned_short  # 5 ManufacturerID
+    + sc.unsigned_short,  # 6 ModelNumber
+)
+
+
 def msgPage80_ManufacturerInfo(
     Channel, Reserved1, Reserved2, HWrevision, ManufacturerID, ModelNumber
 ):
-    DataPageNumber = 80
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1 = sc.unsigned_char
-    fReserved2 = sc.unsigned_char
-    fHWrevision = sc.unsigned_char
-    fManufacturerID = sc.unsigned_short
-    fModelNumber = sc.unsigned_short
-
-    # page 28 byte 4,5,6,7- 15=dynastream, 89=tacx
-    # antifier used 15 : "a4 09 4e 00 50 ff ff 01 0f 00 85 83 bb"
-    # we use 89 (tacx) with the same ModelNumber
-    #
-    # Should be variable and caller-supplied; perhaps it influences pairing
-    # when trainer-software wants a specific device?
-    #
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved1
-        + fReserved2
-        + fHWrevision
-        + fManufacturerID
-        + fModelNumber
-    )
-    info = struct.pack(
-        format,
+    return codecPage80_ManufacturerInfo.Pack(
         Channel,
-        DataPageNumber,
+        80,
         Reserved1,
         Reserved2,
         HWrevision,
@@ -3458,31 +5161,11 @@ def msgPage80_ManufacturerInfo(
         ModelNumber,
     )
 
-    return info
-
 
 def msgUnpage80_ManufacturerInfo(info):
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fReserved1 = sc.unsigned_char  # 2
-    fReserved2 = sc.unsigned_char  # 3
-    fHWrevision = sc.unsigned_char  # 4
-    fManufacturerID = sc.unsigned_short  # 5
-    fModelNumber = sc.unsigned_short  # 6
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved1
-        + fReserved2
-        + fHWrevision
-        + fManufacturerID
-        + fModelNumber
-    )
-    tuple = struct.unpack(format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5], tuple[6]
+    # Channel, DataPageNumber, Reserved1, Reserved2, HWrevision,
+    # ManufacturerID, ModelNumber
+    return codecPage80_ManufacturerInfo.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -3492,60 +5175,37 @@ def msgUnpage80_ManufacturerInfo(info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 81: (0x51) Product Information
 # ------------------------------------------------------------------------------
+codecPage81_ProductInformation = clsAntCodec(
+    msgID_BroadcastData,
+    81,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 2 Reserved1
+    + sc.unsigned_char  # 3 SWrevisionSupp
+    + sc.unsigned_char  # 4 SWrevisionMain
+    + sc.unsigned_int,  # 5 SerialNumber
+)
+
+
 def msgPage81_ProductInformation(
     Channel, Reserved1, SWrevisionSupp, SWrevisionMain, SerialNumber
 ):
-    DataPageNumber = 81
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1 = sc.unsigned_char
-    fSWrevisionSupp = sc.unsigned_char
-    fSWrevisionMain = sc.unsigned_char
-    fSerialNumber = sc.unsigned_int
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved1
-        + fSWrevisionSupp
-        + fSWrevisionMain
-        + fSerialNumber
-    )
-    info = struct.pack(
-        format,
+    return codecPage81_ProductInformation.Pack(
         Channel,
-        DataPageNumber,
+        81,
         Reserved1,
         SWrevisionSupp,
         SWrevisionMain,
         SerialNumber,
     )
 
-    return info
-
 
 def msgUnpage81_ProductInformation(info):
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fReserved1 = sc.unsigned_char  # 2
-    fSWrevisionSupp = sc.unsigned_char  # 3
-    fSWrevisionMain = sc.unsigned_char  # 4
-    fSerialNumber = sc.unsigned_int  # 5
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved1
-        + fSWrevisionSupp
-        + fSWrevisionMain
-        + fSerialNumber
-    )
-    tuple = struct.unpack(format, info)
-
-    return tuple[0], tuple[1], tuple[2], tuple[3], tuple[4], tuple[5]
+    # Channel, DataPageNumber, Reserved1, SWrevisionSupp, SWrevisionMain,
+    # SerialNumber
+    return codecPage81_ProductInformation.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -3555,36 +5215,27 @@ def msgUnpage81_ProductInformation(info):
 # D00001198_-_ANT+_Common_Data_Pages_Rev_3.1.pdf
 # Common Data Page 82: (0x52) Battery Status
 # ------------------------------------------------------------------------------
+codecPage82_BatteryStatus = clsAntCodec(
+    msgID_BroadcastData,
+    82,
+    None,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # Reserved1
+    + sc.unsigned_char  # BatteryIdentifier
+    + sc.unsigned_char  # CumulativeTime1
+    + sc.unsigned_char  # CumulativeTime2
+    + sc.unsigned_char  # CumulativeTime3
+    + sc.unsigned_char  # BatteryVoltage
+    + sc.unsigned_char,  # DescriptiveBitField
+)
+
+
 def msgPage82_BatteryStatus(Channel):
-    DataPageNumber = 82
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fReserved1 = sc.unsigned_char
-    fBatteryIdentifier = sc.unsigned_char
-    fCumulativeTime1 = sc.unsigned_char
-    fCumulativeTime2 = sc.unsigned_char
-    fCumulativeTime3 = sc.unsigned_char
-    fBatteryVoltage = sc.unsigned_char
-    fDescriptiveBitField = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fReserved1
-        + fBatteryIdentifier
-        + fCumulativeTime1
-        + fCumulativeTime2
-        + fCumulativeTime3
-        + fBatteryVoltage
-        + fDescriptiveBitField
+    return codecPage82_BatteryStatus.Pack(
+        Channel, 82, 0xFF, 0x00, 0, 0, 0, 0, 0x0F | 0x10 | 0x00
     )
-    info = struct.pack(
-        format, Channel, DataPageNumber, 0xFF, 0x00, 0, 0, 0, 0, 0x0F | 0x10 | 0x00
-    )
-
-    return info
 
 
 # ------------------------------------------------------------------------------
@@ -3592,7 +5243,26 @@ def msgPage82_BatteryStatus(Channel):
 # ------------------------------------------------------------------------------
 # https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00000693_-_ANT+_Device_Profile_-_Heart_Rate_Rev_2.1.pdf
-# ------------------------------------------------------------------------------
+#
+# All pages have the same layout, the codec is registered with DataPageNumber
+# None
+# ------------------------------------------------------------------------------
+codecPage_Hrm = clsAntCodec(
+    msgID_BroadcastData,
+    None,
+    DeviceTypeID_HRM,
+    sc.no_alignment
+    + sc.unsigned_char  # 0 First byte of the ANT+ message content
+    + sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # 2 Spec1
+    + sc.unsigned_char  # 3 Spec2
+    + sc.unsigned_char  # 4 Spec3
+    + sc.unsigned_short  # 5 HeartBeatEventTime
+    + sc.unsigned_char  # 6 HeartBeatCount
+    + sc.unsigned_char,  # 7 HeartRate
+)
+
+
 def msgPage_Hrm(
     Channel,
     DataPageNumber,
@@ -3613,28 +5283,7 @@ def msgPage_Hrm(
     HeartBeatCount = int(min(0xFF, HeartBeatCount))
     HeartRate = int(min(0xFF, HeartRate))
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fSpec1 = sc.unsigned_char
-    fSpec2 = sc.unsigned_char
-    fSpec3 = sc.unsigned_char
-    fHeartBeatEventTime = sc.unsigned_short
-    fHeartBeatCount = sc.unsigned_char
-    fHeartRate = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fSpec1
-        + fSpec2
-        + fSpec3
-        + fHeartBeatEventTime
-        + fHeartBeatCount
-        + fHeartRate
-    )
-    info = struct.pack(
-        format,
+    return codecPage_Hrm.Pack(
         Channel,
         DataPageNumber,
         Spec1,
@@ -3645,42 +5294,11 @@ def msgPage_Hrm(
         HeartRate,
     )
 
-    return info
-
 
 def msgUnpage_Hrm(info):
-    fChannel = sc.unsigned_char  # 0 First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # 1 First byte of the ANT+ datapage (payload)
-    fSpec1 = sc.unsigned_char  # 2
-    fSpec2 = sc.unsigned_char  # 3
-    fSpec3 = sc.unsigned_char  # 4
-    fHeartBeatEventTime = sc.unsigned_short  # 5
-    fHeartBeatCount = sc.unsigned_char  # 6
-    fHeartRate = sc.unsigned_char  # 7
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fSpec1
-        + fSpec2
-        + fSpec3
-        + fHeartBeatEventTime
-        + fHeartBeatCount
-        + fHeartRate
-    )
-    tuple = struct.unpack(format, info)
-
-    return (
-        tuple[0],
-        tuple[1],
-        tuple[2],
-        tuple[3],
-        tuple[4],
-        tuple[5],
-        tuple[6],
-        tuple[7],
-    )
+    # Channel, DataPageNumber, Spec1, Spec2, Spec3, HeartBeatEventTime,
+    # HeartBeatCount, HeartRate
+    return codecPage_Hrm.Unpack(info)
 
 
 # ------------------------------------------------------------------------------
@@ -3688,7 +5306,22 @@ def msgUnpage_Hrm(info):
 # ------------------------------------------------------------------------------
 # https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001163_-_ANT+_Device_Profile_-_Bicycle_Speed_and_Cadence_2.1.pdf
+#
+# Note that the combined speed and cadence sensor has no datapage number
 # ------------------------------------------------------------------------------
+codecPage_SCS = clsAntCodec(
+    msgID_BroadcastData,
+    None,
+    DeviceTypeID_SCS,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_short  # CadenceEventTime
+    + sc.unsigned_short  # CadenceRevolutionCount
+    + sc.unsigned_short  # SpeedEventTime
+    + sc.unsigned_short,  # SpeedRevolutionCount
+)
+
+
 def msgPage_SCS(
     Channel,
     CadenceEventTime,
@@ -3696,29 +5329,12 @@ def msgPage_SCS(
     SpeedEventTime,
     SpeedRevolutionCount,
 ):
-    _DataPageNumber = 0
     CadenceEventTime = int(min(0xFFFF, CadenceEventTime))
     CadenceRevolutionCount = int(min(0xFFFF, CadenceRevolutionCount))
     SpeedEventTime = int(min(0xFFFF, SpeedEventTime))
     SpeedRevolutionCount = int(min(0xFFFF, SpeedRevolutionCount))
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    _fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCadenceEventTime = sc.unsigned_short
-    fCadenceRevolutionCount = sc.unsigned_short
-    fSpeedEventTime = sc.unsigned_short
-    fSpeedRevolutionCount = sc.unsigned_short
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fCadenceEventTime
-        + fCadenceRevolutionCount
-        + fSpeedEventTime
-        + fSpeedRevolutionCount
-    )
-    info = struct.pack(
-        format,
+    return codecPage_SCS.Pack(
         Channel,
         CadenceEventTime,
         CadenceRevolutionCount,
@@ -3726,29 +5342,10 @@ def msgPage_SCS(
         SpeedRevolutionCount,
     )
 
-    return info
-
 
 def msgUnpage_SCS(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    _fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCadenceEventTime = sc.unsigned_short
-    fCadenceRevolutionCount = sc.unsigned_short
-    fSpeedEventTime = sc.unsigned_short
-    fSpeedRevolutionCount = sc.unsigned_short
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fCadenceEventTime
-        + fCadenceRevolutionCount
-        + fSpeedEventTime
-        + fSpeedRevolutionCount
-    )
-    tuple = struct.unpack(format, info)
-
     #      EventTime, CadenceRevolutionCount, EventTime, SpeedRevolutionCount
-    return tuple[1], tuple[2], tuple[3], tuple[4]
+    return codecPage_SCS.Unpack(info)[1:]
 
 
 # ------------------------------------------------------------------------------
@@ -3757,6 +5354,23 @@ def msgUnpage_SCS(info):
 # https://www.thisisant.com/developer/resources/downloads#documents_tab
 # D00001307_-_ANT+_Device_Profile_-_Controls_-_2.0.pdf
 # ------------------------------------------------------------------------------
+codecPage2_CTRL = clsAntCodec(
+    msgID_BroadcastData,
+    2,
+    DeviceTypeID_CTRL,
+    sc.no_alignment
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.unsigned_char  # CurrentNotifications
+    + sc.unsigned_char  # Reserved1
+    + sc.unsigned_char  # Reserved2
+    + sc.unsigned_char  # Reserved3
+    + sc.unsigned_char  # Reserved4
+    + sc.unsigned_char  # Reserved5
+    + sc.unsigned_char,  # DeviceCapabilities
+)
+
+
 def msgPage2_CTRL(
     Channel,
     CurrentNotifcations,
@@ -3767,34 +5381,9 @@ def msgPage2_CTRL(
     Reserved5,
     DeviceCapabilities,
 ):
-    DataPageNumber = 2
-
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fCurrentNotifications = sc.unsigned_char
-    fReserved1 = sc.unsigned_char
-    fReserved2 = sc.unsigned_char
-    fReserved3 = sc.unsigned_char
-    fReserved4 = sc.unsigned_char
-    fReserved5 = sc.unsigned_char
-    fDeviceCapabilities = sc.unsigned_char
-
-    format = (
-        sc.no_alignment
-        + fChannel
-        + fDataPageNumber
-        + fCurrentNotifications
-        + fReserved1
-        + fReserved2
-        + fReserved3
-        + fReserved4
-        + fReserved5
-        + fDeviceCapabilities
-    )
-    info = struct.pack(
-        format,
+    return codecPage2_CTRL.Pack(
         Channel,
-        DataPageNumber,
+        2,
         CurrentNotifcations,
         Reserved1,
         Reserved2,
@@ -3804,8 +5393,6 @@ def msgPage2_CTRL(
         DeviceCapabilities,
     )
 
-    return info
-
 
 # ------------------------------------------------------------------------------
 # T a c x  B l a c k T r a c k  p a g e s
@@ -3817,33 +5404,50 @@ def msgPage2_CTRL(
 # -------------------------------------------------------------------------------------
 # P a g e 0 0  T a c x B l a c k T r a c k A n g l e
 # -------------------------------------------------------------------------------------
-def msgUnpage00_TacxBlackTrackAngle(info):
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-
-    fAngle = sc.short  # raw angle
-    nAngle = 2
-    fReserved = sc.unsigned_char  # always 0xff (?)
-    nReserved = 3
-    fPadding = 4 * sc.pad
+codecPage00_TacxBlackTrackAngle = clsAntCodec(
+    msgID_BroadcastData,
+    0,
+    DeviceTypeID_BLTR,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.short  # raw angle
+    + sc.unsigned_char  # always 0xff (?)
+    + 4 * sc.pad,
+)
 
-    format = sc.big_endian + fChannel + fDataPageNumber + fAngle + fReserved + fPadding
-    tuple = struct.unpack(format, info)
 
-    return tuple[nAngle], tuple[nReserved]
+def msgUnpage00_TacxBlackTrackAngle(info):
+    # Angle, Reserved
+    return codecPage00_TacxBlackTrackAngle.Unpack(info)[2:]
 
 
 # ------------------------------------------------------------------------------
 # P a g e 0 1  T a c x B l a c k T r a c k K e e p A l i v e
 # ------------------------------------------------------------------------------
+codecPage01_TacxBlackTrackKeepAlive = clsAntCodec(
+    msgID_BroadcastData,
+    0x01,
+    DeviceTypeID_BLTR,
+    sc.big_endian
+    + sc.unsigned_char  # First byte of the ANT+ message content
+    + sc.unsigned_char  # First byte of the ANT+ datapage (payload)
+    + sc.pad * 7,
+)
+
+
 def msgPage01_TacxBlackTrackKeepAlive(Channel):
-    DataPageNumber = 0x01
+    return codecPage01_TacxBlackTrackKeepAlive.Pack(Channel, 0x01)
 
-    fChannel = sc.unsigned_char  # First byte of the ANT+ message content
-    fDataPageNumber = sc.unsigned_char  # First byte of the ANT+ datapage (payload)
-    fPadding = sc.pad * 7
 
-    format = sc.big_endian + fChannel + fDataPageNumber + fPadding
-    info = struct.pack(format, Channel, DataPageNumber)
+# ==============================================================================
+# Main program; decode a trace file, see clsAntTrace
+# ==============================================================================
+if __name__ == "__main__":
+    import sys
 
-    return info
+    if len(sys.argv) != 2:
+        print("usage: python -m fortius_ant.antDongle <trace file>")
+    else:
+        for line in DecodeTrace(sys.argv[1]):
+            print(line)
@@ -2,7 +2,11 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-15"
+__version__ = "2026-10-18"
+# 2026-10-18    Handlers for the FE-C commands (moved from FortiusAntBody),
+#               registered with clsAntDispatcher by RegisterHandlers()
+#               Requested pages are sent with AntDongle.Send() at
+#               WritePriorityRequested.
 # 2023-04-15    Improve flake8 compliance
 # 2020-12-28    AccumulatedPower not negative
 # 2020-12-27    Interleave and EventCount more according specification
@@ -14,6 +18,8 @@ __version__ = "2023-04-15"
 import time
 
 import fortius_ant.antDongle as ant
+import fortius_ant.debug as debug
+import fortius_ant.logfile as logfile
 
 Interleave = None
 EventCount = None
@@ -22,11 +28,31 @@ AccumulatedTime = None
 DistanceTravelled = None
 AccumulatedLastTime = None
 
+# Command status data, returned in page 71
+p71_LastReceivedCommandID = None
+p71_SequenceNr = None
+p71_CommandStatus = None
+p71_Data1 = None
+p71_Data2 = None
+p71_Data3 = None
+p71_Data4 = None
+
+TargetPowerTime = None  # Time that last TargetPower received
+PowerModeActive = None  # Text showing in userinterface
+
+# Set by RegisterHandlers()
+AntDongle = None
+TacxTrainer = None
+clv = None
+
 
 def Initialize():
     """Initialize interface."""
     global Interleave, EventCount, AccumulatedPower, AccumulatedTime
     global DistanceTravelled, AccumulatedLastTime
+    global p71_LastReceivedCommandID, p71_SequenceNr, p71_CommandStatus
+    global p71_Data1, p71_Data2, p71_Data3, p71_Data4
+    global TargetPowerTime, PowerModeActive
     Interleave = 0
     EventCount = 0
     AccumulatedPower = 0
@@ -34,6 +60,17 @@ def Initialize():
     DistanceTravelled = 0
     AccumulatedLastTime = time.time()
 
+    p71_LastReceivedCommandID = 255
+    p71_SequenceNr = 255
+    p71_CommandStatus = 255
+    p71_Data1 = 0xFF
+    p71_Data2 = 0xFF
+    p71_Data3 = 0xFF
+    p71_Data4 = 0xFF
+
+    TargetPowerTime = 0
+    PowerModeActive = ""
+
 
 # ------------------------------------------------------------------------------
 # B r o a d c a s t T r a i n e r D a t a M e s s a g e
@@ -178,6 +215,256 @@ def BroadcastTrainerDataMessage(Cadence, CurrentPower, SpeedKmh, HeartRate):
     return rtn
 
 
+# ------------------------------------------------------------------------------
+# R e g i s t e r H a n d l e r s
+# ------------------------------------------------------------------------------
+# input:        Dispatcher, clsAntDispatcher
+#               pAntDongle, pTacxTrainer, pclv used by the handlers
+#
+# Description:  The commands from the CTP (Trainer Road, Zwift) are received as
+#               AcknowledgedData on the Fitness Equipment channel.
+# ------------------------------------------------------------------------------
+def RegisterHandlers(Dispatcher, pAntDongle, pTacxTrainer, pclv):
+    """Register the FE-C command handlers."""
+    global AntDongle, TacxTrainer, clv
+    AntDongle = pAntDongle
+    TacxTrainer = pTacxTrainer
+    clv = pclv
+
+    for DataPageNumber, Handler in (
+        (48, HandleBasicResistance),
+        (49, HandleTargetPower),
+        (50, HandleWindResistance),
+        (51, HandleTrackResistance),
+        (55, HandleUserConfiguration),
+        (70, HandleRequestDataPage),
+        (252, HandlePage252),
+    ):
+        Dispatcher.Register(
+            ant.msgID_AcknowledgedData, ant.channel_FE, DataPageNumber, Handler
+        )
+
+
+# ------------------------------------------------------------------------------
+# C o m m a n d S t a t u s
+# ------------------------------------------------------------------------------
+# Update "last command" data in case page 71 is requested later.
+# The raw command data is echoed (cannot use unpage, unpage does unit conversion)
+# ------------------------------------------------------------------------------
+def _CommandStatus(DataPageNumber, Data2, Data3, Data4):
+    global p71_LastReceivedCommandID, p71_SequenceNr, p71_CommandStatus
+    global p71_Data2, p71_Data3, p71_Data4
+    p71_LastReceivedCommandID = DataPageNumber
+    # wrap around after 254 (255 = no command received)
+    p71_SequenceNr = (p71_SequenceNr + 1) % 255
+    p71_CommandStatus = 0  # successfully processed
+    p71_Data2 = Data2
+    p71_Data3 = Data3
+    p71_Data4 = Data4
+
+
+# ------------------------------------------------------------------------------
+# Data page 48 (0x30) Basic resistance
+# ------------------------------------------------------------------------------
+def HandleBasicResistance(_id, _Channel, DataPageNumber, info):
+    """Handle page 48, basic resistance."""
+    # logfile.Console('Data page 48 Basic mode not implemented')
+    # I never saw this appear anywhere (2020-05-08)
+    # TargetMode            = mode_Basic
+    # TargetGradeFromDongle = 0
+    # TargetPowerFromDongle = ant.msgUnpage48_BasicResistance(info) * 1000  # n % of maximum of 1000Watt
+
+    # 2020-11-04 as requested in issue 119
+    # The percentage is used to calculate grade 0...20%
+    Grade = ant.msgUnpage48_BasicResistance(info) * 20
+
+    # Implemented for Magnetic Brake:
+    # - grade is NOT shifted with GradeShift (here never negative)
+    # - but is reduced with factor
+    # - and is NOT reduced with factorDH since never negative
+    Grade *= clv.GradeFactor
+
+    TacxTrainer.SetGrade(Grade)
+    TacxTrainer.SetRollingResistance(0.004)
+    TacxTrainer.SetWind(0.51, 0.0, 1.0)
+
+    _CommandStatus(DataPageNumber, 0xFF, 0xFF, info[8])  # target resistance
+    return True
+
+
+# ------------------------------------------------------------------------------
+# Data page 49 (0x31) Target Power
+# ------------------------------------------------------------------------------
+def HandleTargetPower(_id, _Channel, DataPageNumber, info):
+    """Handle page 49, target power."""
+    global TargetPowerTime
+    TacxTrainer.SetPower(ant.msgUnpage49_TargetPower(info))
+    TargetPowerTime = time.time()
+
+    _CommandStatus(DataPageNumber, 0xFF, info[7], info[8])  # target power LSB/MSB
+    return True
+
+
+# ------------------------------------------------------------------------------
+# Data page 50 (0x32) Wind Resistance
+# ------------------------------------------------------------------------------
+def HandleWindResistance(_id, _Channel, DataPageNumber, info):
+    """Handle page 50, wind resistance."""
+    (
+        WindResistance,
+        WindSpeed,
+        DraftingFactor,
+    ) = ant.msgUnpage50_WindResistance(info)
+    TacxTrainer.SetWind(WindResistance, WindSpeed, DraftingFactor)
+
+    # wind resistance coefficient, wind speed, drafting factor
+    _CommandStatus(DataPageNumber, info[6], info[7], info[8])
+    return True
+
+
+# ------------------------------------------------------------------------------
+# Data page 51 (0x33) Track resistance
+# ------------------------------------------------------------------------------
+def HandleTrackResistance(_id, _Channel, DataPageNumber, info):
+    """Handle page 51, track resistance."""
+    global PowerModeActive
+    if clv.PowerMode and (time.time() - TargetPowerTime) < 30:
+        # -----------------------------------------------------------------------
+        # In PowerMode, TrackResistance is ignored
+        #       (for xx seconds after the last power-command)
+        # So if TrainerRoad is used simultaneously with
+        #       Zwift/Rouvythe power commands from TR
+        #       take precedence over Zwift/Rouvy and a
+        #       power-training can be done while riding
+        #       a Zwift/Rouvy simulation/video!
+        # When TrainerRoad is finished, the Track
+        #       resistance is active again
+        # -----------------------------------------------------------------------
+        PowerModeActive = " [P]"
+    else:
+        Grade, RollingResistance = ant.msgUnpage51_TrackResistance(info)
+
+        # -----------------------------------------------------------------------
+        # Implemented when implementing Magnetic Brake:
+        # [-] grade is shifted with GradeShift (-10% --> 0) ]
+        # - then reduced with factor (can be re-adjusted with Virtual Gearbox)
+        # - and reduced with factorDH (for downhill only)
+        #
+        # GradeAdjust is valid for all configurations!
+        #
+        # GradeShift is not expected to be used anymore,
+        # and only left from earliest implementations
+        # to avoid it has to be re-introduced in future again.
+        # -----------------------------------------------------------------------
+        Grade += clv.GradeShift
+        Grade *= clv.GradeFactor
+        if Grade < 0:
+            Grade *= clv.GradeFactorDH
+
+        TacxTrainer.SetGrade(Grade)
+        TacxTrainer.SetRollingResistance(RollingResistance)
+        PowerModeActive = ""
+
+    # grade LSB, grade MSB, rolling resistance
+    _CommandStatus(DataPageNumber, info[6], info[7], info[8])
+    return True
+
+
+# ------------------------------------------------------------------------------
+# Data page 55 User configuration
+# ------------------------------------------------------------------------------
+def HandleUserConfiguration(_id, _Channel, _DataPageNumber, info):
+    """Handle page 55, user configuration."""
+    (
+        UserWeight,
+        BicycleWeight,
+        BicycleWheelDiameter,
+        GearRatio,
+    ) = ant.msgUnpage55_UserConfiguration(info)
+    TacxTrainer.SetUserConfiguration(
+        UserWeight, BicycleWeight, BicycleWheelDiameter, GearRatio
+    )
+    return True
+
+
+# ------------------------------------------------------------------------------
+# Data page 70 Request data page
+# ------------------------------------------------------------------------------
+def HandleRequestDataPage(_id, _Channel, _DataPageNumber, info):
+    """Handle page 70, request data page."""
+    (
+        _SlaveSerialNumber,
+        _DescriptorByte1,
+        _DescriptorByte2,
+        _AckRequired,
+        NrTimes,
+        RequestedPageNumber,
+        _CommandType,
+    ) = ant.msgUnpage70_RequestDataPage(info)
+
+    info = False
+    if RequestedPageNumber == 54:
+        # Capabilities;
+        # bit 0 = Basic mode
+        # bit 1 = Target/Power/Ergo mode
+        # bit 2 = Simulation/Restance/Slope mode
+        info = ant.msgPage54_FE_Capabilities(
+            ant.channel_FE, 0xFF, 0xFF, 0xFF, 0xFF, 1000, 0x07
+        )
+
+    elif RequestedPageNumber == 71:
+        info = ant.msgPage71_CommandStatus(
+            ant.channel_FE,
+            p71_LastReceivedCommandID,
+            p71_SequenceNr,
+            p71_CommandStatus,
+            p71_Data1,
+            p71_Data2,
+            p71_Data3,
+            p71_Data4,
+        )
+
+    elif RequestedPageNumber == 80:
+        info = ant.msgPage80_ManufacturerInfo(
+            ant.channel_FE,
+            0xFF,
+            0xFF,
+            ant.HWrevision_FE,
+            ant.Manufacturer_tacx,
+            ant.ModelNumber_FE,
+        )
+
+    elif RequestedPageNumber == 81:
+        info = ant.msgPage81_ProductInformation(
+            ant.channel_FE,
+            0xFF,
+            ant.SWrevisionSupp_FE,
+            ant.SWrevisionMain_FE,
+            ant.SerialNumber_FE,
+        )
+
+    elif RequestedPageNumber == 82:
+        info = ant.msgPage82_BatteryStatus(ant.channel_FE)
+
+    elif debug.on(debug.Data1):
+        logfile.Write("FE requested page %s not supported" % RequestedPageNumber)
+
+    if info != False:
+        d = ant.ComposeMessage(ant.msgID_BroadcastData, info)
+        AntDongle.Send([d] * NrTimes, ant.WritePriorityRequested)
+    return True
+
+
+# ------------------------------------------------------------------------------
+# Data page 252 ????
+# ------------------------------------------------------------------------------
+def HandlePage252(_id, _Channel, _DataPageNumber, info):
+    """Ignore page 252."""
+    if debug.on(debug.Data1):
+        logfile.Write("FE data page 252 ignored. info=%s" % logfile.HexSpace(info))
+    return True
+
+
 # -------------------------------------------------------------------------------
 # Main program for module test
 # -------------------------------------------------------------------------------
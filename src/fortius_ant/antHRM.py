@@ -2,7 +2,10 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-15"
+__version__ = "2026-10-18"
+# 2026-10-18    Handlers for the HRM slave channel (moved from FortiusAntBody),
+#               registered with clsAntDispatcher by RegisterHandlers()
+#               ChannelID request sent with AntDongle.Send().
 # 2023-04-15    Improve flake8 compliance
 # 2020-12-27    Interleave like antPWR.py
 # 2020-05-07    devAntDongle not needed, not used
@@ -19,17 +22,31 @@ HeartBeatEventTime = None
 HeartBeatTime = None
 PageChangeToggle = None
 
+# Info received on the HRM slave channel
+Paired = None
+DeviceNumber = None
+HeartRate = None
+
+# Set by RegisterHandlers()
+AntDongle = None
+clv = None
+
 
 def Initialize():
     """Initialize interface."""
     global Interleave, HeartBeatCounter, HeartBeatEventTime
     global HeartBeatTime, PageChangeToggle
+    global Paired, DeviceNumber, HeartRate
     Interleave = 0
     HeartBeatCounter = 0
     HeartBeatEventTime = 0
     HeartBeatTime = 0
     PageChangeToggle = 0
 
+    Paired = False
+    DeviceNumber = 0
+    HeartRate = 0
+
 
 def BroadcastHeartrateMessage(HeartRate):
     """Create next message to be sent.
@@ -116,6 +133,78 @@ def BroadcastHeartrateMessage(HeartRate):
     return hrdata
 
 
+# -------------------------------------------------------------------------------
+# R e g i s t e r H a n d l e r s
+# -------------------------------------------------------------------------------
+# input:        Dispatcher, clsAntDispatcher
+#               pAntDongle, pclv used by the handlers
+#
+# Description:  Heartbeat is received as BroadcastData on the HRM slave channel
+# -------------------------------------------------------------------------------
+def RegisterHandlers(Dispatcher, pAntDongle, pclv):
+    """Register the HRM slave channel handlers."""
+    global AntDongle, clv
+    AntDongle = pAntDongle
+    clv = pclv
+
+    Dispatcher.Register(
+        ant.msgID_BroadcastData, ant.channel_HRM_s, None, HandleHeartRate
+    )
+    Dispatcher.Register(ant.msgID_ChannelID, ant.channel_HRM_s, None, HandleChannelID)
+
+
+# -------------------------------------------------------------------------------
+# Data page 0...7 HRM data
+# -------------------------------------------------------------------------------
+def HandleHeartRate(_id, _Channel, DataPageNumber, info):
+    """Handle HRM data; HeartRate is only used when -H flag specified."""
+    global HeartRate
+    # ---------------------------------------------------------------------------
+    # Ask what device is paired
+    # ---------------------------------------------------------------------------
+    if not Paired:
+        msg = ant.msg4D_RequestMessage(ant.channel_HRM_s, ant.msgID_ChannelID)
+        AntDongle.Send([msg])
+
+    # ---------------------------------------------------------------------------
+    # Data page 89 (HRM strap Garmin#3), 95(HRM strap Garmin#4)
+    # Added to previous set, provides HR info
+    # ---------------------------------------------------------------------------
+    if DataPageNumber & 0x7F in (0, 1, 2, 3, 4, 5, 6, 7, 89, 95):
+        if clv.hrm >= 0:
+            HeartRate = ant.msgUnpage_Hrm(info)[7]
+        return True
+
+    elif DataPageNumber in (89, 95):
+        return True
+
+    return False  # Unknown HRM data page
+
+
+# -------------------------------------------------------------------------------
+# ChannelID - the info that a master on the network is paired
+# -------------------------------------------------------------------------------
+def HandleChannelID(_id, _Channel, _DataPageNumber, info):
+    """Mark the HRM as paired."""
+    global Paired, DeviceNumber
+    (
+        _Channel,
+        pDeviceNumber,
+        DeviceTypeID,
+        _TransmissionType,
+    ) = ant.unmsg51_ChannelID(info)
+
+    if pDeviceNumber == 0:  # No device paired, ignore
+        return True
+
+    if DeviceTypeID == ant.DeviceTypeID_HRM:
+        Paired = True
+        DeviceNumber = pDeviceNumber
+        return True
+
+    return False  # Unexpected device
+
+
 # -------------------------------------------------------------------------------
 # Main program for module test
 # -------------------------------------------------------------------------------
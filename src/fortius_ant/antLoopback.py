@@ -0,0 +1,350 @@
+"""Software ANT dongle with the pyusb endpoint interface, to run without hardware."""
+
+# -------------------------------------------------------------------------------
+# Version info
+# -------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version
+#               Continuous scan mode (Open Rx Scan Mode) and extended messages
+#               with channel ID, RSSI and RX timestamp (Lib Config).
+# -------------------------------------------------------------------------------
+import random
+import threading
+import time
+
+import fortius_ant.antDongle as ant
+import fortius_ant.debug as debug
+import fortius_ant.logfile as logfile
+
+MaxChannels = 8
+MaxNetworks = 8
+ANTversion = b"LOOPBACK\x00"
+RSSI = -60  # dBm, for all simulated devices
+
+
+# -------------------------------------------------------------------------------
+# c l s S i m u l a t e d D e v i c e
+# -------------------------------------------------------------------------------
+# Description   An ANT master device that can be found by a slave channel of
+#               the loopback dongle.
+#
+#               PageFunction(Channel, Count) returns the info of the Count-th
+#               broadcast message.
+#               Loss is the fraction of the messages that is not received.
+# -------------------------------------------------------------------------------
+class clsSimulatedDevice:
+    def __init__(
+        self,
+        DeviceTypeID,
+        DeviceNumber,
+        PageFunction,
+        Loss=0.0,
+        TransmissionType=ant.TransmissionType_IC,
+    ):
+        self.DeviceTypeID = DeviceTypeID
+        self.DeviceNumber = DeviceNumber
+        self.PageFunction = PageFunction
+        self.Loss = Loss
+        self.TransmissionType = TransmissionType
+
+
+def SimulatedHRM(DeviceNumber=1201, HeartRate=120, Loss=0.0):
+    def Page(Channel, Count):
+        # Period is 8070/32768 seconds; HeartBeatEventTime in seconds
+        Beats = Count * 8070 / 32768 * HeartRate / 60
+        EventTime = Beats * 60 / HeartRate % 64
+        return ant.msgPage_Hrm(
+            Channel, 0, 0xFF, 0xFF, 0xFF, EventTime, Beats % 256, HeartRate
+        )
+
+    return clsSimulatedDevice(ant.DeviceTypeID_HRM, DeviceNumber, Page, Loss)
+
+
+def SimulatedSCS(DeviceNumber=1211, Cadence=90, SpeedKmh=30, Loss=0.0):
+    def Page(Channel, Count):
+        Time = Count * 8086 / 32768  # Period is 8086/32768 seconds
+        CadenceRevolutions = Time * Cadence / 60
+        SpeedRevolutions = Time * SpeedKmh / 3.6 / 2.096  # 2.096m wheel
+        return ant.msgPage_SCS(
+            Channel,
+            Time * 1024 % 0x10000,
+            CadenceRevolutions % 0x10000,
+            Time * 1024 % 0x10000,
+            SpeedRevolutions % 0x10000,
+        )
+
+    return clsSimulatedDevice(ant.DeviceTypeID_SCS, DeviceNumber, Page, Loss)
+
+
+def SimulatedVortex(DeviceNumber=1221, Power=150, Speed=300, Cadence=90, Loss=0.0):
+    def Page(Channel, _Count):
+        return ant.msgPage00_TacxVortexDataSpeed(Channel, Power, Speed, Cadence)
+
+    return clsSimulatedDevice(ant.DeviceTypeID_VTX, DeviceNumber, Page, Loss)
+
+
+def SimulatedBlackTrack(DeviceNumber=1231, Angle=0, Loss=0.0):
+    def Page(Channel, _Count):
+        return ant.codecPage00_TacxBlackTrackAngle.Pack(Channel, 0, Angle, 0xFF)
+
+    return clsSimulatedDevice(ant.DeviceTypeID_BLTR, DeviceNumber, Page, Loss)
+
+
+# -------------------------------------------------------------------------------
+# c l s L o o p b a c k C h a n n e l
+# -------------------------------------------------------------------------------
+class clsLoopbackChannel:
+    def __init__(self, ChannelType, NetworkNumber):
+        self.ChannelType = ChannelType
+        self.NetworkNumber = NetworkNumber
+        self.DeviceNumber = 0
+        self.DeviceTypeID = 0
+        self.TransmissionType = 0
+        self.ChannelPeriod = 8192
+        self.Open = False
+        self.Scan = False  # Continuous scan mode, receives all devices
+        self.NextTime = 0
+        self.Count = 0
+        self.Device = None  # clsSimulatedDevice, for a slave channel
+
+    def Master(self):
+        return self.ChannelType & ant.ChannelType_BidirectionalTransmit
+
+
+# -------------------------------------------------------------------------------
+# c l s L o o p b a c k D e v i c e
+# -------------------------------------------------------------------------------
+# Description   Behaves like the pyusb device of an ANT dongle:
+#                   write(0x01, message)
+#                   read(0x81, length, timeout)
+#               so that clsAntDongle(Devices=[clsLoopbackDevice()]) runs the
+#               complete stack (ReadThread, framing, main loop) without dongle.
+#
+#               - Reset, capabilities, ANT version and channel configuration
+#                 are answered as by a dongle
+#               - an open master channel sends EVENT_TX every channel period
+#               - an open slave channel pairs with the first matching
+#                 simulated device and receives its broadcasts every period
+#               - a channel in continuous scan mode receives the broadcasts of
+#                 all simulated devices, extended with the channel ID when
+#                 enabled with Lib Config
+#
+#               TimeScale > 1 makes the channel periods that much shorter,
+#               for load tests.
+# -------------------------------------------------------------------------------
+class clsLoopbackDevice:
+    manufacturer = "Loopback"
+    product = "ANT loopback"
+    idVendor = 0x0FCF
+    idProduct = 0x1008
+    bus = -1
+    _Address = 0
+
+    def __init__(self, SimulatedDevices=None, TimeScale=1.0, Seed=None):
+        if SimulatedDevices is None:
+            SimulatedDevices = [
+                SimulatedHRM(),
+                SimulatedSCS(),
+                SimulatedVortex(),
+                SimulatedBlackTrack(),
+            ]
+        self.SimulatedDevices = SimulatedDevices
+        self.TimeScale = TimeScale
+        self.Random = random.Random(Seed)
+        clsLoopbackDevice._Address += 1
+        self.address = clsLoopbackDevice._Address
+
+        self.Channels = {}
+        self.LibConfig = 0
+        self._Output = []  # Messages to be returned by read()
+        self._Reassembler = ant.clsAntFrameReassembler()
+        self._Condition = threading.Condition()
+
+    # ---------------------------------------------------------------------------
+    # pyusb device functions used by clsAntDongle
+    # ---------------------------------------------------------------------------
+    def __iter__(self):
+        return iter(())  # No configurations, no kernel drivers to detach
+
+    def set_configuration(self):
+        pass
+
+    def is_kernel_driver_active(self, _interface):
+        return False
+
+    def detach_kernel_driver(self, _interface):
+        pass
+
+    def write(self, _endpoint, data, _timeout=None):
+        with self._Condition:
+            for d in self._Reassembler.Feed(data):
+                self._Handle(bytes(d))
+            self._Condition.notify()
+        return len(data)
+
+    def read(self, _endpoint, length, timeout=None):
+        Deadline = time.monotonic() + (timeout or 1000) / 1000
+        with self._Condition:
+            while True:
+                now = time.monotonic()
+                self._Tick(now)
+                if self._Output:
+                    rtn = b""
+                    while self._Output and len(rtn) + len(self._Output[0]) <= length:
+                        rtn += self._Output.pop(0)
+                    return rtn
+                if now >= Deadline:
+                    raise TimeoutError("Loopback read timed out")
+                self._Condition.wait(min(Deadline, self._NextTime()) - now)
+
+    # ---------------------------------------------------------------------------
+    # H a n d l e
+    # ---------------------------------------------------------------------------
+    # function  Process a message written to the dongle
+    # ---------------------------------------------------------------------------
+    def _Handle(self, d):
+        id = d[2]
+        info = d[3:-1]
+        Channel = info[0] if info else 0
+        if debug.on(debug.Data1):
+            logfile.Write("Loopback: received %s" % logfile.HexSpace(d))
+
+        if id == ant.msgID_ResetSystem:
+            self.Channels = {}
+            self.LibConfig = 0
+            self._Output = [ant.ComposeMessage(ant.msgID_StartUp, b"\x00")]
+            return
+
+        if id == ant.msgID_RequestMessage:
+            self._Request(Channel, info[1])
+            return
+
+        if id == ant.msgID_LibConfig:
+            self.LibConfig = info[1]
+            self._Response(0, id, ant.RESPONSE_NO_ERROR)
+            return
+
+        if id == ant.msgID_BurstData:
+            Channel &= 0b00011111
+            if info[0] & 0b10000000:  # Last packet
+                self._Event(Channel, ant.EVENT_TRANSFER_TX_COMPLETED)
+            return
+
+        c = self.Channels.get(Channel)
+        if id == ant.msgID_AssignChannel:
+            self.Channels[Channel] = clsLoopbackChannel(info[1], info[2])
+        elif id == ant.msgID_UnassignChannel:
+            self.Channels.pop(Channel, None)
+        elif c is None and id != ant.msgID_SetNetworkKey:
+            self._Response(Channel, id, 0x15)  # CHANNEL_IN_WRONG_STATE
+            return
+        elif id == ant.msgID_ChannelID:
+            (
+                _Channel,
+                c.DeviceNumber,
+                c.DeviceTypeID,
+                c.TransmissionType,
+            ) = ant.unmsg51_ChannelID(info)
+        elif id == ant.msgID_ChannelPeriod:
+            c.ChannelPeriod = ant.codecMsg43_ChannelPeriod.Unpack(info)[1]
+        elif id in (ant.msgID_OpenChannel, ant.msgID_OpenRxScanMode):
+            c.Open = True
+            c.Scan = id == ant.msgID_OpenRxScanMode
+            c.NextTime = time.monotonic() + self._Period(c)
+            if not c.Master() and not c.Scan:
+                c.Device = self._Pair(c)
+        elif id == ant.msgID_BroadcastData:
+            return  # Sent on next EVENT_TX, no response
+        elif id == ant.msgID_AcknowledgedData:
+            self._Event(Channel, ant.EVENT_TRANSFER_TX_COMPLETED)
+            return
+
+        self._Response(Channel, id, ant.RESPONSE_NO_ERROR)
+
+    def _Request(self, Channel, RequestedMessageID):
+        if RequestedMessageID == ant.msgID_Capabilities:
+            info = bytes((MaxChannels, MaxNetworks, 0, 0, 0, 0))
+            self._Output.append(ant.ComposeMessage(ant.msgID_Capabilities, info))
+        elif RequestedMessageID == ant.msgID_ANTversion:
+            self._Output.append(ant.ComposeMessage(ant.msgID_ANTversion, ANTversion))
+        elif RequestedMessageID == ant.msgID_ChannelID and Channel in self.Channels:
+            c = self.Channels[Channel]
+            if c.Device:
+                d = c.Device
+                ID = (d.DeviceNumber, d.DeviceTypeID, d.TransmissionType)
+            else:
+                ID = (c.DeviceNumber, c.DeviceTypeID, c.TransmissionType)
+            self._Output.append(ant.msg51_ChannelID(Channel, *ID))
+        else:
+            self._Response(Channel, ant.msgID_RequestMessage, 0x28)  # INVALID_MESSAGE
+
+    def _Response(self, Channel, MessageID, ResponseCode):
+        info = bytes((Channel, MessageID, ResponseCode))
+        self._Output.append(ant.ComposeMessage(ant.msgID_ChannelResponse, info))
+
+    def _Event(self, Channel, Event):
+        self._Response(Channel, ant.msgID_RF_EVENT, Event)
+
+    # ---------------------------------------------------------------------------
+    # P a i r
+    # ---------------------------------------------------------------------------
+    # returns   the first simulated device that matches the channel id, where
+    #           zero is a wildcard, and is not paired to another channel
+    # ---------------------------------------------------------------------------
+    def _Pair(self, c):
+        paired = [x.Device for x in self.Channels.values() if x.Device]
+        for d in self.SimulatedDevices:
+            if (
+                d not in paired
+                and c.DeviceTypeID in (0, d.DeviceTypeID)
+                and c.DeviceNumber in (0, d.DeviceNumber)
+            ):
+                return d
+        return None
+
+    # ---------------------------------------------------------------------------
+    # T i c k
+    # ---------------------------------------------------------------------------
+    # function  Generate the events and broadcasts for all periods passed
+    # ---------------------------------------------------------------------------
+    def _Period(self, c):
+        return c.ChannelPeriod / 32768 / self.TimeScale
+
+    def _NextTime(self):
+        rtn = [c.NextTime for c in self.Channels.values() if c.Open]
+        return min(rtn) if rtn else float("inf")
+
+    def _Tick(self, now):
+        for Channel, c in self.Channels.items():
+            if not c.Open:
+                continue
+            if c.NextTime < now - 1:
+                c.NextTime = now  # Far behind, do not catch up
+            while c.NextTime <= now:
+                RxTime = c.NextTime
+                c.NextTime += self._Period(c)
+                c.Count += 1
+                if c.Master():
+                    self._Event(Channel, ant.EVENT_TX)
+                elif c.Scan:
+                    for d in self.SimulatedDevices:
+                        self._Broadcast(Channel, c, d, RxTime)
+                elif c.Device:
+                    self._Broadcast(Channel, c, c.Device, RxTime)
+
+    def _Broadcast(self, Channel, c, Device, RxTime):
+        if self.Random.random() < Device.Loss:
+            return
+        info = Device.PageFunction(Channel, c.Count)
+        if self.LibConfig:
+            info += bytes((self.LibConfig,))
+        if self.LibConfig & ant.LibConfig_ChannelID:
+            info += ant.ExtendedChannelID.pack(
+                Device.DeviceNumber, Device.DeviceTypeID, Device.TransmissionType
+            )
+        if self.LibConfig & ant.LibConfig_RSSI:
+            info += ant.ExtendedRSSI.pack(0x20, RSSI, -96)
+        if self.LibConfig & ant.LibConfig_Timestamp:
+            Timestamp = int(RxTime * ant.clsAntRxClock.TicksPerSecond) & 0xFFFF
+            info += ant.ExtendedTimestamp.pack(Timestamp)
+        self._Output.append(ant.ComposeMessage(ant.msgID_BroadcastData, info))
@@ -0,0 +1,104 @@
+"""Send the pages of the ANT master channels synchronised with the RF slots."""
+
+# -------------------------------------------------------------------------------
+# Version info
+# -------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; master pages were sent on a 250ms time.sleep()
+#               tick that drifts against the channel period.
+#               Pages are sent with AntDongle.Send(), so via the WriteQueue.
+# -------------------------------------------------------------------------------
+import time
+
+import fortius_ant.antDongle as ant
+import fortius_ant.debug as debug
+import fortius_ant.logfile as logfile
+
+
+# -------------------------------------------------------------------------------
+# c l s A n t S c h e d u l e r
+# -------------------------------------------------------------------------------
+# Description   A master channel transmits its data once per channel period.
+#               After each transmission the dongle sends a Channel Response
+#               with EVENT_TX; that is the moment to load the next page,
+#               which is then sent in the next RF slot.
+#
+#               Per channel a PageFunction is registered, returning the next
+#               message for the channel (or None, nothing new).
+#               The PageFunction is called exactly once per EVENT_TX, so that
+#               the Interleave counters in antFE, antPWR etc. are in step
+#               with what is on air.
+#
+#               As long as no EVENT_TX is received for a channel (just after
+#               opening or if the dongle does not send events) the caller
+#               sends the pages itself, using Pages().
+# -------------------------------------------------------------------------------
+class clsAntScheduler:
+    SyncTimeout = 1.0  # No EVENT_TX during this time: not synchronised
+
+    def __init__(self, AntDongle):
+        self.AntDongle = AntDongle
+        self.PageFunctions = {}  # Channel: PageFunction
+        self.LastEventTime = {}  # Channel: time of last EVENT_TX
+        self.Slots = {}  # Channel: nr of EVENT_TX received
+
+    # ---------------------------------------------------------------------------
+    # R e g i s t e r
+    # ---------------------------------------------------------------------------
+    # input     Dispatcher, clsAntDispatcher
+    #           Channel, the master channel
+    #           PageFunction, returns the next message for the channel
+    #
+    # function  Register the PageFunction and HandleEvent() for the channel
+    # ---------------------------------------------------------------------------
+    def Register(self, Dispatcher, Channel, PageFunction):
+        self.PageFunctions[Channel] = PageFunction
+        self.Slots[Channel] = 0
+        Dispatcher.Register(ant.msgID_ChannelResponse, Channel, None, self.HandleEvent)
+
+    # ---------------------------------------------------------------------------
+    # H a n d l e E v e n t
+    # ---------------------------------------------------------------------------
+    # function  On EVENT_TX, load the next page for the channel
+    #
+    # returns   True for EVENT_TX, other responses are not handled
+    # ---------------------------------------------------------------------------
+    def HandleEvent(self, _id, Channel, _DataPageNumber, info):
+        _Channel, MessageID, Code = ant.unmsg64_ChannelResponse(info)
+        if MessageID != ant.msgID_RF_EVENT or Code != ant.EVENT_TX:
+            return False
+
+        self.LastEventTime[Channel] = time.time()
+        self.Slots[Channel] += 1
+        message = self.PageFunctions[Channel]()
+        if message is not None:
+            self.AntDongle.Send([message])
+        if debug.on(debug.Data1):
+            logfile.Write(
+                "AntScheduler: channel %s slot %s" % (Channel, self.Slots[Channel])
+            )
+        return True
+
+    # ---------------------------------------------------------------------------
+    # S y n c h r o n i s e d
+    # ---------------------------------------------------------------------------
+    # returns   True when the channel is fed on EVENT_TX
+    # ---------------------------------------------------------------------------
+    def Synchronised(self, Channel):
+        return time.time() - self.LastEventTime.get(Channel, 0) < self.SyncTimeout
+
+    # ---------------------------------------------------------------------------
+    # P a g e s
+    # ---------------------------------------------------------------------------
+    # function  Get the next page for the channels that are not synchronised
+    #
+    # returns   list of messages, to be sent by the caller
+    # ---------------------------------------------------------------------------
+    def Pages(self):
+        rtn = []
+        for Channel, PageFunction in self.PageFunctions.items():
+            if not self.Synchronised(Channel):
+                message = PageFunction()
+                if message is not None:
+                    rtn.append(message)
+        return rtn
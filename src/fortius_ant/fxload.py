@@ -5,9 +5,10 @@
 import optparse
 import time
 
-import usb.core
 import usb.util
 
+import fortius_ant.usbDevices as usbDevices
+
 # Some words about the variants of TACX head units and brakes:
 #
 # There are 4 different USB based head-units for two types of brakes.
@@ -204,10 +205,7 @@ def main():
 
     # find our device
     devices = [
-        device
-        for device in usb.core.find(
-            custom_match=lambda e: e.idVendor in vendors, find_all=True
-        )
+        device for device in usbDevices.Find(Rescan=True) if device.idVendor in vendors
     ]
 
     if not devices or len(devices) == 0:
@@ -250,10 +248,7 @@ def main():
 
     # find (all) our device(s) after firmwareload
     devices = [
-        device
-        for device in usb.core.find(
-            custom_match=lambda e: e.idVendor in vendors, find_all=True
-        )
+        device for device in usbDevices.Find(Rescan=True) if device.idVendor in vendors
     ]
 
     retry = 0
@@ -265,9 +260,8 @@ def main():
         print("Waiting for device ... Try again")
         devices = [
             device
-            for device in usb.core.find(
-                custom_match=lambda e: e.idVendor in vendors, find_all=True
-            )
+            for device in usbDevices.Find(Rescan=True)
+            if device.idVendor in vendors
         ]
 
     print("\nDevices found after download:")
@@ -1,7 +1,8 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2022-12-28"
+__version__ = "2026-10-18"
+# 2026-10-18    FileName of the logfile kept, e.g. for the ANT trace file
 # 2022-12-28    PythonLogger.info() error in Write() avoided by disabling.
 # 2022-04-07    Comment typo corrected
 # 2022-03-28    Traceback() added
@@ -37,6 +38,7 @@ from fortius_ant.constants import UsePythonLogging
 
 global LogfileCreated
 LogfileCreated = False
+FileName = None  # Of the logfile, set by Open()
 
 if UsePythonLogging:
     import logging
@@ -152,6 +154,7 @@ class clsLogfileJson:
 # -------------------------------------------------------------------------------
 def Open(prefix="FortiusAnt", suffix=""):
     global fLogfile, LogfileJson, LogfileCreated, UsePythonLogging, PythonLogger
+    global FileName
 
     fLogfile = None
     if debug.on():
@@ -167,6 +170,7 @@ def Open(prefix="FortiusAnt", suffix=""):
             + suffix
             + ".log"
         )
+        FileName = filename
 
         # -----------------------------------------------------------------------
         # Open the file
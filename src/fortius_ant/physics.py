@@ -0,0 +1,267 @@
+"""The cycling model: power required for a speed, and the speed for a power."""
+
+# -------------------------------------------------------------------------------
+# Version info
+# -------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; Power2Speed() solves the model in closed form,
+#               replacing the bisection in clsTacxTrainer.Power2Speed().
+#               Grade2Power() and Grade2PowerFietsNL() accept NumPy arrays;
+#               Power2SpeedArray() and CubicRootsArray() are the vectorised
+#               Power2Speed() and CubicRoots(), for offline tools.
+#               clsTacxTrainer uses the scalar functions of this module.
+# -------------------------------------------------------------------------------
+# All functions accept scalars; the functions marked (array) accept NumPy
+# arrays as well, broadcast against each other, so that e.g. a whole ride is
+# calculated in one call:
+#   Power = Grade2Power(SpeedKmh=numpy.array([...]), Grade=numpy.array([...]),
+#                       Weight=85)
+# -------------------------------------------------------------------------------
+import functools
+import math
+
+import numpy
+
+g = 9.81  # m/s2
+MaxSpeedKmh = 100  # Smart guy going faster :-)
+
+
+# -------------------------------------------------------------------------------
+# G r a d e 2 P o w e r
+# -------------------------------------------------------------------------------
+# input     SpeedKmh, Grade (percentage), Weight (user and bike, kg)
+#           RollingResistance, WindResistance (CdA, default=0.51),
+#           WindSpeed (km/h, headwind positive), DraftingFactor
+#
+# function  The model of www.gribble.org (array)
+#           See: https://www.gribble.org/cycling/power_v_speed.html
+#               Power = Proll + Pair + Pslope
+#
+# returns   Power in Watt (float)
+# -------------------------------------------------------------------------------
+def Grade2Power(
+    SpeedKmh,
+    Grade,
+    Weight,
+    RollingResistance=0.004,
+    WindResistance=0.51,
+    WindSpeed=0,
+    DraftingFactor=1.0,
+):
+    v = SpeedKmh / 3.6  # m/s   km/hr * 1000 / 3600
+    w = WindSpeed / 3.6
+    Proll = RollingResistance * Weight * g * v
+    # without abs a strong tailwind would result in a higher power
+    Pair = 0.5 * WindResistance * (v + w) * abs(v + w) * DraftingFactor * v
+    Pslope = Grade / 100 * Weight * g * v
+    return Proll + Pair + Pslope
+
+
+# -------------------------------------------------------------------------------
+# G r a d e 2 P o w e r F i e t s N L
+# -------------------------------------------------------------------------------
+# input     SpeedKmh, Grade (percentage), Weight (user and bike, kg)
+#           RollingResistance
+#
+# function  Thanks to https://www.fiets.nl/2016/05/02/de-natuurkunde-van-het-fietsen/
+#           Required power = roll + air + slope + mechanical (array)
+#           Air-density, CdA and the mechanical power are constants, there is
+#           no wind.
+#
+# returns   Power in Watt (float)
+# -------------------------------------------------------------------------------
+def Grade2PowerFietsNL(SpeedKmh, Grade, Weight, RollingResistance=0.004):
+    v = SpeedKmh / 3.6  # m/s       km/hr * 1000 / 3600
+    Proll = RollingResistance * Weight * g * v  # Watt
+
+    p = 1.205  # air-density
+    cdA = 0.3  # resistance factor
+    w = 0  # wind-speed
+    Pair = 0.5 * p * cdA * (v + w) * (v + w) * v  # Watt
+
+    Pslope = Grade / 100 * Weight * g * v  # Watt
+
+    Pbike = 37
+    return Proll + Pair + Pslope + Pbike
+
+
+# -------------------------------------------------------------------------------
+# P o w e r 2 S p e e d
+# -------------------------------------------------------------------------------
+# input     Power (Watt), other parameters as Grade2Power()
+#
+# function  Solve Grade2Power(Speed) == Power for Speed; exact, no search.
+#
+#           With a = (RollingResistance + Grade/100) * Weight * g
+#                b = 0.5 * WindResistance * DraftingFactor
+#           Power = a*v + b*(v+w)*|v+w|*v, which for v+w >= 0 is the cubic
+#               b*v^3 + 2bw*v^2 + (b*w^2 + a)*v - Power = 0
+#           and for v+w < 0 (tailwind faster than the cyclist) the same with
+#           -b instead of b.
+#
+#           A steep descent has two speeds for a (negative) power; the
+#           highest speed is returned, which is the stable one.
+#
+#           The result is cached; the parameters change seldomly and Power
+#           is an integer, so the same equation is solved often.
+#
+# returns   Speed in km/h, 0...MaxSpeedKmh; 0 when there is no solution
+# -------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1024)
+def Power2Speed(
+    Power,
+    Grade,
+    Weight,
+    RollingResistance=0.004,
+    WindResistance=0.51,
+    WindSpeed=0,
+    DraftingFactor=1.0,
+):
+    if Power == 0:
+        return 0  # No power, no speed
+
+    a = (RollingResistance + Grade / 100) * Weight * g
+    b = 0.5 * WindResistance * DraftingFactor
+    w = WindSpeed / 3.6
+
+    Speed = 0
+    for sign in (1, -1):  # v + w >= 0, then v + w < 0
+        bs = b * sign
+        for v in CubicRoots(bs, 2 * bs * w, bs * w * w + a, -Power):
+            if v > 0 and (v + w >= 0) == (sign == 1):
+                Speed = max(Speed, v * 3.6)
+    return min(Speed, MaxSpeedKmh)
+
+
+# -------------------------------------------------------------------------------
+# C u b i c R o o t s
+# -------------------------------------------------------------------------------
+# input     a3, a2, a1, a0: a3*x^3 + a2*x^2 + a1*x + a0 = 0
+#
+# function  Real roots with Cardano's method (one real root) or the
+#           trigonometric method (three real roots); a3 == 0 is solved as a
+#           quadratic or linear equation.
+#
+# returns   list of the real roots
+# -------------------------------------------------------------------------------
+def CubicRoots(a3, a2, a1, a0):
+    if a3 == 0:
+        if a2 == 0:
+            return [-a0 / a1] if a1 else []
+        D = a1 * a1 - 4 * a2 * a0
+        if D < 0:
+            return []
+        return [(-a1 + s * math.sqrt(D)) / (2 * a2) for s in (1, -1)]
+
+    # ---------------------------------------------------------------------------
+    # Depressed cubic t^3 + p*t + q = 0, with x = t - a2 / (3 * a3)
+    # ---------------------------------------------------------------------------
+    A2, A1, A0 = a2 / a3, a1 / a3, a0 / a3
+    shift = A2 / 3
+    p = A1 - A2 * A2 / 3
+    q = 2 * A2**3 / 27 - A2 * A1 / 3 + A0
+
+    D = (q / 2) ** 2 + (p / 3) ** 3
+    if D > 0:
+        s = math.sqrt(D)
+        t = _cbrt(-q / 2 + s) + _cbrt(-q / 2 - s)
+        return [t - shift]
+    if p == 0:
+        return [-shift]  # Triple root
+    r = 2 * math.sqrt(-p / 3)
+    phi = math.acos(max(-1, min(1, 3 * q / (p * r))))
+    return [r * math.cos((phi - 2 * math.pi * k) / 3) - shift for k in range(3)]
+
+
+def _cbrt(x):
+    return math.copysign(abs(x) ** (1 / 3), x)
+
+
+# -------------------------------------------------------------------------------
+# P o w e r 2 S p e e d A r r a y
+# -------------------------------------------------------------------------------
+# input     as Power2Speed(), NumPy arrays or scalars
+#
+# function  Power2Speed() for all elements in one vectorised calculation;
+#           the result equals Power2Speed() for each element.
+#
+# returns   numpy.ndarray of Speed in km/h
+# -------------------------------------------------------------------------------
+def Power2SpeedArray(
+    Power,
+    Grade,
+    Weight,
+    RollingResistance=0.004,
+    WindResistance=0.51,
+    WindSpeed=0,
+    DraftingFactor=1.0,
+):
+    Power, Grade, Weight, RollingResistance, WindResistance, WindSpeed = (
+        numpy.broadcast_arrays(
+            *(
+                numpy.asarray(x, dtype=float)
+                for x in (
+                    Power,
+                    Grade,
+                    Weight,
+                    RollingResistance,
+                    WindResistance * numpy.asarray(DraftingFactor),
+                    WindSpeed,
+                )
+            )
+        )
+    )
+    a = (RollingResistance + Grade / 100) * Weight * g
+    b = 0.5 * WindResistance  # Including DraftingFactor
+    w = WindSpeed / 3.6
+
+    Speed = numpy.zeros(Power.shape)
+    for sign in (1, -1):  # v + w >= 0, then v + w < 0
+        bs = b * sign
+        v = CubicRootsArray(bs, 2 * bs * w, bs * w * w + a, -Power)
+        with numpy.errstate(invalid="ignore"):
+            valid = (v > 0) & ((v + w >= 0) == (sign == 1))
+        Speed = numpy.maximum(Speed, numpy.where(valid, v * 3.6, 0).max(axis=0))
+    return numpy.where(Power == 0, 0, numpy.minimum(Speed, MaxSpeedKmh))
+
+
+# -------------------------------------------------------------------------------
+# C u b i c R o o t s A r r a y
+# -------------------------------------------------------------------------------
+# input     a3, a2, a1, a0: arrays of equal shape
+#
+# function  CubicRoots() for all elements; a3 == 0 is solved as a linear
+#           equation (a2 is then zero as well in Power2SpeedArray()).
+#
+# returns   array of shape (3, ...), NaN where there is no (other) real root
+# -------------------------------------------------------------------------------
+def CubicRootsArray(a3, a2, a1, a0):
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        A2, A1, A0 = a2 / a3, a1 / a3, a0 / a3
+        shift = A2 / 3
+        p = A1 - A2 * A2 / 3
+        q = 2 * A2**3 / 27 - A2 * A1 / 3 + A0
+        D = (q / 2) ** 2 + (p / 3) ** 3
+
+        # One real root, Cardano
+        s = numpy.sqrt(numpy.maximum(D, 0))
+        Cardano = numpy.cbrt(-q / 2 + s) + numpy.cbrt(-q / 2 - s) - shift
+
+        # Three real roots, trigonometric; r == 0 is a triple root
+        r = 2 * numpy.sqrt(numpy.maximum(-p / 3, 0))
+        phi = numpy.arccos(numpy.clip(3 * q / (p * r), -1, 1))
+        Trig = [
+            numpy.where(r == 0, 0, r * numpy.cos((phi - 2 * math.pi * k) / 3)) - shift
+            for k in range(3)
+        ]
+
+        One = D > 0
+        Linear = a3 == 0
+        roots = numpy.array(
+            [
+                numpy.where(Linear, -a0 / a1, numpy.where(One, Cardano, Trig[0])),
+                numpy.where(Linear | One, numpy.nan, Trig[1]),
+                numpy.where(Linear | One, numpy.nan, Trig[2]),
+            ]
+        )
+    return roots
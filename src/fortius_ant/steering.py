@@ -1,7 +1,8 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2022-08-22"
+__version__ = "2026-10-18"
+# 2026-10-18    clsBlackTrack.HandleAntMessage() called by clsAntDispatcher
 # 2022-08-22    Small debugging line added
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
 # 2021-11-14    Initial version, switchable
@@ -191,27 +192,29 @@ class clsBlackTrack:
         # time of last keep-alive message
         self._KeepAliveTime = time.time()
 
+    # ---------------------------------------------------------------------------
+    # RegisterHandlers
+    # ---------------------------------------------------------------------------
+    # function  Register HandleAntMessage() for the BlackTrack channel
+    #
+    # inputs    Dispatcher, clsAntDispatcher
+    # ---------------------------------------------------------------------------
+    def RegisterHandlers(self, Dispatcher):
+        for msgId in (ant.msgID_BroadcastData, ant.msgID_ChannelID):
+            Dispatcher.Register(msgId, self._Channel, None, self.HandleAntMessage)
+
     # ---------------------------------------------------------------------------
     # HandleAntMessage
     # ---------------------------------------------------------------------------
     # function  Process an ANT message (if related to the BlackTrack)
     #
-    # inputs    ANT message bytes
+    # inputs    msgId, channel, dataPageNumber, info as decomposed by
+    #           clsAntDispatcher
     #
     # returns   True if message was handled
     #           False if it should still be handled elsewhere
     # ---------------------------------------------------------------------------
-    def HandleAntMessage(self, Message):
-        (
-            _sync,
-            _length,
-            msgId,
-            info,
-            _checksum,
-            _rest,
-            channel,
-            dataPageNumber,
-        ) = ant.DecomposeMessage(Message)
+    def HandleAntMessage(self, msgId, channel, dataPageNumber, info):
         dataHandled = False
         messages = []
 
@@ -0,0 +1,91 @@
+"""Enumerate the USB devices once, shared by antDongle, usbTrainer and fxload."""
+
+# -------------------------------------------------------------------------------
+# Version info
+# -------------------------------------------------------------------------------
+__version__ = "2026-10-18"
+# 2026-10-18    First version; usb.core.find() was called per product id by
+#               GetDongle() and GetTrainer(), and again on every reconnect.
+# -------------------------------------------------------------------------------
+import time
+
+import usb.core
+
+import fortius_ant.debug as debug
+import fortius_ant.logfile as logfile
+
+# -------------------------------------------------------------------------------
+# Index of the last scan: (idVendor, idProduct): [devices]
+# None when not scanned yet or invalidated (e.g. dongle reconnect, firmware
+# loaded; a device then gets a new address) and by LocateHW(), so that a
+# device that is plugged in later is found.
+# -------------------------------------------------------------------------------
+Devices = None
+ScanTime = 0.0  # Seconds the last Scan() took
+
+# (idVendor, idProduct): (bus, address) of the device that was used last
+LastUsed = {}
+
+
+# -------------------------------------------------------------------------------
+# S c a n
+# -------------------------------------------------------------------------------
+# function  Enumerate all USB devices in one pass and index them
+#
+# returns   Devices
+# -------------------------------------------------------------------------------
+def Scan():
+    global Devices, ScanTime
+    StartTime = time.perf_counter()
+    Index = {}
+    for device in usb.core.find(find_all=True):
+        Index.setdefault((device.idVendor, device.idProduct), []).append(device)
+    Devices = Index
+    ScanTime = time.perf_counter() - StartTime
+    if debug.on(debug.Function | debug.Performance):
+        logfile.Write(
+            "usbDevices.Scan(): %s devices in %4.1fms"
+            % (sum(len(x) for x in Devices.values()), ScanTime * 1000)
+        )
+    return Devices
+
+
+def Invalidate():
+    global Devices
+    Devices = None
+
+
+# -------------------------------------------------------------------------------
+# F i n d
+# -------------------------------------------------------------------------------
+# input     idVendor, idProduct     None = any
+#           Rescan                  scan again, even if there is an index
+#
+# function  Find the devices in the index, scanning only when required
+#
+# returns   list of devices; the device that was used last (see Used()) is
+#           first, so that a reconnect tries that one first
+# -------------------------------------------------------------------------------
+def Find(idVendor=None, idProduct=None, Rescan=False):
+    if Devices is None or Rescan:
+        Scan()
+    rtn = []
+    for (Vendor, Product), devices in Devices.items():
+        if idVendor in (None, Vendor) and idProduct in (None, Product):
+            rtn.extend(devices)
+    rtn.sort(key=lambda d: not _IsLastUsed(d))  # Stable, scan order kept
+    return rtn
+
+
+def _IsLastUsed(device):
+    key = (device.idVendor, device.idProduct)
+    return LastUsed.get(key) == (device.bus, device.address)
+
+
+# -------------------------------------------------------------------------------
+# U s e d
+# -------------------------------------------------------------------------------
+# function  Remember the bus/address of a device that works
+# -------------------------------------------------------------------------------
+def Used(device):
+    LastUsed[(device.idVendor, device.idProduct)] = (device.bus, device.address)
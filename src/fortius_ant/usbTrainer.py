@@ -1,7 +1,31 @@
 # -------------------------------------------------------------------------------
 # Version info
 # -------------------------------------------------------------------------------
-__version__ = "2023-04-06"
+__version__ = "2026-10-18"
+# 2026-10-18    Magnetic brake: TargetPower2Resistance() looks up the power per
+#               resistance step in a table per speed (PowerStepsMB()) with
+#               bisect, and selects the step with the nearest power instead
+#               of the first step with at least TargetPower.
+# 2026-10-18    Power2Speed() uses physics.Power2Speed(), an exact solution
+#               instead of a bisection that modified and restored self.
+#               __Grade2Power_Gribble() and __Grade2Power_FietsNL() use the
+#               models in physics, which also work on NumPy arrays.
+# 2026-10-18    StartIOThread(): USB-trainers can be read and written by a thread
+#               of their own; Refresh() then uses the latest TrainerSnapshot
+#               and SendToTrainer() only replaces the IOCommand.
+#               USB_Read() and USB_Read_retry4x40() are split into a part that
+#               returns data, Header and tacxEvent (used by the IOThread) and
+#               a wrapper that sets self.Header and self.tacxEvent.
+# 2026-10-18    The head unit frames are parsed with precompiled structs
+#               (UsbFrameLegacy, UsbFrameNew, UsbFrameVersion) and unpack_from();
+#               48-byte frames are no longer appended to 64 bytes.
+# 2026-10-18    GetTrainer() uses usbDevices.Find() instead of usb.core.find()
+#               per head unit, so the USB devices are enumerated once.
+# 2026-10-18    SendTarget() added, so that a new target (ANT+ command) is sent
+#               to the trainer without waiting for the next Refresh().
+#               Target calculation moved from Refresh() to _CalculateTarget().
+#               HandleANTmessage() registered with clsAntDispatcher and called
+#               with the decomposed message.
 # 2023-04-06    If UserAndBikeWeight is set below the minimum, a sensible value is set.
 # 2022-08-22    Steering only active when -S wired specified.
 # 2022-08-10    Steering merged from marcoveeneman and switchable's code
@@ -149,15 +173,17 @@ __version__ = "2023-04-06"
 # 2019-12-25    Target grade implemented; modes defined
 # -------------------------------------------------------------------------------
 import array
+import bisect
+import collections
 import os
 import random
 import struct
 import sys
+import threading
 import time
 from enum import Enum
 
 import lib_programname
-import usb.core
 
 import fortius_ant.antDongle as ant
 import fortius_ant.constants as constants
@@ -165,7 +191,9 @@ import fortius_ant.debug as debug
 import fortius_ant.FortiusAntCommand as cmd
 import fortius_ant.fxload as fxload
 import fortius_ant.logfile as logfile
+import fortius_ant.physics as physics
 import fortius_ant.structConstants as sc
+import fortius_ant.usbDevices as usbDevices
 from fortius_ant.constants import mode_Grade, mode_Power
 
 # -------------------------------------------------------------------------------
@@ -199,6 +227,66 @@ USB_ControlResponse = 0x00021303
 USB_VersionRequest = 0x00000002
 USB_VersionResponse = 0x00000C03
 
+# -------------------------------------------------------------------------------
+# Frames received from the head unit
+# One precompiled struct per frame, parsed with unpack_from() so that no format
+# is built and the buffer is neither copied nor padded (48 or 64 bytes).
+# Only the fields that are used are unpacked; the others are pad bytes.
+# -------------------------------------------------------------------------------
+UsbHeader = struct.Struct(sc.little_endian + sc.unsigned_int)
+UsbHeaderOffset = 24  # 24...27 is the message response header
+
+UsbFrameLegacy = struct.Struct(
+    sc.no_alignment
+    + sc.unsigned_char  # 0         StatusAndCursors
+    + sc.unsigned_short  # 1, 2     Wheel speed
+    + sc.unsigned_char  # 3         Cadence
+    + sc.unsigned_char  # 4         HeartRate
+    + sc.pad * 4  # 5...8           StopWatch
+    + sc.unsigned_char  # 9         CurrentResistance
+    + sc.unsigned_char  # 10        PedalSensor
+    + sc.pad  # 11                  Axis0
+    + sc.unsigned_char  # 12        Axis1
+)  # 13...20: Axis2, Axis3, Counter, WheelCount, YearProduction, DeviceSerial,
+#             FirmwareVersion
+
+UsbFrameNew = struct.Struct(
+    sc.no_alignment
+    + sc.pad * 12  # 0...11         DeviceSerial, YearProduction
+    + sc.unsigned_char  # 12        HeartRate
+    + sc.unsigned_char  # 13        Buttons
+    + sc.pad * 4  # 14...17         HeartDetect, ErrorCount, Axis0
+    + sc.unsigned_short  # 18, 19   Axis1
+    + sc.pad * 12  # 20...31        Axis2, Axis3, Header, Distance
+    + sc.unsigned_short  # 32, 33   Wheel speed
+    + sc.pad * 4  # 34...37         Increases if you accellerate? Average power?
+    + sc.short  # 38, 39            CurrentResistance
+    + sc.short  # 40, 41            TargetResistance
+    + sc.unsigned_char  # 42        Events
+    + sc.pad  # 43
+    + sc.unsigned_char  # 44        Cadence
+)  # 45...63: ModeEcho, ChecksumLSB, ChecksumMSB, filler
+
+UsbFrameVersion = struct.Struct(
+    sc.no_alignment
+    + sc.unsigned_int  # 28...31    MotorBrakeUnitFirmware 0.x.y.z
+    + sc.unsigned_int  # 32...35    MotorBrakeUnitSerial tt-YY-#####
+    + sc.unsigned_short  # 36, 37   Version2
+)
+UsbFrameVersionOffset = 28
+
+# -------------------------------------------------------------------------------
+# The latest frame read by the IOThread of a USB trainer, see StartIOThread()
+#   Count       incremented per frame, to detect a new frame
+#   Time        time.time() of the read
+#   Data        the frame (bytes, immutable)
+#   Header      and
+#   tacxEvent   of the frame, as returned by _ReadFrame()
+# -------------------------------------------------------------------------------
+TrainerSnapshot = collections.namedtuple(
+    "TrainerSnapshot", ["Count", "Time", "Data", "Header", "tacxEvent"]
+)
+
 # -------------------------------------------------------------------------------
 # path to firmware files; since 29-3-2020 in same folder as .py or .exe
 # -------------------------------------------------------------------------------
@@ -240,6 +328,9 @@ fortius_fw = os.path.join(dirname, "tacxfortius_1942_firmware.hex")
 #     def SetUserConfiguration(UserWeight, ...)               # Store User
 #
 #     def Refresh(QuarterSecond, TacxMode)                    # Receive, Calculate, Send
+#     def SendTarget(TacxMode)                                # Calculate, Send
+#     def RegisterHandlers(Dispatcher)                        # For ANT-trainers
+#     def StartIOThread(IOInterval) / StopIOThread()          # For USB-trainers
 #     def SendToTrainer(QuarterSecond, TacxMode)              # To be defined by child class
 #     def _ReceiveFromTrainer()                               # To be defined by child class
 #     def TargetPower2Resistance()                            # To be defined by child class
@@ -254,13 +345,15 @@ fortius_fw = os.path.join(dirname, "tacxfortius_1942_firmware.hex")
 # class clsSimulatedTrainer(clsTacxTrainer)
 #     def Refresh(QuarterSecond, Tacxmode)                    # Randomize data (does not receive/send!)
 #                                                             # Completely replaces parent.Refresh()
+#     def SendTarget(TacxMode)                                # Nothing to send
 #
 # class clsTacxAntVortexTrainer(clsTacxTrainer)
 #     def Refresh(QuarterSecond, TacxMode)
 #     def SendToTrainer(QuarterSecond, TacxMode)
 #     def _ReceiveFromTrainer()
 #     def TargetPower2Resistance()                            # Conversion TargetPower -> TargetResistance
-#     def HandleANTmessage(message)
+#     def RegisterHandlers(Dispatcher)
+#     def HandleANTmessage(id, Channel, DataPageNumber, info)
 #
 # class clsTacxUsbTrainer(clsTacxTrainer)
 #     def Wheel2Speed()                                       # Convert Wheelspeed -> Kmh
@@ -268,6 +361,7 @@ fortius_fw = os.path.join(dirname, "tacxfortius_1942_firmware.hex")
 #     def Refresh(QuarterSecond, TacxMode)                    # Add USB-special(s) to parent.Refresh()
 #     def USB_Read()                                          # Read buffer from USB connected Tacx
 #     def SendToTrainer(tacxMode)                             # Send buffer to   USB connected Tacx
+#     def StartIOThread(IOInterval) / StopIOThread()          # Receive/send in thread
 #
 # class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer)
 #     def TargetPower2Resistance()                            # Legacy conversion TargetPower -> TargetResistance
@@ -408,9 +502,8 @@ class clsTacxTrainer:
                 else:
                     vendor = idVendor_Tacx  # For all others
 
-                dev = usb.core.find(
-                    idVendor=vendor, idProduct=hu
-                )  # find trainer USB device
+                devices = usbDevices.Find(vendor, hu)  # find trainer USB device
+                dev = devices[0] if devices else None
                 if dev:
                     msg = (
                         "Connected to Tacx Trainer T" + hex(hu)[2:]
@@ -470,7 +563,9 @@ class clsTacxTrainer:
                     dev = False
                 else:
                     time.sleep(5)
-                    dev = usb.core.find(idVendor=idVendor_Tacx, idProduct=hu1942)
+                    # New device after firmware load, so scan again
+                    devices = usbDevices.Find(idVendor_Tacx, hu1942, Rescan=True)
+                    dev = devices[0] if devices else None
                     if dev != None:
                         msg = "T1942 head unit initialised (Fortius)"
                         hu = hu1942
@@ -663,6 +758,53 @@ class clsTacxTrainer:
             self.PedalEchoTime = time.time()
         self.PreviousPedalEcho = self.PedalEcho
 
+        # -----------------------------------------------------------------------
+        # Calculate TargetResistance
+        # -----------------------------------------------------------------------
+        self._CalculateTarget()
+
+        # -----------------------------------------------------------------------
+        # Antifier's calibration; valid for USB devices only
+        #                         non-USB classes will set PowerFactor=1
+        #
+        # The idea is that Power2Resistance gives insufficient resistance
+        # and that the formula can be corrected with the PowerFactor.
+        # Therefore before Send:
+        #       the TargetResistance is multiplied by factor (_CalculateTarget)
+        # and after Receive:
+        #       the CurrentResistance and CurrentPower are divided by factor
+        # Just for antifier upwards compatibility; usage unknown.
+        # -----------------------------------------------------------------------
+        if self.clv.PowerFactor:
+            self.CurrentResistance /= self.clv.PowerFactor  # Was just received
+            self.CurrentPower /= self.clv.PowerFactor  # Was just received
+
+        # ----------------------------------------------------------------------
+        # Round after all these calculations (and correct data type!) #361
+        # ----------------------------------------------------------------------
+        self.Cadence = int(self.Cadence)
+        self.CurrentResistance = int(self.CurrentResistance)
+        self.CurrentPower = int(self.CurrentPower)
+        self.SpeedKmh = round(self.SpeedKmh, 1)
+
+        # -----------------------------------------------------------------------
+        # Then send the results to the trainer again
+        # -----------------------------------------------------------------------
+        self.SendToTrainer(QuarterSecond, TacxMode)
+
+    # ---------------------------------------------------------------------------
+    # C a l c u l a t e T a r g e t
+    # ---------------------------------------------------------------------------
+    # Input         Class variables Target***, SpeedKmh, GearboxReduction
+    #
+    # Function      Calculate TargetPower and TargetResistance from the
+    #               Target*** as provided by SetPower(), SetGrade() etc.
+    #               Does not use data received from the trainer, other than
+    #               the SpeedKmh of the previous receive.
+    #
+    # Output        TargetPower, TargetResistance, VirtualSpeedKmh
+    # ---------------------------------------------------------------------------
+    def _CalculateTarget(self):
         # -----------------------------------------------------------------------
         # Calculate Virtual speed applying the digital gearbox
         # if DOWN has been pressed, we pretend to be riding slower than the
@@ -697,38 +839,61 @@ class clsTacxTrainer:
         self.TargetPower2Resistance()
 
         # -----------------------------------------------------------------------
-        # Antifier's calibration; valid for USB devices only
-        #                         non-USB classes will set PowerFactor=1
-        #
-        # The idea is that Power2Resistance gives insufficient resistance
-        # and that the formula can be corrected with the PowerFactor.
-        # Therefore before Send:
-        #       the TargetResistance is multiplied by factor
-        # and after Receive:
-        #       the CurrentResistance and CurrentPower are divided by factor
-        # Just for antifier upwards compatibility; usage unknown.
+        # PowerFactor, see Refresh()
         # -----------------------------------------------------------------------
         if self.clv.PowerFactor:
             self.TargetResistance *= self.clv.PowerFactor  # Will be sent
 
-            self.CurrentResistance /= self.clv.PowerFactor  # Was just received
-            self.CurrentPower /= self.clv.PowerFactor  # Was just received
-
-        # ----------------------------------------------------------------------
-        # Round after all these calculations (and correct data type!) #361
-        # ----------------------------------------------------------------------
-        self.Cadence = int(self.Cadence)
         self.TargetPower = int(self.TargetPower)
         self.TargetResistance = int(self.TargetResistance)
-        self.CurrentResistance = int(self.CurrentResistance)
-        self.CurrentPower = int(self.CurrentPower)
-        self.SpeedKmh = round(self.SpeedKmh, 1)
         self.VirtualSpeedKmh = round(self.VirtualSpeedKmh, 1)
 
-        # -----------------------------------------------------------------------
-        # Then send the results to the trainer again
-        # -----------------------------------------------------------------------
-        self.SendToTrainer(QuarterSecond, TacxMode)
+    # ---------------------------------------------------------------------------
+    # S e n d T a r g e t
+    # ---------------------------------------------------------------------------
+    # Input         Class variables Target***
+    #               TacxMode, to pass to SendToTrainer()
+    #
+    # Function      When a new target is received (e.g. ANT+ page 49/51), send
+    #               it to the trainer immediately instead of waiting for the
+    #               next Refresh(); nothing is received from the trainer.
+    #
+    #               USB-trainers send immediately.
+    #               ANT-trainers send on QuarterSecond only (their own pacing),
+    #               so the new target is sent with the next Refresh().
+    #
+    # Output        Trainer instructed
+    # ---------------------------------------------------------------------------
+    def SendTarget(self, TacxMode):
+        if debug.on(debug.Function):
+            logfile.Write("clsTacxTrainer.SendTarget(%s)" % TacxMode)
+        self._CalculateTarget()
+        self.SendToTrainer(False, TacxMode)
+
+    # ---------------------------------------------------------------------------
+    # R e g i s t e r H a n d l e r s
+    # ---------------------------------------------------------------------------
+    # Input         Dispatcher, clsAntDispatcher
+    #
+    # Function      ANT-trainers register HandleANTmessage() for their channels
+    #               USB-trainers have nothing to register
+    # ---------------------------------------------------------------------------
+    def RegisterHandlers(self, Dispatcher):
+        pass
+
+    # ---------------------------------------------------------------------------
+    # S t a r t I O T h r e a d   /   S t o p I O T h r e a d
+    # ---------------------------------------------------------------------------
+    # Input         IOInterval, seconds between two polls of the trainer
+    #
+    # Function      USB-trainers poll the head unit in a thread of their own,
+    #               see clsTacxUsbTrainer; nothing to do for other trainers
+    # ---------------------------------------------------------------------------
+    def StartIOThread(self, IOInterval=0.05):
+        pass
+
+    def StopIOThread(self):
+        pass
 
     # ---------------------------------------------------------------------------
     # C a l i b r a t e S u p p o r t e d
@@ -803,56 +968,33 @@ class clsTacxTrainer:
             )
 
     # ---------------------------------------------------------------------------
-    # www.gribble.org
+    # www.gribble.org, see physics.Grade2Power()
     # ---------------------------------------------------------------------------
     def __Grade2Power_Gribble(self):
-        # -----------------------------------------------------------------------
-        # Matthew updates according www.gribble.org
-        # See: https://www.gribble.org/cycling/power_v_speed.html
-        # -----------------------------------------------------------------------
-        c = self.RollingResistance  # default=0.004
-        m = self.UserAndBikeWeight  # default=75+10 kg
-        g = 9.81  # m/s2
-        v = self.VirtualSpeedKmh / 3.6  # m/s   km/hr * 1000 / 3600
-        Proll = c * m * g * v  # Watt
-
-        p_cdA = self.WindResistance  # default=0.51
-        w = self.WindSpeed / 3.6  # default=0
-        d = self.DraftingFactor  # default=1
-        # without abs a strong tailwind would result in a higher power
-        Pair = 0.5 * p_cdA * (v + w) * abs(v + w) * d * v  # Watt
-
-        i = self.TargetGrade  # Percentage 0...100
-        Pslope = i / 100 * m * g * v  # Watt
-
-        self.TargetPower = int(Proll + Pair + Pslope)
+        self.TargetPower = int(
+            physics.Grade2Power(
+                self.VirtualSpeedKmh,
+                self.TargetGrade,
+                self.UserAndBikeWeight,
+                self.RollingResistance,
+                self.WindResistance,
+                self.WindSpeed,
+                self.DraftingFactor,
+            )
+        )
 
     # ---------------------------------------------------------------------------
-    # www.fiets.nl
+    # www.fiets.nl, see physics.Grade2PowerFietsNL()
     # ---------------------------------------------------------------------------
     def __Grade2Power_FietsNL(self):
-        # -----------------------------------------------------------------------
-        # Thanks to https://www.fiets.nl/2016/05/02/de-natuurkunde-van-het-fietsen/
-        # Required power = roll + air + slope + mechanical
-        # -----------------------------------------------------------------------
-        c = self.RollingResistance  # roll-resistance constant
-        m = self.UserAndBikeWeight  # kg
-        g = 9.81  # m/s2
-        v = self.VirtualSpeedKmh / 3.6  # m/s       km/hr * 1000 / 3600
-        Proll = c * m * g * v  # Watt
-
-        p = 1.205  # air-density
-        cdA = 0.3  # resistance factor
-        # p_cdA = 0.375
-        w = 0  # wind-speed
-        Pair = 0.5 * p * cdA * (v + w) * (v + w) * v  # Watt
-
-        i = self.TargetGrade  # Percentage 0...100
-        Pslope = i / 100 * m * g * v  # Watt
-
-        Pbike = 37
-
-        self.TargetPower = int(Proll + Pair + Pslope + Pbike)
+        self.TargetPower = int(
+            physics.Grade2PowerFietsNL(
+                self.VirtualSpeedKmh,
+                self.TargetGrade,
+                self.UserAndBikeWeight,
+                self.RollingResistance,
+            )
+        )
 
     # ---------------------------------------------------------------------------
     # Convert Power to Speed
@@ -861,103 +1003,43 @@ class clsTacxTrainer:
     # This function should be similar
     # ---------------------------------------------------------------------------
     # input:        self.CurrentPower, self.UserAndBikeWeight, self.TargetGrade
+    #               Grade, used in power mode (in grade mode TargetGrade is set)
     #
-    # description   Based upon inputs, estimate Speed
-    #
-    #               Note: the Grade2Power() functions operate on self, and
-    #                     therefore do not require input/return variables.
+    # description   Based upon inputs, calculate Speed with physics.Power2Speed()
+    #               which solves the model of _Grade2Power() exactly; no field
+    #               of self is modified, other than the output.
     #
     #               The reason we do NOT modify self.VirtualSpeedKmh here is
     #               that that speed is directly related to the physical wheel-
     #               speed. So CalculatedSpeed is added and the consumer of the
     #               data can choose which of the two to use.
     #
-    #               _Grade2Power() uses self.VirtualSpeedKmh as input to
-    #               calculate power. Therefore the value is saved and restored.
-    #               The field is used here to find the correct speed resulting
-    #               in the searched power.
-    #               *** appologies for this construction ***
-    #
     # output:       self.CalculatedSpeed
     #
     # returns:      None
     # ---------------------------------------------------------------------------
     def Power2Speed(self, Grade=0):  # Power2Speed#
-        SpeedLo = 1  # The low  speed in the range where we estimate
-        SpeedHi = 100  # The high ...
-        Speed = 0  # The estimated speed
-        PrevPower = 0  # The previous power
-
-        # ----------------------------------------------------------------------
-        # We are going to SEARCH a VirtualSpeedKmh, resulting in TargetPower
-        # that equals CurrentPower. Save these two fields and restore afterwards
-        # ----------------------------------------------------------------------
-        SaveVirtualSpeedKmh = self.VirtualSpeedKmh
-        SaveTargetPower = self.TargetPower
-        SaveTargetGrade = self.TargetGrade
-
         # ----------------------------------------------------------------------
         # In powermode, by default we use TargetGrade=0 to calculate the speed
         # if we ride a virtual route, the TargetGrade is taken from the GPX and
         # provided as a parameter.
-        # We COULD leave TargetGrade modified, but restore it just to be neat.
-        #
-        # In GradeMode, the TargetGrade is already set.
-        # ----------------------------------------------------------------------
-        if self.TargetMode == mode_Power:
-            self.TargetGrade = Grade
-
-        if self.CurrentPower == 0:
-            Speed = 0  # No power, no speed
-        else:
-            SpeedLo = 1  # We do not cycle backwards
-            SpeedHi = 100  # Smart guy going faster :-)
-
-            # ------------------------------------------------------------------
-            # If power is negative, find point where curve goes up
-            # The powercurve with a big negative slope has two solutions for the
-            # speed when the (negative) power is given; herewith we chose to get
-            # the highest speed of the two.
-            # ------------------------------------------------------------------
-            if self.CurrentPower < 0:
-                self.VirtualSpeedKmh = SpeedLo
-                self._Grade2Power()
-                PrevPower = 10000
-                while self.TargetPower < PrevPower:
-                    SpeedLo = SpeedLo + 5
-                    PrevPower = self.TargetPower
-                    self.VirtualSpeedKmh = SpeedLo
-                    self._Grade2Power()
-
-            # ------------------------------------------------------------------
-            # Find the power that matches the searched speed
-            #
-            #    +----------+----------+
-            # SpeedLo ... Speed ... SpeedHi
-            #          TargetPower
-            # Move SpeedLo/SpeedHi based upon power, untill close enough.
-            # ------------------------------------------------------------------
-            while (SpeedHi / SpeedLo) > 1.05:
-                Speed = (SpeedLo + SpeedHi) / 2  # The estimated speed
-                self.VirtualSpeedKmh = Speed  # results in
-                self._Grade2Power()  # TargetPower
-
-                if self.TargetPower < self.CurrentPower:
-                    SpeedLo = Speed  # New boundary
-                else:
-                    SpeedHi = Speed  # New boundary
-
-        # ----------------------------------------------------------------------
-        # Restore fields
-        # ----------------------------------------------------------------------
-        self.VirtualSpeedKmh = SaveVirtualSpeedKmh
-        self.TargetPower = SaveTargetPower
-        self.TargetGrade = SaveTargetGrade
-
-        # ----------------------------------------------------------------------
-        # Our output
         # ----------------------------------------------------------------------
-        self.CalculatedSpeedKmh = Speed
+        if self.TargetMode != mode_Power:
+            Grade = self.TargetGrade
+
+        Weight = self.UserAndBikeWeight
+        if Weight < 70:
+            Weight = 75 + 10  # As _Grade2Power()
+
+        self.CalculatedSpeedKmh = physics.Power2Speed(
+            self.CurrentPower,
+            Grade,
+            Weight,
+            self.RollingResistance,
+            self.WindResistance,
+            self.WindSpeed,
+            self.DraftingFactor,
+        )
 
     # --------------------------------------------------------------------------
     # D i s p l a y S t a t e T a b l e
@@ -1197,6 +1279,14 @@ class clsSimulatedTrainer(clsTacxTrainer):
             for _i in range(10):
                 self.SteeringFrame.Update(-self.Axis)
 
+    # --------------------------------------------------------------------------
+    # S e n d T a r g e t
+    # --------------------------------------------------------------------------
+    # Description:  There is no trainer, Refresh() does all; see parent
+    # --------------------------------------------------------------------------
+    def SendTarget(self, _TacxMode=None):
+        pass
+
 
 # -------------------------------------------------------------------------------
 # c l s T a c x A n t V o r t e x T r a i n e r
@@ -1401,20 +1491,22 @@ class clsTacxAntVortexTrainer(clsTacxTrainer):
     #     if debug.on(debug.Function):logfile.Write ("clsTacxAntVortexTrainer.Refresh()")
     #     pass
 
+    # ---------------------------------------------------------------------------
+    # RegisterHandlers()
+    # ---------------------------------------------------------------------------
+    def RegisterHandlers(self, Dispatcher):
+        for Channel in (ant.channel_VTX_s, ant.channel_VHU_s):
+            for id in (
+                ant.msgID_BroadcastData,
+                ant.msgID_AcknowledgedData,
+                ant.msgID_ChannelID,
+            ):
+                Dispatcher.Register(id, Channel, None, self.HandleANTmessage)
+
     # ---------------------------------------------------------------------------
     # HandleANTmessage()
     # ---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        (
-            _synch,
-            _length,
-            id,
-            info,
-            _checksum,
-            _rest,
-            Channel,
-            DataPageNumber,
-        ) = ant.DecomposeMessage(msg)
+    def HandleANTmessage(self, id, Channel, DataPageNumber, info):
         SubPageNumber = info[2] if len(info) > 2 else None
         dataHandled = False
         messages = []
@@ -1865,20 +1957,21 @@ class clsTacxAntTrainer(clsTacxTrainer):
         deltaRR = self.RollingResistance - defaultRR
         return deltaRR * 100
 
+    # ---------------------------------------------------------------------------
+    # RegisterHandlers()
+    # ---------------------------------------------------------------------------
+    def RegisterHandlers(self, Dispatcher):
+        for id in (
+            ant.msgID_BroadcastData,
+            ant.msgID_AcknowledgedData,
+            ant.msgID_ChannelID,
+        ):
+            Dispatcher.Register(id, self.Channel, None, self.HandleANTmessage)
+
     # ---------------------------------------------------------------------------
     # HandleANTmessage()
     # ---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        (
-            _synch,
-            _length,
-            id,
-            info,
-            _checksum,
-            _rest,
-            Channel,
-            DataPageNumber,
-        ) = ant.DecomposeMessage(msg)
+    def HandleANTmessage(self, id, Channel, DataPageNumber, info):
         SubPageNumber = info[2] if len(info) > 2 else None
         dataHandled = False
         messages = []
@@ -2165,17 +2258,7 @@ class clsTacxAntGeniusTrainer(clsTacxAntTrainer):
     # ---------------------------------------------------------------------------
     # HandleANTmessage()
     # ---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        (
-            _synch,
-            _length,
-            id,
-            info,
-            _checksum,
-            _rest,
-            Channel,
-            DataPageNumber,
-        ) = ant.DecomposeMessage(msg)
+    def HandleANTmessage(self, id, Channel, DataPageNumber, info):
         SubPageNumber = info[2] if len(info) > 2 else None
         dataHandled = False
         messages = []
@@ -2275,7 +2358,7 @@ class clsTacxAntGeniusTrainer(clsTacxAntTrainer):
         # Messages that are not Genius specific are handled by the base class
         # -----------------------------------------------------------------------
         if not dataHandled:
-            dataHandled = super().HandleANTmessage(msg)
+            dataHandled = super().HandleANTmessage(id, Channel, DataPageNumber, info)
 
         # -----------------------------------------------------------------------
         # Send messages, leave receiving to the outer loop
@@ -2524,17 +2607,7 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
     # ---------------------------------------------------------------------------
     # HandleANTmessage()
     # ---------------------------------------------------------------------------
-    def HandleANTmessage(self, msg):
-        (
-            _synch,
-            _length,
-            id,
-            info,
-            _checksum,
-            _rest,
-            Channel,
-            DataPageNumber,
-        ) = ant.DecomposeMessage(msg)
+    def HandleANTmessage(self, id, Channel, DataPageNumber, info):
         SubPageNumber = info[2] if len(info) > 2 else None
         dataHandled = False
         messages = []
@@ -2655,7 +2728,7 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
         # Messages that are not Bushido specific are handled by the base class
         # -----------------------------------------------------------------------
         if not dataHandled:
-            dataHandled = super().HandleANTmessage(msg)
+            dataHandled = super().HandleANTmessage(id, Channel, DataPageNumber, info)
 
         # -----------------------------------------------------------------------
         # Send messages, leave receiving to the outer loop
@@ -2748,6 +2821,14 @@ class clsTacxAntBushidoTrainer(clsTacxAntTrainer):
 # c l s T a c x U s b T r a i n e r
 # -------------------------------------------------------------------------------
 class clsTacxUsbTrainer(clsTacxTrainer):
+    IOThread = None  # threading.Thread, see StartIOThread()
+    IOThreadActive = False
+    IOInterval = 0.05  # Seconds between two polls by the IOThread
+    IOCommand = None  # Latest command for the IOThread, see SendToTrainer()
+    Snapshot = None  # TrainerSnapshot, latest frame read by the IOThread
+    PedalEchoOffset = None  # Of PedalEcho in the frame, to be set in sub-class
+    _SnapshotCount = 0  # Of the last snapshot used by _ReceiveFrame()
+
     # ---------------------------------------------------------------------------
     # Convert WheelSpeed --> Speed in km/hr
     # SpeedScale must be defined in sub-class
@@ -2805,6 +2886,118 @@ class clsTacxUsbTrainer(clsTacxTrainer):
     #         self._ReceiveFromTrainer()
 
     #     self.Buttons = Buttons                  # Restore buttons
+    # ---------------------------------------------------------------------------
+    # S t a r t I O T h r e a d
+    # ---------------------------------------------------------------------------
+    # Input         IOInterval, seconds between two polls of the head unit
+    #
+    # Function      Without IOThread, Refresh() reads and writes the head unit
+    #               inline; a slow read (30ms timeout, retries of 100ms) then
+    #               delays the ANT, BLE and GUI processing of the main loop.
+    #
+    #               The IOThread owns the USB device and per IOInterval:
+    #               - reads a frame and publishes it as self.Snapshot
+    #               - writes the latest self.IOCommand, as composed by
+    #                 SendToTrainer(), echoing the PedalEcho of the frame
+    #               _ReceiveFromTrainer() parses the latest Snapshot and
+    #               SendToTrainer() only replaces IOCommand, so both return
+    #               immediately and the head unit is polled at its own rate.
+    #
+    #               The IOThread does not modify the trainer object; Header and
+    #               tacxEvent of the frame are in the Snapshot as well.
+    # ---------------------------------------------------------------------------
+    def StartIOThread(self, IOInterval=0.05):
+        if self.IOThread:
+            return
+        if debug.on(debug.Function):
+            logfile.Write("clsTacxUsbTrainer.StartIOThread(%s)" % IOInterval)
+        self.IOInterval = IOInterval
+        self.IOCommand = None
+        self.Snapshot = None
+        self._FirstSnapshot = threading.Event()
+        self.IOThreadActive = True
+        self.IOThread = threading.Thread(
+            target=self._IOThread, name="TrainerIO", daemon=True
+        )
+        self.IOThread.start()
+        self._FirstSnapshot.wait(1)  # So that Refresh() has a frame to parse
+
+    def StopIOThread(self):
+        if self.IOThread:
+            self.IOThreadActive = False
+            self.IOThread.join()
+            self.IOThread = None
+            if debug.on(debug.Function):
+                logfile.Write("clsTacxUsbTrainer.StopIOThread() done")
+
+    def _IOThread(self):
+        Count = 0
+        while self.IOThreadActive:
+            StartTime = time.monotonic()
+            # -------------------------------------------------------------------
+            # Read and publish; an empty buffer (timeout) is not published,
+            # the previous frame remains valid.
+            # -------------------------------------------------------------------
+            data, Header, tacxEvent = self._ReadFrame()
+            if len(data):
+                Count += 1
+                self.Snapshot = TrainerSnapshot(
+                    Count, time.time(), bytes(data), Header, tacxEvent
+                )
+                self._FirstSnapshot.set()
+
+            # -------------------------------------------------------------------
+            # Write the most recent command
+            # -------------------------------------------------------------------
+            Command = self.IOCommand
+            if Command:
+                TacxMode, Calibrate, EchoPedal, Target, Weight = Command
+                PedalEcho = 0
+                if EchoPedal and self.Snapshot:
+                    Data = self.Snapshot.Data
+                    if len(Data) > self.PedalEchoOffset:
+                        PedalEcho = Data[self.PedalEchoOffset]
+                data = self.SendToTrainerUSBData(
+                    TacxMode, Calibrate, PedalEcho, Target, Weight
+                )
+                self._WriteToTrainer(
+                    data, TacxMode, Calibrate, PedalEcho, Target, Weight
+                )
+
+            SleepTime = self.IOInterval - (time.monotonic() - StartTime)
+            if SleepTime > 0:
+                time.sleep(SleepTime)
+
+    # ---------------------------------------------------------------------------
+    # R e c e i v e F r a m e
+    # ---------------------------------------------------------------------------
+    # Function      _ReadFrame() reads one frame from the head unit, as required
+    #               by the sub-class, without modifying self (IOThread).
+    #               _ReceiveFrame() returns that frame, or the latest Snapshot
+    #               when the IOThread is active; tacxEvent is only True when
+    #               the snapshot is new since the previous call.
+    #
+    # output        _ReceiveFrame(): self.Header, self.tacxEvent
+    #
+    # returns       _ReadFrame(): data, Header, tacxEvent
+    #               _ReceiveFrame(): data
+    # ---------------------------------------------------------------------------
+    def _ReadFrame(self):
+        return self._USB_Read()
+
+    def _ReceiveFrame(self):
+        if not self.IOThread:
+            data, self.Header, self.tacxEvent = self._ReadFrame()
+            return data
+        Snapshot = self.Snapshot
+        if Snapshot is None:
+            self.tacxEvent = False
+            return b""
+        self.Header = Snapshot.Header
+        self.tacxEvent = Snapshot.tacxEvent and Snapshot.Count != self._SnapshotCount
+        self._SnapshotCount = Snapshot.Count
+        return Snapshot.Data
+
     # ---------------------------------------------------------------------------
     # U S B _ R e a d
     # ---------------------------------------------------------------------------
@@ -2812,18 +3005,26 @@ class clsTacxUsbTrainer(clsTacxTrainer):
     #
     # function  Read data from Tacx USB trainer
     #
+    # output    self.Header, self.tacxEvent
+    #
     # returns   data
+    #           _USB_Read() returns data, Header, tacxEvent and leaves self
+    #           unmodified, for the IOThread
     # ---------------------------------------------------------------------------
     def USB_Read(self):
-        self.tacxEvent = True  # Assume we receive correct buffer
+        data, self.Header, self.tacxEvent = self._USB_Read()
+        return data
+
+    def _USB_Read(self):
+        tacxEvent = True  # Assume we receive correct buffer
         data = array.array("B", [])  # Empty array of bytes
         try:
             data = self.UsbDevice.read(0x82, 64, 30)
         except TimeoutError:
-            self.tacxEvent = False  # No data received
+            tacxEvent = False  # No data received
             pass
         except Exception as e:
-            self.tacxEvent = False  # No data received
+            tacxEvent = False  # No data received
             if "timeout error" in str(e) or "timed out" in str(
                 e
             ):  # trainer did not return any data
@@ -2835,19 +3036,17 @@ class clsTacxUsbTrainer(clsTacxTrainer):
         # 24...27 is the message response header
         # -----------------------------------------------------------------------
         if len(data) > 27:
-            self.Header = int(
-                data[27] << 24 | data[26] << 16 | data[25] << 8 | data[24]
-            )
+            Header = UsbHeader.unpack_from(data, UsbHeaderOffset)[0]
         else:
-            self.Header = -1
+            Header = -1
 
         if debug.on(debug.Data2):
             logfile.Write(
                 "Trainer recv hdr=%s data=%s (len=%s)"
-                % (hex(self.Header), logfile.HexSpace(data), len(data))
+                % (hex(Header), logfile.HexSpace(data), len(data))
             )
 
-        return data
+        return data, Header, tacxEvent
 
     # ---------------------------------------------------------------------------
     # U S B _ R e a d _ r e t r y 4 x 4 0
@@ -2862,19 +3061,23 @@ class clsTacxUsbTrainer(clsTacxTrainer):
     #           At least 40 bytes must be returned, retry 4 times
     # ---------------------------------------------------------------------------
     def USB_Read_retry4x40(self, expectedHeader=USB_ControlResponse):
+        data, self.Header, self.tacxEvent = self._USB_Read_retry4x40(expectedHeader)
+        return data
+
+    def _USB_Read_retry4x40(self, expectedHeader=USB_ControlResponse):
         retry = 4
 
         while True:
-            data = self.USB_Read()
+            data, Header, tacxEvent = self._USB_Read()
 
             # -------------------------------------------------------------------
             # Retry if no correct buffer received
             # -------------------------------------------------------------------
-            if retry and (len(data) < 40 or self.Header != expectedHeader):
+            if retry and (len(data) < 40 or Header != expectedHeader):
                 if debug.on(debug.Any):
                     logfile.Write(
                         "Retry because short buffer (len=%s) or incorrect header received (expected: %s received: %s)"
-                        % (len(data), hex(expectedHeader), hex(self.Header))
+                        % (len(data), hex(expectedHeader), hex(Header))
                     )
                 time.sleep(0.1)  # 2020-09-29 short delay @RogerPleijers
                 retry -= 1
@@ -2885,7 +3088,7 @@ class clsTacxUsbTrainer(clsTacxTrainer):
         # Inform when there's something unexpected
         # -----------------------------------------------------------------------
         if len(data) < 40:
-            self.tacxEvent = False
+            tacxEvent = False
             # 2020-09-29 the buffer is ignored when too short (was processed before)
             logfile.Console(
                 "Tacx head unit returns insufficient data, len=%s" % len(data)
@@ -2902,14 +3105,14 @@ class clsTacxUsbTrainer(clsTacxTrainer):
                 #            process) then the message disappears automatically.
                 #            A longer timeout does not help (tried: 100ms).
 
-        elif self.Header != expectedHeader:
-            self.tacxEvent = False
+        elif Header != expectedHeader:
+            tacxEvent = False
             logfile.Console(
                 "Tacx head unit returns incorrect header %s (expected: %s)"
-                % (hex(expectedHeader), hex(self.Header))
+                % (hex(expectedHeader), hex(Header))
             )
 
-        return data
+        return data, Header, tacxEvent
 
     # ---------------------------------------------------------------------------
     # S e n d T o T r a i n e r
@@ -2993,6 +3196,12 @@ class clsTacxUsbTrainer(clsTacxTrainer):
 
         if error:
             logfile.Console(error)
+        elif self.IOThread and TacxMode != modeMotorBrake:
+            # -------------------------------------------------------------------
+            # The IOThread sends the command, echoing the latest PedalEcho
+            # -------------------------------------------------------------------
+            EchoPedal = TacxMode == modeResistance
+            self.IOCommand = (TacxMode, Calibrate, EchoPedal, int(Target), Weight)
         else:
             if TacxMode == modeMotorBrake:
                 data = self.SendToTrainerUSBData_MotorBrake()
@@ -3001,25 +3210,27 @@ class clsTacxUsbTrainer(clsTacxTrainer):
                 data = self.SendToTrainerUSBData(
                     TacxMode, Calibrate, PedalEcho, Target, Weight
                 )
+            self._WriteToTrainer(data, TacxMode, Calibrate, PedalEcho, Target, Weight)
 
-            # -------------------------------------------------------------------
-            # Send buffer to trainer
-            # -------------------------------------------------------------------
-            if data != False:
-                if debug.on(debug.Data2):
-                    logfile.Write(
-                        "Trainer send data=%s (len=%s)"
-                        % (logfile.HexSpace(data), len(data))
-                    )
-                    logfile.Write(
-                        "                  tacx mode=%s target=%s pe=%s weight=%s cal=%s"
-                        % (TacxMode, Target, PedalEcho, Weight, Calibrate)
-                    )
+    # ---------------------------------------------------------------------------
+    # Send buffer to trainer
+    # ---------------------------------------------------------------------------
+    def _WriteToTrainer(self, data, TacxMode, Calibrate, PedalEcho, Target, Weight):
+        if data != False:
+            if debug.on(debug.Data2):
+                logfile.Write(
+                    "Trainer send data=%s (len=%s)"
+                    % (logfile.HexSpace(data), len(data))
+                )
+                logfile.Write(
+                    "                  tacx mode=%s target=%s pe=%s weight=%s cal=%s"
+                    % (TacxMode, Target, PedalEcho, Weight, Calibrate)
+                )
 
-                try:
-                    self.UsbDevice.write(0x02, data, 30)  # send data to device
-                except Exception as e:
-                    logfile.Console("Write to USB trainer error: " + str(e))
+            try:
+                self.UsbDevice.write(0x02, data, 30)  # send data to device
+            except Exception as e:
+                logfile.Console("Write to USB trainer error: " + str(e))
 
 
 # -------------------------------------------------------------------------------
@@ -3030,6 +3241,8 @@ class clsTacxUsbTrainer(clsTacxTrainer):
 # ==> iMagic
 # -------------------------------------------------------------------------------
 class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
+    PedalEchoOffset = 10  # See UsbFrameLegacy
+
     def __init__(self, clv, Message, Headunit, UsbDevice):
         super().__init__(clv, Message)
         if debug.on(debug.Function):
@@ -3154,94 +3367,25 @@ class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
         if debug.on(debug.Function):
             logfile.Write("clsTacxLegacyUsbTrainer._ReceiveFromTrainer()")
         # -----------------------------------------------------------------------
-        #  Read from trainer
+        #  Read from trainer (or the IOThread)
         # -----------------------------------------------------------------------
-        data = self.USB_Read()
+        data = self._ReceiveFrame()
 
         # -----------------------------------------------------------------------
-        # Define buffer format
-        # -----------------------------------------------------------------------
-        nStatusAndCursors = 0  # 0
-        fStatusAndCursors = sc.unsigned_char
-
-        nSpeed = 1  # 1, 2      Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
-        fSpeed = sc.unsigned_short
-
-        nCadence = 2  # 3
-        fCadence = sc.unsigned_char
-
-        nHeartRate = 3  # 4
-        fHeartRate = sc.unsigned_char
-
-        # nStopWatch         = 4
-        fStopWatch = sc.unsigned_int  # 5,6,7,8
-
-        nCurrentResistance = 5  # 9
-        fCurrentResistance = sc.unsigned_char
-
-        nPedalSensor = 6  # 10
-        fPedalSensor = sc.unsigned_char
-
-        # nAxis0             = 7                 # 11
-        fAxis0 = sc.unsigned_char
-
-        nAxis1 = 8  # 12
-        fAxis1 = sc.unsigned_char
-
-        # nAxis2             = 9                 # 13
-        fAxis2 = sc.unsigned_char
-
-        # nAxis3             = 10                # 14
-        fAxis3 = sc.unsigned_char
-
-        # nCounter           = 11                # 15
-        fCounter = sc.unsigned_char
-
-        # nWheelCount        = 12                # 16
-        fWheelCount = sc.unsigned_char
-
-        # nYearProduction    = 13                # 17
-        fYearProduction = sc.unsigned_char
-
-        # nDeviceSerial      = 14                # 18, 19
-        fDeviceSerial = sc.unsigned_short
-
-        # nFirmwareVersion   = 15                # 20
-        fFirmwareVersion = sc.unsigned_char
-
-        # -----------------------------------------------------------------------
-        # Parse buffer
+        # Parse buffer, see UsbFrameLegacy
         # Note that the button-bits have an inversed logic:
         #   1=not pushed, 0=pushed. Hence the xor.
         # -----------------------------------------------------------------------
-        format = (
-            sc.no_alignment
-            + fStatusAndCursors
-            + fSpeed
-            + fCadence
-            + fHeartRate
-            + fStopWatch
-            + fCurrentResistance
-            + fPedalSensor
-            + fAxis0
-            + fAxis1
-            + fAxis2
-            + fAxis3
-            + fCounter
-            + fWheelCount
-            + fYearProduction
-            + fDeviceSerial
-            + fFirmwareVersion
-        )
-        tuple = struct.unpack(format, data)
-
-        self.Axis = tuple[nAxis1]
-        self.Buttons = ((tuple[nStatusAndCursors] & 0xF0) >> 4) ^ 0x0F
-        self.Cadence = tuple[nCadence]
-        self.CurrentResistance = tuple[nCurrentResistance]
-        self.HeartRate = tuple[nHeartRate]
-        self.PedalEcho = tuple[nPedalSensor]
-        self.WheelSpeed = tuple[nSpeed]
+        (
+            StatusAndCursors,
+            self.WheelSpeed,
+            self.Cadence,
+            self.HeartRate,
+            self.CurrentResistance,
+            self.PedalEcho,
+            self.Axis,
+        ) = UsbFrameLegacy.unpack_from(data)
+        self.Buttons = ((StatusAndCursors & 0xF0) >> 4) ^ 0x0F
 
         self.Wheel2Speed()
         self.CurrentResistance2Power()
@@ -3283,6 +3427,8 @@ class clsTacxLegacyUsbTrainer(clsTacxUsbTrainer):
 # simplifying it.
 # -------------------------------------------------------------------------------
 class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
+    PedalEchoOffset = 42  # See UsbFrameNew
+
     def __init__(self, clv, Message, Headunit, UsbDevice):
         super().__init__(clv, Message)
         if debug.on(debug.Function):
@@ -3364,6 +3510,8 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
             3600,
             3750,
         ]
+        self.PowerStepsTable = {}  # See PowerStepsMB()
+        self.PowerStepsCalibrateRR = None
 
         # ---------------------------------------------------------------------------
         # Initial state = stop
@@ -3467,6 +3615,30 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
             + RollingResistance
         )
 
+    # ---------------------------------------------------------------------------
+    # P o w e r S t e p s M B
+    # ---------------------------------------------------------------------------
+    # input     SpeedKmh, rounded to 0.1 km/h (see Wheel2Speed)
+    #
+    # function  Power of the magnetic brake for each step in currentR[] at the
+    #           given speed, calculated once per speed (0.1 km/h bin) and
+    #           recalculated when clv.CalibrateRR is changed.
+    #           The powers are increasing, so bisect can be used.
+    #
+    # returns   list of power per currentR[]
+    # ---------------------------------------------------------------------------
+    def PowerStepsMB(self, SpeedKmh):
+        if self.clv.CalibrateRR != self.PowerStepsCalibrateRR:
+            self.PowerStepsTable = {}
+            self.PowerStepsCalibrateRR = self.clv.CalibrateRR
+
+        Bin = round(SpeedKmh * 10)
+        Powers = self.PowerStepsTable.get(Bin)
+        if Powers is None:
+            Powers = [self.Resistance2PowerMB(R, Bin / 10) for R in self.currentR]
+            self.PowerStepsTable[Bin] = Powers
+        return Powers
+
     def TargetPower2Resistance(self):
         rtn = 0
 
@@ -3496,14 +3668,16 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         else:
             # -------------------------------------------------------------------
             # e.g. Tacx Flow: Magnetic Brake T1901 connected to head unit T1932
+            # The step with the power nearest to TargetPower, see PowerStepsMB()
             # -------------------------------------------------------------------
             if self.WheelSpeed > 0:
-                for i in range(0, len(self.currentR)):
-                    if (
-                        self.Resistance2PowerMB(self.currentR[i], self.SpeedKmh)
-                        >= self.TargetPower
-                    ):
-                        break
+                Powers = self.PowerStepsMB(self.SpeedKmh)
+                i = bisect.bisect_left(Powers, self.TargetPower)
+                i = min(len(Powers) - 1, i)  # Not more than 13
+                if i > 0 and (
+                    self.TargetPower - Powers[i - 1] < Powers[i] - self.TargetPower
+                ):
+                    i -= 1  # The lower step is closer
                 rtn = self.targetR[i]
 
         rtn = int(rtn)
@@ -3716,138 +3890,33 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
         #       and USB_VersionResponse = 0x00000c03 ==> CommandResponse = 3
         # As in SendToTrainerUSBData() I do not change the code accordingly.
         # -----------------------------------------------------------------------
-        data = self.USB_Read_retry4x40()
+        data = self._ReceiveFrame()
 
         if len(data) < 40:
             pass
         else:
             # -----------------------------------------------------------------------
-            # Define buffer format
-            # -----------------------------------------------------------------------
-            # nDeviceSerial      =  0                # 0...1
-            fDeviceSerial = sc.unsigned_short
-
-            fFiller2_7 = sc.pad * (7 - 1)  # 2...7
-
-            # nYearProduction    =  1                # 8
-            fYearProduction = sc.unsigned_char
-
-            fFiller9_11 = sc.pad * (11 - 8)  # 9...11
-
-            nHeartRate = 2  # 12
-            fHeartRate = sc.unsigned_char
-
-            nButtons = 3  # 13
-            fButtons = sc.unsigned_char
-
-            # nHeartDetect       =  4                # 14
-            fHeartDetect = sc.unsigned_char
-
-            # nErrorCount        =  5                # 15
-            fErrorCount = sc.unsigned_char
-
-            # nAxis0             =  6                # 16-17
-            fAxis0 = sc.unsigned_short
-
-            nAxis1 = 7  # 18-19
-            fAxis1 = sc.unsigned_short
-
-            # nAxis2             =  8                # 20-21
-            fAxis2 = sc.unsigned_short
-
-            # nAxis3             =  9                # 22-23
-            fAxis3 = sc.unsigned_short
-
-            _nHeader = 10  # 24-27
-            fHeader = sc.unsigned_int
-
-            # nDistance          = 11                # 28-31
-            fDistance = sc.unsigned_int
-
-            nSpeed = 12  # 32, 33            Wheel speed (Speed = WheelSpeed / SpeedScale in km/h)
-            fSpeed = sc.unsigned_short
-
-            fFiller34_35 = sc.pad * 2  # 34...35           Increases if you accellerate?
-            fFiller36_37 = sc.pad * 2  # 36...37           Average power?
-
-            nCurrentResistance = 13  # 38, 39
-            fCurrentResistance = sc.short
-
-            nTargetResistance = 14  # 40, 41
-            fTargetResistance = sc.short
-
-            nEvents = 15  # 42
-            fEvents = sc.unsigned_char
-
-            fFiller43 = sc.pad  # 43
-
-            nCadence = 16  # 44
-            fCadence = sc.unsigned_char
-
-            fFiller45 = sc.pad  # 45
-
-            # nModeEcho          = 17                # 46
-            fModeEcho = sc.unsigned_char
-
-            # nChecksumLSB       = 18                # 47
-            fChecksumLSB = sc.unsigned_char
-
-            # nChecksumMSB       = 19                # 48
-            fChecksumMSB = sc.unsigned_char
-
-            fFiller49_63 = sc.pad * (63 - 48)  # 49...63
-
-            format = (
-                sc.no_alignment
-                + fDeviceSerial
-                + fFiller2_7
-                + fYearProduction
-                + fFiller9_11
-                + fHeartRate
-                + fButtons
-                + fHeartDetect
-                + fErrorCount
-                + fAxis0
-                + fAxis1
-                + fAxis2
-                + fAxis3
-                + fHeader
-                + fDistance
-                + fSpeed
-                + fFiller34_35
-                + fFiller36_37
-                + fCurrentResistance
-                + fTargetResistance
-                + fEvents
-                + fFiller43
-                + fCadence
-                + fFiller45
-                + fModeEcho
-                + fChecksumLSB
-                + fChecksumMSB
-                + fFiller49_63
-            )
-
-            # -----------------------------------------------------------------------
-            # Buffer must be 64 characters (struct.calcsize(format)),
-            # Note that tt_FortiusSB returns 48 bytes only; append with dummy
+            # Buffer is 64 characters, but tt_FortiusSB returns 48 bytes only;
+            # both are parsed as they are. Shorter buffers (40...44 bytes) are
+            # exceptional and appended with dummy.
             # -----------------------------------------------------------------------
-            for _v in range(64 - len(data)):
-                data.append(0)
+            if len(data) < UsbFrameNew.size:
+                data = bytes(data) + bytes(UsbFrameNew.size - len(data))
 
             # -----------------------------------------------------------------------
-            # Parse buffer
+            # Parse buffer, see UsbFrameNew
+            # self.Header is filled in USB_Read already
             # -----------------------------------------------------------------------
-            tuple = struct.unpack(format, data)
-            self.Axis = tuple[nAxis1]
-            self.Buttons = tuple[nButtons]
-            self.Cadence = tuple[nCadence]
-            self.CurrentResistance = tuple[nCurrentResistance]
-            # self.Header            = tuple[nHeader]   filled in USB_Read already
-            self.HeartRate = tuple[nHeartRate]
-            self.PedalEcho = tuple[nEvents]
-            self.TargetResistanceFT = tuple[nTargetResistance]
-            self.WheelSpeed = tuple[nSpeed]
+            (
+                self.HeartRate,
+                self.Buttons,
+                self.Axis,
+                self.WheelSpeed,
+                self.CurrentResistance,
+                self.TargetResistanceFT,
+                self.PedalEcho,
+                self.Cadence,
+            ) = UsbFrameNew.unpack_from(data)
 
             self.Wheel2Speed()
             self.CurrentResistance2Power()
@@ -3880,6 +3949,9 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
                     )
                 )
 
+    def _ReadFrame(self):
+        return self._USB_Read_retry4x40()  # See _ReceiveFromTrainer()
+
     # ---------------------------------------------------------------------------
     # R e c e i v e F r o m T r a i n e r
     # ---------------------------------------------------------------------------
@@ -3913,51 +3985,14 @@ class clsTacxNewUsbTrainer(clsTacxUsbTrainer):
             pass
         else:
             # -------------------------------------------------------------------
-            # Define buffer format
+            # Parse buffer, see UsbFrameVersion
+            # self.Header is filled in USB_Read already
             # -------------------------------------------------------------------
-            fFiller0_23 = sc.pad * 24  #  0...23
-
-            _nHeader = 0
-            fHeader = sc.unsigned_int  # 24...27
-
-            nMotorBrakeUnitFirmware = 1
-            fMotorBrakeUnitFirmware = sc.unsigned_int  # 28...31   0.x.y.z
-
-            nMotorBrakeUnitSerial = 2  # 32...35   tt-YY-##### (tt=41 (T1941), YY=year,
-            fMotorBrakeUnitSerial = (
-                sc.unsigned_int
-            )  #                 ##### brake individual serial)
-
-            nVersion2 = 3  # 36, 37
-            fVersion2 = sc.unsigned_short
-
-            fFiller38_63 = sc.pad * (63 - 37)  # 38...63
-
-            format = (
-                sc.no_alignment
-                + fFiller0_23
-                + fHeader
-                + fMotorBrakeUnitFirmware
-                + fMotorBrakeUnitSerial
-                + fVersion2
-                + fFiller38_63
-            )
-
-            # -----------------------------------------------------------------------
-            # Buffer must be 64 characters (struct.calcsize(format)),
-            # Note that tt_FortiusSB returns 48 bytes only; append with dummy
-            # -----------------------------------------------------------------------
-            for _v in range(64 - len(data)):
-                data.append(0)
-
-            # -----------------------------------------------------------------------
-            # Parse buffer
-            # -----------------------------------------------------------------------
-            tuple = struct.unpack(format, data)
-            # self.Header                = tuple[nHeader]   filled in USB_Read already
-            self.MotorBrakeUnitFirmware = tuple[nMotorBrakeUnitFirmware]
-            self.MotorBrakeUnitSerial = tuple[nMotorBrakeUnitSerial]
-            self.Version2 = tuple[nVersion2]
+            (
+                self.MotorBrakeUnitFirmware,
+                self.MotorBrakeUnitSerial,
+                self.Version2,
+            ) = UsbFrameVersion.unpack_from(data, UsbFrameVersionOffset)
 
             # -----------------------------------------------------------------------
             # Split serial; all decimal digits = tt-yy-#####
@@ -0,0 +1,106 @@
+from fortius_ant import antCTRL, antDispatcher, antFE, antScheduler
+from fortius_ant import antDongle as ant
+from fortius_ant import debug
+
+
+def _message(id, info):
+    return ant.ComposeMessage(id, bytes(info))
+
+
+def test_dispatch_most_specific_first():
+    dispatcher = antDispatcher.clsAntDispatcher()
+    calls = []
+
+    def page16(id, Channel, DataPageNumber, info):
+        calls.append(("page16", Channel, DataPageNumber))
+        return DataPageNumber == 16
+
+    def anypage(id, Channel, DataPageNumber, info):
+        calls.append(("anypage", Channel, DataPageNumber))
+        return True
+
+    dispatcher.Register(ant.msgID_BroadcastData, 5, 16, page16)
+    dispatcher.Register(ant.msgID_BroadcastData, 5, None, anypage)
+
+    d = _message(ant.msgID_BroadcastData, [5, 16, 0, 0, 0, 0, 0, 0, 0])
+    assert dispatcher.Dispatch(d)[-1] is True
+    d = _message(ant.msgID_BroadcastData, [5, 25, 0, 0, 0, 0, 0, 0, 0])
+    assert dispatcher.Dispatch(d)[-1] is True
+    assert calls == [("page16", 5, 16), ("anypage", 5, 25)]
+
+    d = _message(ant.msgID_BroadcastData, [6, 16, 0, 0, 0, 0, 0, 0, 0])
+    assert dispatcher.Dispatch(d) == (ant.msgID_BroadcastData, 6, 16, d[3:-1], False)
+
+
+def test_dispatch_fall_through():
+    dispatcher = antDispatcher.clsAntDispatcher()
+    dispatcher.Register(ant.msgID_ChannelID, 1, None, lambda *_args: False)
+    dispatcher.Register(ant.msgID_ChannelID, None, None, antDispatcher.HandleIgnore)
+
+    d = ant.msg51_ChannelID(1, 1234, ant.DeviceTypeID_HRM, 1)
+    assert dispatcher.Dispatch(d)[-1] is True
+
+
+def test_dispatch_timing(mocker):
+    mocker.patch.object(debug, "on", return_value=True)
+    mocker.patch("fortius_ant.logfile.Write")
+    dispatcher = antDispatcher.clsAntDispatcher()
+    dispatcher.Register(
+        ant.msgID_ChannelResponse, None, None, antDispatcher.HandleIgnore
+    )
+    dispatcher.Dispatch(ant.ComposeMessage(ant.msgID_ChannelResponse, b"\x00\x4b\x00"))
+    assert dispatcher.HandlerTime["HandleIgnore"][0] == 1
+
+
+def test_fe_target_power(mocker):
+    dispatcher = antDispatcher.clsAntDispatcher()
+    trainer = mocker.Mock()
+    antFE.Initialize()
+    antFE.RegisterHandlers(dispatcher, mocker.Mock(), trainer, mocker.Mock())
+
+    info = [ant.channel_FE, 49, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x20, 0x03]
+    d = _message(ant.msgID_AcknowledgedData, info)
+    assert dispatcher.Dispatch(d)[-1] is True
+    trainer.SetPower.assert_called_once_with(200)
+    assert antFE.p71_LastReceivedCommandID == 49
+    assert antFE.p71_SequenceNr == 1  # 255 = no command received yet
+    assert (antFE.p71_Data3, antFE.p71_Data4) == (0x20, 0x03)
+
+
+def test_ctrl_generic_command(mocker):
+    dispatcher = antDispatcher.clsAntDispatcher()
+    antCTRL.Initialize()
+    antCTRL.RegisterHandlers(dispatcher, mocker.Mock())
+
+    info = ant.msgPage73_GenericCommand(ant.channel_CTRL, 1, 2, 3, antCTRL.MenuUp)
+    d = _message(ant.msgID_AcknowledgedData, info)
+    assert dispatcher.Dispatch(d)[-1] is True
+    assert antCTRL.Commands == [(2, 1, antCTRL.MenuUp)]
+    assert antCTRL.p71_SequenceNr == 3
+
+
+def test_scheduler_one_page_per_event(mocker):
+    dongle = mocker.Mock()
+    dispatcher = antDispatcher.clsAntDispatcher()
+    dispatcher.Register(
+        ant.msgID_ChannelResponse, None, None, antDispatcher.HandleIgnore
+    )
+    scheduler = antScheduler.clsAntScheduler(dongle)
+    pages = []
+
+    def PageFunction():
+        pages.append(len(pages))
+        return b"page%d" % pages[-1]
+
+    scheduler.Register(dispatcher, ant.channel_PWR, PageFunction)
+    assert scheduler.Pages() == [b"page0"]  # Not synchronised yet
+
+    event = _message(ant.msgID_ChannelResponse, [ant.channel_PWR, 1, ant.EVENT_TX])
+    assert dispatcher.Dispatch(event)[-1] is True
+    dongle.Send.assert_called_once_with([b"page1"])
+    assert scheduler.Synchronised(ant.channel_PWR)
+    assert scheduler.Pages() == []  # Sent on EVENT_TX only
+
+    ack = _message(ant.msgID_ChannelResponse, [ant.channel_PWR, 0x4B, 0])
+    assert dispatcher.Dispatch(ack)[-1] is True  # Ignored, no page
+    assert pages == [0, 1]
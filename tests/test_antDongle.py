@@ -0,0 +1,623 @@
+import array
+import asyncio
+import queue
+import threading
+import time
+
+from fortius_ant import antDongle as ant
+from fortius_ant import debug
+
+# Broadcast page 16 on channel 0 and a channel response, as sent by a dongle
+message1 = ant.ComposeMessage(
+    ant.msgID_BroadcastData, b"\x00\x10\x01\x02\x03\x04\x05\x06\x07"
+)
+message2 = ant.ComposeMessage(ant.msgID_ChannelResponse, b"\x00\x4b\x00")
+
+
+def test_checksum():
+    for message in (message1, message2):
+        expected = 0
+        for b in message[:-1]:
+            expected ^= b
+        assert ant.CalcChecksum(message) == bytes([expected])
+        assert ant.CalcChecksum(memoryview(message)) == message[-1:]
+
+
+def test_reassemble_multiple_messages():
+    reassembler = ant.clsAntFrameReassembler()
+    out = reassembler.Feed(array.array("B", message1 + message2))
+    assert [bytes(d) for d in out] == [message1, message2]
+    assert reassembler.Messages == 2
+    assert reassembler.SkippedBytes == 0
+
+
+def test_reassemble_split_message():
+    reassembler = ant.clsAntFrameReassembler()
+    data = message1 + message2
+    for split in range(1, len(data)):
+        out = reassembler.Feed(data[:split])
+        out += reassembler.Feed(data[split:])
+        assert [bytes(d) for d in out] == [message1, message2]
+    assert reassembler.SkippedBytes == 0
+    assert reassembler.ChecksumErrors == 0
+
+
+def test_reassemble_garbage():
+    reassembler = ant.clsAntFrameReassembler()
+    corrupt = message1[:-1] + bytes([message1[-1] ^ 0xFF])
+    out = reassembler.Feed(b"\x00\x01" + corrupt + message2 + b"\xa4\xff")
+    assert [bytes(d) for d in out] == [message2]
+    assert reassembler.ChecksumErrors == 1
+    assert reassembler.SkippedBytes == 2 + len(corrupt) - 1 + 2
+
+    reassembler.Reset()
+    assert [bytes(d) for d in reassembler.Feed(message1)] == [message1]
+
+
+def test_codec():
+    codec = ant.GetCodec(ant.msgID_BroadcastData, 16, ant.DeviceTypeID_FE)
+    assert codec is ant.codecPage16_GeneralFEdata
+    assert ant.GetCodec(ant.msgID_AcknowledgedData, 70, ant.DeviceTypeID_FE) is (
+        ant.codecPage70_RequestDataPage
+    )
+
+    info = ant.msgPage16_GeneralFEdata(0, 1, 2, 3, 4)
+    message = ant.ComposeMessage(ant.msgID_BroadcastData, info)
+    assert codec.UnpackFrom(message) == ant.msgUnpage16_GeneralFEdata(info)
+
+    buffer = bytearray(codec.Size)
+    codec.PackInto(buffer, 0, *codec.Unpack(info))
+    assert buffer == info
+
+    assert ant.msg4B_OpenChannel(1) == ant.ComposeMessage(
+        ant.msgID_OpenChannel, b"\x01"
+    )
+
+
+def test_message_queue():
+    dongle = ant.clsAntDongle(-1)  # No ANT dongle, queue only
+    assert dongle.MessageQueueGet() is None
+    assert dongle.WaitForMessage(0.01) is None
+
+    dongle.MessageQueuePut(message1)
+    dongle.MessageQueuePut(message2)
+    assert dongle.MessageQueueSize() == 2
+    assert dongle.WaitForMessage(0.01) == message1
+    assert dongle.MessageArrivalTime > 0
+    assert list(dongle.Messages(0)) == [message2]
+    assert dongle.MessageQueueSize() == 0
+
+
+def test_message_queue_wakeup():
+    dongle = ant.clsAntDongle(-1)
+    timer = threading.Timer(0.05, dongle.MessageQueuePut, (message1,))
+    timer.start()
+    start = time.time()
+    assert list(dongle.Messages(start + 0.2)) == [message1]
+    assert dongle.MessageArrivalTime - start < 0.15
+    timer.join()
+
+
+class clsFakeDevice:
+    # Acknowledges every command; rejects the first Open Channel
+    def __init__(self, dongle):
+        self.dongle = dongle
+        self.written = []
+        self.rejected = False
+
+    def write(self, _endpoint, message):
+        self.written.append(bytes(message))
+        id, channel = message[2], message[3]
+        if id == ant.msgID_RequestMessage:
+            return
+        code = 0
+        if id == ant.msgID_OpenChannel and not self.rejected:
+            self.rejected = True
+            code = 0x15  # CHANNEL_IN_WRONG_STATE
+        self.dongle.MessageQueuePut(
+            ant.ComposeMessage(ant.msgID_ChannelResponse, bytes([channel, id, code]))
+        )
+
+
+def test_configure_channels():
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.ThreadActive = True  # Responses are put in the queue directly
+    dongle.devAntDongle = clsFakeDevice(dongle)
+    dongle.ConfigMsg = False
+
+    dongle.BeginChannelConfig()
+    dongle.Trainer_ChannelConfig()
+    dongle.SlaveHRM_ChannelConfig(0)
+    assert dongle.devAntDongle.written == []
+    assert dongle.EndChannelConfig()
+
+    written = dongle.devAntDongle.written
+    assert len(written) == 6 + 7 + 1  # Only the rejected Open Channel again
+    assert written[-1] == ant.msg4B_OpenChannel(ant.channel_FE)
+    assert set(dongle.ChannelSetupTime) == {ant.channel_FE, ant.channel_HRM_s}
+    assert dongle.MessageQueueSize() == 0
+
+    # After a reconnect, the configuration is sent again
+    journal = list(dongle.Journal)
+    assert len(journal) == 6 + 7
+    dongle.devAntDongle = clsFakeDevice(dongle)
+    dongle.devAntDongle.rejected = True
+    assert dongle.ReplayJournal()
+    assert dongle.devAntDongle.written == journal
+    assert dongle.Journal == journal
+
+
+def test_journal_acknowledged_only():
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.ThreadActive = True
+    dongle.devAntDongle = clsFakeDevice(dongle)
+    dongle.ConfigMsg = False
+    dongle.ConfigRetries = 0
+
+    assert not dongle.ConfigureChannels(
+        [ant.msg4B_OpenChannel(ant.channel_FE), ant.msg4B_OpenChannel(ant.channel_HRM)]
+    )
+    assert dongle.Journal == [ant.msg4B_OpenChannel(ant.channel_HRM)]
+
+
+class clsFakeResetDevice:
+    # Answers a reset with a pending message and StartUp
+    def __init__(self):
+        self.data = []
+
+    def write(self, _endpoint, message):
+        if message[2] == ant.msgID_ResetSystem:
+            self.data = [message2, ant.ComposeMessage(ant.msgID_StartUp, b"\x00")]
+
+    def read(self, _endpoint, _length, _timeout):
+        if self.data:
+            return self.data.pop(0)
+        raise TimeoutError
+
+
+def test_reset_waits_for_startup():
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeResetDevice()
+    dongle.MessageQueuePut(message1)  # Not yet handled by the application
+    start = time.time()
+    dongle.ResetDongle()
+    assert time.time() - start < dongle.ResetTimeout
+    # The message sent before the reset is dropped, the queue is kept
+    assert list(dongle.Messages(0)) == [message1]
+
+    assert not dongle.WaitForStartUp()  # No reset, no StartUp
+
+
+def test_burst():
+    payload = bytes(range(30))
+    messages = ant.ComposeBurst(3, payload)
+    assert len(messages) == 4
+    assert [m[3] >> 5 for m in messages] == [0, 1, 2, 3 | 4]
+
+    received = []
+    reassembler = ant.clsAntBurstReassembler()
+    reassembler.Register(3, lambda Channel, Payload: received.append(Payload))
+    for m in messages:
+        reassembler.HandleBurst(ant.msgID_BurstData, 3, m[4], m[3:-1])
+    assert received == [payload + b"\x00\x00"]
+
+    # A missing packet drops the burst
+    for m in messages[:1] + messages[2:]:
+        assert reassembler.Feed(m[3:-1]) is None
+    assert reassembler.SequenceErrors == 1
+    assert reassembler.Bursts == 1
+
+
+class clsFakeReadDevice:
+    # Acknowledges every command, the response is returned by read()
+    def __init__(self):
+        self.written = []
+        self.data = []
+
+    def write(self, _endpoint, message):
+        self.written.append(bytes(message))
+        if message[2] != ant.msgID_RequestMessage:
+            self.data.append(
+                ant.ComposeMessage(
+                    ant.msgID_ChannelResponse, bytes([message[3], message[2], 0])
+                )
+            )
+
+    def read(self, _endpoint, _length, _timeout):
+        if self.data:
+            return self.data.pop(0)
+        raise TimeoutError
+
+
+def test_dongle_pool():
+    dongles = []
+    for _ in range(2):
+        dongle = ant.clsAntDongle(-1)
+        dongle.OK = True
+        dongle.devAntDongle = clsFakeReadDevice()
+        dongles.append(dongle)
+
+    pool = ant.clsAntDonglePool(Dongles=dongles)
+    pool.ConfigMsg = False
+    pool.ChannelsPerDongle = 2
+    # Dongle 0 reports 3 channels, dongle 1 does not respond
+    dongles[0].devAntDongle.data.append(
+        ant.ComposeMessage(ant.msgID_Capabilities, b"\x03\x08\x00\x00\x00\x00")
+    )
+    pool._Read(False, 1)
+    assert pool.MessageQueueGet()[2] == ant.msgID_Capabilities
+    assert dongles[0].MaxChannels == 3
+
+    pool.BeginChannelConfig()
+    pool.Trainer_ChannelConfig()  # channel 0
+    pool.HRM_ChannelConfig()  # channel 1
+    pool.PWR_ChannelConfig(0)  # channel 2
+    assert pool.EndChannelConfig()
+
+    assert pool.Assignment == {
+        ant.channel_FE: (dongles[0], 0),
+        ant.channel_HRM: (dongles[1], 0),
+        ant.channel_PWR: (dongles[0], 1),
+    }
+    assert dongles[1].devAntDongle.written[0] == ant.msg42_AssignChannel(
+        0, ant.ChannelType_BidirectionalTransmit, NetworkNumber=0x00
+    )
+    assert set(pool.ChannelSetupTime) == {0, 1, 2}  # Logical channels
+    assert pool.AssignChannel(5) == (dongles[1], 1)
+    assert pool.AssignChannel(6) == (dongles[0], 2)  # Dongle 1 is full
+
+    # A dongle replays its own part of the configuration after a reconnect
+    journal = list(dongles[1].Journal)
+    assert journal[0] == dongles[1].devAntDongle.written[0]
+    dongles[1].devAntDongle = clsFakeReadDevice()
+    assert dongles[1].ReplayJournal()
+    assert dongles[1].devAntDongle.written == journal
+    assert pool.MessageQueueSize() == 0
+
+    # Received message is mapped to the logical channel
+    dongles[1].devAntDongle.data.append(message1)  # channel 0 of dongle 1
+    pool._Read(False, 1)
+    assert pool.MessageQueueGet()[3] == ant.channel_HRM
+
+    # The statistics of the pool are those of the dongles, logical channels
+    dongles[0].devAntDongle.data.append(b"\x00" + message1)
+    pool._Read(False, 1)
+    pool.MessageQueueGet()
+    Members = [d.Statistics.Snapshot() for d in dongles]
+    assert set(Members[1]["Transmitted"]) == {ant.channel_HRM}
+    s = pool.Statistics.Snapshot()
+    for Counter in ("Received", "Transmitted"):
+        for Channel in (ant.channel_FE, ant.channel_HRM, ant.channel_PWR):
+            assert s[Counter][Channel] == sum(
+                m[Counter].get(Channel, 0) for m in Members
+            )
+    assert s["Pages"][ant.channel_HRM, 16] == 1
+    assert s["SkippedBytes"] == 1
+
+
+class clsConsumedQueue(queue.Queue):
+    # The application takes every message as soon as it is queued
+    def __init__(self):
+        queue.Queue.__init__(self)
+        self.consumed = []
+
+    def put(self, item, block=True, timeout=None):
+        self.consumed.append(item[1])
+
+
+def ReplayWithConsumer(dongle, expected):
+    MessageQueue = dongle._MessageQueue
+    dongle._MessageQueue = clsConsumedQueue()
+    try:
+        journal = list(dongle.Journal)
+        dongle.devAntDongle = clsFakeReadDevice()
+        dongle.devAntDongle.data.append(message1)  # Received during the replay
+        assert dongle.ReplayJournal()
+        assert dongle.devAntDongle.written == journal
+        assert dongle._MessageQueue.consumed == [expected]  # No Channel Response
+    finally:
+        dongle._MessageQueue = MessageQueue
+
+
+def test_replay_concurrent_consumer():
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeReadDevice()
+    dongle.ConfigMsg = False
+    assert dongle.ConfigureChannels(
+        [ant.msg4B_OpenChannel(ant.channel_FE), ant.msg4B_OpenChannel(ant.channel_HRM)]
+    )
+    ReplayWithConsumer(dongle, message1)
+
+    # A dongle of a pool, which shares the queue of the pool
+    dongles = [dongle, ant.clsAntDongle(-1)]
+    dongles[1].OK = True
+    dongles[1].devAntDongle = clsFakeReadDevice()
+    pool = ant.clsAntDonglePool(Dongles=dongles)
+    pool.ConfigMsg = False
+    pool.ResetDongle()
+    assert pool.ConfigureChannels([ant.msg4B_OpenChannel(c) for c in range(4)])
+    Logical = ant.MapChannel(message1, dongles[1].ChannelMap)
+    assert Logical[3] == 1
+    ReplayWithConsumer(dongles[1], Logical)
+
+
+def test_capture_replay(tmp_path):
+    FileName = str(tmp_path / "ant.cap")
+    capture = ant.clsAntCapture(FileName)
+    capture.Write(ant.CaptureReceived, message1)
+    capture.Write(ant.CaptureSent, ant.msg4B_OpenChannel(0))
+    capture.Write(ant.CaptureReceived, message2)
+    capture.Close()
+    with open(FileName, "ab") as f:
+        f.write(b"\x00\x01")  # Incomplete record
+
+    for MemoryMap in (True, False):
+        records = list(ant.ReadCapture(FileName, MemoryMap))
+        assert [(r[1], bytes(r[2])) for r in records] == [
+            (ant.CaptureReceived, message1),
+            (ant.CaptureSent, ant.msg4B_OpenChannel(0)),
+            (ant.CaptureReceived, message2),
+        ]
+        assert records[0][0] <= records[2][0]
+
+    dongle = ant.clsReplayAntDongle(FileName, RealTime=False)
+    dongle.Read(False)
+    assert list(dongle.Messages(0)) == [message1]  # Until the next sent message
+    dongle.Write([ant.msg4B_OpenChannel(0)])
+    assert list(dongle.Messages(0)) == [message2]
+    assert dongle.Finished and dongle.Sent == 1
+
+
+class clsFakeUnpluggedDevice:
+    # The wake-up cannot be written, the read ends at its timeout
+    def write(self, _endpoint, _message):
+        raise OSError("No such device")
+
+    def read(self, _endpoint, _length, timeout):
+        time.sleep(timeout / 1000)
+        raise TimeoutError
+
+
+def test_stop_read_thread_wakeup_failed(mocker):
+    Write = mocker.patch("fortius_ant.logfile.Write")
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeUnpluggedDevice()
+    dongle.ReadThreadTimeout = 100
+    dongle.StartReadThread()
+    thread = dongle.MessageThread
+    start = time.time()
+    dongle.StopReadThread()
+    assert time.time() - start < 1
+    assert not thread.is_alive()
+    assert "wake-up failed" in Write.call_args_list[-1][0][0]
+
+
+class clsFakeWakeDevice:
+    # Answers the capabilities request; read() blocks until data or timeout
+    def __init__(self):
+        self.written = []
+        self.data = queue.Queue()
+
+    def write(self, _endpoint, message):
+        self.written.append((time.time(), bytes(message)))
+        if message[2] == ant.msgID_RequestMessage:
+            self.data.put(ant.ComposeMessage(ant.msgID_Capabilities, bytes(6)))
+
+    def read(self, _endpoint, _length, timeout):
+        try:
+            return self.data.get(timeout=timeout / 1000)
+        except queue.Empty:
+            raise TimeoutError
+
+
+def test_stop_read_thread_wakeup():
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeWakeDevice()
+    dongle.StartReadThread()
+    thread = dongle.MessageThread
+
+    # The wake-up waits for a reconnect, as any other write
+    locked = threading.Event()
+
+    def Reconnect():
+        with dongle._WriteLock:
+            locked.set()
+            time.sleep(0.1)
+
+    threading.Thread(target=Reconnect).start()
+    locked.wait()
+    start = time.time()
+    dongle.StopReadThread()
+    assert not thread.is_alive()
+    assert dongle.devAntDongle.written[0][0] - start >= 0.09
+    assert time.time() - start < 0.5  # The response ends the read
+    assert dongle.Statistics.Snapshot()["Transmitted"] == {None: 1}
+    assert dongle.MessageQueueSize() == 0  # The response is not queued
+
+
+def test_async_replay(tmp_path):
+    FileName = str(tmp_path / "ant.cap")
+    capture = ant.clsAntCapture(FileName)
+    for _ in range(3):
+        capture.Write(ant.CaptureReceived, message1)
+    capture.Close()
+
+    dongle = ant.clsReplayAntDongle(FileName)
+    AsyncDongle = ant.clsAsyncAntDongle(dongle)
+
+    async def main():
+        frames = []
+        async for d in AsyncDongle.Frames():
+            frames.append(d)
+            if len(frames) == 3:
+                AsyncDongle.Close()
+        return frames
+
+    assert asyncio.run(asyncio.wait_for(main(), 5)) == [message1] * 3
+
+
+def test_write_queue():
+    fe1 = ant.ComposeMessage(ant.msgID_BroadcastData, b"\x00\x10" + bytes(7))
+    fe2 = ant.ComposeMessage(ant.msgID_BroadcastData, b"\x00\x19" + bytes(7))
+    hrm = ant.ComposeMessage(ant.msgID_BroadcastData, b"\x01\x00" + bytes(7))
+    page71 = ant.ComposeMessage(ant.msgID_BroadcastData, b"\x00\x47" + bytes(7))
+    request = ant.msg4D_RequestMessage(1, ant.msgID_ChannelID)
+
+    WriteQueue = ant.clsAntWriteQueue(None)
+    WriteQueue.Active = True
+    WriteQueue.Put([fe1, hrm, fe2])
+    WriteQueue.Put([page71] * 2, ant.WritePriorityRequested)
+    WriteQueue.Put([request])
+    assert WriteQueue.Coalesced == 1
+    assert WriteQueue.Size() == 5
+    assert [WriteQueue.Get(0) for _ in range(6)] == [
+        request,
+        page71,
+        page71,
+        fe2,  # fe1 is replaced
+        hrm,
+        None,
+    ]
+
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeReadDevice()
+    dongle.StartWriteThread()
+    dongle.Send([request])
+    for _ in range(100):
+        if dongle.WriteQueue.Written:
+            break
+        time.sleep(0.01)
+    dongle.StopWriteThread()
+    assert dongle.devAntDongle.written == [request]
+
+
+def test_write_queue_reset():
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeReadDevice()
+    dongle.ResetTimeout = 0.01
+    dongle.StartWriteThread()
+    WriteQueue = dongle.WriteQueue
+    request = ant.msg4D_RequestMessage(1, ant.msgID_ChannelID)
+
+    dongle.ResetDongle()  # Paused until the channels are configured again
+    dongle.devAntDongle.written = []
+    dongle.Send([request])
+    time.sleep(0.05)
+    assert dongle.devAntDongle.written == []
+    assert WriteQueue.Paused and WriteQueue.Size() == 1
+
+    dongle.ConfigureChannels([ant.msg4B_OpenChannel(0)])
+    for _ in range(100):
+        if request in dongle.devAntDongle.written:
+            break
+        time.sleep(0.01)
+    dongle.StopWriteThread()
+    assert dongle.WriteQueue is None and not WriteQueue.Paused
+    assert dongle.devAntDongle.written == [ant.msg4B_OpenChannel(0), request]
+
+
+def test_statistics(mocker):
+    Write = mocker.patch("fortius_ant.logfile.Write")
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeReadDevice()
+    dongle.devAntDongle.data = [
+        message1 + message2,
+        ant.ComposeMessage(ant.msgID_ChannelResponse, b"\x00\x01\x02"),
+        b"\x00" + message1,
+    ]
+    dongle.Write([ant.msg4B_OpenChannel(0)], False)
+    dongle._Read(False)
+    while dongle.MessageQueueGet():
+        pass
+
+    s = dongle.Statistics.Snapshot()
+    assert s["Received"] == {0: 5}  # Including the response on Open Channel
+    assert s["Transmitted"] == {0: 1}
+    assert s["Pages"] == {(0, 16): 2}
+    assert s["Events"] == {(0, ant.EVENT_RX_FAIL): 1}
+    assert s["QueueHighWater"] == 5
+    assert s["QueueSize"] == 0
+    assert s["SkippedBytes"] == 1
+    assert 0 < s["LatencyMax"] < 1
+
+    dongle.Statistics.Log()
+    assert "rx fail:1" in Write.call_args_list[-1][0][0]
+
+
+def test_extended_message(mocker):
+    info = b"\x00\x10" + bytes(7)
+    flags = ant.LibConfig_ChannelID | ant.LibConfig_RSSI | ant.LibConfig_Timestamp
+    extension = bytes((flags,)) + b"\x39\x30\x11\x01" + b"\x20\xc4\xa0" + b"\x00\x80"
+    d = ant.ComposeMessage(ant.msgID_BroadcastData, info + extension)
+    assert ant.DecomposeMessage(d)[3] == info  # Codecs see the 8 bytes only
+    assert ant.unmsgExtended(d[3:-1]) == ((12345, 0x11, 1), -60, 0x8000)
+    assert ant.unmsgExtended(info) == (None, None, None)
+
+    clock = ant.clsAntRxClock()
+    assert clock.RxTime(0xFF00, 100.01) == 100.01
+    # 0.25s later with rollover, read 50ms late
+    t = clock.RxTime((0xFF00 + 8192) & 0xFFFF, 100.31)
+    assert abs(t - 100.26) < 1e-3  # MaxDrift allowed
+    # 4.25s later (two rollovers missed), read without delay
+    t = clock.RxTime((0xFF00 + 8192 * 18) & 0xFFFF, 104.26)
+    assert abs(t - 104.26) < 1e-3
+
+    # Only the extended data messages have an RX timestamp
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.LibConfig = ant.LibConfig_Timestamp
+    dongle.RxClock = ant.clsAntRxClock()
+    dongle.devAntDongle = clsFakeReadDevice()
+    version = ant.ComposeMessage(ant.msgID_ANTversion, b"AP2-1.05\x00\x20\x00\x40")
+    dongle.devAntDongle.data += [d, version]  # version looks extended
+    RxTime = mocker.spy(dongle.RxClock, "RxTime")
+    dongle._Read(False, 1)
+    assert list(dongle.Messages(0)) == [d, version]
+    assert [c[0][0] for c in RxTime.call_args_list] == [0x8000]
+
+
+def test_trace(tmp_path):
+    FileName = str(tmp_path / "ant.cap")
+    capture = ant.clsAntCapture(FileName)
+    capture.Write(ant.CaptureReceived, message1)
+    capture.Close()
+
+    TraceName = str(tmp_path / "ant.anttrace")
+    dongle = ant.clsReplayAntDongle(FileName, RealTime=False)
+    dongle.StartTrace(TraceName)
+    dongle.Write([ant.msg4B_OpenChannel(0)], receive=False)
+    dongle.Read(False)
+    assert dongle.Trace.Frames == 2
+    dongle.StopTrace()
+
+    records = list(ant.ReadCapture(TraceName))
+    assert [(r[1], bytes(r[2])) for r in records] == [
+        (ant.CaptureSent, ant.msg4B_OpenChannel(0)),
+        (ant.CaptureReceived, message1),
+    ]
+    lines = list(ant.DecodeTrace(TraceName))
+    assert "send" in lines[0] and "Open Channel" in lines[0]
+    assert "receive" in lines[1] and "p=16(Main data page)" in lines[1]
+
+
+def test_trace_no_text_logging(mocker, tmp_path):
+    mocker.patch("fortius_ant.debug.xDebug", debug.Data1 | debug.Function, create=True)
+    Write = mocker.patch("fortius_ant.logfile.Write")
+    dongle = ant.clsAntDongle(-1)
+    dongle.OK = True
+    dongle.devAntDongle = clsFakeReadDevice()
+    dongle.StartTrace(str(tmp_path / "ant.anttrace"))
+    dongle.Write([ant.msg4B_OpenChannel(0)])
+    assert dongle.WaitForMessage(0) == message2
+    dongle.StopTrace()
+    # The messages are in the trace, not formatted in the logfile
+    assert not [c for c in Write.call_args_list if "a4 " in c[0][0]]
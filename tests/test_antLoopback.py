@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+from fortius_ant import antDongle as ant
+from fortius_ant import antLoopback
+
+
+def test_loopback_dongle():
+    device = antLoopback.clsLoopbackDevice(TimeScale=20, Seed=1)
+    dongle = ant.clsAntDongle(Devices=[device])
+    assert dongle.OK
+    assert dongle.Message == "Using Loopback dongle"
+
+    dongle.ConfigMsg = False
+    dongle.Calibrate()  # Starts the ReadThread
+    dongle.BeginChannelConfig()
+    dongle.Trainer_ChannelConfig()
+    dongle.SlaveHRM_ChannelConfig(0)
+    assert dongle.EndChannelConfig()
+
+    events = 0
+    heartrates = []
+    paired = None
+    for d in dongle.Messages(dongle.MessageArrivalTime + 0.3):
+        _s, _l, id, info, _c, _r, Channel, _p = ant.DecomposeMessage(d)
+        if id == ant.msgID_ChannelResponse and info[1:] == bytes(
+            (ant.msgID_RF_EVENT, ant.EVENT_TX)
+        ):
+            assert Channel == ant.channel_FE
+            events += 1
+        elif id == ant.msgID_BroadcastData:
+            assert Channel == ant.channel_HRM_s
+            heartrates.append(info[8])
+        elif id == ant.msgID_ChannelID:
+            paired = ant.unmsg51_ChannelID(info)[1]
+    dongle.StopReadThread()
+
+    assert events >= 10  # 80Hz instead of 4Hz
+    assert heartrates and set(heartrates) == {120}
+    assert paired == 1201
+
+
+def test_read_thread_idle():
+    device = antLoopback.clsLoopbackDevice()
+    dongle = ant.clsAntDongle(Devices=[device])
+    dongle.Calibrate()  # No channels open, so no data
+    time.sleep(0.3)
+    start = time.time()
+    dongle.StopReadThread()
+    assert time.time() - start < dongle.ReadThreadTimeout / 1000 / 2  # Woken up
+    assert dongle.IdleWakeupsPerSecond() < 5  # Instead of 50
+
+
+def test_async_dongle():
+    device = antLoopback.clsLoopbackDevice(TimeScale=20)
+    dongle = ant.clsAntDongle(Devices=[device])
+    dongle.ConfigMsg = False
+    dongle.Calibrate()
+    dongle.Trainer_ChannelConfig()
+    AsyncDongle = ant.clsAsyncAntDongle(dongle)
+
+    async def main():
+        events = 0
+        await AsyncDongle.Send([ant.msg4D_RequestMessage(0, ant.msgID_ChannelID)])
+        async for d in AsyncDongle.Frames():
+            if d[2] == ant.msgID_ChannelResponse and d[5] == ant.EVENT_TX:
+                events += 1
+                if events == 5:
+                    AsyncDongle.Close()
+        return events
+
+    assert asyncio.run(asyncio.wait_for(main(), 5)) == 5
+    assert not dongle.ThreadActive
+
+
+def test_scan_mode():
+    device = antLoopback.clsLoopbackDevice(TimeScale=20, Seed=1)
+    device.SimulatedDevices.append(antLoopback.SimulatedHRM(DeviceNumber=1202))
+    dongle = ant.clsAntDongle(Devices=[device])
+    dongle.ConfigMsg = False
+    dongle.Calibrate()
+    dongle.ScanMode_ChannelConfig()
+
+    inventory = ant.clsAntInventory()
+    for d in dongle.Messages(time.time() + 0.3):
+        inventory.Update(d)
+    dongle.StopReadThread()
+
+    assert set(inventory.Devices) == {
+        (1201, ant.DeviceTypeID_HRM),
+        (1202, ant.DeviceTypeID_HRM),
+        (1211, ant.DeviceTypeID_SCS),
+        (1221, ant.DeviceTypeID_VTX),
+        (1231, ant.DeviceTypeID_BLTR),
+    }
+    hrm = inventory.Devices[1201, ant.DeviceTypeID_HRM]
+    assert hrm.Messages >= 10
+    assert hrm.Rate() > 40  # 4Hz * TimeScale
+    assert inventory.Seen(1)[0].LastSeen >= hrm.LastSeen
+
+
+def test_rx_timestamps():
+    device = antLoopback.clsLoopbackDevice(TimeScale=20, Seed=1)
+    dongle = ant.clsAntDongle(Devices=[device])
+    dongle.ConfigMsg = False
+    dongle.LibConfig = ant.LibConfig_RSSI | ant.LibConfig_Timestamp
+    dongle.Calibrate()
+    dongle.SlaveHRM_ChannelConfig(0)
+
+    times = []
+    for d in dongle.Messages(time.time() + 0.5):
+        if d[2] == ant.msgID_BroadcastData:
+            times.append(dongle.MessageArrivalTime)
+    dongle.StopReadThread()
+
+    period = 8070 / 32768 / 20
+    intervals = [b - a for a, b in zip(times[1:], times[2:])]
+    assert len(intervals) > 10
+    assert max(abs(x - period) for x in intervals) < period / 2
+    assert dongle.Statistics.RSSI == {ant.channel_HRM_s: antLoopback.RSSI}
@@ -0,0 +1,55 @@
+import numpy
+import pytest
+
+from fortius_ant import physics
+
+
+@pytest.mark.parametrize(
+    "Power, Grade, WindSpeed",
+    [
+        (200, 0, 0),
+        (150, 5, 0),
+        (300, 0, 20),  # Headwind
+        (100, 0, -30),  # Tailwind
+        (50, -4, 0),
+        (-100, -8, 0),  # Descent, highest speed of the two
+    ],
+)
+def test_power2speed(Power, Grade, WindSpeed):
+    Speed = physics.Power2Speed(Power, Grade, 85, 0.004, 0.51, WindSpeed, 1.0)
+    assert 0 < Speed < physics.MaxSpeedKmh
+    Calculated = physics.Grade2Power(Speed, Grade, 85, 0.004, 0.51, WindSpeed, 1.0)
+    assert Calculated == pytest.approx(Power, abs=1e-6)
+    if Power < 0:  # The power curve rises at the returned speed
+        assert physics.Grade2Power(Speed + 1, Grade, 85, 0.004, 0.51, WindSpeed) > Power
+
+
+def test_power2speed_no_solution():
+    assert physics.Power2Speed(0, 0, 85) == 0
+    assert physics.Power2Speed(-100, 0, 85) == 0  # Negative power on the flat
+    assert physics.Power2Speed(100000, 0, 85) == physics.MaxSpeedKmh
+
+
+def test_arrays():
+    rng = numpy.random.default_rng(1)
+    n = 1000
+    Power = rng.integers(-300, 600, n)
+    Grade = rng.uniform(-10, 10, n)
+    WindSpeed = rng.uniform(-40, 40, n)
+    Drafting = rng.uniform(0.5, 1, n)
+
+    Speed = physics.Power2SpeedArray(Power, Grade, 85, 0.004, 0.51, WindSpeed, Drafting)
+    assert Speed.shape == (n,)
+    for i in range(0, n, 10):  # The array and scalar kernels match
+        expected = physics.Power2Speed(
+            int(Power[i]), Grade[i], 85, 0.004, 0.51, WindSpeed[i], Drafting[i]
+        )
+        assert Speed[i] == pytest.approx(expected, abs=1e-9)
+
+    SpeedKmh = rng.uniform(0, 60, n)
+    Power = physics.Grade2Power(SpeedKmh, Grade, 85, 0.004, 0.51, WindSpeed, Drafting)
+    assert Power[7] == physics.Grade2Power(
+        SpeedKmh[7], Grade[7], 85, 0.004, 0.51, WindSpeed[7], Drafting[7]
+    )
+    Power = physics.Grade2PowerFietsNL(SpeedKmh, Grade, 85)
+    assert Power[7] == physics.Grade2PowerFietsNL(SpeedKmh[7], Grade[7], 85)
@@ -0,0 +1,45 @@
+from fortius_ant import usbDevices
+
+
+class clsFakeUsbDevice:
+    def __init__(self, idVendor, idProduct, address):
+        self.idVendor = idVendor
+        self.idProduct = idProduct
+        self.bus = 1
+        self.address = address
+
+
+def test_find(mocker):
+    dongle1 = clsFakeUsbDevice(0x0FCF, 4104, 3)
+    dongle2 = clsFakeUsbDevice(0x0FCF, 4104, 4)
+    trainer = clsFakeUsbDevice(0x3561, 0x1942, 5)
+    find = mocker.patch("usb.core.find", return_value=iter([dongle1, dongle2, trainer]))
+    usbDevices.Invalidate()
+
+    assert usbDevices.Find(idProduct=4104) == [dongle1, dongle2]
+    assert usbDevices.Find(0x3561, 0x1942) == [trainer]
+    assert usbDevices.Find(0x3561, 4104) == []
+    assert find.call_count == 1  # One scan for all
+    assert usbDevices.ScanTime > 0
+
+    usbDevices.Used(dongle2)
+    assert usbDevices.Find(idProduct=4104) == [dongle2, dongle1]
+
+    find.return_value = iter([trainer])
+    usbDevices.Invalidate()
+    assert usbDevices.Find(idProduct=4104) == []
+    assert find.call_count == 2
+
+
+def test_device_plugged_in_later(mocker):
+    trainer = clsFakeUsbDevice(0x3561, 0x1942, 5)
+    dongle = clsFakeUsbDevice(0x0FCF, 4104, 6)
+    find = mocker.patch("usb.core.find", return_value=iter([trainer]))
+    usbDevices.Invalidate()
+    assert usbDevices.Find(idProduct=4104) == []
+
+    find.return_value = iter([trainer, dongle])  # Dongle plugged in
+    assert usbDevices.Find(idProduct=4104) == []  # Index of the first scan
+    usbDevices.Invalidate()  # As LocateHW() does
+    assert usbDevices.Find(idProduct=4104) == [dongle]
+    assert find.call_count == 2
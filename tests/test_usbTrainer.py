@@ -0,0 +1,154 @@
+import array
+import struct
+import time
+
+import pytest
+
+from fortius_ant import usbTrainer
+
+
+def NewFrame(length):
+    data = bytearray(64)
+    data[12] = 72  # HeartRate
+    data[13] = usbTrainer.EnterButton
+    struct.pack_into("<H", data, 18, 0x0A0D)  # Axis1
+    struct.pack_into("<I", data, 24, usbTrainer.USB_ControlResponse)
+    struct.pack_into("<H", data, 32, 8692)  # WheelSpeed, 30km/h
+    struct.pack_into("<hh", data, 38, -150, 1900)
+    data[42] = 3  # Events (PedalEcho)
+    data[44] = 90  # Cadence
+    return array.array("B", data[:length])
+
+
+def test_new_frame():
+    for length in (48, 64):
+        data = NewFrame(length)
+        assert usbTrainer.UsbFrameNew.unpack_from(data) == (
+            72,
+            usbTrainer.EnterButton,
+            0x0A0D,
+            8692,
+            -150,
+            1900,
+            3,
+            90,
+        )
+        assert len(data) == length  # Not padded
+        assert (
+            usbTrainer.UsbHeader.unpack_from(data, usbTrainer.UsbHeaderOffset)[0]
+            == usbTrainer.USB_ControlResponse
+        )
+
+
+def test_legacy_frame():
+    data = struct.pack("<BHBBIBBBB", 0xE0, 5795, 85, 130, 0, 7, 1, 0, 128)
+    data += bytes(24 - len(data))
+    assert usbTrainer.UsbFrameLegacy.unpack_from(data) == (
+        0xE0,
+        5795,
+        85,
+        130,
+        7,
+        1,
+        128,
+    )
+
+
+def test_usb_read_header(mocker):
+    trainer = usbTrainer.clsTacxNewUsbTrainer.__new__(usbTrainer.clsTacxNewUsbTrainer)
+    trainer.UsbDevice = mocker.Mock()
+    trainer.UsbDevice.read.return_value = NewFrame(48)
+    assert len(trainer.USB_Read()) == 48
+    assert trainer.Header == usbTrainer.USB_ControlResponse
+
+    trainer.UsbDevice.read.return_value = array.array("B", [])
+    trainer.USB_Read()
+    assert trainer.Header == -1
+
+
+def test_io_thread(mocker):
+    clv = mocker.Mock(
+        Steering=None, PowerFactor=1, PedalStrokeAnalysis=False, CalibrateRR=0
+    )
+    device = mocker.Mock()
+    device.read.return_value = NewFrame(64)
+    trainer = usbTrainer.clsTacxNewUsbTrainer(clv, "", usbTrainer.hu1932, device)
+    trainer.MotorBrake = True
+
+    trainer.StartIOThread(0.001)
+    trainer.Refresh(True, usbTrainer.modeResistance)
+    assert trainer.tacxEvent
+    assert (trainer.HeartRate, trainer.Cadence, trainer.PedalEcho) == (72, 90, 3)
+    assert trainer.IOCommand[0] == usbTrainer.modeResistance
+
+    Deadline = time.time() + 1
+    while trainer.Snapshot.Count < 3 and time.time() < Deadline:
+        time.sleep(0.01)  # The thread polls without Refresh()
+    trainer.StopIOThread()
+    assert trainer.Snapshot.Count >= 3
+
+    # The thread polls and echoes the PedalEcho of the latest frame
+    assert device.read.call_count >= trainer.Snapshot.Count
+    device.write.assert_called()
+    trainer.SendToTrainer(True, usbTrainer.modeStop)  # Directly, not queued
+    assert trainer.IOCommand[0] == usbTrainer.modeResistance
+
+
+def test_io_thread_header(mocker):
+    clv = mocker.Mock(
+        Steering=None, PowerFactor=1, PedalStrokeAnalysis=False, CalibrateRR=0
+    )
+    device = mocker.Mock()
+    device.read.return_value = NewFrame(64)
+    trainer = usbTrainer.clsTacxNewUsbTrainer(clv, "", usbTrainer.hu1932, device)
+    trainer.MotorBrake = True
+    trainer.Header = None
+    trainer.tacxEvent = None
+
+    trainer.StartIOThread(0.001)
+    Deadline = time.time() + 1
+    while trainer.Snapshot is None and time.time() < Deadline:
+        time.sleep(0.01)
+    assert (trainer.Header, trainer.tacxEvent) == (None, None)  # Not by the thread
+    assert trainer.Snapshot.Header == usbTrainer.USB_ControlResponse
+
+    trainer.Refresh(True, usbTrainer.modeResistance)
+    trainer.StopIOThread()
+    assert trainer.Header == usbTrainer.USB_ControlResponse
+    assert trainer.tacxEvent
+
+
+def test_power2speed(mocker):
+    trainer = usbTrainer.clsTacxTrainer(mocker.Mock(), "")
+    trainer.CurrentPower = 200
+    trainer.VirtualSpeedKmh = 12.3
+    trainer.TargetPower = 150
+    trainer.Power2Speed(0)
+    assert trainer.CalculatedSpeedKmh == pytest.approx(31.5, abs=0.01)
+    assert (trainer.VirtualSpeedKmh, trainer.TargetPower) == (12.3, 150)
+
+
+def test_magnetic_brake_resistance(mocker):
+    clv = mocker.Mock(
+        Steering=None, PowerFactor=1, PedalStrokeAnalysis=False, CalibrateRR=0
+    )
+    clv.Resistance = False
+    device = mocker.Mock()
+    device.read.return_value = NewFrame(64)
+    trainer = usbTrainer.clsTacxNewUsbTrainer(clv, "", usbTrainer.hu1932, device)
+    trainer.MotorBrake = False
+    trainer.WheelSpeed = 8692
+    trainer.Wheel2Speed()
+
+    Powers = trainer.PowerStepsMB(trainer.SpeedKmh)
+    assert Powers == sorted(Powers)
+    for i in (0, 5, 13):
+        trainer.TargetPower = Powers[i] + 1  # Nearest is step i
+        trainer.TargetPower2Resistance()
+        assert trainer.TargetResistance == trainer.targetR[i]
+    trainer.TargetPower = 10000
+    trainer.TargetPower2Resistance()
+    assert trainer.TargetResistance == trainer.targetR[-1]
+
+    clv.CalibrateRR = 30  # The table is recalculated
+    assert trainer.PowerStepsMB(trainer.SpeedKmh)[0] > Powers[0]